@@ -0,0 +1,9 @@
+"""Shared machinery for the public/ HTML and src/ component codemods.
+
+Run them with ``python -m codemods`` (see ``codemods/cli.py``); the rules
+themselves live in ``codemods/rules/``.
+"""
+
+from .engine import Pipeline, RewriteResult, Rule, RuleSet
+
+__all__ = ['Pipeline', 'RewriteResult', 'Rule', 'RuleSet']
@@ -0,0 +1,489 @@
+"""
+codemods.bench — benchmark the registered codemods on synthetic sites.
+
+    python -m codemods.bench [--pages N] [--kb M] [--variant legacy|canonical|auth-flood]
+                             [--jobs N] [--out FILE] [--compare OLD.json]
+
+Generates N pages of roughly M KB under a temporary root laid out like
+public/ (index, methodology, pricing, the two profile pages, the
+baza-wiedzy pages the kb-* codemods target, then generated knowledge-base
+pages).  Page markup is modelled on the real pages:
+
+  legacy      pre-unification markup: theme toggle, Korzyści, "Wykonaj test",
+              old footer, auth JS without Baza Wiedzy; most rules fire
+  canonical   already-unified nav/footer markup; rules scan, almost none fire
+  auth-flood  legacy plus thousands of long ``<a href="/auth" ...>`` tags,
+              the worst case for the ``[^>]*bg-white[^>]*`` style patterns
+
+Measured:
+
+  - per rule: ops/sec (pages/s with only that rule), hits, and the slowest
+    single match attempt — also as an estimated sre step count (attempt time
+    divided by the measured cost of one character step)
+  - per codemod: ops/sec of the whole transform on the pages it targets
+  - end to end: read + rewrite + write of the whole site with ``--jobs``
+  - peak RSS of this process and of its workers
+
+Results go to JSON (default ``bench-results/<git sha>-<variant>.json``);
+``--compare`` prints per-rule slowdowns against an earlier run and exits 1
+if any exceeds ``--threshold``.
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import re
+import shutil
+import subprocess
+import tempfile
+import time
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import resource
+except ImportError:         # not on Windows
+    resource = None
+
+from . import registry
+from .cache import ROOT
+from .cli import FileJob, process_file
+from .engine import Rule, RuleSet
+from .htmltok import ElementRule, ElementRuleSet
+from .rules.nav_footer import CANONICAL_FOOTER
+from .runner import resolve_jobs, run_parallel
+
+VARIANTS = ('legacy', 'canonical', 'auth-flood')
+
+# Fixed pages first (the ones codemods target by name), then generated ones
+SITE_PATHS = (
+    'public/index.html',
+    'public/methodology.html',
+    'public/pricing.html',
+    'public/user-profile-tests.html',
+    'public/user-profile.html',
+    'public/baza-wiedzy/index.html',
+    'public/baza-wiedzy/enneagram/index.html',
+    'public/baza-wiedzy/enneagram/typ-1-reformator.html',
+    'public/baza-wiedzy/enneagram/typ-4-indywidualista.html',
+    'public/baza-wiedzy/hexaco/index.html',
+)
+
+
+# ─── Synthetic pages ──────────────────────────────────────────────────────────
+
+LEGACY_CSS = '''
+    /* NAV */
+    nav { position: sticky; top: 0; z-index: 50; }
+    .nav-cta { padding: 8px 18px; border-radius: 999px; }
+    .nav-cta:hover { background: #fff; }
+    .theme-toggle { width: 52px; height: 28px; border-radius: 14px; }
+    .theme-toggle:hover { opacity: .8; }
+    .theme-toggle-slider { position: absolute; left: 2px; }
+    .theme-toggle.light .theme-toggle-slider { left: 26px; }
+    .theme-icon { width: 14px; }
+    .theme-icon-moon { opacity: 1; }
+    .theme-icon-sun { opacity: 0; }
+    .theme-toggle.light .theme-icon-moon { opacity: 0; }
+    .theme-toggle.light .theme-icon-sun { opacity: 1; }'''
+
+CANONICAL_CSS = '''
+    .iiy-nav-link{position:relative;color:rgba(255,255,255,.5);font-size:13.5px;}
+    .iiy-nav-link.active{color:#fff;}'''
+
+LEGACY_NAV = '''  <nav id="main-nav" class="fixed w-full z-50 glass-panel">
+    <div class="flex justify-between items-center h-20">
+      <a href="https://www.alcheme.io/" class="alcheme-logo"><span class="alcheme-logo-name">Alcheme</span></a>
+      <div class="hidden md:flex items-center gap-8" id="nav-links">
+          <a href="/#features" class="iiy-nav-link">Korzyści</a>
+          <a href="/methodology" class="iiy-nav-link">Metodologia</a>
+          <a href="/pricing" class="iiy-nav-link">Cennik</a>
+      </div>
+      <div class="hidden md:flex items-center gap-4" id="nav-actions">
+          <button id="nav-theme-btn" class="theme-toggle" title="Motyw"><span class="theme-toggle-slider"></span></button>
+          <a href="/auth" class="text-sm font-medium text-slate-400 hover:text-white transition-colors hidden sm:block">Zaloguj</a>
+          <a href="/auth" class="bg-white text-slate-950 px-6 py-2.5 rounded-full text-sm font-bold shadow-[0_0_20px_rgba(255,255,255,0.15)]">
+            Wykonaj test
+          </a>
+      </div>
+    </div>
+    <div id="mobile-menu" class="hidden md:hidden">
+      <div id="mobile-menu-content" class="px-4 py-4 space-y-1">
+      <a href="/#features" class="block px-4 py-3 rounded-xl text-sm">Korzyści</a>
+      <a href="/methodology" class="block px-4 py-3 rounded-xl text-sm">Metodologia</a>
+      <a href="/auth" class="block px-4 py-3 rounded-xl text-sm font-bold text-slate-950 bg-white">Wykonaj test</a>
+      </div>
+    </div>
+  </nav>'''
+
+CANONICAL_NAV = '''  <nav id="main-nav" class="fixed w-full z-50 glass-panel">
+    <div class="flex justify-between items-center h-20">
+      <a href="/" class="alcheme-logo"><span class="alcheme-logo-name">Alcheme</span></a>
+      <div class="hidden md:flex items-center gap-8" id="nav-links">
+          <a href="/baza-wiedzy/" class="iiy-nav-link">Baza Wiedzy</a>
+          <a href="/methodology" class="iiy-nav-link">Metodologia</a>
+          <a href="/pricing" class="iiy-nav-link">Cennik</a>
+      </div>
+      <div class="hidden md:flex items-center gap-4" id="nav-actions">
+          <a href="/auth" class="inline-flex items-center gap-2 px-4 py-2 rounded-xl text-sm font-semibold text-white">Zaloguj się</a>
+      </div>
+    </div>
+    <div id="mobile-menu" class="hidden md:hidden">
+      <div id="mobile-menu-content" class="px-4 py-4 space-y-1">
+      <a href="/baza-wiedzy/" class="block px-4 py-3 rounded-xl text-sm">Baza Wiedzy</a>
+      <a href="/methodology" class="block px-4 py-3 rounded-xl text-sm">Metodologia</a>
+      </div>
+    </div>
+  </nav>'''
+
+LEGACY_SCRIPT = '''  <script type="module">
+    import { createClient } from 'https://cdn.jsdelivr.net/npm/@supabase/supabase-js@2/+esm';
+    const supabase = createClient('https://example.supabase.co', 'anon');
+    const MOON_SVG = `<svg width="14" height="14" viewBox="0 0 24 24"><path d="M21 12.79A9 9 0 1111.21 3"/></svg>`;
+    const SUN_SVG = `<svg width="14" height="14" viewBox="0 0 24 24"><circle cx="12" cy="12" r="5"/></svg>`;
+    const { data: { session } } = await supabase.auth.getSession();
+    if (session) {
+      document.getElementById('nav-links').innerHTML = `
+        <a href="/methodology" class="iiy-nav-link">Metodologia</a>
+        <a href="/pricing" class="iiy-nav-link">Cennik</a>
+        <a href="/character" class="iiy-nav-link">Karta Postaci</a>
+      `;
+      document.getElementById('mobile-menu-content').innerHTML = `
+        <a href="/methodology" class="block px-4 py-3">Metodologia</a>
+      `;
+    }
+    document.querySelectorAll('.theme-toggle').forEach(b => b.addEventListener('click', toggleTheme));
+  </script>'''
+
+CANONICAL_SCRIPT = '''  <script type="module">
+    import { createClient } from 'https://cdn.jsdelivr.net/npm/@supabase/supabase-js@2/+esm';
+    const supabase = createClient('https://example.supabase.co', 'anon');
+    const { data: { session } } = await supabase.auth.getSession();
+    if (session) {
+      document.getElementById('nav-links').innerHTML = `
+        <a href="/baza-wiedzy/" class="iiy-nav-link">Baza Wiedzy</a>
+        <a href="/methodology" class="iiy-nav-link">Metodologia</a>
+      `;
+    }
+  </script>'''
+
+LEGACY_FOOTER = '''  <footer class="py-8 border-t border-white/5">
+    <div class="max-w-7xl mx-auto px-6"><div class="grid grid-cols-3 gap-8">
+      <div><a href="/methodology">Metodologia</a></div>
+      <div><a href="/pricing">Cennik</a></div>
+      <div><p>&copy; Alcheme</p></div>
+    </div></div>
+  </footer>'''
+
+AUTH_FLOOD_TAG = ('<a href="/auth" class="' + 'bg-white px-4 py-2 rounded-xl ' * 12
+                  + '" data-x="' + 'y' * 120 + '">Zaloguj</a>\n')
+
+
+def _filler(kb: int, rng: random.Random, flood: bool) -> str:
+    """Article body of roughly ``kb`` KB: sections, paragraphs, cards, links."""
+    words = ('osobowość', 'temperament', 'motywacja', 'wartości', 'relacje', 'rozwój',
+             'test', 'wynik', 'profil', 'emocje', 'cechy', 'enneagram', 'hexaco')
+    parts = []
+    size = 0
+    target = kb * 1024
+    while size < target:
+        if flood:
+            chunk = AUTH_FLOOD_TAG * 20
+        else:
+            text = ' '.join(rng.choice(words) for _ in range(rng.randint(40, 90)))
+            chunk = (
+                f'    <section class="card glass-panel p-6 mb-6">\n'
+                f'      <h2 class="text-xl font-bold">{rng.choice(words).title()}</h2>\n'
+                f'      <div class="grid grid-cols-2 gap-4"><div><p>{text}</p></div>\n'
+                f'      <div><a href="/baza-wiedzy/" class="text-cyan-400">Więcej</a></div></div>\n'
+                f'    </section>\n'
+            )
+        parts.append(chunk)
+        size += len(chunk)
+    return ''.join(parts)
+
+
+def synthetic_page(variant: str, kb: int, rng: random.Random) -> str:
+    legacy = variant != 'canonical'
+    body = _filler(kb, rng, flood=False)
+    if variant == 'auth-flood':
+        body += _filler(kb, rng, flood=True)
+    return (
+        '<!DOCTYPE html>\n<html lang="pl">\n<head>\n  <meta charset="UTF-8">\n'
+        '  <title>Alcheme</title>\n'
+        '  <link href="https://fonts.googleapis.com/css2?family=Space+Grotesk:wght@400;500;600;700&display=swap" rel="stylesheet">\n'
+        '  <style>\n    body { margin: 0; }'
+        + (LEGACY_CSS if legacy else CANONICAL_CSS)
+        + '\n  </style>\n</head>\n<body>\n'
+        + (LEGACY_NAV if legacy else CANONICAL_NAV)
+        + '\n  <main class="max-w-5xl mx-auto pt-24">\n' + body + '  </main>\n'
+        + (LEGACY_FOOTER if legacy else CANONICAL_FOOTER)
+        + '\n' + (LEGACY_SCRIPT if legacy else CANONICAL_SCRIPT)
+        + '\n</body>\n</html>\n'
+    )
+
+
+def site_paths(pages: int) -> List[str]:
+    paths = list(SITE_PATHS[:pages])
+    for i in range(pages - len(paths)):
+        paths.append(f'public/baza-wiedzy/bench/page-{i:04d}.html')
+    return paths
+
+
+def generate_site(root: str, pages: int, kb: int, variant: str, seed: int = 0) -> Dict[str, str]:
+    """Write the synthetic site under ``root``; return {path: html}."""
+    rng = random.Random(seed)
+    site = {}
+    for path in site_paths(pages):
+        html = synthetic_page(variant, kb, rng)
+        full = os.path.join(root, path)
+        os.makedirs(os.path.dirname(full), exist_ok=True)
+        with open(full, 'w', encoding='utf-8') as f:
+            f.write(html)
+        site[path] = html
+    return site
+
+
+# ─── Measurements ─────────────────────────────────────────────────────────────
+
+def peak_rss_kb() -> Dict[str, Optional[int]]:
+    if resource is None:
+        return {'self': None, 'children': None}
+    scale = 1024 if platform.system() == 'Darwin' else 1    # bytes on macOS, KB on Linux
+    return {
+        'self': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss // scale,
+        'children': resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss // scale,
+    }
+
+
+def step_cost_ns() -> float:
+    """Cost of one sre character step: a single-instruction scan over 1M chars."""
+    text = 'a' * 1_000_000
+    scan = re.compile(r'[^\x00]*')
+    best = min(_timed(lambda: scan.match(text))[1] for _ in range(5))
+    return best * 1e9 / len(text)
+
+
+def _timed(func) -> Tuple[object, float]:
+    t = time.perf_counter()
+    out = func()
+    return out, time.perf_counter() - t
+
+
+def _ops_per_sec(func, pages: List[str], min_time: float) -> Tuple[float, int]:
+    """Pages/s for ``func`` over ``pages`` (repeated until ``min_time``); hits of one pass."""
+    hits = 0
+    for page in pages:
+        hits += sum(func(page).hits.values())
+    done = 0
+    started = time.perf_counter()
+    while True:
+        for page in pages:
+            func(page)
+        done += len(pages)
+        elapsed = time.perf_counter() - started
+        if elapsed >= min_time:
+            return done / elapsed, hits
+
+
+def worst_attempt_ns(rule: Rule, pages: List[str]) -> int:
+    """Slowest single ``rule.body.match`` at any anchor occurrence."""
+    scanner = re.compile('|'.join(re.escape(a) for a in rule.anchors))
+    match = rule.body.match
+    clock = time.perf_counter_ns
+    worst = 0
+    for page in pages:
+        for a in scanner.finditer(page):
+            t = clock()
+            match(page, a.start())
+            worst = max(worst, clock() - t)
+    return worst
+
+
+def bench_rules(codemod: registry.Codemod, pages: List[str], min_time: float, step_ns: float) -> Dict[str, dict]:
+    results = {}
+    for rule in codemod.rules:
+        if isinstance(rule, ElementRule):
+            single = ElementRuleSet([rule])
+            worst = None
+        else:
+            single = RuleSet([rule])
+            worst = worst_attempt_ns(rule, pages)
+        ops, hits = _ops_per_sec(single.apply, pages, min_time)
+        results[rule.name] = {
+            'codemod': codemod.name,
+            'ops_per_sec': round(ops, 1),
+            'hits': hits,
+            'worst_attempt_us': None if worst is None else round(worst / 1000, 1),
+            'worst_steps_est': None if worst is None else int(worst / step_ns),
+        }
+    return results
+
+
+def bench_codemod(codemod: registry.Codemod, pages: Dict[str, str], min_time: float) -> dict:
+    items = list(pages.items())
+    ops, hits = _ops_per_sec(lambda item: codemod.apply(*item), items, min_time)
+    return {'pages': len(items), 'ops_per_sec': round(ops, 1), 'hits': hits}
+
+
+def bench_end_to_end(site_root: str, work_root: str, selected, jobs: int) -> dict:
+    """Read + rewrite + write of a fresh copy of the site."""
+    if os.path.exists(work_root):
+        shutil.rmtree(work_root)
+    shutil.copytree(site_root, work_root)
+    file_jobs = [FileJob(work_root, path, tuple(names))
+                 for path, names in registry.plan(selected, work_root).items()]
+    workers = min(resolve_jobs(jobs), len(file_jobs))
+    started = time.perf_counter()
+    results = list(run_parallel(process_file, file_jobs, workers))
+    elapsed = time.perf_counter() - started
+    nbytes = sum(r.size for r in results)
+    return {
+        'files': len(results),
+        'changed': sum(r.changed for r in results),
+        'bytes': nbytes,
+        'seconds': round(elapsed, 4),
+        'files_per_sec': round(len(results) / elapsed, 1),
+        'mb_per_sec': round(nbytes / 1024 / 1024 / elapsed, 2),
+        'workers': workers,
+    }
+
+
+def git_revision() -> str:
+    try:
+        out = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT,
+                             capture_output=True, text=True, check=True)
+        return out.stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+
+
+def run(pages: int, kb: int, variant: str, jobs: int, names=(), min_time: float = 0.2, seed: int = 0) -> dict:
+    selected = registry.select(names)
+    step_ns = step_cost_ns()
+    with tempfile.TemporaryDirectory(prefix='codemods-bench-') as tmp:
+        site_root = os.path.join(tmp, 'site')
+        site = generate_site(site_root, pages, kb, variant, seed)
+        plan = registry.plan(selected, site_root)
+
+        rules, codemods = {}, {}
+        for c in selected:
+            targeted = {p: site[p] for p, names in plan.items() if c.name in names}
+            if not targeted:
+                continue
+            codemods[c.name] = bench_codemod(c, targeted, min_time)
+            rules.update(bench_rules(c, list(targeted.values()), min_time, step_ns))
+
+        end_to_end = bench_end_to_end(site_root, os.path.join(tmp, 'work'), selected, jobs)
+
+    return {
+        'meta': {
+            'revision': git_revision(),
+            'timestamp': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'config': {'pages': pages, 'kb': kb, 'variant': variant, 'jobs': jobs,
+                       'codemods': [c.name for c in selected], 'seed': seed},
+            'step_cost_ns': round(step_ns, 3),
+        },
+        'rules': rules,
+        'codemods': codemods,
+        'end_to_end': end_to_end,
+        'peak_rss_kb': peak_rss_kb(),
+    }
+
+
+# ─── Reporting ────────────────────────────────────────────────────────────────
+
+def print_report(result: dict):
+    meta = result['meta']
+    cfg = meta['config']
+    print(f"\n=== codemods bench @ {meta['revision']}: {cfg['pages']} pages × {cfg['kb']} KB, "
+          f"{cfg['variant']} ===\n")
+    rules = result['rules']
+    if rules:
+        width = max(len(n) for n in rules)
+        print(f"  {'rule':<{width}}  {'pages/s':>10}  {'hits':>6}  {'worst µs':>10}  {'~steps':>12}")
+        for name, r in sorted(rules.items(), key=lambda kv: kv[1]['ops_per_sec']):
+            worst = '-' if r['worst_attempt_us'] is None else f"{r['worst_attempt_us']:,.1f}"
+            steps = '-' if r['worst_steps_est'] is None else f"{r['worst_steps_est']:,}"
+            print(f"  {name:<{width}}  {r['ops_per_sec']:>10,.1f}  {r['hits']:>6}  {worst:>10}  {steps:>12}")
+    print()
+    for name, c in result['codemods'].items():
+        print(f"  codemod {name:<20} {c['ops_per_sec']:>10,.1f} pages/s  ({c['pages']} pages, {c['hits']} hits)")
+    e2e = result['end_to_end']
+    print(f"\n  end to end: {e2e['files']} files ({e2e['changed']} changed), {e2e['bytes'] / 1024:,.0f} KB "
+          f"in {e2e['seconds']:.2f}s — {e2e['files_per_sec']} files/s, {e2e['mb_per_sec']} MB/s, "
+          f"{e2e['workers']} workers")
+    rss = result['peak_rss_kb']
+    if rss['self'] is not None:
+        print(f"  peak RSS: {rss['self'] / 1024:.1f} MB (workers {rss['children'] / 1024:.1f} MB)")
+
+
+def compare(old: dict, new: dict, threshold: float) -> List[str]:
+    """Rules whose pages/s dropped by more than ``threshold``× since ``old``."""
+    if old['meta']['config'] != new['meta']['config']:
+        print(f"\n  ! configs differ: {old['meta']['config']} vs {new['meta']['config']}")
+    print(f"\n--- vs {old['meta']['revision']} (slowdown = old pages/s ÷ new pages/s) ---")
+    regressions = []
+    rows = []
+    for name, r in new['rules'].items():
+        before = old['rules'].get(name)
+        if before is None or not r['ops_per_sec']:
+            continue
+        rows.append((before['ops_per_sec'] / r['ops_per_sec'], name))
+    width = max((len(n) for _, n in rows), default=4)
+    for slowdown, name in sorted(rows, reverse=True):
+        flag = '  REGRESSION' if slowdown > threshold else ''
+        print(f"  {name:<{width}}  {slowdown:6.2f}×{flag}")
+        if slowdown > threshold:
+            regressions.append(name)
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m codemods.bench',
+                                     description="Benchmark codemods on a synthetic site.")
+    parser.add_argument('codemods', nargs='*', metavar='NAME',
+                        help="codemods to benchmark (default: all default codemods)")
+    parser.add_argument('--pages', type=int, default=50, help="pages in the site (default 50)")
+    parser.add_argument('--kb', type=int, default=40, help="approximate page size in KB (default 40)")
+    parser.add_argument('--variant', choices=VARIANTS, default='legacy')
+    parser.add_argument('--jobs', '-j', type=int, default=1,
+                        help="workers for the end-to-end run (0 = one per CPU)")
+    parser.add_argument('--min-time', type=float, default=0.2,
+                        help="seconds to repeat each timing for (default 0.2)")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--out', help="JSON output (default bench-results/<sha>-<variant>.json)")
+    parser.add_argument('--compare', metavar='OLD_JSON', help="earlier result to compare against")
+    parser.add_argument('--threshold', type=float, default=1.25,
+                        help="slowdown factor counted as a regression (default 1.25)")
+    args = parser.parse_args(argv)
+
+    try:
+        result = run(args.pages, args.kb, args.variant, args.jobs, args.codemods,
+                     args.min_time, args.seed)
+    except KeyError as e:
+        parser.error(e.args[0])
+    print_report(result)
+
+    out = args.out or os.path.join(ROOT, 'bench-results',
+                                   f"{result['meta']['revision']}-{args.variant}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(out)), exist_ok=True)
+    with open(out, 'w', encoding='utf-8') as f:
+        json.dump(result, f, indent=1, ensure_ascii=False)
+    print(f"\n  results: {os.path.relpath(out)}")
+
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            old = json.load(f)
+        if compare(old, result, args.threshold):
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    import sys
+    sys.exit(main())
@@ -0,0 +1,120 @@
+"""
+codemods.cache — persistent content-hash manifest for incremental runs.
+
+For every (codemod selection, file) the manifest remembers which input
+sha256 produced which output sha256 under a given ruleset version.  The
+namespace is the space-separated names of the selected codemods, as
+``python -m codemods`` runs them (see ``cli.manifest_for``):
+
+    .codemod-cache.json
+    {"nav-auth kb-nav ...": {"public/baza-wiedzy/index.html":
+        {"ruleset": "<sha256>", "seen": {"<input sha256>": "<output sha256>"}}}}
+
+A file is skipped without being decoded or regexed when its current hash is
+a known fixed point (input == output) for the current ruleset.  After a
+file is changed, the next run processes it once more to confirm the new
+content is stable; from then on it is skipped until it or the rules change.
+
+The ruleset version is ``source_version`` of every module of the package,
+rules included, so editing a constant such as CANONICAL_FOOTER or NAV_HTML
+invalidates every entry, whichever codemods imported it.
+"""
+
+import hashlib
+import json
+import os
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MANIFEST_PATH = os.path.join(ROOT, '.codemod-cache.json')
+
+# Input hashes remembered per file; older ones are dropped first
+MAX_SEEN = 8
+
+
+def sha256(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def source_version(*paths: str) -> str:
+    """Ruleset version: hash of the given source files' contents."""
+    h = hashlib.sha256()
+    for path in paths:
+        with open(path, 'rb') as f:
+            h.update(f.read())
+        h.update(b'\0')
+    return h.hexdigest()
+
+
+def manifest_key(path: str) -> str:
+    path = os.path.abspath(path)
+    rel = os.path.relpath(path, ROOT)
+    return path if rel.startswith('..') else rel
+
+
+class Manifest:
+    """One script's view of the shared manifest file."""
+
+    def __init__(self, namespace: str, version: str, path: str = MANIFEST_PATH, enabled: bool = True):
+        self.namespace = namespace
+        self.version = version
+        self.path = path
+        self.enabled = enabled
+        self.hits = 0
+        self.misses = 0
+        self._data = {}
+        if enabled and os.path.exists(path):
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    self._data = json.load(f)
+            except (OSError, ValueError):
+                self._data = {}
+
+    def _entry(self, path: str) -> dict:
+        entries = self._data.setdefault(self.namespace, {})
+        key = manifest_key(path)
+        entry = entries.get(key)
+        if entry is None or entry.get('ruleset') != self.version:
+            entry = entries[key] = {'ruleset': self.version, 'seen': {}}
+        return entry
+
+    def fixed_points(self, path: str) -> frozenset:
+        """Input hashes known to come out of this ruleset unchanged."""
+        if not self.enabled:
+            return frozenset()
+        seen = self._entry(path)['seen']
+        return frozenset(i for i, o in seen.items() if i == o)
+
+    def is_fixed_point(self, path: str, digest: str) -> bool:
+        return digest in self.fixed_points(path)
+
+    def record(self, path: str, input_digest: str, output_digest: str, skipped: bool = False):
+        if skipped:
+            self.hits += 1
+            return
+        self.misses += 1
+        if not self.enabled:
+            return
+        seen = self._entry(path)['seen']
+        seen.pop(input_digest, None)
+        seen[input_digest] = output_digest
+        while len(seen) > MAX_SEEN:
+            del seen[next(iter(seen))]
+
+    def save(self):
+        if not self.enabled:
+            return
+        tmp = self.path + '.tmp'
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(self._data, f, indent=1, sort_keys=True)
+        os.replace(tmp, self.path)
+
+    def summary(self) -> str:
+        if not self.enabled:
+            return "cache disabled"
+        return f"cache: {self.hits} skipped, {self.misses} processed"
+
+
+def read_text(raw: bytes) -> str:
+    """Decode like open(..., encoding='utf-8') in text mode (universal newlines)."""
+    return raw.decode('utf-8').replace('\r\n', '\n').replace('\r', '\n')
+
@@ -0,0 +1,266 @@
+"""
+codemods.cli — ``python -m codemods [NAME ...]``.
+
+Runs the named codemods (default: every codemod marked default, see
+``--list``) over their target files.  Each file is read once, passed through
+all of its codemods in memory and written back at most once, only if its
+content changed.
+
+``--dry-run`` writes nothing: it streams a unified diff per changed file,
+then a table of bytes in/out, rules fired and time per file, and exits 1
+if any file would change (so CI can gate on it).
+
+Every rule runs under a match-time budget (``--rule-budget``, per rule and
+file); a rule that exceeds it is skipped for the rest of that file instead
+of stalling the batch.  That makes the output depend on machine load, so an
+overrun is an error: it is reported with the offset the rule was stuck at,
+the file is not recorded in the cache, and the run exits 1.
+
+Files of ``--stream-above`` KB or more whose codemods all declare
+``regions`` are memory-mapped and rewritten element by element (see
+``codemods/stream.py``) instead of being loaded whole.
+"""
+
+import argparse
+import difflib
+import glob
+import os
+import time
+from collections import Counter
+from typing import List, NamedTuple, Optional, Tuple
+
+from . import engine, patterns, registry, stream
+from .cache import ROOT, Manifest, read_text, sha256, source_version
+from .runner import format_throughput, resolve_jobs, run_parallel
+
+
+class FileJob(NamedTuple):
+    root: str
+    path: str                               # repo-relative, forward slashes
+    codemods: Tuple[str, ...]
+    fixed_points: frozenset = frozenset()   # input hashes known to be no-ops
+    dry_run: bool = False
+    rule_budget: float = 0.0                # seconds per rule per file, 0 = unlimited
+    stream_above: Optional[int] = None      # stream files of at least this many bytes
+
+
+class FileResult(NamedTuple):
+    path: str
+    changed: bool
+    hits: Counter
+    size: int
+    input_digest: str
+    output_digest: str
+    cached: bool = False
+    out_size: int = 0
+    seconds: float = 0.0
+    diff: str = ''
+    overruns: Tuple[engine.Overrun, ...] = ()
+    compiles: int = 0                       # regexes compiled while rewriting (should be 0)
+    streamed: bool = False
+    regex: engine.Stats = engine.Stats(0, 0, 0)     # match attempts made / avoided by the prefilter
+
+
+def unified_diff(path: str, before: str, after: str) -> str:
+    return ''.join(difflib.unified_diff(
+        before.splitlines(keepends=True), after.splitlines(keepends=True),
+        fromfile=f'a/{path}', tofile=f'b/{path}',
+    ))
+
+
+def _since(before: engine.Stats) -> engine.Stats:
+    return engine.Stats(*(now - then for now, then in zip(engine.stats(), before)))
+
+
+def process_file(job: FileJob) -> FileResult:
+    """Worker entry point: one read, every codemod in memory, at most one write."""
+    started = time.perf_counter()
+    registry.load()
+    compiles = patterns.stats().compiles
+    regex = engine.stats()
+    full = os.path.join(job.root, job.path)
+    if (job.stream_above is not None and not job.dry_run and stream.can_stream(job.codemods)
+            and os.path.getsize(full) >= job.stream_above):
+        with engine.budget(job.rule_budget) as budget:
+            streamed = stream.rewrite_file(full, job.path, job.codemods, job.fixed_points)
+        if streamed is not None:
+            return FileResult(job.path, streamed.changed, streamed.hits, streamed.size,
+                              streamed.input_digest, streamed.output_digest, streamed.cached,
+                              streamed.out_size, time.perf_counter() - started,
+                              overruns=tuple(budget.overruns),
+                              compiles=patterns.stats().compiles - compiles, streamed=True,
+                              regex=_since(regex))
+
+    with open(full, 'rb') as f:
+        raw = f.read()
+    digest = sha256(raw)
+    if digest in job.fixed_points:
+        return FileResult(job.path, False, Counter(), len(raw), digest, digest, cached=True,
+                          out_size=len(raw), seconds=time.perf_counter() - started)
+
+    original = read_text(raw)
+    with engine.budget(job.rule_budget) as budget:
+        text, hits = registry.apply(job.path, original, job.codemods)
+
+    data = text.encode('utf-8')
+    changed = text != original
+    diff = ''
+    if changed and job.dry_run:
+        diff = unified_diff(job.path, original, text)
+    elif changed:
+        with open(full, 'wb') as f:
+            f.write(data)
+    return FileResult(job.path, changed, hits, len(raw), digest, sha256(data),
+                      out_size=len(data), seconds=time.perf_counter() - started, diff=diff,
+                      overruns=tuple(budget.overruns),
+                      compiles=patterns.stats().compiles - compiles, regex=_since(regex))
+
+
+def report(result: FileResult, dry_run: bool = False):
+    if dry_run:
+        # Only the diffs; unchanged files show up in the summary table
+        if result.diff:
+            print(result.diff, end='' if result.diff.endswith('\n') else '\n')
+    elif result.changed:
+        print(f"  ✓ Fixed{' (streamed)' if result.streamed else ''}: {result.path}")
+    elif result.cached:
+        print(f"  - No changes (cached): {result.path}")
+    else:
+        print(f"  - No changes: {result.path}")
+
+
+def print_overruns(results: List[FileResult], budget_ms: float):
+    overrun = [(r.path, o) for r in results for o in r.overruns]
+    if not overrun:
+        return
+    print(f"\n--- Rules over the {budget_ms:g} ms budget (skipped for the rest of the file) ---")
+    for path, o in overrun:
+        print(f"  ✗ {path}: {o.rule} at offset {o.offset:,} ({o.seconds * 1000:.1f} ms)")
+    print(f"  {len(overrun)} overrun(s): these files are missing those rules' edits "
+          f"(raise --rule-budget or fix the pattern)")
+
+
+def print_rule_hits(hits: Counter, codemods: List[registry.Codemod]):
+    """Per-rule hit counts, in registry order, including rules that never fired."""
+    names = list(dict.fromkeys(n for c in codemods for n in c.rule_names()))
+    width = max(len(n) for n in names)
+    print("\n--- Rule hits ---")
+    for name in names:
+        print(f"  {name:<{width}}  {hits[name]}")
+
+
+def print_summary_table(results: List[FileResult]):
+    """Bytes in/out, rules fired and wall time for every file."""
+    width = max(len(r.path) for r in results)
+    print(f"\n  {'file':<{width}}  {'in':>9}  {'out':>9}  {'delta':>8}  {'ms':>7}  rules")
+    for r in results:
+        if r.cached:
+            fired = '(cached)'
+        else:
+            fired = ', '.join(f"{name}×{n}" for name, n in r.hits.items()) or '-'
+        print(f"  {r.path:<{width}}  {r.size:>9,}  {r.out_size:>9,}  {r.out_size - r.size:>+8,}"
+              f"  {r.seconds * 1000:>7.1f}  {fired}")
+    size = sum(r.size for r in results)
+    out_size = sum(r.out_size for r in results)
+    print(f"  {'total':<{width}}  {size:>9,}  {out_size:>9,}  {out_size - size:>+8,}"
+          f"  {sum(r.seconds for r in results) * 1000:>7.1f}")
+
+
+def print_codemods():
+    codemods = registry.load().values()
+    width = max(len(c.name) for c in codemods)
+    for c in codemods:
+        flag = ' ' if c.default else '*'
+        print(f"  {c.name:<{width}} {flag} {c.help}")
+    print("\n  * not part of a default run; name it explicitly")
+
+
+def manifest_for(codemods: List[registry.Codemod], enabled: bool = True) -> Manifest:
+    """The manifest namespace and ruleset version for a selection of codemods."""
+    # Shared machinery (engine, tokenizer, ...) plus every rule module: a
+    # selected codemod may use snippets from one that is not selected
+    here = os.path.dirname(__file__)
+    shared = sorted(glob.glob(os.path.join(here, '*.py'))) + sorted(glob.glob(os.path.join(here, 'rules', '*.py')))
+    sources = dict.fromkeys(shared + [c.source for c in codemods])
+    return Manifest(' '.join(c.name for c in codemods), source_version(*sources), enabled=enabled)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog='python -m codemods',
+        description="Run the repo's HTML/TSX codemods, one read and write per file.",
+    )
+    parser.add_argument('codemods', nargs='*', metavar='NAME',
+                        help="codemods to run (default: all default codemods)")
+    parser.add_argument('--list', action='store_true', help="list codemods and exit")
+    parser.add_argument('--jobs', '-j', type=int, default=1,
+                        help="worker processes (0 = one per CPU, default 1)")
+    parser.add_argument('--no-cache', action='store_true',
+                        help="ignore and do not update the content-hash manifest")
+    parser.add_argument('--dry-run', '-n', action='store_true',
+                        help="write nothing; print unified diffs and a per-file summary")
+    parser.add_argument('--rule-budget', type=float, default=250, metavar='MS',
+                        help="match-time budget per rule and file in ms (0 = unlimited, default 250)")
+    parser.add_argument('--stream-above', type=int, default=1024, metavar='KB',
+                        help="memory-map and rewrite element by element files of at least "
+                             "KB kilobytes (0 = every file, default 1024); ignored by --dry-run")
+    parser.add_argument('--root', default=ROOT,
+                        help="repository root the target globs are relative to")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        print_codemods()
+        return 0
+    try:
+        selected = registry.select(args.codemods)
+    except KeyError as e:
+        parser.error(e.args[0])
+
+    names = [c.name for c in selected]
+    print(f"\n=== codemods: {', '.join(names)} ===\n")
+
+    manifest = manifest_for(selected, enabled=not args.no_cache)
+    root = os.path.abspath(args.root)
+    jobs = [
+        FileJob(root, path, tuple(codemods), manifest.fixed_points(os.path.join(root, path)),
+                args.dry_run, args.rule_budget / 1000, args.stream_above * 1024)
+        for path, codemods in registry.plan(selected, root).items()
+    ]
+    if not jobs:
+        print("  no target files found")
+        return 0
+    workers = min(resolve_jobs(args.jobs), len(jobs))
+    hits = Counter()
+    results = []
+
+    started = time.perf_counter()
+    for result in run_parallel(process_file, jobs, workers):
+        report(result, args.dry_run)
+        # Output cut short by the budget depends on machine load: never a fixed point
+        manifest.record(os.path.join(root, result.path), result.input_digest,
+                        '' if result.overruns else result.output_digest, skipped=result.cached)
+        hits += result.hits
+        results.append(result)
+    elapsed = time.perf_counter() - started
+    fixed = sum(r.changed for r in results)
+    if not args.dry_run:
+        manifest.save()
+
+    print_rule_hits(hits, selected)
+    print_overruns(results, args.rule_budget)
+    if args.dry_run:
+        print_summary_table(results)
+        print(f"\n  {fixed} would change / {len(jobs) - fixed} unchanged (dry run, nothing written)")
+    else:
+        print(f"\n  {fixed} fixed / {len(jobs) - fixed} unchanged")
+    print(f"  {format_throughput(len(jobs), sum(r.size for r in results), elapsed, workers)}")
+    compiled = patterns.stats()
+    print(f"  patterns: {compiled.patterns} compiled at import ({compiled.hits} reused), "
+          f"{sum(r.compiles for r in results)} compiled while rewriting")
+    regex = engine.Stats(*map(sum, zip(*(r.regex for r in results))))
+    print(f"  regex: {regex.attempts:,} match attempts, {regex.skipped:,} skipped by the "
+          f"required-literal prefilter ({regex.rules_skipped} rule/file pairs ruled out)")
+    print(f"  {manifest.summary()}")
+    print("\n=== Done ===\n")
+    overran = any(r.overruns for r in results)
+    return 1 if overran or (args.dry_run and fixed) else 0
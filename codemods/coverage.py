@@ -0,0 +1,208 @@
+"""
+codemods.coverage — which rules still fire, where, and what they cost.
+
+    python -m codemods.coverage [NAME ...] [-j N] [--json FILE] [--matrix]
+
+Runs every registered codemod (default: all of them, including the
+non-default ones) over every page — ``public/**/*.html`` and the ``src/``
+components, whether or not the codemod targets them — and builds a
+rule × file matrix:
+
+  hits     how often the rule fired when its codemod ran in full (later
+           phases see earlier phases' output, as in a real run)
+  time     the rule's own cost on the file, timed on its own in a
+           single-rule RuleSet — what retiring it would save
+
+Codemods without rule objects (plain transforms) count as one rule that
+"fires" when it changes the file.  Rules with no hits anywhere are listed
+as dead, with the share of total rule time they account for.  Nothing is
+written to the tree.
+"""
+
+import argparse
+import glob
+import json
+import os
+import time
+from collections import Counter
+from typing import Dict, List, NamedTuple, Tuple
+
+from . import registry
+from .cache import ROOT, read_text
+from .engine import Rule, RuleSet
+from .htmltok import ElementRule, ElementRuleSet
+from .runner import resolve_jobs, run_parallel
+
+PAGES = (
+    'public/**/*.html',
+    'src/**/*.js',
+    'src/**/*.jsx',
+    'src/**/*.ts',
+    'src/**/*.tsx',
+)
+
+
+class CoverageJob(NamedTuple):
+    root: str
+    path: str
+    codemods: Tuple[str, ...]
+    targeted: Tuple[str, ...]       # codemods whose globs include this file
+    repeat: int = 3
+
+
+class FileCoverage(NamedTuple):
+    path: str
+    hits: Counter                   # rule → hits in a full codemod run
+    seconds: Dict[str, float]       # rule → best-of-``repeat`` time on its own
+    targeted: Tuple[str, ...]
+
+
+def _best(func, repeat: int) -> Tuple[object, float]:
+    best = float('inf')
+    for _ in range(repeat):
+        t = time.perf_counter()
+        out = func()
+        best = min(best, time.perf_counter() - t)
+    return out, best
+
+
+def _single(rule):
+    if isinstance(rule, ElementRule):
+        return ElementRuleSet([rule])
+    if isinstance(rule, Rule):
+        return RuleSet([rule])
+    raise TypeError(f"unsupported rule type {type(rule).__name__}")
+
+
+def cover_file(job: CoverageJob) -> FileCoverage:
+    """Worker entry point: every codemod in context, then every rule alone."""
+    codemods = registry.load()
+    with open(os.path.join(job.root, job.path), 'rb') as f:
+        text = read_text(f.read())
+
+    hits = Counter()
+    seconds = {}
+    for name in job.codemods:
+        c = codemods[name]
+        result, elapsed = _best(lambda: c.apply(job.path, text), job.repeat)
+        hits.update(result.hits)
+        if not c.rules:
+            seconds[name] = elapsed
+            continue
+        for rule in c.rules:
+            if rule.name not in seconds:
+                _, seconds[rule.name] = _best(lambda: _single(rule).apply(text), job.repeat)
+    return FileCoverage(job.path, hits, seconds, job.targeted)
+
+
+def pages(root: str, codemods: List[registry.Codemod]) -> Dict[str, Tuple[str, ...]]:
+    """Every page in the tree → names of the codemods that target it."""
+    files = {}
+    for pattern in PAGES:
+        for path in glob.glob(os.path.join(root, pattern), recursive=True):
+            files.setdefault(os.path.relpath(path, root).replace(os.sep, '/'), ())
+    for path, names in registry.plan(codemods, root).items():
+        files[path] = tuple(names)
+    return dict(sorted(files.items()))
+
+
+# ─── Reporting ────────────────────────────────────────────────────────────────
+
+def summarise(results: List[FileCoverage], codemods: List[registry.Codemod]) -> List[dict]:
+    """One row per rule, in registry order."""
+    rows = []
+    seen = set()
+    for c in codemods:
+        for name in c.rule_names():
+            if name in seen:
+                continue
+            seen.add(name)
+            hit_files = [r for r in results if r.hits[name]]
+            rows.append({
+                'rule': name,
+                'codemod': c.name,
+                'hits': sum(r.hits[name] for r in hit_files),
+                'files_hit': len(hit_files),
+                'targets_hit': sum(c.name in r.targeted for r in hit_files),
+                'targets': sum(c.name in r.targeted for r in results),
+                'ms': sum(r.seconds.get(name, 0.0) for r in results) * 1000,
+            })
+    return rows
+
+
+def print_report(rows: List[dict], files: int):
+    width = max(len(r['rule']) for r in rows)
+    print(f"\n  {'rule':<{width}}  {'codemod':<20}  {'hits':>6}  {'files':>7}  {'targets':>9}  {'ms':>8}")
+    for r in rows:
+        dead = '  DEAD' if not r['hits'] else ''
+        print(f"  {r['rule']:<{width}}  {r['codemod']:<20}  {r['hits']:>6}  {r['files_hit']:>3}/{files:<3}"
+              f"  {r['targets_hit']:>4}/{r['targets']:<4}  {r['ms']:>8.2f}{dead}")
+
+    total = sum(r['ms'] for r in rows)
+    dead = [r for r in rows if not r['hits']]
+    dead_ms = sum(r['ms'] for r in dead)
+    print(f"\n  {len(dead)} of {len(rows)} rules never fire; they take {dead_ms:.1f} of {total:.1f} ms "
+          f"({dead_ms / total * 100 if total else 0:.0f}%) of rule time across {files} files")
+
+
+def print_matrix(results: List[FileCoverage], rows: List[dict]):
+    """Hits per rule (columns numbered as in the report) per file; '·' = none."""
+    print("\n--- Hit matrix ---")
+    for i, r in enumerate(rows, 1):
+        print(f"  {i:>3}  {r['rule']}")
+    width = max(len(r.path) for r in results)
+    print(f"\n  {'':<{width}}  " + ' '.join(f"{i:>3}" for i in range(1, len(rows) + 1)))
+    for result in results:
+        cells = ' '.join(f"{result.hits[r['rule']] or '·':>3}" for r in rows)
+        print(f"  {result.path:<{width}}  {cells}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m codemods.coverage',
+                                     description="Rule × file hit matrix for the whole tree.")
+    parser.add_argument('codemods', nargs='*', metavar='NAME',
+                        help="codemods to cover (default: every registered codemod)")
+    parser.add_argument('--jobs', '-j', type=int, default=0,
+                        help="worker processes (0 = one per CPU, the default)")
+    parser.add_argument('--repeat', type=int, default=3, help="timing runs per rule and file (best of)")
+    parser.add_argument('--matrix', action='store_true', help="also print the full rule × file matrix")
+    parser.add_argument('--json', metavar='FILE', help="write rows and the matrix as JSON")
+    parser.add_argument('--root', default=ROOT)
+    args = parser.parse_args(argv)
+
+    codemods = list(registry.load().values())
+    if args.codemods:
+        try:
+            codemods = registry.select(args.codemods)
+        except KeyError as e:
+            parser.error(e.args[0])
+    names = tuple(c.name for c in codemods)
+    root = os.path.abspath(args.root)
+    jobs = [CoverageJob(root, path, names, targeted, args.repeat)
+            for path, targeted in pages(root, codemods).items()]
+    workers = min(resolve_jobs(args.jobs), len(jobs))
+
+    print(f"\n=== codemod coverage: {len(names)} codemods × {len(jobs)} files, {workers} workers ===")
+    started = time.perf_counter()
+    results = list(run_parallel(cover_file, jobs, workers))
+    rows = summarise(results, codemods)
+    print_report(rows, len(results))
+    if args.matrix:
+        print_matrix(results, rows)
+    print(f"\n  {time.perf_counter() - started:.2f}s")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({
+                'rules': rows,
+                'files': {r.path: {'targeted': list(r.targeted), 'hits': dict(r.hits),
+                                   'ms': {k: v * 1000 for k, v in r.seconds.items()}}
+                          for r in results},
+            }, f, indent=1, ensure_ascii=False)
+        print(f"  results: {os.path.relpath(args.json)}")
+    return 0
+
+
+if __name__ == '__main__':
+    import sys
+    sys.exit(main())
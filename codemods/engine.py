@@ -0,0 +1,457 @@
+"""
+codemods.engine — single-pass, multi-rule rewrite engine.
+
+A ``Rule`` is one regex rewrite (pattern + template string or callable).
+Every rule has one or more literal *anchors*: strings each match must start
+with (derived from the pattern, or given explicitly).  A ``RuleSet`` compiles
+the anchors of all its rules into one alternation of escaped literals,
+longest first, and rewrites a document in ONE left-to-right scan.  That is
+not a multi-pattern automaton: sre skips ahead to the characters an anchor
+can start with, then tries the branches one by one with backtracking.  It
+does stay in C, and no rule's regex runs where none of its anchors starts:
+
+  1. find the next anchor occurrence,
+  2. try only the rules whose anchor sits there,
+  3. emit the unchanged slice + replacement into a list of chunks.
+
+Rules also have *required* literals: strings every match contains somewhere
+(the longest mandatory literal runs of the pattern, plus any passed as
+``requires=``).  At a rule's first anchor hit in a document they are looked
+up once; if one is missing the rule is dropped for that document and its
+regex never runs.  (Folding them into the scanner alternation instead was
+several times slower: common first characters defeat sre's skip-ahead.)
+
+The chunks are joined once at the end, so a RuleSet reads the input once and
+builds one output string, however many rules it holds.
+
+A leading ``\\s*`` is hoisted out of the scan (it would otherwise make every
+whitespace character a candidate position); the match start is extended back
+over the whitespace run instead, exactly as ``re.sub`` would find it.
+
+``stats()`` counts regex match attempts made and the attempts the required
+literal check avoided (one per anchor occurrence of a dropped rule).
+
+Semantics inside a RuleSet:
+  - the leftmost match wins; at the same offset, the rule declared first wins
+  - replacement text is never rescanned by other rules of the same set
+  - ``max_hits`` mirrors ``re.sub(count=...)``
+  - a match whose replacement equals the matched text is not counted as a hit
+
+Rules that must see another rule's output belong to a later RuleSet;
+a ``Pipeline`` runs RuleSets (phases) in order.
+
+Match-time budget: inside ``with budget(seconds) as b:`` every RuleSet times
+its match attempts, and the time adds up per rule name across every
+RuleSet applied in the block — all phases of a Pipeline, all codemods of
+a file.  A rule whose total passes ``seconds`` is stopped at that offset,
+recorded in ``b.overruns`` and skipped for the rest of the block.
+ElementRuleSets charge their tokenizer pass to each rule they run, and a
+codemod without rules (a plain transform) is metered as one rule under its
+own name (see ``registry.Codemod.apply``).  sre cannot be interrupted
+mid-match, so a single exponential attempt still runs to completion;
+``python -m codemods.lint`` flags the patterns that can do that.
+"""
+
+import re
+import time
+from collections import Counter
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Callable, Iterable, Iterator, List, NamedTuple, Optional, Set, Tuple, Union
+
+try:
+    from re import _constants as sre_constants, _parser as sre_parse
+except ImportError:         # Python < 3.11
+    import sre_constants
+    import sre_parse
+
+from .patterns import compiled
+
+Replacement = Union[str, Callable[[re.Match], str]]
+
+_LEADING_WS = r'\s*'
+_META = '\\.^$*+?{}[]|()'
+
+
+def literal_prefix(pattern: str) -> str:
+    """Longest literal every match of ``pattern`` must start with ('' if none).
+
+    Steps into leading ``(`` / ``(?:`` groups; gives up if any enclosing group
+    (or the top level) has an alternation or an optional quantifier.
+    """
+    n = len(pattern)
+    i = 0
+    lead = 0
+    while True:
+        if pattern.startswith('(?:', i):
+            i += 3
+        elif pattern.startswith('(', i) and not pattern.startswith('(?', i):
+            i += 1
+        else:
+            break
+        lead += 1
+
+    prefix = []
+    while i < n:
+        ch = pattern[i]
+        if ch == '\\' and i + 1 < n and not pattern[i + 1].isalnum():
+            lit, step = pattern[i + 1], 2
+        elif ch not in _META:
+            lit, step = ch, 1
+        else:
+            break
+        if i + step < n and pattern[i + step] in '*?{':
+            break
+        prefix.append(lit)
+        i += step
+    if not prefix:
+        return ''
+
+    depth = 0
+    open_lead = lead
+    j = 0
+    while j < n:
+        ch = pattern[j]
+        if ch == '\\':
+            j += 2
+            continue
+        if ch == '[':
+            j += 1
+            if pattern.startswith('^', j):
+                j += 1
+            if pattern.startswith(']', j):
+                j += 1
+            while j < n and pattern[j] != ']':
+                j += 2 if pattern[j] == '\\' else 1
+            j += 1
+            continue
+        if ch == '(':
+            depth += 1
+        elif ch == ')':
+            if depth <= open_lead:
+                open_lead = depth - 1
+                if pattern[j + 1:j + 2] in ('*', '?', '{'):
+                    return ''
+            depth -= 1
+        elif ch == '|' and depth <= open_lead:
+            return ''
+        j += 1
+    return ''.join(prefix)
+
+
+MIN_REQUIRED = 6        # shorter literals are too common to rule anything out
+MAX_REQUIRED = 3
+
+
+def required_literals(pattern: str, flags: int = 0) -> Tuple[str, ...]:
+    """The longest literal runs every match of ``pattern`` must contain.
+
+    Only runs outside alternations and optional parts count; repeats with a
+    minimum of one contribute their body once.
+    """
+    runs = []
+
+    def walk(seq, run):
+        for op, av in seq:
+            if op is sre_constants.LITERAL:
+                run.append(chr(av))
+                continue
+            if op is sre_constants.SUBPATTERN:
+                walk(av[3], run)
+                continue
+            runs.append(''.join(run))
+            run.clear()
+            if op in (sre_constants.MAX_REPEAT, sre_constants.MIN_REPEAT) and av[0] >= 1:
+                inner = []
+                walk(av[2], inner)
+                runs.append(''.join(inner))
+
+    top = []
+    walk(sre_parse.parse(pattern, flags), top)
+    runs.append(''.join(top))
+    runs = sorted({r for r in runs if len(r) >= MIN_REQUIRED}, key=lambda r: (-len(r), r))
+    return tuple(runs[:MAX_REQUIRED])
+
+
+@dataclass(frozen=True)
+class Rule:
+    """One regex rewrite: ``pattern`` → ``repl`` (template or callable)."""
+
+    name: str
+    pattern: str
+    repl: Replacement
+    flags: int = 0
+    max_hits: Optional[int] = None
+    anchors: Tuple[str, ...] = ()
+    requires: Tuple[str, ...] = ()
+    regex: re.Pattern = field(init=False, repr=False, compare=False)
+    body: re.Pattern = field(init=False, repr=False, compare=False)
+    lead_ws: bool = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        if self.flags & (re.IGNORECASE | re.VERBOSE):
+            raise ValueError(f"rule {self.name!r}: IGNORECASE/VERBOSE rules cannot be anchored")
+        lead_ws = self.pattern.startswith(_LEADING_WS)
+        body = self.pattern[len(_LEADING_WS):] if lead_ws else self.pattern
+        anchors = (self.anchors,) if isinstance(self.anchors, str) else tuple(self.anchors)
+        if not anchors:
+            prefix = literal_prefix(body)
+            if not prefix:
+                raise ValueError(f"rule {self.name!r}: no literal anchor in pattern, pass anchors=")
+            anchors = (prefix,)
+        if lead_ws and any(a[:1].isspace() for a in anchors):
+            raise ValueError(f"rule {self.name!r}: anchor after a leading \\s* must not start with whitespace")
+        requires = (self.requires,) if isinstance(self.requires, str) else tuple(self.requires)
+        derived = tuple(r for r in required_literals(body, self.flags) if r not in anchors)
+        object.__setattr__(self, 'anchors', anchors)
+        object.__setattr__(self, 'requires', tuple(dict.fromkeys(requires + derived)))
+        object.__setattr__(self, 'lead_ws', lead_ws)
+        object.__setattr__(self, 'regex', compiled(self.pattern, self.flags))
+        object.__setattr__(self, 'body', compiled(body, self.flags))
+
+    @classmethod
+    def literal(cls, name: str, old: str, new: str, max_hits: Optional[int] = None) -> 'Rule':
+        """Plain substring replacement, like ``str.replace``."""
+        return cls(name, re.escape(old), lambda m: new, max_hits=max_hits, anchors=(old,))
+
+    def expand(self, m: re.Match) -> str:
+        return self.repl(m) if callable(self.repl) else m.expand(self.repl)
+
+
+class RewriteResult(NamedTuple):
+    text: str
+    hits: Counter
+
+
+# ─── Required-literal prefilter stats ────────────────────────────────────────
+
+class Stats(NamedTuple):
+    attempts: int       # regex match attempts made
+    skipped: int        # attempts avoided: anchor hits of rules missing a required literal
+    rules_skipped: int  # (rule, document) pairs ruled out by a missing required literal
+
+
+_attempts = 0
+_skipped = 0
+_rules_skipped = 0
+
+
+def stats() -> Stats:
+    return Stats(_attempts, _skipped, _rules_skipped)
+
+
+# ─── Match-time budget ────────────────────────────────────────────────────────
+
+class Overrun(NamedTuple):
+    rule: str
+    offset: int         # anchor position of the attempt that exhausted the budget
+    seconds: float      # match time spent by the rule in the document so far
+
+
+class Budget:
+    """Per-rule match-time allowance for one document."""
+
+    def __init__(self, seconds: float):
+        self.seconds = seconds
+        self.spent: Counter = Counter()     # rule name → match seconds so far
+        self.overruns: List[Overrun] = []
+        self.skipped: Set[str] = set()
+
+    def overrun(self, rule: str, offset: int, seconds: float):
+        self.overruns.append(Overrun(rule, offset, seconds))
+        self.skipped.add(rule)
+
+
+_budget: Optional[Budget] = None
+
+
+@contextmanager
+def budget(seconds: Optional[float]) -> Iterator[Budget]:
+    """Enforce a per-rule match-time budget on RuleSets applied in the block.
+
+    ``seconds`` of 0 / None yields a Budget that is never enforced.
+    """
+    global _budget
+    previous = _budget
+    active = Budget(seconds or 0.0)
+    _budget = active if seconds else None
+    try:
+        yield active
+    finally:
+        _budget = previous
+
+
+def over_budget(rule: str) -> bool:
+    """Whether ``rule`` has used up its budget in the active block."""
+    return _budget is not None and rule in _budget.skipped
+
+
+def charge(rule: str, seconds: float, offset: int = 0) -> bool:
+    """Add match time to ``rule``; False once it is over budget."""
+    guard = _budget
+    if guard is None:
+        return True
+    guard.spent[rule] += seconds
+    if guard.spent[rule] <= guard.seconds:
+        return True
+    if rule not in guard.skipped:
+        guard.overrun(rule, offset, guard.spent[rule])
+    return False
+
+
+@contextmanager
+def metered(*rules: str, offset: int = 0) -> Iterator[Set[str]]:
+    """Charge the time spent in the block to each of ``rules``.
+
+    For matching done outside a RuleSet.  Yields a set that, after the
+    block, holds the rules it put over budget; their result should be
+    dropped, as a RuleSet drops the match that overran.
+    """
+    over: Set[str] = set()
+    start = time.perf_counter()
+    try:
+        yield over
+    finally:
+        seconds = time.perf_counter() - start
+        over.update(rule for rule in rules if not charge(rule, seconds, offset))
+
+
+class RuleSet:
+    """Rules compiled into one anchor scanner and applied in a single pass."""
+
+    def __init__(self, rules: Iterable[Rule]):
+        self.rules = tuple(rules)
+        names = [r.name for r in self.rules]
+        if len(names) != len(set(names)):
+            raise ValueError(f"duplicate rule names in {names}")
+
+        # first anchor char → rule indices, in declaration order
+        self._candidates = {}
+        anchors = set()
+        for i, rule in enumerate(self.rules):
+            for anchor in rule.anchors:
+                anchors.add(anchor)
+                bucket = self._candidates.setdefault(anchor[0], [])
+                if i not in bucket:
+                    bucket.append(i)
+        self._scanner = compiled('|'.join(
+            re.escape(a) for a in sorted(anchors, key=lambda a: (-len(a), a))
+        )) if anchors else None
+
+    def __add__(self, other: 'RuleSet') -> 'RuleSet':
+        return RuleSet(self.rules + other.rules)
+
+    def __len__(self):
+        return len(self.rules)
+
+    def __repr__(self):
+        return f"RuleSet({[r.name for r in self.rules]})"
+
+    def apply(self, text: str) -> RewriteResult:
+        global _attempts, _skipped, _rules_skipped
+        hits = Counter()
+        if self._scanner is None:
+            return RewriteResult(text, hits)
+
+        remaining = {i: r.max_hits for i, r in enumerate(self.rules) if r.max_hits is not None}
+        # rule index → whether its required literals are all in the text;
+        # decided at the rule's first anchor hit, before its regex ever runs
+        viable = {}
+        guard = _budget
+        if guard is not None:
+            clock = time.perf_counter
+            spent = guard.spent         # per rule name, carried across phases
+            for i, rule in enumerate(self.rules):
+                if rule.name in guard.skipped:
+                    remaining[i] = 0
+        attempts = skipped = 0
+        search = self._scanner.search
+        chunks = []
+        pos = 0          # end of the last emitted chunk
+        scan = 0         # where the next anchor search starts
+
+        while True:
+            a = search(text, scan)
+            if a is None:
+                break
+            q = a.start()
+
+            best = None  # (start, rule index)
+            for i in self._candidates[text[q]]:
+                if remaining.get(i, 1) <= 0:
+                    continue
+                rule = self.rules[i]
+                if not any(text.startswith(anchor, q) for anchor in rule.anchors):
+                    continue
+                ok = viable.get(i)
+                if ok is None:
+                    ok = viable[i] = all(r in text for r in rule.requires)
+                    if not ok:
+                        _rules_skipped += 1
+                if not ok:
+                    skipped += 1
+                    continue
+                start = q
+                if rule.lead_ws:
+                    while start > pos and text[start - 1].isspace():
+                        start -= 1
+                if best is not None and start >= best[0]:
+                    continue
+                attempts += 1
+                if guard is None:
+                    matched = rule.body.match(text, q) is not None
+                else:
+                    t = clock()
+                    matched = rule.body.match(text, q) is not None
+                    spent[rule.name] += clock() - t
+                    if spent[rule.name] > guard.seconds:
+                        guard.overrun(rule.name, q, spent[rule.name])
+                        remaining[i] = 0
+                        continue
+                if matched:
+                    best = (start, i)
+
+            if best is None:
+                scan = q + 1
+                continue
+
+            start, i = best
+            rule = self.rules[i]
+            # Match with the full pattern so templates and callables see the
+            # same match object a plain re.sub would hand them.
+            m = rule.regex.match(text, start)
+            replacement = rule.expand(m)
+            chunks.append(text[pos:start])
+            chunks.append(replacement)
+            if replacement != m.group(0):
+                hits[rule.name] += 1
+            pos = scan = m.end()
+            if i in remaining:
+                remaining[i] -= 1
+
+        _attempts += attempts
+        _skipped += skipped
+        chunks.append(text[pos:])
+        return RewriteResult(''.join(chunks), hits)
+
+
+class Pipeline:
+    """Ordered RuleSets; each phase sees the previous phase's output."""
+
+    def __init__(self, phases: Iterable[RuleSet]):
+        self.phases = tuple(phases)
+
+    def all_rules(self) -> tuple:
+        """Every rule (first of each name), in phase/declaration order."""
+        rules = {}
+        for phase in self.phases:
+            for rule in phase.rules:
+                rules.setdefault(rule.name, rule)
+        return tuple(rules.values())
+
+    def apply(self, text: str) -> RewriteResult:
+        hits = Counter()
+        for phase in self.phases:
+            text, phase_hits = phase.apply(text)
+            hits.update(phase_hits)
+        return RewriteResult(text, hits)
@@ -0,0 +1,348 @@
+"""
+codemods.lint — static backtracking check for codemod rule patterns.
+
+    python -m codemods.lint [NAME ...] [--strict]
+
+Parses every ``Rule`` pattern of the named codemods (default: all registered
+codemods), and every other pattern their modules compiled through
+``patterns.compiled`` (the regexes of plain-transform codemods, named
+``module.CONSTANT``), with the stdlib regex parser and reports:
+
+  error    nested quantifier — a repeated group whose body can end in a
+           repeat that also matches the start of the next iteration, e.g.
+           ``(a+)+`` or ``(?:\\s*x\\s*)*``: exponential on a failing input
+  warning  overlapping quantifiers — two unbounded repeats over overlapping
+           characters with at most one shared character between them,
+           e.g. ``\\s*\\n\\s*``: quadratic in the length of the run
+  warning  unbounded DOTALL ``.*`` / ``.*?`` — a failing attempt scans to the
+           end of the document, so a page full of anchors is quadratic
+
+Exits 1 on errors (or on warnings with ``--strict``).  Element rules have no
+backtracking and are not checked.
+"""
+
+import argparse
+import os
+import re
+import sys
+from typing import FrozenSet, List, NamedTuple, Tuple
+
+try:
+    from re import _constants as sre_constants, _parser as sre_parse
+except ImportError:         # Python < 3.11
+    import sre_constants
+    import sre_parse
+
+from . import patterns, registry
+from .engine import Rule
+
+# Characters the set arithmetic works over: ASCII, Latin-1 and Latin
+# Extended-A (Polish letters) are enough to tell whether two classes overlap.
+ALPHABET = frozenset(chr(c) for c in range(0x180))
+
+_CATEGORIES = {
+    'CATEGORY_DIGIT': r'\d', 'CATEGORY_NOT_DIGIT': r'\D',
+    'CATEGORY_SPACE': r'\s', 'CATEGORY_NOT_SPACE': r'\S',
+    'CATEGORY_WORD': r'\w', 'CATEGORY_NOT_WORD': r'\W',
+}
+_CATEGORY_SETS = {
+    name: frozenset(c for c in ALPHABET if re.fullmatch(cls, c))
+    for name, cls in _CATEGORIES.items()
+}
+
+_REPEATS = {sre_constants.MAX_REPEAT, sre_constants.MIN_REPEAT}
+_POSSESSIVE = getattr(sre_constants, 'POSSESSIVE_REPEAT', None)
+_ATOMIC = getattr(sre_constants, 'ATOMIC_GROUP', None)
+_UNBOUNDED = sre_constants.MAXREPEAT
+
+
+class Finding(NamedTuple):
+    rule: str
+    severity: str       # 'error' | 'warning'
+    kind: str
+    fragment: str
+    pattern: str
+
+
+# ─── Pattern model ────────────────────────────────────────────────────────────
+
+def _charset(op, av, dotall: bool) -> FrozenSet[str]:
+    """Characters a single-character item can consume."""
+    if op is sre_constants.LITERAL:
+        return frozenset((chr(av),))
+    if op is sre_constants.NOT_LITERAL:
+        return ALPHABET - {chr(av)}
+    if op is sre_constants.ANY:
+        return ALPHABET if dotall else ALPHABET - {'\n'}
+    if op is sre_constants.IN:
+        chars = set()
+        negate = False
+        for sub_op, sub_av in av:
+            if sub_op is sre_constants.NEGATE:
+                negate = True
+            elif sub_op is sre_constants.LITERAL:
+                chars.add(chr(sub_av))
+            elif sub_op is sre_constants.RANGE:
+                chars.update(chr(c) for c in range(sub_av[0], min(sub_av[1], 0x17F) + 1))
+            elif sub_op is sre_constants.CATEGORY:
+                chars.update(_CATEGORY_SETS.get(str(sub_av), ()))
+        return ALPHABET - chars if negate else frozenset(chars)
+    return frozenset()
+
+
+def _children(op, av) -> List[list]:
+    """Sub-sequences of a compound item."""
+    if op in _REPEATS or op is _POSSESSIVE:
+        return [av[2]]
+    if op is sre_constants.SUBPATTERN:
+        return [av[3]]
+    if op is sre_constants.BRANCH:
+        return list(av[1])
+    if op is _ATOMIC:
+        return [av]
+    return []
+
+
+def _is_repeat(op) -> bool:
+    return op in _REPEATS
+
+
+def _nullable_item(op, av) -> bool:
+    if op in _REPEATS or op is _POSSESSIVE:
+        return av[0] == 0 or _nullable(av[2])
+    if op is sre_constants.SUBPATTERN:
+        return _nullable(av[3])
+    if op is sre_constants.BRANCH:
+        return any(_nullable(b) for b in av[1])
+    if op is _ATOMIC:
+        return _nullable(av)
+    if op in (sre_constants.LITERAL, sre_constants.NOT_LITERAL, sre_constants.ANY, sre_constants.IN):
+        return False
+    return True     # anchors, lookarounds, group references: conservatively empty
+
+
+def _nullable(seq) -> bool:
+    return all(_nullable_item(op, av) for op, av in seq)
+
+
+def _alphabet(seq, dotall: bool) -> FrozenSet[str]:
+    """Every character ``seq`` can consume anywhere."""
+    chars = set()
+    for op, av in seq:
+        chars |= _charset(op, av, dotall)
+        if op not in (sre_constants.ASSERT, sre_constants.ASSERT_NOT):
+            for child in _children(op, av):
+                chars |= _alphabet(child, dotall)
+    return frozenset(chars)
+
+
+def _first(seq, dotall: bool) -> FrozenSet[str]:
+    """Characters a match of ``seq`` can start with."""
+    chars = set()
+    for op, av in seq:
+        chars |= _charset(op, av, dotall)
+        for child in _children(op, av):
+            chars |= _first(child, dotall)
+        if not _nullable_item(op, av):
+            break
+    return frozenset(chars)
+
+
+def _tail_repeats(seq) -> list:
+    """Unbounded repeats a match of ``seq`` can end in."""
+    tails = []
+    for op, av in reversed(seq):
+        if _is_repeat(op) and av[1] == _UNBOUNDED:
+            tails.append((op, av))
+        for child in _children(op, av):
+            tails.extend(_tail_repeats(child))
+        if not _nullable_item(op, av):
+            break
+    return tails
+
+
+# ─── Rendering (for messages only) ────────────────────────────────────────────
+
+_ESCAPES = {'\n': r'\n', '\t': r'\t', '\r': r'\r'}
+
+
+def _escape(ch: str) -> str:
+    if ch in _ESCAPES:
+        return _ESCAPES[ch]
+    return '\\' + ch if ch in '.^$*+?{}[]|()\\' else ch
+
+
+def _render(seq) -> str:
+    return ''.join(_render_item(op, av) for op, av in seq)
+
+
+def _render_item(op, av) -> str:
+    if op is sre_constants.LITERAL:
+        return _escape(chr(av))
+    if op is sre_constants.NOT_LITERAL:
+        return f'[^{_escape(chr(av))}]'
+    if op is sre_constants.ANY:
+        return '.'
+    if op is sre_constants.IN:
+        parts = []
+        for sub_op, sub_av in av:
+            if sub_op is sre_constants.NEGATE:
+                parts.append('^')
+            elif sub_op is sre_constants.LITERAL:
+                parts.append(_escape(chr(sub_av)))
+            elif sub_op is sre_constants.RANGE:
+                parts.append(f'{chr(sub_av[0])}-{chr(sub_av[1])}')
+            elif sub_op is sre_constants.CATEGORY:
+                parts.append(_CATEGORIES.get(str(sub_av), '?'))
+        if len(parts) == 1 and parts[0].startswith('\\') and len(parts[0]) == 2:
+            return parts[0]
+        return '[' + ''.join(parts) + ']'
+    if op in _REPEATS or op is _POSSESSIVE:
+        lo, hi, body = av
+        quant = {(0, _UNBOUNDED): '*', (1, _UNBOUNDED): '+', (0, 1): '?'}.get(
+            (lo, hi), f'{{{lo},{"" if hi == _UNBOUNDED else hi}}}')
+        if op is sre_constants.MIN_REPEAT:
+            quant += '?'
+        inner = _render(body)
+        if len(body) != 1 or body[0][0] in (sre_constants.SUBPATTERN, sre_constants.BRANCH):
+            if not (len(body) == 1 and body[0][0] is sre_constants.SUBPATTERN):
+                inner = f'(?:{inner})'
+        return inner + quant
+    if op is sre_constants.SUBPATTERN:
+        group = av[0]
+        return f'({_render(av[3])})' if group else f'(?:{_render(av[3])})'
+    if op is sre_constants.BRANCH:
+        return '|'.join(_render(b) for b in av[1])
+    if op is sre_constants.AT:
+        return {'AT_BEGINNING': '^', 'AT_END': '$', 'AT_BOUNDARY': r'\b'}.get(str(av), '')
+    return '…'
+
+
+# ─── Checks ───────────────────────────────────────────────────────────────────
+
+def analyse(pattern: str, flags: int = 0, name: str = '') -> List[Finding]:
+    """Backtracking hazards in one pattern."""
+    parsed = sre_parse.parse(pattern, flags)
+    dotall = bool(parsed.state.flags & re.DOTALL)
+    findings = []
+
+    def report(severity, kind, seq):
+        findings.append(Finding(name, severity, kind, _render(seq), pattern))
+
+    def walk(seq):
+        for index, (op, av) in enumerate(seq):
+            if _is_repeat(op):
+                lo, hi, body = av
+                if hi == _UNBOUNDED and op is not _POSSESSIVE:
+                    _check_nested(op, av, report, dotall)
+                    _check_overlap(seq, index, report, dotall)
+                    if len(body) == 1 and body[0][0] is sre_constants.ANY and dotall:
+                        report('warning', 'unbounded DOTALL scan', [(op, av)])
+            for child in _children(op, av):
+                walk(child)
+
+    walk(parsed)
+    return findings
+
+
+def _check_nested(op, av, report, dotall):
+    """``(x+)+``: the inner repeat can end an iteration the next one could start."""
+    body = av[2]
+    if _nullable(body):
+        report('error', 'nested quantifier (body can match empty)', [(op, av)])
+        return
+    start = _first(body, dotall)
+    for tail in _tail_repeats(body):
+        if _alphabet(tail[1][2], dotall) & start:
+            report('error', 'nested quantifier', [(op, av)])
+            return
+
+
+def _check_overlap(seq, index, report, dotall):
+    """``\\s*\\n\\s*``: two repeats that can trade characters between them.
+
+    At most one required character may separate them; a longer literal in
+    between (``[^>]*id="x"[^>]*``) only splits where it occurs, which is rare.
+    """
+    op, av = seq[index]
+    left = _alphabet(av[2], dotall)
+    between = []
+    for next_op, next_av in seq[index + 1:]:
+        if _is_repeat(next_op) and next_av[1] == _UNBOUNDED:
+            shared = left & _alphabet(next_av[2], dotall)
+            required = [item for item in between if not _nullable_item(*item)]
+            if shared and len(required) <= 1 and all(_alphabet([item], dotall) <= shared
+                                                     for item in required):
+                report('warning', 'overlapping quantifiers', [seq[index]] + between + [(next_op, next_av)])
+            return
+        if not (_nullable_item(next_op, next_av) or _charset(next_op, next_av, dotall)):
+            return      # a group or anything else ends the run
+        between.append((next_op, next_av))
+
+
+def lint_rules(rules) -> List[Finding]:
+    findings = []
+    for rule in rules:
+        if isinstance(rule, Rule):
+            findings.extend(analyse(rule.pattern, rule.flags, rule.name))
+    return findings
+
+
+def module_patterns(sources) -> List[Tuple[str, re.Pattern]]:
+    """(``module.CONSTANT``, regex) of the registered patterns compiled by the modules at ``sources``."""
+    sources = {os.path.abspath(s) for s in sources}
+    found = []
+    for regex, origin in patterns.registered().items():
+        module = sys.modules.get(origin)
+        if module is None or os.path.abspath(getattr(module, '__file__', '') or '') not in sources:
+            continue
+        names = [k for k, v in vars(module).items() if v is regex]
+        short = origin.rpartition('.')[2]
+        found.append((f"{short}.{names[0]}" if names else f"{short}:{regex.pattern[:40]!r}", regex))
+    return sorted(found, key=lambda item: item[0])
+
+
+def lint_patterns(named) -> List[Finding]:
+    findings = []
+    for name, regex in named:
+        findings.extend(analyse(regex.pattern, regex.flags & ~re.UNICODE, name))
+    return findings
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m codemods.lint',
+                                     description="Flag codemod rule patterns that can backtrack badly.")
+    parser.add_argument('codemods', nargs='*', metavar='NAME',
+                        help="codemods to check (default: every registered codemod)")
+    parser.add_argument('--strict', action='store_true', help="exit 1 on warnings too")
+    args = parser.parse_args(argv)
+
+    codemods = registry.load()
+    names = args.codemods or list(codemods)
+    unknown = [n for n in names if n not in codemods]
+    if unknown:
+        parser.error(f"unknown codemod(s): {', '.join(unknown)}")
+
+    seen = set()
+    rules = []
+    for name in names:
+        for rule in codemods[name].rules:
+            if rule.name not in seen:
+                seen.add(rule.name)
+                rules.append(rule)
+
+    # Rule objects compile in codemods.engine, so only the modules' own regexes show up here
+    named = module_patterns({codemods[name].source for name in names})
+    findings = lint_rules(rules) + lint_patterns(named)
+    for f in findings:
+        mark = '✗' if f.severity == 'error' else '!'
+        print(f"  {mark} {f.rule}: {f.kind}: {f.fragment}")
+    errors = sum(f.severity == 'error' for f in findings)
+    warnings = len(findings) - errors
+    checked = sum(isinstance(r, Rule) for r in rules) + len(named)
+    print(f"\n  {checked} patterns checked: {errors} errors, {warnings} warnings")
+    return 1 if errors or (args.strict and warnings) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
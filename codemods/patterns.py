@@ -0,0 +1,55 @@
+"""
+codemods.patterns — one compiled regex per (pattern, flags), process-wide.
+
+``re.sub(pattern_string, ...)`` goes through ``re``'s internal cache, which
+holds a few hundred entries and is shared with everything else in the
+process; with dozens of rule patterns per page that cache churns and
+patterns get recompiled page after page.  Codemods compile through here
+instead, once, at import time, as module constants:
+
+    NAV_BLOCK = patterns.compiled(r'<nav>.*?</nav>', re.DOTALL)
+
+``stats()`` reports how many patterns exist, how often one was compiled and
+how often an existing one was reused.  After import, ``compiles`` must stay
+flat however many pages a run rewrites (the CLI prints it).  ``registered()``
+lists every pattern with the module that first asked for it, so
+``python -m codemods.lint`` can check the ones outside any ``Rule`` too.
+"""
+
+import re
+import sys
+from typing import Dict, NamedTuple, Tuple
+
+_compiled: Dict[Tuple[str, int], re.Pattern] = {}
+_origins: Dict[Tuple[str, int], str] = {}
+_compiles = 0
+_hits = 0
+
+
+class Stats(NamedTuple):
+    patterns: int
+    compiles: int       # re.compile calls made
+    hits: int           # requests served by an already compiled pattern
+
+
+def compiled(pattern: str, flags: int = 0) -> re.Pattern:
+    """The compiled form of ``pattern``, compiling it on first use only."""
+    global _compiles, _hits
+    key = (pattern, flags)
+    regex = _compiled.get(key)
+    if regex is None:
+        regex = _compiled[key] = re.compile(pattern, flags)
+        _origins[key] = sys._getframe(1).f_globals.get('__name__', '?')
+        _compiles += 1
+    else:
+        _hits += 1
+    return regex
+
+
+def stats() -> Stats:
+    return Stats(len(_compiled), _compiles, _hits)
+
+
+def registered() -> Dict[re.Pattern, str]:
+    """Every compiled pattern → the module that compiled it first."""
+    return {regex: _origins[key] for key, regex in _compiled.items()}
@@ -0,0 +1,121 @@
+"""
+codemods.registry — every codemod in the repo, by name.
+
+A codemod is a transform ``(path, text) -> text`` (or ``RewriteResult``) plus
+the repo-relative globs it applies to; ``path`` is the repo-relative target
+with forward slashes.  Rule modules under ``codemods/rules/`` register
+themselves with ``@codemod`` when imported.
+
+``plan`` groups the selected codemods by target file and ``apply`` runs all
+of a file's codemods in memory, in registry order, so a full run reads and
+writes every file at most once.
+"""
+
+import glob
+import inspect
+import os
+from collections import Counter
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, List, Tuple, Union
+
+from .cache import ROOT
+from .engine import RewriteResult, metered, over_budget
+
+Transform = Callable[[str, str], Union[str, RewriteResult]]
+
+
+@dataclass(frozen=True)
+class Codemod:
+    name: str
+    targets: Tuple[str, ...]
+    transform: Transform
+    help: str = ''
+    rules: tuple = ()               # Rule / ElementRule objects, for hit tables and benchmarks
+    regions: Tuple[str, ...] = ()   # tags its edits stay inside (enables codemods.stream)
+    default: bool = True            # part of a bare ``python -m codemods`` run
+    source: str = ''                # defining module, hashed into cache versions
+
+    def apply(self, path: str, text: str) -> RewriteResult:
+        if self.rules:
+            out = self.transform(path, text)        # its RuleSets keep their own budget
+        else:
+            # A plain transform (its own regexes and scanning) counts as one rule, its name
+            if over_budget(self.name):
+                return RewriteResult(text, Counter())
+            with metered(self.name) as over:
+                out = self.transform(path, text)
+            if over:
+                return RewriteResult(text, Counter())
+        if isinstance(out, RewriteResult):
+            return out
+        return RewriteResult(out, Counter({self.name: 1}) if out != text else Counter())
+
+    def rule_names(self) -> Tuple[str, ...]:
+        return tuple(r.name for r in self.rules) or (self.name,)
+
+
+REGISTRY: Dict[str, Codemod] = {}
+
+
+def codemod(name: str, *targets: str, rules: Iterable = (), regions: Iterable[str] = (),
+            default: bool = True):
+    """Register the decorated ``(path, text)`` transform under ``name``.
+
+    ``regions`` declares that every edit falls inside one of those elements
+    (e.g. ``('nav', 'footer')``), so large files can be rewritten element
+    by element (see ``codemods.stream``).
+    """
+    def register(func: Transform) -> Transform:
+        if name in REGISTRY:
+            raise ValueError(f"codemod {name!r} registered twice")
+        doc = inspect.getdoc(func) or ''
+        REGISTRY[name] = Codemod(
+            name, targets, func,
+            help=doc.splitlines()[0] if doc else '',
+            rules=tuple(rules),
+            regions=tuple(regions),
+            default=default,
+            source=inspect.getsourcefile(func),
+        )
+        return func
+    return register
+
+
+def load() -> Dict[str, Codemod]:
+    """Import every rule module (registration is an import side effect)."""
+    from . import rules  # noqa: F401
+    return REGISTRY
+
+
+def select(names: Iterable[str] = ()) -> List[Codemod]:
+    """Codemods by name, in registry order; no names means every default one."""
+    load()
+    names = list(names)
+    if not names:
+        return [c for c in REGISTRY.values() if c.default]
+    unknown = [n for n in names if n not in REGISTRY]
+    if unknown:
+        raise KeyError(f"unknown codemod(s): {', '.join(unknown)}")
+    return [c for c in REGISTRY.values() if c.name in names]
+
+
+def plan(codemods: Iterable[Codemod], root: str = ROOT) -> Dict[str, List[str]]:
+    """Target path → names of the codemods that touch it (sorted by path)."""
+    files = {}
+    for c in codemods:
+        for pattern in c.targets:
+            for path in glob.glob(os.path.join(root, pattern), recursive=True):
+                rel = os.path.relpath(path, root).replace(os.sep, '/')
+                names = files.setdefault(rel, [])
+                if c.name not in names:
+                    names.append(c.name)
+    return dict(sorted(files.items()))
+
+
+def apply(path: str, text: str, names: Iterable[str]) -> RewriteResult:
+    """Run the named codemods over one file's text, in order."""
+    hits = Counter()
+    for name in names:
+        text, codemod_hits = REGISTRY[name].apply(path, text)
+        hits.update(codemod_hits)
+    return RewriteResult(text, hits)
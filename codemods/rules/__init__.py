@@ -0,0 +1,7 @@
+"""
+Rule modules.  Importing this package registers every codemod; the import
+order below is the order codemods run in when several touch the same file.
+"""
+
+from . import knowledge_base, js_auth, nav_footer, user_profile  # noqa: F401
+from . import components, app  # noqa: F401
@@ -1,14 +1,14 @@
-with open('src/App.jsx', 'r') as f:
-    content = f.read()
+"""
+codemods.rules.app — wrap App.jsx result/settings routes in the shared
+Layout instead of <><Page /><Footer /></> (formerly update_app.py).
 
-# Replace import
-content = content.replace(
-    "import Footer from './components/Footer'",
-    "import Layout from './components/shared/Layout'"
-)
+Targets the old ``./components/Footer`` import; not part of a default run.
+"""
+
+from ..registry import codemod
 
 # Results pages
-replacements = [
+LAYOUT_REPLACEMENTS = [
     (
         "return <><HexacoResults /><Footer /></>",
         "return <Layout isAuthenticated={!!user} activeLink=\"tests\"><HexacoResults /></Layout>"
@@ -47,14 +47,14 @@ replacements = [
     ),
 ]
 
-for old, new in replacements:
-    if old in content:
-        content = content.replace(old, new)
-        print(f"replaced: {old[:55]}")
-    else:
-        print(f"NOT FOUND: {old[:55]}")
-
-with open('src/App.jsx', 'w') as f:
-    f.write(content)
 
-print("Done.")
+@codemod('app-layout', 'src/App.jsx', default=False)
+def use_layout(path: str, content: str) -> str:
+    """<><Page /><Footer /></> → <Layout>…</Layout> in App.jsx routes."""
+    content = content.replace(
+        "import Footer from './components/Footer'",
+        "import Layout from './components/shared/Layout'"
+    )
+    for old, new in LAYOUT_REPLACEMENTS:
+        content = content.replace(old, new)
+    return content
@@ -0,0 +1,245 @@
+"""
+codemods.rules.components — one-off nav migrations of the React components
+(formerly the CharacterSheet/Dashboard steps of fix_all_navs.py,
+fix_nav_components.py and update_components.py).
+
+These were written against older component trees and are not part of a
+default run; name them explicitly, e.g. ``python -m codemods cs-main-nav``.
+"""
+
+import re
+
+from ..patterns import compiled
+from ..registry import codemod
+
+CHARACTER_SHEET = 'src/components/CharacterSheet/CharacterSheet.tsx'
+DASHBOARD = 'src/components/Dashboard/NewUserDashboard.tsx'
+SETTINGS = 'src/components/Settings/Settings.tsx'
+
+TOP_NAV_START = '      {/* TOP NAV */}\n      {!demoMode && (!isPublic ? (\n      <nav className="border-b border-white/5 bg-bg-surface/80 backdrop-blur-xl sticky top-0 z-50 nav-neural">'
+
+MAIN_NAV_BLOCK = '''      {/* TOP NAV */}
+      {!demoMode && (!isPublic ? (
+        <MainNav activeLink="character" theme={theme} onThemeToggle={() => setTheme((t) => (t === 'light' ? 'dark' : 'light'))} />
+      ) : (
+      <nav className="border-b border-white/5 bg-bg-surface/80 backdrop-blur-xl sticky top-0 z-50 nav-neural">
+        <div className="max-w-7xl mx-auto px-3 sm:px-6 py-3">
+          <div className="flex items-center justify-between gap-4">
+            <AlchemeLogo href="/" size={32} />
+            <a
+              href="/auth"
+              className="inline-flex items-center gap-2 px-3 sm:px-5 py-2 sm:py-2.5 rounded-xl text-xs sm:text-sm font-semibold text-white transition-all"
+              style={{
+                background: 'linear-gradient(120deg, rgba(112,0,255,.75) 0%, rgba(0,200,220,.8) 100%)',
+                boxShadow: '0 0 18px -4px rgba(0,240,255,.35)',
+                textDecoration: 'none',
+              }}
+            >
+              Stwórz swoją kartę
+              <svg width="14" height="14" fill="none" stroke="currentColor" strokeWidth="2.2" viewBox="0 0 24 24"><path strokeLinecap="round" strokeLinejoin="round" d="M5 12h14M13 6l6 6-6 6"/></svg>
+            </a>
+          </div>
+        </div>
+      </nav>
+      ))}'''
+
+TOP_NAV_BLOCK = '''      {/* TOP NAV */}
+      {!demoMode && (!isPublic ? (
+        <MainNav activeLink="character" theme={theme} onThemeToggle={() => setTheme((t) => (t === 'light' ? 'dark' : 'light'))} />
+      ) : (
+      <nav className="border-b border-white/5 bg-bg-surface/80 backdrop-blur-xl sticky top-0 z-50 nav-neural">
+        <div className="max-w-7xl mx-auto px-3 sm:px-6 py-3">
+          <div className="flex items-center justify-between gap-4">
+            <AlchemeLogo href="/" size={32} />
+            <a
+              href="/auth"
+              className="inline-flex items-center gap-2 px-3 sm:px-5 py-2 sm:py-2.5 rounded-xl text-xs sm:text-sm font-semibold text-white transition-all"
+              style={{
+                background: 'linear-gradient(120deg, rgba(112,0,255,.75) 0%, rgba(0,200,220,.8) 100%)',
+                boxShadow: '0 0 18px -4px rgba(0,240,255,.35)',
+                textDecoration: 'none',
+              }}
+            >
+              Stwórz swoją kartę
+              <svg width="14" height="14" fill="none" stroke="currentColor" strokeWidth="2.2" viewBox="0 0 24 24"><path strokeLinecap="round" strokeLinejoin="round" d="M5 12h14M13 6l6 6-6 6"/></svg>
+            </a>
+          </div>
+        </div>
+      </nav>
+      ))}
+'''
+
+OLD_NUD_NAV = '      {/* NAVBAR */}\n      <nav className="border-b border-white/5 bg-bg-surface/80 backdrop-blur-md sticky top-0 z-50">'
+
+SETTINGS_OLD_NAV = """      {/* ── Navigation bar ── */}
+      <nav style={{
+        position: 'sticky', top: 0, zIndex: 100,
+        background: 'rgba(13,15,43,.8)', backdropFilter: 'blur(20px)',
+        borderBottom: '1px solid rgba(255,255,255,.07)',
+        padding: '0 24px',
+      }}>
+        <div style={{ maxWidth: 1100, margin: '0 auto', height: 60, display: 'flex', alignItems: 'center', justifyContent: 'space-between' }}>
+          <button
+            onClick={() => window.location.href = '/user-profile-tests.html'}
+            style={{ display: 'flex', alignItems: 'center', gap: 8, background: 'none', border: 'none', color: 'rgba(255,255,255,.5)', cursor: 'pointer', fontSize: 14, fontFamily: 'Space Grotesk, sans-serif', fontWeight: 600, padding: '6px 10px', borderRadius: 8, transition: 'color .2s' }}
+            onMouseEnter={e => (e.target as HTMLElement).style.color = '#fff'}
+            onMouseLeave={e => (e.target as HTMLElement).style.color = 'rgba(255,255,255,.5)'}
+          >
+            ← Wróć
+          </button>
+          <span style={{ fontSize: 15, fontWeight: 700, letterSpacing: '.5px' }}>Ustawienia konta</span>
+          <div style={{ width: 80 }} />
+        </div>
+      </nav>"""
+
+SETTINGS_SUBHEADER = """      {/* ── Page sub-header ── */}
+      <div style={{
+        borderBottom: '1px solid rgba(255,255,255,.07)',
+        padding: '0 24px',
+        background: 'rgba(13,15,43,.4)',
+      }}>
+        <div style={{ maxWidth: 1100, margin: '0 auto', height: 52, display: 'flex', alignItems: 'center', justifyContent: 'space-between' }}>
+          <button
+            onClick={() => window.location.href = '/user-profile-tests'}
+            style={{ display: 'flex', alignItems: 'center', gap: 8, background: 'none', border: 'none', color: 'rgba(255,255,255,.4)', cursor: 'pointer', fontSize: 13, fontFamily: 'Space Grotesk, sans-serif', fontWeight: 600, padding: '6px 10px', borderRadius: 8, transition: 'color .2s' }}
+            onMouseEnter={e => (e.target as HTMLElement).style.color = '#fff'}
+            onMouseLeave={e => (e.target as HTMLElement).style.color = 'rgba(255,255,255,.4)'}
+          >
+            ← Wróć
+          </button>
+          <span style={{ fontSize: 14, fontWeight: 700, letterSpacing: '.5px', color: 'rgba(255,255,255,.7)' }}>Ustawienia konta</span>
+          <div style={{ width: 80 }} />
+        </div>
+      </div>"""
+
+
+TOP_NAV_CONDITIONAL = compiled(r'(\s+\{/\* TOP NAV \*/\}\s+\{!demoMode &&.*?)\}\}\)\}\s*\n(\s+<main)', re.DOTALL)
+MAIN_OPEN = compiled(r'\s*\n(\s+<main)')
+MOBILE_MENU_STATE = compiled(r'\s+const \[mobileMenuOpen, setMobileMenuOpen\] = useState\(false\);\n')
+MOBILE_MENU_STATE_LINE = compiled(r'  const \[mobileMenuOpen, setMobileMenuOpen\] = useState\(false\);\n')
+FIRST_IMPORT = compiled(r'(import[^\n]+\n)')
+SETTINGS_NAV_BAR = compiled(r'\s*\{/\* ── Navigation bar ── \*/\}\s*<nav style=\{.*?\}\s*</nav>', re.DOTALL)
+
+
+# ─── CharacterSheet.tsx: TOP NAV → MainNav ────────────────────────────────
+
+@codemod('cs-top-nav', CHARACTER_SHEET, default=False)
+def replace_top_nav(path: str, content: str) -> str:
+    """Regex variant: TOP NAV block up to <main> → MainNav + public nav."""
+    # Pattern: from {/* TOP NAV */} through end of nav conditional
+    old = TOP_NAV_CONDITIONAL.search(content)
+    if old:
+        end = old.end(1) + len('))}')
+
+        # Find what's immediately after the nav conditional
+        after_nav = content[end:]
+        # Find the <main start
+        main_match = MAIN_OPEN.search(after_nav)
+        if main_match:
+            end = end + main_match.start()
+
+        content = content[:old.start(1)] + TOP_NAV_BLOCK + content[end:]
+
+    # Add MainNav import after AlchemeLogo import
+    if "import MainNav" not in content:
+        content = content.replace(
+            "import AlchemeLogo from '../AlchemeLogo';",
+            "import AlchemeLogo from '../AlchemeLogo';\nimport MainNav from '../shared/MainNav';"
+        )
+
+    # Remove mobileMenuOpen state since MainNav handles it
+    old_state = MOBILE_MENU_STATE.search(content)
+    if old_state:
+        content = content[:old_state.start()] + '\n' + content[old_state.end():]
+    return content
+
+
+@codemod('cs-main-nav', CHARACTER_SHEET, default=False)
+def fix_character_sheet(path: str, cs: str) -> str:
+    """Marker variant: TOP NAV block up to <main> → MainNav + public nav."""
+    # Add import
+    if "import MainNav" not in cs:
+        cs = cs.replace(
+            "import AlchemeLogo from '../AlchemeLogo';",
+            "import AlchemeLogo from '../AlchemeLogo';\nimport MainNav from '../shared/MainNav';"
+        )
+
+    # Replace the big authenticated nav block:
+    # Find from '{/* TOP NAV */}' to the end of '))}' that closes the nav conditional
+    # The block ends right before <main
+    if TOP_NAV_START in cs:
+        # Find the start of the auth nav block
+        start_idx = cs.find('      {/* TOP NAV */}')
+        # Find the end - the public nav closing
+        end_marker = '      ))}\n\n      <main'
+        end_idx = cs.find(end_marker)
+        if end_idx == -1:
+            end_marker = '      ))}\n      <main'
+            end_idx = cs.find(end_marker)
+
+        if start_idx != -1 and end_idx != -1:
+            cs = cs[:start_idx] + MAIN_NAV_BLOCK + '\n\n      <main' + cs[end_idx + len(end_marker):]
+
+    # Remove mobileMenuOpen state since MainNav handles it now
+    return MOBILE_MENU_STATE_LINE.sub('', cs)
+
+
+# ─── NewUserDashboard.tsx: NAVBAR → MainNav ───────────────────────────────
+
+@codemod('dashboard-main-nav', DASHBOARD, default=False)
+def fix_dashboard(path: str, nud: str) -> str:
+    """Inline NAVBAR <nav> → MainNav."""
+    if "import MainNav" not in nud:
+        if "import AlchemeLogo" in nud:
+            nud = nud.replace(
+                "import AlchemeLogo",
+                "import MainNav from '../shared/MainNav';\nimport AlchemeLogo"
+            )
+        else:
+            # Find first import and add after it
+            nud = FIRST_IMPORT.sub(r'\1import MainNav from \'../shared/MainNav\';\n', nud, count=1)
+
+    if OLD_NUD_NAV in nud:
+        # Find nav end </nav> after this
+        nav_start = nud.find(OLD_NUD_NAV)
+        nav_end = nud.find('      </nav>', nav_start) + len('      </nav>')
+        nud = nud[:nav_start] + '      {/* NAVBAR */}\n      <MainNav activeLink="tests" />' + nud[nav_end:]
+    return nud
+
+
+# ─── MainNav → Navbar ─────────────────────────────────────────────────────
+
+@codemod('navbar-component', CHARACTER_SHEET, DASHBOARD, default=False)
+def main_nav_to_navbar(path: str, src: str) -> str:
+    """MainNav → shared Navbar in CharacterSheet and NewUserDashboard."""
+    src = src.replace(
+        "import MainNav from '../shared/MainNav';",
+        "import Navbar from '../shared/Navbar';"
+    )
+    if path == CHARACTER_SHEET:
+        return src.replace(
+            "<MainNav activeLink=\"character\" theme={theme} onThemeToggle={() => setTheme((t) => (t === 'light' ? 'dark' : 'light'))} />",
+            "<Navbar isAuthenticated={true} activeLink=\"character\" theme={theme} onThemeToggle={() => setTheme((t) => (t === 'light' ? 'dark' : 'light'))} />"
+        )
+    src = src.replace(
+        "<MainNav activeLink=\"tests\" />",
+        "<Navbar isAuthenticated={true} activeLink=\"tests\" />"
+    )
+    return src.replace(
+        "<MainNav activeLink='tests' />",
+        "<Navbar isAuthenticated={true} activeLink='tests' />"
+    )
+
+
+# ─── Settings.tsx: internal <nav> → page sub-header ───────────────────────
+
+@codemod('settings-subheader', SETTINGS, default=False)
+def settings_subheader(path: str, st: str) -> str:
+    """Settings' own sticky <nav> → a plain sub-header under the shared Navbar."""
+    if SETTINGS_OLD_NAV in st:
+        return st.replace(SETTINGS_OLD_NAV, SETTINGS_SUBHEADER)
+    # Try regex approach for minor whitespace differences
+    match = SETTINGS_NAV_BAR.search(st)
+    if match:
+        st = st[:match.start()] + '\n' + SETTINGS_SUBHEADER + st[match.end():]
+    return st
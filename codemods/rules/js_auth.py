@@ -0,0 +1,144 @@
+"""
+codemods.rules.js_auth — the logged-in nav of the static pages comes from
+one shared module, ``public/nav-auth.js``, instead of an inline auth script
+per page (formerly fix_js_auth.py, which kept Baza Wiedzy in those inline
+``innerHTML`` templates).
+
+Every page used to import supabase-js from jsDelivr, await ``getSession()``
+and only then swap ``nav-links`` / ``nav-actions`` / ``mobile-menu-content``.
+This codemod cuts that session block (and whatever it leaves unused: the SVG
+constants, the client, the import) out of the inline script, drops the
+script if nothing else is left in it, and links the module instead —
+``<link rel="modulepreload">`` in ``<head>``, the ``<script>`` where the
+inline one was.  ``python -m sitebuild`` gives the module a hashed name.
+"""
+
+import re
+from typing import Optional, Tuple
+
+from ..htmltok import locate
+from ..patterns import compiled
+from ..registry import codemod
+
+AUTH_PAGES = (
+    'public/index.html',
+    'public/methodology.html',
+    'public/pricing.html',
+    'public/baza-wiedzy/**/*.html',
+)
+
+NAV_AUTH_SRC = '/nav-auth.js'
+NAV_AUTH_PRELOAD = f'<link rel="modulepreload" href="{NAV_AUTH_SRC}">'
+NAV_AUTH_SCRIPT = f'<script type="module" src="{NAV_AUTH_SRC}"></script>'
+
+SESSION = compiled(r'const\s*\{\s*data\s*:\s*\{\s*session\s*\}\s*\}\s*=\s*await\s+supabase\.auth\.getSession\(\)\s*;\s*'
+                   r'if\s*\(\s*session\s*\)\s*\{')
+ASYNC_IIFE_OPEN = compiled(r'\(\s*async\s*\(\s*\)\s*=>\s*\{\s*$')
+ASYNC_IIFE_CLOSE = compiled(r'\s*\}\s*\)\s*\(\s*\)\s*;?')
+NAV_SWAP = compiled(r"getElementById\(['\"]nav-links['\"]\)\.innerHTML")
+NAV_COMMENT = compiled(r'[ \t]*//[^\n]*\bnav\b[^\n]*\n(?=\s*(?:const|\(async))', re.IGNORECASE)
+CONST = compiled(r'[ \t]*const ([A-Z_]+)\s*=\s*(?:`[^`]*`|\'[^\']*\'|"[^"]*")\s*;[ \t]*\n?')
+CLIENT = compiled(r'[ \t]*const supabase\s*=\s*createClient\([^;]*\)\s*;[ \t]*\n?')
+IMPORT = compiled(r'[ \t]*import\s*\{\s*createClient\s*\}\s*from\s*[\'"][^\'"]*supabase-js[^\'"]*[\'"]\s*;[ \t]*\n?')
+BLANK_LINES = compiled(r'\n[ \t]*\n(?:[ \t]*\n)+')
+HEAD_CLOSE = compiled(r'([ \t]*)</head>', re.IGNORECASE)
+
+
+def block_end(code: str, i: int) -> int:
+    """Just past the ``}`` closing the block whose body starts at ``i``.
+
+    Strings are skipped and template literals count only their ``${...}``
+    braces, so markup inside ``innerHTML`` templates cannot end it early.
+    """
+    stack = ['{']                   # '{' block, '`' template, '$' substitution
+    n = len(code)
+    while i < n and stack:
+        ch = code[i]
+        if stack[-1] == '`':
+            if ch == '\\':
+                i += 1
+            elif ch == '`':
+                stack.pop()
+            elif code.startswith('${', i):
+                stack.append('$')
+                i += 1
+        elif ch in '\'"':
+            end = i + 1
+            while end < n and code[end] != ch:
+                end += 2 if code[end] == '\\' else 1
+            i = end
+        elif ch == '`':
+            stack.append('`')
+        elif ch == '{':
+            stack.append('{')
+        elif ch == '}':
+            stack.pop()
+        i += 1
+    return i
+
+
+def strip_session_block(code: str) -> Tuple[str, bool]:
+    """``code`` without the logged-in nav swap; whether there was one."""
+    m = SESSION.search(code)
+    if not m or not NAV_SWAP.search(code, m.end()):
+        return code, False
+    start, end = m.start(), block_end(code, m.end())
+    iife = ASYNC_IIFE_OPEN.search(code, 0, start)
+    close = ASYNC_IIFE_CLOSE.match(code, end)
+    if iife and close and not code[iife.end():start].strip():
+        start, end = iife.start(), close.end()
+    line = code.rfind('\n', 0, start) + 1
+    rest = code.find('\n', end)
+    rest = len(code) if rest < 0 else rest
+    if not code[line:start].strip() and not code[end:rest].strip():
+        code = code[:line] + code[rest + 1:]            # whole lines
+    else:
+        code = code[:start] + code[end:].lstrip(' \t')
+
+    # Declarations only the nav swap used
+    code = NAV_COMMENT.sub('', code)
+    unused = True
+    while unused:
+        unused = next((c for c in CONST.finditer(code)
+                       if not re.search(rf'\b{c.group(1)}\b', code[:c.start()] + code[c.end():])), None)
+        if unused:
+            code = code[:unused.start()] + code[unused.end():]
+    if not re.search(r'\bsupabase\b', IMPORT.sub('', CLIENT.sub('', code))):
+        code = CLIENT.sub('', code)
+    if not re.search(r'\bcreateClient\b', IMPORT.sub('', code)):
+        code = IMPORT.sub('', code)
+    return BLANK_LINES.sub('\n\n', code), True
+
+
+def _inline_auth_script(html: str) -> Optional[Tuple[int, int, str]]:
+    """(start, end, new element or '') of the first inline script with a nav swap."""
+    for span in locate(html, ('script',))[0]:
+        if 'type="module"' not in html[span.start:span.inner_start]:
+            continue
+        code, found = strip_session_block(html[span.inner_start:span.inner_end])
+        if found:
+            new = html[span.start:span.inner_start] + code + html[span.inner_end:span.end]
+            return span.start, span.end, new if code.strip() else ''
+    return None
+
+
+@codemod('nav-auth', *AUTH_PAGES)
+def nav_auth(path: str, html: str) -> str:
+    """Shared /nav-auth.js module (preloaded) instead of the inline auth nav script."""
+    found = _inline_auth_script(html)
+    if found is None:
+        return html
+    start, end, new = found
+    if NAV_AUTH_SRC not in html:
+        line = html[html.rfind('\n', 0, start) + 1:start]
+        indent = '' if line.strip() else line
+        new = new + f'\n{indent}{NAV_AUTH_SCRIPT}' if new else NAV_AUTH_SCRIPT
+    elif not new:
+        # Element and the whitespace line it sat on both go
+        line = html.rfind('\n', 0, start)
+        if not html[line + 1:start].strip():
+            start = line
+    html = html[:start] + new + html[end:]
+    if NAV_AUTH_PRELOAD not in html:
+        html = HEAD_CLOSE.sub(lambda m: f'{m.group(1)}  {NAV_AUTH_PRELOAD}\n{m.group()}', html, count=1)
+    return html
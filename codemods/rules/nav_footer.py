@@ -0,0 +1,341 @@
+"""
+codemods.rules.nav_footer — unified nav/footer for all public HTML pages.
+
+Canonical rules:
+  - Public desktop links: Baza Wiedzy, Metodologia, Cennik
+  - Auth   desktop links: Baza Wiedzy, Metodologia, Cennik, Karta Postaci, Moje Testy
+  - Nav action (public):  single gradient "Zaloguj się" button
+  - Nav action (auth):    Settings icon + Logout icon
+  - Remove dark/light mode toggle everywhere
+  - Canonical footer on all pages
+  - Logo href always "/"
+  - Logged-in nav swap: the shared /nav-auth.js module (codemods.rules.js_auth)
+
+Rewrites are codemods.Rule objects grouped into a few single-pass phases
+per page type.  Formerly fix_all_nav_footer.py; run with
+``python -m codemods nav-footer``.
+"""
+
+import re
+from functools import lru_cache
+
+from ..engine import Pipeline, Rule, RuleSet
+from ..htmltok import ElementRule, ElementRuleSet
+from ..registry import codemod
+
+# ─── Canonical snippets ──────────────────────────────────────────────────────
+
+NAV_ACTION_PUBLIC = (
+    '<div class="hidden md:flex items-center gap-4" id="nav-actions">\n'
+    '          <a href="/auth" class="inline-flex items-center gap-2 px-4 py-2 rounded-xl text-sm font-semibold text-white transition-all" style="background:linear-gradient(120deg,rgba(112,0,255,.75) 0%,rgba(0,200,220,.8) 100%);box-shadow:0 0 18px -4px rgba(0,240,255,.35);text-decoration:none;">Zaloguj się <svg width="13" height="13" fill="none" stroke="currentColor" stroke-width="2.2" viewBox="0 0 24 24"><path stroke-linecap="round" stroke-linejoin="round" d="M5 12h14M13 6l6 6-6 6"/></svg></a>\n'
+    '        </div>'
+)
+
+NAV_ACTION_PUBLIC_ALT = (
+    '<div id="nav-actions" class="hidden md:flex items-center gap-4">\n'
+    '        <a href="/auth" class="inline-flex items-center gap-2 px-4 py-2 rounded-xl text-sm font-semibold text-white transition-all" style="background:linear-gradient(120deg,rgba(112,0,255,.75) 0%,rgba(0,200,220,.8) 100%);box-shadow:0 0 18px -4px rgba(0,240,255,.35);text-decoration:none;">Zaloguj się <svg width="13" height="13" fill="none" stroke="currentColor" stroke-width="2.2" viewBox="0 0 24 24"><path stroke-linecap="round" stroke-linejoin="round" d="M5 12h14M13 6l6 6-6 6"/></svg></a>\n'
+    '      </div>'
+)
+
+# Mobile menu "Zaloguj się" single button (used in public pages)
+MOBILE_LOGIN_BTN = (
+    '<a href="/auth" class="flex items-center justify-center gap-2 mb-2 py-3 '
+    'rounded-xl text-sm font-semibold text-white transition-all" '
+    'style="text-decoration:none;background:linear-gradient(120deg,rgba(112,0,255,.75),rgba(0,200,220,.8));">'
+    'Zaloguj się</a>'
+)
+
+# Canonical footer HTML, as live on the pages (the codemod must be a no-op on them)
+CANONICAL_FOOTER = '''  <footer class="border-t border-white/5 bg-black/30 backdrop-blur-xl mt-16">
+    <div class="max-w-7xl mx-auto px-6 py-10">
+      <div class="grid grid-cols-2 md:grid-cols-4 gap-8 mb-10">
+        <div class="col-span-2 md:col-span-1">
+          <a href="/" style="display:inline-block;margin-bottom:8px;text-decoration:none;">
+            <span style="font-family:'Cinzel',serif;font-size:18px;font-weight:600;letter-spacing:.14em;background:linear-gradient(120deg,#fff 0%,rgba(0,240,255,.88) 55%,rgba(112,0,255,.75) 100%);-webkit-background-clip:text;-webkit-text-fill-color:transparent;background-clip:text;">Alcheme</span>
+          </a>
+          <p style="color:rgba(100,116,139,1);font-size:14px;line-height:1.6;">Odkryj swój potencjał — testy osobowości w formie przystępnej grywalizacji.</p>
+          <a href="mailto:hello@alcheme.io" style="display:inline-block;margin-top:16px;font-size:14px;color:rgba(34,211,238,.8);text-decoration:none;">hello@alcheme.io</a>
+        </div>
+        <div>
+          <h4 style="color:#fff;font-weight:700;margin-bottom:12px;font-size:14px;">Projekt</h4>
+          <ul style="list-style:none;padding:0;margin:0;display:flex;flex-direction:column;gap:8px;">
+            <li><a href="/" style="color:rgba(100,116,139,1);font-size:14px;text-decoration:none;" onmouseover="this.style.color='#818cf8'" onmouseout="this.style.color='rgba(100,116,139,1)'">Strona główna</a></li>
+            <li><a href="/pricing" style="color:rgba(100,116,139,1);font-size:14px;text-decoration:none;" onmouseover="this.style.color='#818cf8'" onmouseout="this.style.color='rgba(100,116,139,1)'">Cennik</a></li>
+            <li><a href="/methodology" style="color:rgba(100,116,139,1);font-size:14px;text-decoration:none;" onmouseover="this.style.color='#818cf8'" onmouseout="this.style.color='rgba(100,116,139,1)'">Metodologia</a></li>
+            <li><a href="/user-profile-tests" style="color:rgba(100,116,139,1);font-size:14px;text-decoration:none;" onmouseover="this.style.color='#818cf8'" onmouseout="this.style.color='rgba(100,116,139,1)'">Testy</a></li>
+            <li><a href="/character" style="color:rgba(100,116,139,1);font-size:14px;text-decoration:none;" onmouseover="this.style.color='#818cf8'" onmouseout="this.style.color='rgba(100,116,139,1)'">Karta Postaci</a></li>
+          </ul>
+        </div>
+        <div>
+          <h4 style="color:#fff;font-weight:700;margin-bottom:12px;font-size:14px;">Baza Wiedzy</h4>
+          <ul style="list-style:none;padding:0;margin:0;display:flex;flex-direction:column;gap:8px;">
+            <li><a href="/baza-wiedzy/" style="color:rgba(100,116,139,1);font-size:14px;text-decoration:none;" onmouseover="this.style.color='#818cf8'" onmouseout="this.style.color='rgba(100,116,139,1)'">Wszystkie modele</a></li>
+            <li><a href="/baza-wiedzy/enneagram/" style="color:rgba(100,116,139,1);font-size:14px;text-decoration:none;" onmouseover="this.style.color='#818cf8'" onmouseout="this.style.color='rgba(100,116,139,1)'">Enneagram</a></li>
+            <li><a href="/baza-wiedzy/hexaco/" style="color:rgba(100,116,139,1);font-size:14px;text-decoration:none;" onmouseover="this.style.color='#818cf8'" onmouseout="this.style.color='rgba(100,116,139,1)'">HEXACO</a></li>
+          </ul>
+        </div>
+        <div>
+          <h4 style="color:#fff;font-weight:700;margin-bottom:12px;font-size:14px;">Legal</h4>
+          <ul style="list-style:none;padding:0;margin:0;display:flex;flex-direction:column;gap:8px;">
+            <li><a href="/polityka-prywatnosci.pdf" target="_blank" rel="noopener noreferrer" style="color:rgba(100,116,139,1);font-size:14px;text-decoration:none;" onmouseover="this.style.color='#818cf8'" onmouseout="this.style.color='rgba(100,116,139,1)'">Polityka Prywatności</a></li><li><a href="/regulamin.pdf" target="_blank" rel="noopener noreferrer" style="color:rgba(100,116,139,1);font-size:14px;text-decoration:none;" onmouseover="this.style.color='#818cf8'" onmouseout="this.style.color='rgba(100,116,139,1)'">Regulamin</a></li><li><a href="/polityka-cookies.pdf" target="_blank" rel="noopener noreferrer" style="color:rgba(100,116,139,1);font-size:14px;text-decoration:none;" onmouseover="this.style.color='#818cf8'" onmouseout="this.style.color='rgba(100,116,139,1)'">Polityka Cookies</a></li>
+          </ul>
+        </div>
+      </div>
+      <div style="border-top:1px solid rgba(255,255,255,0.05);padding-top:24px;display:flex;flex-direction:column;gap:8px;align-items:center;justify-content:space-between;" class="sm:flex-row">
+        <span style="color:rgba(100,116,139,1);font-size:12px;">&copy; 2026 Alcheme. All rights reserved.</span>
+        <span style="color:rgba(100,116,139,1);font-size:12px;">Disclaimer: To narzędzie rozwojowe, nie diagnoza kliniczna.</span>
+      </div>
+    </div>
+  </footer>'''
+
+# The knowledge base hub also links the VIA strengths section from its footer
+_VIA_ITEM = ('            <li><a href="/baza-wiedzy/mocne-strony/" style="color:rgba(34,211,238,.8);'
+             'font-size:14px;text-decoration:none;">Mocne Strony VIA</a></li>\n')
+_AFTER_HEXACO = CANONICAL_FOOTER.index('\n', CANONICAL_FOOTER.index('href="/baza-wiedzy/hexaco/"')) + 1
+KB_HUB_FOOTER = CANONICAL_FOOTER[:_AFTER_HEXACO] + _VIA_ITEM + CANONICAL_FOOTER[_AFTER_HEXACO:]
+
+# Baza Wiedzy item for the mobile menu (static markup and JS-injected variant)
+BAZA_MOBILE_LINK = (
+    '<a href="/baza-wiedzy/" class="flex items-center gap-3 px-4 py-3 '
+    'rounded-xl text-sm font-semibold text-white/80 hover:text-white '
+    'hover:bg-white/5 transition-all" style="text-decoration:none;">Baza Wiedzy</a>'
+)
+
+# ─── Rewrite rules ────────────────────────────────────────────────────────────
+#
+# Every rewrite is a codemods.Rule.  Rules that do not depend on each other
+# share a RuleSet and run in one combined scan (see codemods/engine.py);
+# the process_* pipelines below only split into a new phase where a rule
+# has to see the output of an earlier one.
+
+THEME_TOGGLE_CSS = RuleSet([
+    Rule('theme-toggle-css', r'\s*\.theme-toggle\s*\{[^}]*\}', ''),
+    Rule('theme-toggle-hover-css', r'\s*\.theme-toggle:hover\s*\{[^}]*\}', ''),
+    Rule('theme-toggle-slider-css', r'\s*\.theme-toggle-slider\s*\{[^}]*\}', ''),
+    Rule('theme-toggle-light-slider-css', r'\s*\.theme-toggle\.light\s+\.theme-toggle-slider\s*\{[^}]*\}', ''),
+    Rule('theme-icon-css', r'\s*\.theme-icon\s*\{[^}]*\}', ''),
+    Rule('theme-icon-moon-css', r'\s*\.theme-icon-moon\s*\{[^}]*\}', ''),
+    Rule('theme-icon-sun-css', r'\s*\.theme-icon-sun\s*\{[^}]*\}', ''),
+    Rule('theme-toggle-light-moon-css', r'\s*\.theme-toggle\.light\s+\.theme-icon-moon\s*\{[^}]*\}', ''),
+    Rule('theme-toggle-light-sun-css', r'\s*\.theme-toggle\.light\s+\.theme-icon-sun\s*\{[^}]*\}', ''),
+])
+
+THEME_TOGGLE_BUTTON = RuleSet([
+    Rule('theme-toggle-button',
+         r'\s*<button[^>]*id=["\']nav-theme-btn["\'][^>]*>.*?</button>', '', re.DOTALL),
+])
+
+THEME_TOGGLE_JS = RuleSet([
+    Rule('moon-svg-const', r'\s*const MOON_SVG\s*=\s*`[^`]*`;', ''),
+    Rule('sun-svg-const', r'\s*const SUN_SVG\s*=\s*`[^`]*`;', ''),
+    # Theme toggle injection lines
+    Rule('theme-toggle-inject-js',
+         r'\s*(?:document\.getElementById\(["\']nav-theme-btn["\'\)][^;]*;|const toggles?\s*=.*?theme-toggle[^;]*;[^}]*)',
+         '', re.DOTALL, anchors=('document.getElementById(', 'const toggle')),
+    # The long theme toggle inject block in index.html
+    Rule('theme-toggle-query-js',
+         r'\s*document\.querySelectorAll\([\'"]\.theme-toggle[\'"]\).*?;', '', re.DOTALL),
+])
+
+LOGO_HREF = RuleSet([
+    Rule.literal('logo-href',
+                 'href="https://www.alcheme.io/" class="alcheme-logo"',
+                 'href="/" class="alcheme-logo"'),
+])
+
+KORZYSC = RuleSet([
+    Rule('korzysc-nav-link', r'\s*<a href="[^"]*#features[^"]*" class="iiy-nav-link[^"]*">Korzyści</a>', ''),
+    # Also remove from mobile menu
+    Rule('korzysc-mobile-link', r'\s*<a href="[^"]*#features[^"]*"[^>]*>Korzyści</a>', ''),
+])
+
+NAV_ACTIONS_TWO_BUTTONS = RuleSet([
+    # Variant 1: id comes after class
+    Rule('nav-actions-two-buttons',
+         r'(<div class="hidden md:flex items-center gap-4" id="nav-actions">)\s*'
+         r'<a href="/auth"[^>]*>Zaloguj</a>\s*'
+         r'<a href="/auth"[^>]*(?:shadow[^"]*"[^>]*)?>(?:\s*\n\s*)?Wykonaj test(?:\s*\n\s*)?</a>\s*'
+         r'(</div>)',
+         NAV_ACTION_PUBLIC, re.DOTALL),
+    # Variant 2: id comes first
+    Rule('nav-actions-two-buttons-alt',
+         r'(<div id="nav-actions" class="hidden md:flex items-center gap-4">)\s*'
+         r'<a href="/auth"[^>]*>Zaloguj</a>\s*'
+         r'<a href="/auth"[^>]*(?:shadow[^"]*"[^>]*)?>(?:\s*\n\s*)?Wykonaj test(?:\s*\n\s*)?</a>\s*'
+         r'(</div>)',
+         NAV_ACTION_PUBLIC_ALT, re.DOTALL),
+    # Extra "Wykonaj test" button in the mobile menu
+    Rule('mobile-wykonaj-button',
+         r'\s*<a href="/auth"[^>]*bg-white[^>]*text-slate-950[^>]*>(?:\s*\n\s*)?Wykonaj test(?:\s*\n\s*)?</a>',
+         '', re.DOTALL),
+    # Plain "Zaloguj" link left over next to the gradient button
+    Rule('plain-zaloguj-link',
+         r'\s*<a href="/auth" class="text-sm font-medium text-slate-400[^"]*"(?:\s+[^>]*)?>Zaloguj</a>', ''),
+    Rule('plain-zaloguj-link-sm',
+         r'\s*<a href="/auth" class="text-sm font-medium text-slate-400[^"]*hidden sm:block[^"]*"(?:\s+[^>]*)?>Zaloguj</a>', ''),
+])
+
+MOBILE_WYKONAJ = RuleSet([
+    Rule('mobile-wykonaj-link',
+         r'\s*<a href="/auth"[^>]*(?:font-bold text-slate-950 bg-white|bg-white[^>]*text-slate-950)[^>]*>\s*Wykonaj test\s*</a>',
+         '', re.DOTALL),
+])
+
+# Located with the tokenizer (own phase): ends at the footer's own </footer>,
+# ignores "<footer" inside scripts, and cannot backtrack over the page.  The
+# element's own indentation stays in place, so the replacement starts at the tag.
+FOOTER = ElementRuleSet([
+    ElementRule('canonical-footer', 'footer', CANONICAL_FOOTER.lstrip()),
+])
+KB_HUB_FOOTER_RULES = ElementRuleSet([
+    ElementRule('kb-hub-footer', 'footer', KB_HUB_FOOTER.lstrip()),
+])
+
+# index.html: three-link desktop nav (after Korzyści is gone) → add Baza Wiedzy
+INDEX_NAV = RuleSet([
+    Rule('index-nav-links',
+         r'(<div id="nav-links" class="hidden md:flex items-center gap-8">)\s*'
+         r'<a href="/methodology" class="iiy-nav-link">Metodologia</a>\s*'
+         r'<a href="/pricing" class="iiy-nav-link">Cennik</a>\s*'
+         r'(</div>)',
+         r'\1\n'
+         r'                    <a href="/baza-wiedzy/" class="iiy-nav-link">Baza Wiedzy</a>\n'
+         r'                    <a href="/methodology" class="iiy-nav-link">Metodologia</a>\n'
+         r'                    <a href="/pricing" class="iiy-nav-link">Cennik</a>\n'
+         r'                \2',
+         re.DOTALL),
+    # index.html nav-actions with different whitespace
+    Rule('index-nav-actions',
+         r'<div id="nav-actions" class="hidden md:flex items-center gap-4">\s*'
+         r'<a href="/auth"[^>]*>Zaloguj</a>\s*'
+         r'<a href="/auth"[^>]*>\s*\n\s*Wykonaj test\s*\n\s*</a>\s*'
+         r'</div>',
+         '<div id="nav-actions" class="hidden md:flex items-center gap-4">\n'
+         '                    <a href="/auth" class="inline-flex items-center gap-2 px-4 py-2 rounded-xl text-sm font-semibold text-white transition-all" style="background:linear-gradient(120deg,rgba(112,0,255,.75) 0%,rgba(0,200,220,.8) 100%);box-shadow:0 0 18px -4px rgba(0,240,255,.35);text-decoration:none;">Zaloguj się <svg width="13" height="13" fill="none" stroke="currentColor" stroke-width="2.2" viewBox="0 0 24 24"><path stroke-linecap="round" stroke-linejoin="round" d="M5 12h14M13 6l6 6-6 6"/></svg></a>\n'
+         '                </div>',
+         re.DOTALL),
+])
+
+
+def _index_mobile_baza(m: re.Match) -> str:
+    """Add Baza Wiedzy before Metodologia unless the menu already has it."""
+    html = m.string
+    start = html.find('mobile-menu-content')
+    if '/baza-wiedzy/' in html[start:start + 1000]:
+        return m.group(0)
+    return m.group(1) + '\n            ' + BAZA_MOBILE_LINK + '\n            ' + m.group(2)
+
+
+INDEX_MOBILE = RuleSet([
+    Rule('index-mobile-baza',
+         r'(<div id="mobile-menu-content"[^>]*>)\s*'
+         r'(<a href="/methodology"[^>]*>Metodologia</a>)',
+         _index_mobile_baza, re.DOTALL),
+])
+
+# Auth pages: leftover theme toggle JS (user-profile / user-profile-tests)
+AUTH_THEME_JS = RuleSet([
+    Rule('toggles-query-js',
+         r"const toggles\s*=\s*document\.querySelectorAll\(['\"]\.theme-toggle['\"]\);\s*\n"
+         r"[^\n]*toggles\.[^\n]*\n",
+         ''),
+    Rule('toggles-foreach-js',
+         r"document\.querySelectorAll\(['\"]\.theme-toggle['\"]\)\.forEach\([^)]+\)[^;]*;", ''),
+    Rule('toggle-by-id-js',
+         r"const toggle\s*=\s*document\.getElementById\(['\"]theme-toggle['\"]\);[^\n]*\n", ''),
+    Rule('toggle-mobile-by-id-js',
+         r"const toggleMobile\s*=\s*document\.getElementById\(['\"]theme-toggle-mobile['\"]\);[^\n]*\n", ''),
+])
+
+
+@lru_cache(maxsize=None)
+def public_nav_baza_rules(active_key: str = '') -> RuleSet:
+    """Baza Wiedzy as the first desktop nav link and first mobile menu item."""
+    baza_active = ' active' if active_key == 'baza-wiedzy' else ''
+
+    def desktop(m):
+        if '/baza-wiedzy/' in m.group(2):
+            return m.group(0)
+        return (m.group(1) + f'<a href="/baza-wiedzy/" class="iiy-nav-link{baza_active}">Baza Wiedzy</a>\n          '
+                + m.group(2) + m.group(3))
+
+    def mobile(m):
+        body = m.group(2)
+        first = body.lstrip()
+        if '/baza-wiedzy/' in body or not first.startswith('<a href="/'):
+            return m.group(0)
+        return m.group(1) + '\n      ' + BAZA_MOBILE_LINK + '\n      ' + first + m.group(3)
+
+    return RuleSet([
+        Rule('nav-links-baza', r'(<div[^>]*id="nav-links"[^>]*>\s*)(.*?)(</div>)',
+             desktop, re.DOTALL, max_hits=1),
+        Rule('mobile-menu-baza', r'(<div[^>]*id="mobile-menu-content"[^>]*>)(.*?)(</div>)',
+             mobile, re.DOTALL, max_hits=1),
+    ])
+
+
+# ─── Page pipelines ───────────────────────────────────────────────────────────
+#
+# Phase boundaries: theme/logo/Korzyści cleanup must run before the nav
+# rewrites (the old nav-actions markup had the theme button inside it), and
+# the Baza Wiedzy insertions look at the menus only after "Wykonaj test" is gone.
+
+CLEANUP = THEME_TOGGLE_CSS + THEME_TOGGLE_BUTTON + THEME_TOGGLE_JS + LOGO_HREF
+
+INDEX_PIPELINE = Pipeline([
+    CLEANUP + KORZYSC,
+    NAV_ACTIONS_TWO_BUTTONS + INDEX_NAV,
+    INDEX_MOBILE,
+    FOOTER,
+])
+
+AUTH_PIPELINE = Pipeline([
+    CLEANUP,
+    AUTH_THEME_JS,
+    FOOTER,
+])
+
+
+@lru_cache(maxsize=None)
+def public_pipeline(active_key: str = '', hub: bool = False) -> Pipeline:
+    return Pipeline([
+        CLEANUP + KORZYSC,
+        NAV_ACTIONS_TWO_BUTTONS + MOBILE_WYKONAJ,
+        public_nav_baza_rules(active_key),
+        KB_HUB_FOOTER_RULES if hub else FOOTER,
+    ])
+
+
+def page_pipeline(path: str) -> Pipeline:
+    """Pipeline for a repo-relative public/ page."""
+    page = path[len('public/'):]
+    if page == 'index.html':
+        return INDEX_PIPELINE
+    if page in ('user-profile.html', 'user-profile-tests.html'):
+        return AUTH_PIPELINE
+    if page.startswith('baza-wiedzy/'):
+        return public_pipeline('baza-wiedzy', hub=page == 'baza-wiedzy/index.html')
+    return public_pipeline(page[:-len('.html')])    # methodology, pricing
+
+
+@codemod(
+    'nav-footer',
+    'public/index.html',
+    'public/methodology.html',
+    'public/pricing.html',
+    # Authenticated pages
+    'public/user-profile-tests.html',
+    'public/user-profile.html',
+    # Knowledge base hub, HEXACO and Enneagram; the mocne-strony pages keep
+    # their own, shorter nav and footer
+    'public/baza-wiedzy/index.html',
+    'public/baza-wiedzy/hexaco/index.html',
+    'public/baza-wiedzy/enneagram/*.html',
+    rules=Pipeline(INDEX_PIPELINE.phases + AUTH_PIPELINE.phases + public_pipeline('baza-wiedzy').phases
+                   + (KB_HUB_FOOTER_RULES,)).all_rules(),
+    # theme CSS, nav markup, auth/theme JS, footer
+    regions=('style', 'nav', 'script', 'footer'),
+)
+def nav_footer(path: str, html: str):
+    """Canonical nav links/actions, no theme toggle, canonical footer."""
+    return page_pipeline(path).apply(html)
@@ -0,0 +1,31 @@
+"""
+codemods.rules.user_profile — user-profile.html mobile menu: add Baza Wiedzy,
+drop the leftover "Motyw" theme row (formerly fix_up.py).
+"""
+
+from ..patterns import compiled
+from ..registry import codemod
+from .nav_footer import BAZA_MOBILE_LINK
+
+SETTINGS_THEN_METHODOLOGY = compiled(r'(href="/settings"[^>]*>Ustawienia</a>)\s*(<a href="/methodology")')
+MOBILE_MENU_REGION = compiled(r'id="mobile-menu"[\s\S]*?</nav>')
+MOTYW_ROW = compiled(r'\s*<div[^>]*>\s*<span[^>]*>Motyw</span>\s*</div>')
+
+
+def add_baza_mobile(m):
+    text = m.group(0)
+    if '/baza-wiedzy/' not in text:
+        text = SETTINGS_THEN_METHODOLOGY.sub(r'\1' + BAZA_MOBILE_LINK + r'\2', text)
+    return text
+
+
+@codemod('user-profile-menu', 'public/user-profile.html', regions=('nav',))
+def fix_user_profile(path: str, html: str) -> str:
+    """Baza Wiedzy in the mobile menu; no "Motyw" row."""
+    mobile_region = MOBILE_MENU_REGION.search(html)
+    if mobile_region and '/baza-wiedzy/' not in mobile_region.group(0):
+        # Insert Baza Wiedzy after Settings link in mobile menu (only in mobile-menu region)
+        html = MOBILE_MENU_REGION.sub(add_baza_mobile, html, count=1)
+
+    # Remove 'Motyw' theme remnant div from mobile menu
+    return MOTYW_ROW.sub('', html)
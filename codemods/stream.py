@@ -0,0 +1,129 @@
+"""
+codemods.stream — rewrite a large page without holding copies of it.
+
+The in-memory path decodes the whole file and every codemod phase builds a
+new full-size string.  For pages whose codemods only touch known elements
+(``@codemod(..., regions=('nav', 'footer', ...))``) this module instead:
+
+  1. memory-maps the file and finds those elements with a bytes scan
+     (an element's content runs to its first end tag, so ``<script>`` and
+     ``<style>`` bodies are never mistaken for markup),
+  2. decodes and rewrites each element on its own,
+  3. writes unchanged byte ranges straight from the map, interleaved with
+     the rewritten elements, to a temporary file that replaces the original.
+
+Memory stays proportional to the largest element plus the edits, whatever
+the file size.  An element without an end tag is left alone, as in
+``htmltok``.  Files with ``\\r`` newlines are not streamed: the in-memory
+path normalises them and the two modes must write the same bytes.
+"""
+
+import hashlib
+import mmap
+import os
+import re
+import shutil
+from collections import Counter
+from typing import Iterable, List, NamedTuple, Optional, Tuple
+
+from . import registry
+from .cache import read_text
+from .patterns import compiled
+
+
+class Edit(NamedTuple):
+    start: int
+    end: int
+    data: bytes
+
+
+class StreamResult(NamedTuple):
+    changed: bool
+    hits: Counter
+    size: int
+    input_digest: str
+    output_digest: str
+    out_size: int
+    cached: bool = False
+
+
+def can_stream(codemods: Iterable[str]) -> bool:
+    """Whether every codemod confines its edits to declared regions."""
+    return all(registry.REGISTRY[name].regions for name in codemods)
+
+
+def regions(buf, tags: Iterable[str]) -> List[Tuple[int, int]]:
+    """Byte ranges of the outermost ``tags`` elements, in document order."""
+    names = '|'.join(sorted(set(tags))).encode()
+    opener = compiled(rb'<(' + names + rb')(?=[\s>/])', re.IGNORECASE)
+    found = []
+    pos = 0
+    while True:
+        m = opener.search(buf, pos)
+        if m is None:
+            return found
+        closer = compiled(rb'</' + m.group(1).lower() + rb'\s*>', re.IGNORECASE)
+        close = closer.search(buf, m.end())
+        if close is None:
+            pos = m.end()               # unclosed: never guessed at
+            continue
+        found.append((m.start(), close.end()))
+        pos = close.end()
+
+
+def rewrite(path: str, buf, codemods: Tuple[str, ...]) -> Tuple[List[Edit], Counter]:
+    """Run the codemods over each region; edits for the regions they change."""
+    tags = {tag for name in codemods for tag in registry.REGISTRY[name].regions}
+    edits = []
+    hits = Counter()
+    for start, end in regions(buf, tags):
+        text = read_text(buf[start:end])
+        out, region_hits = registry.apply(path, text, codemods)
+        hits.update(region_hits)
+        if out != text:
+            edits.append(Edit(start, end, out.encode('utf-8')))
+    return edits, hits
+
+
+def write(target: str, buf, edits: List[Edit]) -> Tuple[int, str]:
+    """Unchanged ranges of ``buf`` + edits → ``target``; return (size, sha256)."""
+    digest = hashlib.sha256()
+    size = 0
+    with memoryview(buf) as view, open(target, 'wb') as f:
+        def emit(chunk):
+            nonlocal size
+            f.write(chunk)
+            digest.update(chunk)
+            size += len(chunk)
+
+        pos = 0
+        for start, end, data in edits:
+            emit(view[pos:start])       # slices of the map, not copies
+            emit(data)
+            pos = end
+        emit(view[pos:])
+    return size, digest.hexdigest()
+
+
+def rewrite_file(full: str, path: str, codemods: Tuple[str, ...],
+                 fixed_points: frozenset = frozenset()) -> Optional[StreamResult]:
+    """Stream the codemods over one file; None if it has to go in-memory instead."""
+    with open(full, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return None
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+            if buf.find(b'\r') != -1:
+                return None
+            size = len(buf)
+            digest = hashlib.sha256(buf).hexdigest()
+            if digest in fixed_points:
+                return StreamResult(False, Counter(), size, digest, digest, size, cached=True)
+            edits, hits = rewrite(path, buf, codemods)
+            if not edits:
+                return StreamResult(False, hits, size, digest, digest, size)
+            tmp = full + '.codemod-tmp'
+            out_size, out_digest = write(tmp, buf, edits)
+    # the map is closed before the rename (required on Windows)
+    shutil.copymode(full, tmp)
+    os.replace(tmp, full)
+    return StreamResult(True, hits, size, digest, out_digest, out_size)
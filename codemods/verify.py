@@ -0,0 +1,136 @@
+"""
+codemods.verify — prove a second codemod pass would change nothing.
+
+    python -m codemods.verify [NAME ...] [-j N] [--no-cache]
+
+For every target file: apply the codemods in memory, hash the result, apply
+them again to that result and compare hashes.  A file whose second pass
+still changes something is reported with the rules that fired on it (the
+guards that failed to notice their own output) and the first lines of the
+second-pass diff.  Nothing in the tree is written; exits 1 if any file is
+not a fixed point, so it can sit in the pre-deploy path.
+
+Cheap by construction: files the content-hash manifest already knows to be
+fixed points are skipped unread, a first pass that changes nothing needs no
+second one, and every confirmed result is recorded in the manifest so the
+next ``python -m codemods`` run can skip the file too.
+"""
+
+import argparse
+import os
+import time
+from collections import Counter
+from typing import List, NamedTuple, Tuple
+
+from . import registry
+from .cache import ROOT, read_text, sha256
+from .cli import manifest_for, unified_diff
+from .runner import format_throughput, resolve_jobs, run_parallel
+
+DIFF_LINES = 16
+
+
+class VerifyJob(NamedTuple):
+    root: str
+    path: str
+    codemods: Tuple[str, ...]
+    fixed_points: frozenset = frozenset()
+
+
+class VerifyResult(NamedTuple):
+    path: str
+    input_digest: str
+    first_digest: str               # after one pass
+    second_digest: str              # after two passes
+    size: int
+    rules: Counter = Counter()      # hits of the second pass
+    diff: str = ''
+    cached: bool = False
+
+    @property
+    def stable(self) -> bool:
+        return self.first_digest == self.second_digest
+
+
+def verify_file(job: VerifyJob) -> VerifyResult:
+    """Worker entry point: two in-memory passes, compared by hash."""
+    registry.load()
+    with open(os.path.join(job.root, job.path), 'rb') as f:
+        raw = f.read()
+    digest = sha256(raw)
+    if digest in job.fixed_points:
+        return VerifyResult(job.path, digest, digest, digest, len(raw), cached=True)
+
+    original = read_text(raw)
+    first = registry.apply(job.path, original, job.codemods).text
+    first_digest = sha256(first.encode('utf-8'))
+    if first == original:
+        return VerifyResult(job.path, digest, first_digest, first_digest, len(raw))
+
+    second, hits = registry.apply(job.path, first, job.codemods)
+    second_digest = sha256(second.encode('utf-8'))
+    if second_digest == first_digest:
+        return VerifyResult(job.path, digest, first_digest, second_digest, len(raw))
+    diff = unified_diff(job.path, first, second).splitlines(keepends=True)
+    excerpt = ''.join(diff[:DIFF_LINES]) + ('  ...\n' if len(diff) > DIFF_LINES else '')
+    return VerifyResult(job.path, digest, first_digest, second_digest, len(raw), hits, excerpt)
+
+
+def report(result: VerifyResult):
+    if result.stable:
+        return
+    fired = ', '.join(f"{name}×{n}" for name, n in result.rules.most_common()) or '(no rule hits)'
+    print(f"  ✗ Not a fixed point: {result.path}\n    second pass: {fired}")
+    print(''.join(f"    {line}" for line in result.diff.splitlines(keepends=True)), end='')
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m codemods.verify',
+                                     description="Check that a second codemod pass is a no-op.")
+    parser.add_argument('codemods', nargs='*', metavar='NAME',
+                        help="codemods to verify (default: all default codemods)")
+    parser.add_argument('--jobs', '-j', type=int, default=0,
+                        help="worker processes (0 = one per CPU, the default)")
+    parser.add_argument('--no-cache', action='store_true',
+                        help="verify every file, ignoring and not updating the manifest")
+    parser.add_argument('--root', default=ROOT)
+    args = parser.parse_args(argv)
+
+    try:
+        selected = registry.select(args.codemods)
+    except KeyError as e:
+        parser.error(e.args[0])
+    print(f"\n=== codemods verify: {', '.join(c.name for c in selected)} ===\n")
+
+    manifest = manifest_for(selected, enabled=not args.no_cache)
+    root = os.path.abspath(args.root)
+    jobs = [VerifyJob(root, path, tuple(names), manifest.fixed_points(os.path.join(root, path)))
+            for path, names in registry.plan(selected, root).items()]
+    workers = min(resolve_jobs(args.jobs), len(jobs)) if jobs else 1
+
+    results: List[VerifyResult] = []
+    started = time.perf_counter()
+    for result in run_parallel(verify_file, jobs, workers):
+        report(result)
+        full = os.path.join(root, result.path)
+        if result.cached:
+            manifest.record(full, result.input_digest, result.input_digest, skipped=True)
+        elif result.stable:
+            manifest.record(full, result.input_digest, result.first_digest)
+            manifest.record(full, result.first_digest, result.first_digest)
+        results.append(result)
+    elapsed = time.perf_counter() - started
+    manifest.save()
+
+    unstable = [r for r in results if not r.stable]
+    changed = sum(r.input_digest != r.first_digest for r in results)
+    print(f"\n  {len(results) - len(unstable)} fixed points / {len(unstable)} not "
+          f"({changed} would change on the next run, {sum(r.cached for r in results)} cached)")
+    print(f"  {format_throughput(len(results), sum(r.size for r in results), elapsed, workers)}")
+    print("\n=== Done ===\n")
+    return 1 if unstable else 0
+
+
+if __name__ == '__main__':
+    import sys
+    sys.exit(main())
@@ -0,0 +1,13 @@
+"""Local harnesses for the Supabase edge functions in ``supabase/functions/``.
+
+``interpret-test`` and ``character-card-generate`` sit between the browser,
+PostgREST and the LLM API.  ``edgetools.stubs`` stands in for the last two
+(an in-memory PostgREST with the auth ``/user`` endpoint, and a chat
+completions endpoint with a configurable latency distribution), so the
+real functions can be run under ``deno`` and driven with no network at all
+by ``python -m edgetools.load``.  ``python -m edgetools.warm`` fills the
+interpretation cache ahead of users after a ``PROMPT_VERSION`` bump, and
+runs against the same stubs with ``--local``.  The HTTP side is standard
+library only; ``deno`` is needed to run the functions themselves, and the
+warm job uses ``node`` (and, with ``--local``, ``numpy``) via ``scoring``.
+"""
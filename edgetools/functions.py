@@ -0,0 +1,100 @@
+"""
+edgetools.functions — the edge functions the harnesses drive, and how to run them.
+
+Each ``Function`` names its cache table and the response field that says
+whether the answer came from it.  ``run`` starts one under ``deno`` with
+the stubs' environment (``supabase functions serve`` cannot be pointed at
+them: it injects its own ``SUPABASE_URL``); ``deno`` must have the
+functions' imports cached (``deno cache supabase/functions/*/index.ts``)
+to start without network.
+"""
+
+import asyncio
+import base64
+import hashlib
+import hmac
+import json
+import os
+import shutil
+import time
+from typing import Dict, NamedTuple, Optional
+
+from codemods.cache import ROOT
+from codemods.patterns import compiled
+
+FUNCTIONS_DIR = os.path.join(ROOT, 'supabase', 'functions')
+# ``serve`` from deno std listens here; one function per process
+PORT = 8000
+# The JWT secret of a local ``supabase start``
+LOCAL_JWT_SECRET = 'super-secret-jwt-token-with-at-least-32-characters-long'
+
+_PROMPT_VERSION = compiled(r'export\s+const\s+PROMPT_VERSION\s*=\s*(\d+)')
+
+
+class Function(NamedTuple):
+    name: str
+    table: str          # where it caches LLM output
+    hit_field: str      # true in a response served from that cache
+
+    @property
+    def entry(self) -> str:
+        return os.path.join(FUNCTIONS_DIR, self.name, 'index.ts')
+
+
+FUNCTIONS = {f.name: f for f in (
+    Function('interpret-test', 'ai_interpretations', 'cached'),
+    Function('character-card-generate', 'character_card_cache', 'from_cache'),
+)}
+
+
+def prompt_version() -> int:
+    """``PROMPT_VERSION`` of interpret-test, the version its cache rows are keyed by."""
+    path = os.path.join(FUNCTIONS_DIR, 'interpret-test', 'promptConfig.ts')
+    with open(path, encoding='utf-8') as f:
+        match = _PROMPT_VERSION.search(f.read())
+    if match is None:
+        raise SystemExit(f"no PROMPT_VERSION in {os.path.relpath(path, ROOT)}")
+    return int(match.group(1))
+
+
+def _b64(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b'=').decode()
+
+
+def token(user_id: str, secret: str = LOCAL_JWT_SECRET, ttl: int = 3600) -> str:
+    """An HS256 access token for ``user_id``, as Supabase auth would issue it."""
+    now = int(time.time())
+    header = _b64(json.dumps({'alg': 'HS256', 'typ': 'JWT'}).encode())
+    payload = _b64(json.dumps({'sub': user_id, 'aud': 'authenticated', 'role': 'authenticated',
+                               'iat': now, 'exp': now + ttl}).encode())
+    signature = hmac.new(secret.encode(), f'{header}.{payload}'.encode(), hashlib.sha256).digest()
+    return f'{header}.{payload}.{_b64(signature)}'
+
+
+async def run(function: Function, env: Dict[str, str], timeout: float = 60.0) -> asyncio.subprocess.Process:
+    """Start ``function`` under deno and wait until it accepts connections on ``PORT``."""
+    deno = shutil.which('deno')
+    if deno is None:
+        raise SystemExit(f"deno not found — it runs {function.name} against the stubs")
+    process = await asyncio.create_subprocess_exec(
+        deno, 'run', '--allow-net', '--allow-env', '--allow-read', function.entry,
+        env={**os.environ, **env}, cwd=ROOT)
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.returncode is not None:
+            raise SystemExit(f"{function.name}: deno exited with {process.returncode}")
+        try:
+            _, writer = await asyncio.open_connection('127.0.0.1', PORT)
+        except OSError:
+            await asyncio.sleep(0.2)
+            continue
+        writer.close()
+        return process
+    await stop(process)
+    raise SystemExit(f"{function.name}: not listening on :{PORT} after {timeout:.0f} s")
+
+
+async def stop(process: Optional[asyncio.subprocess.Process]):
+    if process is not None and process.returncode is None:
+        process.terminate()
+        await process.wait()
@@ -0,0 +1,185 @@
+"""
+edgetools.http — just enough HTTP/1.1 over asyncio streams for the harnesses.
+
+The stubs only ever talk to ``fetch`` in Deno on localhost, and the
+harnesses to the functions, the stubs or a Supabase project, so this is
+HTTP/1.1 with ``Content-Length`` or chunked bodies and keep-alive (TLS
+for ``https://`` only on the client side) — no pipelining, no
+``Expect: 100-continue``.  Keeping it in the standard library means the
+harness runs wherever ``python3`` does.
+"""
+
+import asyncio
+import json
+from typing import Awaitable, Callable, Dict, List, NamedTuple, Optional, Tuple
+from urllib.parse import parse_qsl, urlsplit
+
+REASONS = {200: 'OK', 201: 'Created', 204: 'No Content', 400: 'Bad Request', 401: 'Unauthorized',
+           404: 'Not Found', 406: 'Not Acceptable', 429: 'Too Many Requests',
+           500: 'Internal Server Error', 503: 'Service Unavailable'}
+
+
+class Request(NamedTuple):
+    method: str
+    path: str
+    query: List[Tuple[str, str]]
+    headers: Dict[str, str]     # lower-cased names
+    body: bytes
+
+    def json(self):
+        return json.loads(self.body or b'null')
+
+
+class Response(NamedTuple):
+    status: int
+    headers: Dict[str, str]     # lower-cased names
+    body: bytes
+
+    def json(self):
+        return json.loads(self.body or b'null')
+
+
+def json_response(status: int, payload, headers: Optional[Dict[str, str]] = None) -> Response:
+    return Response(status, {'content-type': 'application/json', **(headers or {})},
+                    json.dumps(payload, ensure_ascii=False).encode())
+
+
+# ─── Wire format ──────────────────────────────────────────────────────────────
+
+async def _read_headers(reader: asyncio.StreamReader) -> Tuple[Optional[str], Dict[str, str]]:
+    """First line and headers of a message; (None, {}) on a closed connection."""
+    line = await reader.readline()
+    if not line.strip():
+        return None, {}
+    headers = {}
+    while True:
+        raw = await reader.readline()
+        if raw in (b'\r\n', b'\n', b''):
+            break
+        name, _, value = raw.decode('latin-1').partition(':')
+        headers[name.strip().lower()] = value.strip()
+    return line.decode('latin-1').strip(), headers
+
+
+async def _read_body(reader: asyncio.StreamReader, headers: Dict[str, str]) -> bytes:
+    if headers.get('transfer-encoding', '').lower() == 'chunked':
+        chunks = []
+        while True:
+            size = int((await reader.readline()).split(b';')[0], 16)
+            if size == 0:
+                await reader.readline()
+                return b''.join(chunks)
+            chunks.append(await reader.readexactly(size))
+            await reader.readline()
+    return await reader.readexactly(int(headers.get('content-length', 0)))
+
+
+def _encode(first: str, headers: Dict[str, str], body: bytes) -> bytes:
+    lines = [first] + [f'{name}: {value}' for name, value in headers.items()]
+    lines.append(f'content-length: {len(body)}')
+    return ('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1') + body
+
+
+# ─── Server ───────────────────────────────────────────────────────────────────
+
+Handler = Callable[[Request], Awaitable[Response]]
+
+
+async def serve(handler: Handler, host: str = '127.0.0.1', port: int = 0) -> asyncio.AbstractServer:
+    """Start serving ``handler``; ``port=0`` picks a free port (see ``bound_port``)."""
+
+    async def connection(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while True:
+                first, headers = await _read_headers(reader)
+                if first is None:
+                    break
+                method, target, _ = first.split(' ', 2)
+                body = await _read_body(reader, headers)
+                url = urlsplit(target)
+                request = Request(method, url.path, parse_qsl(url.query, keep_blank_values=True), headers, body)
+                try:
+                    response = await handler(request)
+                except Exception as e:  # a stub bug must not look like a hung server
+                    response = json_response(500, {'message': f'stub error: {e!r}'})
+                reason = REASONS.get(response.status, 'Status')
+                writer.write(_encode(f'HTTP/1.1 {response.status} {reason}', response.headers, response.body))
+                await writer.drain()
+                if headers.get('connection', '').lower() == 'close':
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError, asyncio.CancelledError):
+            pass                # client went away, or the loop is shutting down
+        finally:
+            writer.close()
+
+    return await asyncio.start_server(connection, host, port, backlog=1024)
+
+
+def bound_port(server: asyncio.AbstractServer) -> int:
+    return server.sockets[0].getsockname()[1]
+
+
+# ─── Client ───────────────────────────────────────────────────────────────────
+
+class Client:
+    """Keep-alive connections per ``host:port``, reused one request at a time."""
+
+    def __init__(self, timeout: float = 60.0):
+        self.timeout = timeout
+        self._idle: Dict[Tuple[str, int], List[Tuple[asyncio.StreamReader, asyncio.StreamWriter]]] = {}
+
+    async def request(self, method: str, url: str, headers: Optional[Dict[str, str]] = None,
+                      body: bytes = b'') -> Response:
+        return await asyncio.wait_for(self._request(method, url, headers or {}, body), self.timeout)
+
+    async def get_json(self, url: str, headers: Optional[Dict[str, str]] = None):
+        response = await self.request('GET', url, headers)
+        if response.status != 200:
+            raise RuntimeError(f"GET {url}: {response.status} {response.body[:200].decode(errors='replace')}")
+        return response.json()
+
+    async def post_json(self, url: str, payload, headers: Optional[Dict[str, str]] = None) -> Response:
+        return await self.request('POST', url, {'content-type': 'application/json', **(headers or {})},
+                                  json.dumps(payload).encode())
+
+    async def _request(self, method: str, url: str, headers: Dict[str, str], body: bytes) -> Response:
+        parts = urlsplit(url)
+        if parts.scheme not in ('http', 'https'):
+            raise ValueError(f"not an http(s) URL: {url}")
+        tls = parts.scheme == 'https'
+        address = (parts.hostname, parts.port or (443 if tls else 80))
+        target = parts.path or '/'
+        if parts.query:
+            target += '?' + parts.query
+        message = _encode(f'{method} {target} HTTP/1.1', {'host': parts.netloc, **headers}, body)
+        idle = self._idle.setdefault(address, [])
+        # A pooled connection may have been closed by the server meanwhile; retry once on a fresh one
+        for reused in ((True, False) if idle else (False,)):
+            reader, writer = idle.pop() if reused else await asyncio.open_connection(*address, ssl=tls or None)
+            try:
+                writer.write(message)
+                await writer.drain()
+                first, response_headers = await _read_headers(reader)
+                if first is None:
+                    raise ConnectionResetError('connection closed before a response')
+                response_body = await _read_body(reader, response_headers)
+            except (asyncio.IncompleteReadError, ConnectionError):
+                writer.close()
+                if reused:
+                    continue
+                raise
+            except BaseException:
+                writer.close()
+                raise
+            if response_headers.get('connection', '').lower() == 'close':
+                writer.close()
+            else:
+                idle.append((reader, writer))
+            return Response(int(first.split(' ', 2)[1]), response_headers, response_body)
+        raise ConnectionResetError('connection closed before a response')
+
+    async def close(self):
+        for connections in self._idle.values():
+            for _, writer in connections:
+                writer.close()
+        self._idle.clear()
@@ -0,0 +1,267 @@
+"""
+edgetools.load — load-test an edge function against the stand-in LLM and database.
+
+    python -m edgetools.load FUNCTION [--rps 20] [--duration 30] [--users 500]
+                             [--warm F] [--force P] [--tests HEXACO,...]
+                             [--url URL] [--timeout S] [--max-errors P] [--out FILE]
+                             [--llm-latency SPEC] [--llm-errors P] [--llm-rate N] [--db-latency SPEC]
+
+FUNCTION is ``interpret-test`` or ``character-card-generate``.  With no
+network involved:
+
+  1. the stubs from ``edgetools.stubs`` start in-process; with ``--warm F``
+     the cache table is first seeded with rows for a fraction F of the users
+     (every test, current PROMPT_VERSION), as after a day of traffic,
+  2. the function is started under ``deno`` with their environment
+     (``--url`` instead drives one already running, wired to stubs of
+     your own),
+  3. requests are sent open-loop: arrivals are a Poisson process at
+     ``--rps`` for ``--duration`` seconds whatever the function does, so a
+     slow function builds a queue instead of slowing the generator down.
+     Each request is for a random user (and, for interpret-test, a random
+     test) and carries what the app sends; ``--force P`` sets ``force``
+     on that fraction, as the "regenerate" buttons do,
+  4. latency is measured from each request's scheduled start, so time
+     spent waiting behind earlier requests is counted, not omitted.
+
+Reported: achieved rate, p50/p95/p99/max latency overall and for cache hits
+and misses apart, the cache-hit ratio (from ``cached`` / ``from_cache`` in
+the responses), errors by status, and what the stubs saw.  ``--max-errors P``
+exits 1 if more than that fraction of requests failed.
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import random
+import time
+import uuid
+from collections import Counter
+from typing import Dict, List, NamedTuple, Optional
+
+from . import functions, stubs
+from .functions import FUNCTIONS, Function
+from .http import Client
+
+# The test types interpret-test has a prompt for, and what the app sends for each
+TESTS = ('HEXACO', 'ENNEAGRAM', 'DARK_TRIAD', 'STRENGTHS', 'CAREER', 'VALUES', 'CAREER_DNA')
+HEXACO_DIMENSIONS = ('honesty_humility', 'emotionality', 'extraversion',
+                     'agreeableness', 'conscientiousness', 'openness')
+_USERS = uuid.UUID('6f1c2c52-51d5-4c36-9a55-0ad7f3d8c0a1')
+
+
+def user_id(n: int) -> str:
+    return str(uuid.uuid5(_USERS, f'load-{n}'))
+
+
+def percentiles(rng: random.Random) -> Dict[str, int]:
+    return {dim: rng.randint(1, 99) for dim in HEXACO_DIMENSIONS}
+
+
+class Call(NamedTuple):
+    headers: Dict[str, str]
+    body: dict
+
+
+def call(function: Function, user: str, test_type: str, force: bool, rng: random.Random) -> Call:
+    """One request as the app makes it."""
+    if function.name == 'interpret-test':
+        token = functions.token(user)
+        return Call({'authorization': f'Bearer {token}', 'apikey': 'stub-anon-key'},
+                    {'test_type': test_type, 'percentile_scores': percentiles(rng),
+                     'raw_scores': {}, 'report': {}, 'force': force})
+    # CharacterSheet calls it with the anon key and names the user in the body
+    return Call({'authorization': 'Bearer stub-anon-key', 'apikey': 'stub-anon-key'},
+                {'force': force, 'user_id': user, 'input': {'hexaco': percentiles(rng)}})
+
+
+def cache_rows(function: Function, users: List[str], tests: List[str], version: int) -> List[dict]:
+    """What the function itself would have written for ``users``."""
+    if function.name == 'interpret-test':
+        return [{'user_id': u, 'test_type': t, 'prompt_version': version,
+                 'interpretation': '## Twój profil osobowości\n\n(seeded)'} for u in users for t in tests]
+    return [{'user_id': u, 'generated_at': stubs.now_iso(), 'content': {'archetype_name': 'Seeded'}}
+            for u in users]
+
+
+# ─── Load ─────────────────────────────────────────────────────────────────────
+
+class Result(NamedTuple):
+    latency: float          # seconds from scheduled start
+    status: int             # 0 if no response (timeout, connection error)
+    hit: Optional[bool]     # None unless the response says
+    error: Optional[str]
+
+
+async def _send(client: Client, url: str, c: Call, scheduled: float, hit_field: str) -> Result:
+    try:
+        response = await client.post_json(url, c.body, c.headers)
+    except asyncio.TimeoutError:
+        return Result(time.monotonic() - scheduled, 0, None, 'timeout')
+    except OSError as e:
+        return Result(time.monotonic() - scheduled, 0, None, type(e).__name__)
+    latency = time.monotonic() - scheduled
+    try:
+        data = response.json()
+    except ValueError:
+        data = None
+    if response.status != 200:
+        reason = data.get('error') if isinstance(data, dict) else None
+        return Result(latency, response.status, None, f'{response.status} {reason or ""}'.strip())
+    hit = data.get(hit_field) if isinstance(data, dict) else None
+    return Result(latency, 200, bool(hit) if hit is not None else None, None)
+
+
+async def generate(function: Function, url: str, rps: float, duration: float, users: List[str],
+                   tests: List[str], force: float, timeout: float, max_inflight: int,
+                   seed: int = 0) -> Dict[str, object]:
+    """Open-loop Poisson arrivals; every request's ``Result`` plus what was shed."""
+    rng = random.Random(seed)
+    client = Client(timeout)
+    tasks: List[asyncio.Task] = []
+    inflight = [0]
+    shed = 0
+    start = time.monotonic()
+    scheduled = start
+    while True:
+        scheduled += rng.expovariate(rps)
+        if scheduled - start >= duration:
+            break
+        delay = scheduled - time.monotonic()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        if inflight[0] >= max_inflight:
+            shed += 1
+            continue
+        c = call(function, rng.choice(users), rng.choice(tests), rng.random() < force, rng)
+        task = asyncio.ensure_future(_send(client, url, c, scheduled, function.hit_field))
+        inflight[0] += 1
+        task.add_done_callback(lambda _: inflight.__setitem__(0, inflight[0] - 1))
+        tasks.append(task)
+    sent_for = time.monotonic() - start
+    results = await asyncio.gather(*tasks)
+    await client.close()
+    return {'results': results, 'shed': shed, 'seconds': sent_for}
+
+
+# ─── Report ───────────────────────────────────────────────────────────────────
+
+def percentile(ordered: List[float], q: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not ordered:
+        return float('nan')
+    return ordered[max(0, math.ceil(q / 100 * len(ordered)) - 1)]
+
+
+def summary(latencies: List[float]) -> Dict[str, float]:
+    ordered = sorted(latencies)
+    return {'n': len(ordered), 'p50': percentile(ordered, 50), 'p95': percentile(ordered, 95),
+            'p99': percentile(ordered, 99), 'max': ordered[-1] if ordered else float('nan')}
+
+
+def report(results: List[Result], shed: int, seconds: float) -> dict:
+    ok = [r for r in results if r.error is None]
+    hits = [r for r in ok if r.hit]
+    misses = [r for r in ok if r.hit is False]
+    errors = Counter(r.error for r in results if r.error is not None)
+    sent = len(results)
+    return {
+        'sent': sent, 'shed': shed, 'rps': sent / seconds if seconds else 0.0,
+        'ok': len(ok), 'errors': dict(errors), 'error_rate': (sent - len(ok)) / sent if sent else 0.0,
+        'hit_ratio': len(hits) / (len(hits) + len(misses)) if hits or misses else float('nan'),
+        'latency': {'all': summary([r.latency for r in results]),
+                    'hit': summary([r.latency for r in hits]),
+                    'miss': summary([r.latency for r in misses])},
+    }
+
+
+def _ms(s: float) -> str:
+    return '—' if s != s else f"{s * 1000:,.0f} ms"
+
+
+def print_report(result: dict):
+    sent = result['sent']
+    print(f"  sent     {sent:,} ({result['rps']:.1f} rps achieved), {result['shed']:,} shed")
+    print(f"  ok       {result['ok']:,} ({result['ok'] / max(sent, 1):.1%}), "
+          f"cache-hit ratio {result['hit_ratio']:.1%}")
+    errors = ', '.join(f"{reason} ×{n:,}" for reason, n in sorted(result['errors'].items(), key=lambda e: -e[1]))
+    print(f"  errors   {sent - result['ok']:,} ({result['error_rate']:.2%}){': ' + errors if errors else ''}")
+    for label, s in result['latency'].items():
+        print(f"  {label:<8} n={s['n']:<7,} p50 {_ms(s['p50']):>10}   p95 {_ms(s['p95']):>10}"
+              f"   p99 {_ms(s['p99']):>10}   max {_ms(s['max']):>10}")
+
+
+async def run(args: argparse.Namespace) -> dict:
+    function = FUNCTIONS[args.function]
+    users = [user_id(n) for n in range(args.users)]
+    tests = args.tests if function.name == 'interpret-test' else ['-']
+    harness = process = None
+    try:
+        if args.url is None:
+            harness = await stubs.start(*stubs.from_arguments(args))
+            warm = users[:round(args.warm * len(users))]
+            harness.database.seed(function.table, cache_rows(function, warm, tests, functions.prompt_version()))
+            process = await functions.run(function, harness.env())
+        url = args.url or f'http://127.0.0.1:{functions.PORT}'
+        outcome = await generate(function, url, args.rps, args.duration, users, tests, args.force,
+                                 args.timeout, args.max_inflight, args.seed)
+        result = report(outcome['results'], outcome['shed'], outcome['seconds'])
+        print_report(result)
+        if harness is not None:
+            print()
+            stubs.print_stats(harness)
+        return result
+    finally:
+        await functions.stop(process)
+        if harness is not None:
+            harness.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m edgetools.load',
+                                     description="Drive an edge function at a fixed request rate, offline.")
+    parser.add_argument('function', choices=sorted(FUNCTIONS))
+    parser.add_argument('--rps', type=float, default=20.0, help="arrival rate (default: 20)")
+    parser.add_argument('--duration', type=float, default=30.0, help="seconds of arrivals (default: 30)")
+    parser.add_argument('--users', type=int, default=500, help="distinct users (default: 500)")
+    parser.add_argument('--warm', type=float, default=0.0, metavar='F',
+                        help="fraction of users with a cached result before the run (default: 0)")
+    parser.add_argument('--force', type=float, default=0.0, metavar='P',
+                        help="fraction of requests with force=true (default: 0)")
+    parser.add_argument('--tests', type=lambda s: s.split(','), default=list(TESTS),
+                        help=f"interpret-test test types, comma-separated (default: {','.join(TESTS)})")
+    parser.add_argument('--url', help="drive a function already serving here instead of starting one")
+    parser.add_argument('--timeout', type=float, default=60.0, help="per request, seconds (default: 60)")
+    parser.add_argument('--max-inflight', type=int, default=2000,
+                        help="shed arrivals beyond this many open requests (default: 2000)")
+    parser.add_argument('--max-errors', type=float, metavar='P', help="exit 1 above this error rate")
+    parser.add_argument('--out', help="also write the report as JSON")
+    stubs.add_arguments(parser)
+    args = parser.parse_args(argv)
+
+    unknown = sorted(set(args.tests) - set(TESTS))
+    if unknown:
+        parser.error(f"interpret-test has no prompt for: {', '.join(unknown)}")
+    if args.rps <= 0 or args.duration <= 0 or args.users <= 0:
+        parser.error("--rps, --duration and --users must be positive")
+    if args.url and args.warm:
+        parser.error("--warm seeds the in-process stubs; it cannot be used with --url")
+
+    print(f"\n=== load: {args.function} — {args.rps:g} rps for {args.duration:g} s, {args.users:,} users,"
+          f" warm {args.warm:.0%} ===\n")
+    result = asyncio.run(run(args))
+    if args.out:
+        with open(args.out, 'w', encoding='utf-8') as f:
+            json.dump({'function': args.function, 'rps': args.rps, 'duration': args.duration,
+                       'users': args.users, 'warm': args.warm, 'force': args.force, **result}, f, indent=2)
+        print(f"\n  written: {args.out}")
+    print("\n=== Done ===\n")
+    if args.max_errors is not None and result['error_rate'] > args.max_errors:
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    import sys
+    sys.exit(main())
@@ -0,0 +1,478 @@
+"""
+edgetools.stubs — stand-ins for the LLM API and Supabase (PostgREST + auth).
+
+    python -m edgetools.stubs [--db-port 8010] [--llm-port 8011]
+                              [--llm-latency lognormal:2.5,9] [--llm-errors 0.01] [--llm-rate N]
+                              [--db-latency constant:0.004]
+
+Serves, until interrupted, the two upstreams the edge functions call:
+
+  1. the database at ``SUPABASE_URL``: ``GET /auth/v1/user`` answers with
+     the ``sub`` of any bearer JWT (signatures are not checked), and
+     ``/rest/v1/<table>`` keeps rows in memory and speaks the part of
+     PostgREST ``supabase-js`` uses here — ``select``, ``eq``/``in``/...
+     filters, ``order``, ``limit``/``offset``, ``.single()`` and
+     ``.maybeSingle()`` (406 / PGRST116 on no row), and upserts with
+     ``on_conflict`` and ``Prefer: resolution=merge-duplicates``,
+  2. the LLM at ``OPENAI_BASE_URL``: ``POST /v1/chat/completions`` sleeps
+     for a latency drawn from a distribution, can fail (500) a fraction of
+     calls and throttle (429 with ``retry-after``) above a request rate,
+     and answers in the chat-completions shape — with a filled-in JSON
+     object when the prompt carries a ``schema`` (character-card-generate),
+     Markdown of about ``max_tokens`` otherwise.
+
+It prints the environment the functions need to reach both (see
+``Stubs.env``), and the request counts when stopped.  Latencies are specs
+in seconds:
+
+  constant:S   uniform:LO,HI   normal:MEAN,SD   exp:MEAN
+  lognormal:P50,P99            (a bare number is constant)
+"""
+
+import argparse
+import asyncio
+import base64
+import itertools
+import json
+import math
+import random
+import time
+import uuid
+from collections import Counter
+from datetime import datetime, timezone
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from .http import Request, Response, bound_port, json_response, serve
+
+# Primary keys, used by upserts without on_conflict and for 409s on plain inserts
+PRIMARY_KEYS = {
+    'ai_interpretations': ('id',),
+    'character_card_cache': ('user_id',),
+    'user_psychometrics': ('id',),
+}
+# PostgREST's db-max-rows, as in supabase/config.toml
+MAX_ROWS = 1000
+# z of the 99th percentile of a standard normal
+_Z99 = 2.3263
+
+
+def now_iso() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+# ─── Latency ──────────────────────────────────────────────────────────────────
+
+class Latency(NamedTuple):
+    spec: str
+    draw: Callable[[random.Random], float]  # seconds, never negative
+
+    @classmethod
+    def parse(cls, spec: str) -> 'Latency':
+        kind, _, args = spec.partition(':')
+        if not args:
+            kind, args = 'constant', kind
+        try:
+            a = [float(x) for x in args.split(',')]
+        except ValueError:
+            raise ValueError(f"bad latency spec: {spec!r}") from None
+        draws = {
+            ('constant', 1): lambda rng: a[0],
+            ('uniform', 2): lambda rng: rng.uniform(a[0], a[1]),
+            ('normal', 2): lambda rng: max(0.0, rng.gauss(a[0], a[1])),
+            ('exp', 1): lambda rng: rng.expovariate(1 / a[0]) if a[0] > 0 else 0.0,
+            ('lognormal', 2): lambda rng: rng.lognormvariate(math.log(a[0]), math.log(a[1] / a[0]) / _Z99),
+        }
+        draw = draws.get((kind, len(a)))
+        if draw is None or min(a) < 0 or (kind == 'lognormal' and not 0 < a[0] <= a[1]):
+            raise ValueError(f"bad latency spec: {spec!r} (see python -m edgetools.stubs --help)")
+        return cls(spec, draw)
+
+
+class Stats:
+    """Request counts by label, and the latencies the stub chose to add."""
+
+    def __init__(self):
+        self.counts: Counter = Counter()
+        self.delays: List[float] = []
+        self.inflight = 0
+        self.peak_inflight = 0
+
+    def enter(self):
+        self.inflight += 1
+        self.peak_inflight = max(self.peak_inflight, self.inflight)
+
+    def leave(self):
+        self.inflight -= 1
+
+
+# ─── LLM ──────────────────────────────────────────────────────────────────────
+
+_FILLER = ('Twoja siła tkwi w spokojnej konsekwencji. Działasz rozważnie, a ludzie wokół Ciebie '
+           'cenią to, że można na Tobie polegać. ').split()
+
+
+def _fill(schema, text: str):
+    """A value of the shape of ``schema`` with every string leaf set to ``text``."""
+    if isinstance(schema, dict):
+        return {key: _fill(value, text) for key, value in schema.items()}
+    if isinstance(schema, list):
+        return [_fill(value, text) for value in schema]
+    return text if schema == 'string' else schema
+
+
+def completion_text(messages: List[dict], max_tokens: int) -> str:
+    prompt = str(messages[-1].get('content', '')) if messages else ''
+    _, _, tail = prompt.rpartition('\n\n')
+    try:
+        schema = json.loads(tail).get('schema')
+    except (ValueError, AttributeError):
+        schema = None
+    if schema is not None:
+        return json.dumps(_fill(schema, 'Stub'), ensure_ascii=False)
+    words = itertools.islice(itertools.cycle(_FILLER), max(1, int(max_tokens * 0.7)))
+    return '## Twój profil osobowości\n\n' + ' '.join(words)
+
+
+class LLM:
+    """``/v1/chat/completions`` with configurable latency, failures and throttling."""
+
+    def __init__(self, latency: Latency, errors: float = 0.0, rate: float = 0.0, seed: int = 0):
+        self.latency = latency
+        self.errors = errors
+        self.rate = rate                    # requests/s before 429s; 0 = unlimited
+        self.rng = random.Random(seed)
+        self.stats = Stats()
+        self._tokens = max(rate, 1.0)
+        self._refilled = time.monotonic()
+
+    def _throttled(self) -> bool:
+        if not self.rate:
+            return False
+        now = time.monotonic()
+        self._tokens = min(max(self.rate, 1.0), self._tokens + (now - self._refilled) * self.rate)
+        self._refilled = now
+        if self._tokens < 1:
+            return True
+        self._tokens -= 1
+        return False
+
+    async def __call__(self, request: Request) -> Response:
+        if request.method != 'POST' or not request.path.endswith('/chat/completions'):
+            return json_response(404, {'error': {'message': f'no route {request.method} {request.path}'}})
+        if not request.headers.get('authorization', '').startswith('Bearer '):
+            return json_response(401, {'error': {'message': 'missing API key', 'type': 'invalid_request_error'}})
+        if self._throttled():
+            self.stats.counts['throttled'] += 1
+            return json_response(429, {'error': {'message': 'Rate limit reached', 'type': 'requests'}},
+                                 {'retry-after': f'{1 / self.rate:.3f}'})
+        body = request.json()
+        delay = self.latency.draw(self.rng)
+        self.stats.delays.append(delay)
+        self.stats.enter()
+        try:
+            await asyncio.sleep(delay)
+        finally:
+            self.stats.leave()
+        if self.rng.random() < self.errors:
+            self.stats.counts['failed'] += 1
+            return json_response(500, {'error': {'message': 'The server had an error', 'type': 'server_error'}})
+        self.stats.counts['completed'] += 1
+        content = completion_text(body.get('messages', []), int(body.get('max_tokens') or 800))
+        prompt_tokens = sum(len(str(m.get('content', ''))) for m in body.get('messages', [])) // 4
+        completion_tokens = len(content) // 4
+        return json_response(200, {
+            'id': f'chatcmpl-stub-{uuid.uuid4().hex[:12]}',
+            'object': 'chat.completion',
+            'created': int(time.time()),
+            'model': body.get('model', 'stub'),
+            'choices': [{'index': 0, 'message': {'role': 'assistant', 'content': content},
+                         'finish_reason': 'stop'}],
+            'usage': {'prompt_tokens': prompt_tokens, 'completion_tokens': completion_tokens,
+                      'total_tokens': prompt_tokens + completion_tokens},
+        })
+
+
+# ─── Database ─────────────────────────────────────────────────────────────────
+
+def _text(value) -> str:
+    """A column value as it appears in a PostgREST filter."""
+    return value if isinstance(value, str) else json.dumps(value)
+
+
+def _number(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return value
+
+
+def _filter(op: str) -> Optional[Callable[[object], bool]]:
+    """Predicate for a PostgREST ``op.value`` filter; None if not a filter we know."""
+    name, _, arg = op.partition('.')
+    if name == 'eq':
+        return lambda v: _text(v) == arg
+    if name == 'neq':
+        return lambda v: _text(v) != arg
+    if name == 'in':
+        values = {x.strip().strip('"') for x in arg.strip('()').split(',')}
+        return lambda v: _text(v) in values
+    if name == 'is':
+        return lambda v: _text(v) == arg
+    compare = {'gt': lambda a, b: a > b, 'gte': lambda a, b: a >= b,
+               'lt': lambda a, b: a < b, 'lte': lambda a, b: a <= b}.get(name)
+    if compare is None:
+        return None
+    bound = _number(arg)
+    return lambda v: v is not None and compare(_number(v), bound)
+
+
+def _decode_jwt(token: str) -> dict:
+    try:
+        payload = token.split('.')[1]
+        return json.loads(base64.urlsafe_b64decode(payload + '=' * (-len(payload) % 4)))
+    except (IndexError, ValueError):
+        return {}
+
+
+class Database:
+    """In-memory tables behind ``/rest/v1`` and the auth ``/user`` endpoint."""
+
+    def __init__(self, latency: Optional[Latency] = None, seed: int = 0):
+        self.latency = latency
+        self.rng = random.Random(seed)
+        self.tables: Dict[str, List[dict]] = {}
+        self._by_user: Dict[str, Dict[str, List[dict]]] = {}
+        self.stats = Stats()
+
+    def seed(self, table: str, rows: Iterable[dict]):
+        for row in rows:
+            self._insert(table, dict(row))
+
+    def rows(self, table: str) -> List[dict]:
+        return self.tables.get(table, [])
+
+    def _insert(self, table: str, row: dict) -> dict:
+        keys = PRIMARY_KEYS.get(table, ())
+        if 'id' in keys:
+            row.setdefault('id', str(uuid.uuid4()))
+        if table != 'character_card_cache':
+            row.setdefault('created_at', now_iso())
+        self.tables.setdefault(table, []).append(row)
+        if 'user_id' in row:
+            self._by_user.setdefault(table, {}).setdefault(_text(row['user_id']), []).append(row)
+        return row
+
+    def _candidates(self, table: str, filters: List[Tuple[str, str]]) -> List[dict]:
+        for column, op in filters:
+            if column == 'user_id' and op.startswith('eq.'):
+                return self._by_user.get(table, {}).get(op[3:], [])
+        return self.rows(table)
+
+    def select(self, table: str, query: List[Tuple[str, str]]) -> List[dict]:
+        params = dict(query)
+        filters = []
+        for column, op in query:
+            if column not in ('select', 'order', 'limit', 'offset', 'on_conflict', 'columns'):
+                predicate = _filter(op)
+                if predicate is None:
+                    raise ValueError(f'unsupported filter {column}={op}')
+                filters.append((column, predicate))
+        found = [row for row in self._candidates(table, query)
+                 if all(predicate(row.get(column)) for column, predicate in filters)]
+        for term in reversed([t for t in params.get('order', '').split(',') if t]):
+            column, _, direction = term.partition('.')
+            present = [r for r in found if r.get(column) is not None]
+            absent = [r for r in found if r.get(column) is None]
+            present.sort(key=lambda r: r[column], reverse=direction.startswith('desc'))
+            found = present + absent
+        offset = int(params.get('offset', 0))
+        limit = min(int(params.get('limit', MAX_ROWS)), MAX_ROWS)
+        found = found[offset:offset + limit]
+        columns = [c.strip() for c in params.get('select', '*').split(',') if c.strip()]
+        if '*' in columns:
+            return [dict(row) for row in found]
+        return [{c: row.get(c) for c in columns} for row in found]
+
+    def upsert(self, table: str, rows: List[dict], conflict: Tuple[str, ...], merge: bool) -> Tuple[int, List[dict]]:
+        """(status, written rows); a plain insert hitting an existing key is a 409."""
+        written = []
+        for row in rows:
+            key = tuple(_text(row.get(c)) for c in conflict)
+            existing = None
+            if all(c in row for c in conflict):
+                existing = next((r for r in self._candidates(table, [(c, f'eq.{_text(row[c])}') for c in conflict])
+                                 if tuple(_text(r.get(c)) for c in conflict) == key), None)
+            if existing is None:
+                written.append(self._insert(table, dict(row)))
+            elif merge:
+                existing.update(row)
+                if 'updated_at' in existing or table == 'ai_interpretations':
+                    existing['updated_at'] = now_iso()
+                written.append(existing)
+            else:
+                return 409, [{'code': '23505', 'message': 'duplicate key value violates unique constraint',
+                              'details': f'Key ({", ".join(conflict)}) already exists.', 'hint': None}]
+        return 201, written
+
+    async def __call__(self, request: Request) -> Response:
+        self.stats.enter()
+        try:
+            if self.latency is not None:
+                delay = self.latency.draw(self.rng)
+                self.stats.delays.append(delay)
+                await asyncio.sleep(delay)
+            return self._route(request)
+        finally:
+            self.stats.leave()
+
+    def _route(self, request: Request) -> Response:
+        if request.path == '/auth/v1/user' and request.method == 'GET':
+            self.stats.counts['auth'] += 1
+            token = request.headers.get('authorization', '').replace('Bearer ', '', 1)
+            claims = _decode_jwt(token)
+            if not claims.get('sub'):
+                return json_response(401, {'code': 401, 'error_code': 'bad_jwt', 'msg': 'invalid JWT'})
+            return json_response(200, {'id': claims['sub'], 'aud': claims.get('aud', 'authenticated'),
+                                       'role': claims.get('role', 'authenticated'), 'email': claims.get('email'),
+                                       'app_metadata': {}, 'user_metadata': {}, 'created_at': now_iso()})
+        prefix = '/rest/v1/'
+        if not request.path.startswith(prefix):
+            return json_response(404, {'message': f'no route {request.method} {request.path}'})
+        table = request.path[len(prefix):]
+        prefer = request.headers.get('prefer', '')
+        self.stats.counts[f'{request.method} {table}'] += 1
+
+        if request.method in ('GET', 'HEAD'):
+            try:
+                rows = self.select(table, request.query)
+            except ValueError as e:
+                return json_response(400, {'code': 'PGRST100', 'message': str(e), 'details': None, 'hint': None})
+            if 'vnd.pgrst.object' in request.headers.get('accept', ''):
+                if len(rows) != 1:
+                    return json_response(406, {
+                        'code': 'PGRST116', 'message': 'JSON object requested, multiple (or no) rows returned',
+                        'details': f'The result contains {len(rows)} rows', 'hint': None})
+                return json_response(200, rows[0])
+            return json_response(200, rows, {'content-range': f'0-{max(len(rows) - 1, 0)}/*'})
+
+        if request.method == 'POST':
+            body = request.json()
+            rows = body if isinstance(body, list) else [body]
+            params = dict(request.query)
+            conflict = tuple(c.strip() for c in params.get('on_conflict', '').split(',') if c.strip())
+            merge = 'resolution=merge-duplicates' in prefer
+            status, written = self.upsert(table, rows, conflict or PRIMARY_KEYS.get(table, ()), merge)
+            if status != 201 or 'return=representation' in prefer:
+                return json_response(status, written)
+            return Response(201, {}, b'')
+
+        return json_response(405, {'message': f'{request.method} not supported by the stub'})
+
+
+# ─── Both ─────────────────────────────────────────────────────────────────────
+
+class Stubs(NamedTuple):
+    database: Database
+    llm: LLM
+    servers: Tuple[asyncio.AbstractServer, asyncio.AbstractServer]
+    host: str
+
+    @property
+    def database_url(self) -> str:
+        return f'http://{self.host}:{bound_port(self.servers[0])}'
+
+    @property
+    def llm_url(self) -> str:
+        return f'http://{self.host}:{bound_port(self.servers[1])}/v1'
+
+    def env(self) -> Dict[str, str]:
+        """What the edge functions read from ``Deno.env`` to reach the stubs."""
+        return {
+            'SUPABASE_URL': self.database_url,
+            'SUPABASE_ANON_KEY': 'stub-anon-key',
+            'SUPABASE_SERVICE_ROLE_KEY': 'stub-service-role-key',
+            'OPENAI_API_KEY': 'stub-openai-key',
+            'OPENAI_BASE_URL': self.llm_url,
+        }
+
+    def close(self):
+        for server in self.servers:
+            server.close()
+
+
+async def start(database: Database, llm: LLM, host: str = '127.0.0.1', db_port: int = 0, llm_port: int = 0) -> Stubs:
+    servers = (await serve(database, host, db_port), await serve(llm, host, llm_port))
+    return Stubs(database, llm, servers, host)
+
+
+def _latency(spec: str) -> Latency:
+    try:
+        return Latency.parse(spec)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e)) from None
+
+
+def add_arguments(parser: argparse.ArgumentParser):
+    """The stub options shared by every harness that starts the stubs."""
+    group = parser.add_argument_group('stubs')
+    group.add_argument('--llm-latency', type=_latency, default=Latency.parse('lognormal:2.5,9'),
+                       metavar='SPEC', help="LLM latency in seconds (default: lognormal:2.5,9 — p50 2.5 s, p99 9 s)")
+    group.add_argument('--llm-errors', type=float, default=0.0, metavar='P',
+                       help="fraction of LLM calls that fail with 500 (default: 0)")
+    group.add_argument('--llm-rate', type=float, default=0.0, metavar='N',
+                       help="LLM requests per second before 429s (default: unlimited)")
+    group.add_argument('--db-latency', type=_latency, default=Latency.parse('constant:0.004'),
+                       metavar='SPEC', help="added to every database request (default: constant:0.004)")
+    group.add_argument('--seed', type=int, default=0, help="random seed for latencies and failures")
+
+
+def from_arguments(args: argparse.Namespace) -> Tuple[Database, LLM]:
+    return (Database(args.db_latency, args.seed),
+            LLM(args.llm_latency, args.llm_errors, args.llm_rate, args.seed))
+
+
+def print_stats(stubs: Stubs):
+    llm, database = stubs.llm.stats, stubs.database.stats
+    delays = sorted(llm.delays)
+    median = f", median delay {delays[len(delays) // 2]:.2f} s" if delays else ''
+    print(f"  llm  {sum(llm.counts.values()):,} calls: {llm.counts['completed']:,} completed, "
+          f"{llm.counts['failed']:,} failed, {llm.counts['throttled']:,} throttled; "
+          f"peak {llm.peak_inflight} in flight{median}")
+    print(f"  db   {sum(database.counts.values()):,} requests: "
+          + ', '.join(f"{label} {n:,}" for label, n in sorted(database.counts.items())))
+
+
+async def _serve_forever(args: argparse.Namespace):
+    stubs = await start(*from_arguments(args), args.host, args.db_port, args.llm_port)
+    print(f"\n=== stubs: database {stubs.database_url}, llm {stubs.llm_url} ===\n")
+    print("  run a function against them with:\n")
+    for name, value in stubs.env().items():
+        print(f"    export {name}={value}")
+    print("    deno run --allow-net --allow-env --allow-read supabase/functions/interpret-test/index.ts\n")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        print()
+        print_stats(stubs)
+        stubs.close()
+        print("\n=== Done ===\n")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m edgetools.stubs',
+                                     description="Serve the stand-in LLM API and Supabase until interrupted.")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--db-port', type=int, default=8010, help="SUPABASE_URL port (default: 8010)")
+    parser.add_argument('--llm-port', type=int, default=8011, help="OPENAI_BASE_URL port (default: 8011)")
+    add_arguments(parser)
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(_serve_forever(args))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == '__main__':
+    import sys
+    sys.exit(main())
@@ -0,0 +1,509 @@
+"""
+edgetools.warm — pre-generate ai_interpretations for the current PROMPT_VERSION.
+
+    python -m edgetools.warm [TEST_TYPE ...] [-n] [--concurrency 4] [--rate 2]
+                             [--retries 5] [--checkpoint FILE] [--limit N] [--retry-failed]
+    python -m edgetools.warm --local [--users 200] [stub options]
+
+interpret-test caches by ``(user_id, test_type, prompt_version)``, so a
+``PROMPT_VERSION`` bump leaves every stored result without an
+interpretation until its owner opens the results page and waits for the
+LLM.  This job does that wait for them, ahead of time:
+
+  1. checks that ``PROMPT_VERSION`` is the same in the function
+     (``promptConfig.ts``) and the app (``src/utils/promptVersion.js``),
+  2. pages through ``user_psychometrics`` (newest first) and the current
+     version's ``ai_interpretations`` with the service role, and keeps each
+     user's latest result per test that has no interpretation yet — most
+     recently active users first,
+  3. calls interpret-test itself for each one, as that user (a token
+     signed with the project's JWT secret) and with the body the results
+     page would send, so the prompt exists in one place only and the
+     function writes the cache row as usual.  Reports the pages build
+     client-side (CAREER, VALUES, CAREER_DNA) come from ``scoring.js``
+     through ``node``,
+  4. runs ``--concurrency`` workers behind one token bucket of ``--rate``
+     calls per second; a timeout, 429 or 5xx is retried up to
+     ``--retries`` times with exponential backoff and full jitter (at
+     least the ``retry-after`` the function sent), and the run stops
+     after ``--max-failures`` pairs have failed for good,
+  5. appends every finished pair to ``--checkpoint`` as it finishes.  A
+     rerun skips pairs done under the same version — even if their row is
+     still missing (the function does not report failed upserts) — and
+     pairs that failed with a 4xx unless ``--retry-failed``.
+
+Reads ``SUPABASE_URL``, ``SUPABASE_SERVICE_ROLE_KEY`` and
+``SUPABASE_JWT_SECRET``; the function is called at
+``$SUPABASE_URL/functions/v1`` unless ``--functions-url`` says otherwise.
+``-n`` only counts what is missing.  ``--local`` runs the whole job
+against ``edgetools.stubs`` instead, seeded with ``--users`` synthetic
+users scored by ``scoring.js`` and interpretations for the previous
+version, with interpret-test under ``deno``, and then checks that
+nothing is left missing.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import tempfile
+import time
+from collections import Counter
+from typing import Dict, List, NamedTuple, Optional, Set, Tuple
+from urllib.parse import urlencode
+
+from codemods.cache import ROOT
+from codemods.patterns import compiled
+
+from . import functions, stubs
+from .functions import FUNCTIONS
+from .http import Client
+
+# Every test whose results page asks interpret-test for an interpretation
+INTERPRETED = ('HEXACO', 'ENNEAGRAM', 'DARK_TRIAD', 'STRENGTHS', 'CAREER', 'VALUES', 'CAREER_DNA', 'EQ',
+               'ATTACHMENT', 'DEFENSE', 'MENTAL_TOUGHNESS', 'MEANING', 'MOTIVATION', 'COLOR_PERSONALITY')
+# Tests whose page sends a report it builds from raw_scores, not the stored one
+REPORTS = {'CAREER': 'generateCareerReport', 'VALUES': 'generateValuesReport',
+           'CAREER_DNA': 'generateCareerDnaReport'}
+# ...and which of those stamp it with completed_at
+DATED_REPORTS = ('CAREER', 'VALUES')
+RETRYABLE = (0, 429, 500, 502, 503, 504)
+CHECKPOINT = os.path.join(ROOT, '.interpret-warm.jsonl')
+PAGE = stubs.MAX_ROWS
+
+_APP_VERSION = compiled(r'export\s+const\s+PROMPT_VERSION\s*=\s*(\d+)')
+
+_REPORTS_JS = '''
+import { readFileSync } from 'node:fs';
+import * as scoring from './src/utils/scoring.js';
+const out = JSON.parse(readFileSync(0, 'utf8')).map(([name, raw]) => {
+  try { return scoring[name](raw); } catch (e) { return null; }
+});
+process.stdout.write(JSON.stringify(out));
+'''
+
+
+class Pair(NamedTuple):
+    user_id: str
+    test_type: str
+
+
+class Job(NamedTuple):
+    pair: Pair
+    body: dict
+
+
+class Outcome(NamedTuple):
+    pair: Pair
+    status: str             # 'generated', 'cached' (someone got there first) or 'failed'
+    attempts: int
+    error: Optional[str]
+    http: int               # last status; 0 if none
+
+
+def check_versions() -> int:
+    """The current PROMPT_VERSION, if the function and the app agree on it."""
+    version = functions.prompt_version()
+    path = os.path.join(ROOT, 'src', 'utils', 'promptVersion.js')
+    with open(path, encoding='utf-8') as f:
+        match = _APP_VERSION.search(f.read())
+    app = int(match.group(1)) if match else None
+    if app != version:
+        raise SystemExit(f"PROMPT_VERSION is {version} in interpret-test but {app} in src/utils/promptVersion.js"
+                         " — the app would read rows under another version than the function writes")
+    return version
+
+
+# ─── Enumerate ────────────────────────────────────────────────────────────────
+
+class Rest(NamedTuple):
+    url: str                # .../rest/v1
+    headers: Dict[str, str]
+
+    @classmethod
+    def service(cls, supabase_url: str, service_key: str) -> 'Rest':
+        return cls(supabase_url.rstrip('/') + '/rest/v1',
+                   {'apikey': service_key, 'authorization': f'Bearer {service_key}'})
+
+
+async def pages(client: Client, rest: Rest, table: str, params: Dict[str, str]):
+    """Every row matching ``params``, a page of ``PAGE`` at a time."""
+    offset = 0
+    while True:
+        query = urlencode({**params, 'limit': PAGE, 'offset': offset}, safe=',.()')
+        rows = await client.get_json(f'{rest.url}/{table}?{query}', rest.headers)
+        for row in rows:
+            yield row
+        if len(rows) < PAGE:
+            return
+        offset += PAGE
+
+
+async def missing(client: Client, rest: Rest, tests: List[str], version: int) -> Tuple[List[dict], int]:
+    """Latest result of every (user, test) lacking an interpretation, newest first; and how many have one."""
+    in_tests = f"in.({','.join(tests)})"
+    have: Set[Pair] = set()
+    async for row in pages(client, rest, 'ai_interpretations',
+                           {'select': 'user_id,test_type', 'prompt_version': f'eq.{version}',
+                            'test_type': in_tests, 'order': 'id'}):
+        have.add(Pair(row['user_id'], row['test_type']))
+    latest: Dict[Pair, dict] = {}
+    async for row in pages(client, rest, 'user_psychometrics',
+                           {'select': 'id,user_id,test_type,raw_scores,percentile_scores,report,completed_at',
+                            'test_type': in_tests, 'order': 'completed_at.desc,id'}):
+        latest.setdefault(Pair(row['user_id'], row['test_type']), row)
+    return [row for pair, row in latest.items() if pair not in have], len(have)
+
+
+# ─── Request bodies ───────────────────────────────────────────────────────────
+
+def client_reports(rows: List[dict]) -> Dict[int, Optional[dict]]:
+    """``generate*Report(raw_scores)`` from scoring.js for the rows whose page builds one."""
+    wanted = [(i, row) for i, row in enumerate(rows) if row['test_type'] in REPORTS]
+    if not wanted:
+        return {}
+    from scoring import bank
+    calls = [[REPORTS[row['test_type']], row.get('raw_scores') or {}] for _, row in wanted]
+    reports = json.loads(bank.run_node(_REPORTS_JS, stdin=json.dumps(calls)))
+    return {i: report for (i, _), report in zip(wanted, reports)}
+
+
+def body(row: dict, report: Optional[dict] = None) -> dict:
+    """What the test's results page sends to interpret-test for this stored row."""
+    test_type = row['test_type']
+    raw = row.get('raw_scores') or {}
+    if test_type == 'HEXACO':
+        return {'test_type': test_type, 'percentile_scores': row.get('percentile_scores'), 'raw_scores': row.get('raw_scores')}
+    if test_type == 'DARK_TRIAD':
+        dims = raw.get('dimensions') or {}
+        return {'test_type': test_type,
+                'percentile_scores': {k: (v or {}).get('percentile') or 0 for k, v in dims.items()}}
+    if test_type == 'STRENGTHS':
+        if raw.get('top_5'):
+            raw = {**raw, 'top_5': [{**t, 'keywords': [k.strip() for k in t['keywords'].split(',')]
+                                     if isinstance(t.get('keywords'), str) else (t.get('keywords') or [])}
+                                    for t in raw['top_5']]}
+        return {'test_type': test_type, 'raw_scores': raw, 'report': raw}
+    if test_type in REPORTS:
+        if report is not None and test_type in DATED_REPORTS:
+            report = {**report, 'completed_at': row.get('completed_at')}
+        return {'test_type': test_type, 'raw_scores': raw, 'report': report}
+    return {'test_type': test_type, 'raw_scores': row.get('raw_scores'), 'report': row.get('report')}
+
+
+def jobs(rows: List[dict]) -> List[Job]:
+    reports = client_reports(rows)
+    return [Job(Pair(row['user_id'], row['test_type']), body(row, reports.get(i))) for i, row in enumerate(rows)]
+
+
+# ─── Checkpoint ───────────────────────────────────────────────────────────────
+
+class Checkpoint:
+    """Finished pairs, one JSON line each, appended and flushed as they finish."""
+
+    def __init__(self, path: str, version: int):
+        self.path = path
+        self.version = version
+        self.done: Set[Pair] = set()
+        self.failed: Set[Pair] = set()     # for good: a 4xx other than 429
+        if os.path.exists(path):
+            with open(path, encoding='utf-8') as f:
+                for line in f:
+                    entry = json.loads(line)
+                    if entry.get('prompt_version') != version:
+                        continue
+                    pair = Pair(entry['user_id'], entry['test_type'])
+                    if entry['status'] == 'failed':
+                        if entry['http'] not in RETRYABLE:
+                            self.failed.add(pair)
+                    else:
+                        self.done.add(pair)
+                        self.failed.discard(pair)
+        self._file = open(path, 'a', encoding='utf-8')
+
+    def record(self, outcome: Outcome):
+        entry = {'user_id': outcome.pair.user_id, 'test_type': outcome.pair.test_type,
+                 'prompt_version': self.version, 'status': outcome.status, 'attempts': outcome.attempts,
+                 'http': outcome.http, 'error': outcome.error, 'at': stubs.now_iso()}
+        self._file.write(json.dumps(entry) + '\n')
+        self._file.flush()
+
+    def close(self):
+        self._file.close()
+
+
+# ─── Workers ──────────────────────────────────────────────────────────────────
+
+class RateLimiter:
+    """Token bucket shared by every worker: ``rate`` calls per second, bursts of ``burst``."""
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._refilled = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        if not self.rate:
+            return
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._refilled) * self.rate)
+                self._refilled = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+class Settings(NamedTuple):
+    url: str                # interpret-test
+    jwt_secret: str
+    anon_key: str
+    retries: int
+    backoff: float          # seconds before the first retry; doubles, capped at backoff_max
+    backoff_max: float
+
+
+def _retry_after(headers: Dict[str, str]) -> float:
+    try:
+        return float(headers.get('retry-after', 0))
+    except ValueError:
+        return 0.0
+
+
+async def invoke(client: Client, limiter: RateLimiter, settings: Settings, job: Job,
+                 rng: random.Random) -> Outcome:
+    """One pair through interpret-test, with retries."""
+    headers = {'authorization': f'Bearer {functions.token(job.pair.user_id, settings.jwt_secret)}',
+               'apikey': settings.anon_key}
+    error, status = None, 0
+    for attempt in range(1, settings.retries + 2):
+        await limiter.acquire()
+        wait = 0.0
+        try:
+            response = await client.post_json(settings.url, {**job.body, 'force': False}, headers)
+        except asyncio.TimeoutError:
+            error, status = 'timeout', 0
+        except OSError as e:
+            error, status = type(e).__name__, 0
+        else:
+            status = response.status
+            try:
+                data = response.json()
+            except ValueError:
+                data = None
+            if status == 200 and isinstance(data, dict):
+                return Outcome(job.pair, 'cached' if data.get('cached') else 'generated', attempt, None, 200)
+            error = (data or {}).get('error') if isinstance(data, dict) else None
+            error = f"{status} {error or response.body[:80].decode(errors='replace')}".strip()
+            wait = _retry_after(response.headers)
+            if status not in RETRYABLE:
+                break
+        if attempt <= settings.retries:
+            ceiling = min(settings.backoff_max, settings.backoff * 2 ** (attempt - 1))
+            await asyncio.sleep(max(wait, rng.uniform(0, ceiling)))
+    return Outcome(job.pair, 'failed', attempt, error, status)
+
+
+async def warm(client: Client, settings: Settings, todo: List[Job], checkpoint: Checkpoint,
+               concurrency: int, rate: float, max_failures: int, seed: int = 0) -> List[Outcome]:
+    """Run every job through a bounded pool; stop early after ``max_failures`` failures."""
+    queue: asyncio.Queue = asyncio.Queue()
+    for job in todo:
+        queue.put_nowait(job)
+    limiter = RateLimiter(rate, burst=max(1, concurrency))
+    outcomes: List[Outcome] = []
+    failures = 0
+    start = time.monotonic()
+    rng = random.Random(seed)
+
+    async def worker():
+        nonlocal failures
+        while failures < max_failures:
+            try:
+                job = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            outcome = await invoke(client, limiter, settings, job, rng)
+            checkpoint.record(outcome)
+            outcomes.append(outcome)
+            failures += outcome.status == 'failed'
+
+    async def progress():
+        while True:
+            await asyncio.sleep(10)
+            elapsed = time.monotonic() - start
+            left = len(todo) - len(outcomes)
+            speed = len(outcomes) / elapsed
+            eta = f", ~{left / speed / 60:.0f} min left" if speed and left > 60 * speed else ''
+            print(f"  … {len(outcomes):,}/{len(todo):,} pairs, {speed:.2f}/s{eta}", flush=True)
+
+    reporter = asyncio.ensure_future(progress())
+    try:
+        await asyncio.gather(*(worker() for _ in range(max(1, concurrency))))
+    finally:
+        reporter.cancel()
+    return outcomes
+
+
+def print_outcomes(outcomes: List[Outcome], seconds: float):
+    counts = Counter(o.status for o in outcomes)
+    retried = sum(o.attempts > 1 for o in outcomes)
+    print(f"  ✓ generated {counts['generated']:,}, already cached {counts['cached']:,}"
+          f"  ({len(outcomes) / max(seconds, 1e-9):.2f} pairs/s, {retried:,} needed retries)")
+    errors = Counter(o.error for o in outcomes if o.status == 'failed')
+    if errors:
+        print(f"  ✗ failed {counts['failed']:,}: "
+              + ', '.join(f"{reason} ×{n:,}" for reason, n in errors.most_common(5)))
+
+
+# ─── Local stand-ins ──────────────────────────────────────────────────────────
+
+def synthetic_results(users: int, tests: List[str], seed: int = 0) -> List[dict]:
+    """user_psychometrics rows: each user took each test with probability 0.6, scored by scoring.js."""
+    from scoring import diff, engine
+
+    rng = random.Random(seed)
+    rows = []
+    for test_type in tests:
+        k = engine.key(test_type)
+        takers = [n for n in range(users) if rng.random() < 0.6]
+        answers = [{q: rng.randint(1, engine.scale_max(k)) if k.spec.kind == 'likert' else rng.choice(k.labels)
+                    for q in k.questions} for _ in takers]
+        for n, scored in zip(takers, diff.js_scores(test_type, answers)):
+            scores = scored.get('ok') or {}
+            # Stored as TestWizard stores them; every other test keeps its whole result in raw_scores
+            raw = {'HEXACO': scores.get('raw_scores'), 'ENNEAGRAM': scores.get('all_scores')}.get(test_type, scores)
+            rows.append({'user_id': f'00000000-0000-4000-8000-{n:012d}', 'test_type': test_type,
+                         'raw_scores': raw, 'percentile_scores': scores.get('percentile_scores'),
+                         'report': {}, 'completed_at': f'2026-01-{1 + n % 28:02d}T12:00:00+00:00'})
+    return rows
+
+
+async def _local(args: argparse.Namespace, version: int) -> int:
+    harness = await stubs.start(*stubs.from_arguments(args))
+    process = None
+    try:
+        results = synthetic_results(args.users, args.tests, args.seed)
+        harness.database.seed('user_psychometrics', results)
+        # Last version's interpretations for everyone, and this one's for a few already
+        harness.database.seed('ai_interpretations', (
+            {'user_id': r['user_id'], 'test_type': r['test_type'], 'prompt_version': v, 'interpretation': '(old)'}
+            for i, r in enumerate(results) for v in ((version - 1, version) if i % 10 == 0 else (version - 1,))))
+        env = harness.env()
+        process = await functions.run(FUNCTIONS['interpret-test'], env)
+        rest = Rest.service(env['SUPABASE_URL'], env['SUPABASE_SERVICE_ROLE_KEY'])
+        settings = _settings(args, f'http://127.0.0.1:{functions.PORT}', functions.LOCAL_JWT_SECRET,
+                             env['SUPABASE_ANON_KEY'])
+        checkpoint = args.checkpoint or os.path.join(tempfile.mkdtemp(), 'warm.jsonl')
+        rc = await _run(args, rest, settings, version, checkpoint)
+        client = Client(args.timeout)
+        left, _ = await missing(client, rest, args.tests, version)
+        await client.close()
+        print()
+        stubs.print_stats(harness)
+        print(f"\n  {'✓' if not left else '✗'} {len(left):,} pairs still missing after the run")
+        return rc or (1 if left else 0)
+    finally:
+        await functions.stop(process)
+        harness.close()
+
+
+# ─── Run ──────────────────────────────────────────────────────────────────────
+
+def _settings(args: argparse.Namespace, url: str, secret: str, anon_key: str) -> Settings:
+    return Settings(url, secret, anon_key, args.retries, args.backoff, args.backoff_max)
+
+
+async def _run(args: argparse.Namespace, rest: Rest, settings: Settings, version: int, checkpoint_path: str) -> int:
+    client = Client(args.timeout)
+    try:
+        rows, have = await missing(client, rest, args.tests, version)
+        checkpoint = Checkpoint(checkpoint_path, version)
+        skipped = [r for r in rows if Pair(r['user_id'], r['test_type']) in checkpoint.done]
+        failed_before = [] if args.retry_failed else \
+            [r for r in rows if Pair(r['user_id'], r['test_type']) in checkpoint.failed]
+        rows = [r for r in rows if Pair(r['user_id'], r['test_type']) not in checkpoint.done
+                and (args.retry_failed or Pair(r['user_id'], r['test_type']) not in checkpoint.failed)]
+        if args.limit:
+            rows = rows[:args.limit]
+        print(f"  {have:,} pairs have an interpretation for version {version}; {len(rows):,} to generate"
+              + (f", {len(skipped):,} done earlier (row still missing)" if skipped else '')
+              + (f", {len(failed_before):,} failed earlier (--retry-failed)" if failed_before else ''))
+        for test_type, n in sorted(Counter(r['test_type'] for r in rows).items()):
+            print(f"      {test_type:<18} {n:>8,}")
+        if args.dry_run or not rows:
+            checkpoint.close()
+            return 0
+        print(f"\n  checkpoint: {checkpoint_path}\n")
+        start = time.monotonic()
+        try:
+            outcomes = await warm(client, settings, jobs(rows), checkpoint, args.concurrency, args.rate,
+                                  args.max_failures, args.seed)
+        finally:
+            checkpoint.close()
+        print_outcomes(outcomes, time.monotonic() - start)
+        failed = sum(o.status == 'failed' for o in outcomes)
+        if failed >= args.max_failures:
+            print(f"  ✗ stopped after {failed} failures; rerun to resume")
+        return 1 if failed else 0
+    finally:
+        await client.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m edgetools.warm',
+                                     description="Pre-generate interpretations for the current PROMPT_VERSION.")
+    parser.add_argument('tests', nargs='*', metavar='TEST_TYPE',
+                        help="only these test types (default: every interpreted test)")
+    parser.add_argument('-n', '--dry-run', action='store_true', help="count missing pairs, generate nothing")
+    parser.add_argument('--concurrency', type=int, default=4, help="workers (default: 4)")
+    parser.add_argument('--rate', type=float, default=2.0, help="calls per second, 0 = unlimited (default: 2)")
+    parser.add_argument('--retries', type=int, default=5, help="per pair, after the first call (default: 5)")
+    parser.add_argument('--backoff', type=float, default=1.0, help="first retry delay ceiling, seconds (default: 1)")
+    parser.add_argument('--backoff-max', type=float, default=60.0, help="retry delay cap, seconds (default: 60)")
+    parser.add_argument('--timeout', type=float, default=120.0, help="per call, seconds (default: 120)")
+    parser.add_argument('--max-failures', type=int, default=50, help="stop after this many failed pairs (default: 50)")
+    parser.add_argument('--limit', type=int, help="generate at most N pairs this run")
+    parser.add_argument('--checkpoint', help=f"progress file (default: {os.path.relpath(CHECKPOINT, ROOT)};"
+                                             " --local: a temporary one)")
+    parser.add_argument('--retry-failed', action='store_true', help="also retry pairs that failed with a 4xx")
+    parser.add_argument('--functions-url', help="default: $SUPABASE_URL/functions/v1")
+    parser.add_argument('--local', action='store_true', help="run against edgetools.stubs and deno, then verify")
+    parser.add_argument('--users', type=int, default=200, help="--local: synthetic users (default: 200)")
+    stubs.add_arguments(parser)
+    args = parser.parse_args(argv)
+
+    unknown = sorted(set(args.tests) - set(INTERPRETED))
+    if unknown:
+        parser.error(f"not interpreted by interpret-test: {', '.join(unknown)}")
+    args.tests = args.tests or list(INTERPRETED)
+    version = check_versions()
+
+    print(f"\n=== warm ai_interpretations: PROMPT_VERSION {version}"
+          f"{' (local stubs)' if args.local else ''} ===\n")
+    if args.local:
+        rc = asyncio.run(_local(args, version))
+    else:
+        env = {name: os.environ.get(name, '') for name in
+               ('SUPABASE_URL', 'SUPABASE_SERVICE_ROLE_KEY', 'SUPABASE_JWT_SECRET', 'SUPABASE_ANON_KEY')}
+        needed = ['SUPABASE_URL', 'SUPABASE_SERVICE_ROLE_KEY'] + ([] if args.dry_run else ['SUPABASE_JWT_SECRET'])
+        absent = [name for name in needed if not env[name]]
+        if absent:
+            parser.error(f"set {', '.join(absent)}")
+        rest = Rest.service(env['SUPABASE_URL'], env['SUPABASE_SERVICE_ROLE_KEY'])
+        url = (args.functions_url or env['SUPABASE_URL'].rstrip('/') + '/functions/v1').rstrip('/') + '/interpret-test'
+        settings = _settings(args, url, env['SUPABASE_JWT_SECRET'],
+                             env['SUPABASE_ANON_KEY'] or env['SUPABASE_SERVICE_ROLE_KEY'])
+        rc = asyncio.run(_run(args, rest, settings, version, args.checkpoint or CHECKPOINT))
+    print("\n=== Done ===\n")
+    return rc
+
+
+if __name__ == '__main__':
+    import sys
+    sys.exit(main())
@@ -0,0 +1,9 @@
+"""Offline scoring of stored test responses, mirroring ``src/utils/scoring.js``.
+
+The item and dimension definitions are read from ``src/data/tests/*.js``
+themselves (``scoring.bank``), so a key fixed there is picked up here with
+no second copy to keep in step.  ``scoring.engine`` scores whole batches as
+NumPy matrices; ``python -m scoring.batch`` rescores an export of
+``user_psychometrics``, and ``python -m scoring.diff`` proves the engine
+gives what the browser code gives.  Needs ``numpy`` and ``node``.
+"""
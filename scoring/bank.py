@@ -0,0 +1,56 @@
+"""
+scoring.bank — the test definitions of ``src/data/tests/*.js``, as Python data.
+
+The files are ES modules with comments, trailing commas and the odd helper
+function, so rather than parse them, ``node`` imports them and prints every
+exported object as JSON.  One ``node`` run loads all of them; the result is
+memoised for the process.
+"""
+
+import functools
+import glob
+import json
+import os
+import shutil
+import subprocess
+from typing import Dict
+
+from codemods.cache import ROOT
+
+TESTS_DIR = os.path.join(ROOT, 'src', 'data', 'tests')
+SCORING_JS = os.path.join(ROOT, 'src', 'utils', 'scoring.js')
+
+_DUMP = '''
+import { pathToFileURL } from 'node:url';
+const out = {};
+for (const file of process.argv.slice(1)) {
+  for (const [name, value] of Object.entries(await import(pathToFileURL(file)))) {
+    if (value !== null && typeof value === 'object') out[name] = value;
+  }
+}
+process.stdout.write(JSON.stringify(out));
+'''
+
+
+def node() -> str:
+    """Path of ``node``; exits with a hint when it is not installed."""
+    path = shutil.which('node')
+    if path is None:
+        raise SystemExit("node not found — scoring reads src/data/tests/*.js through it")
+    return path
+
+
+def run_node(script: str, *args: str, stdin: str = '') -> str:
+    """stdout of an inline ES module script run from the repo root."""
+    proc = subprocess.run([node(), '--input-type=module', '-e', script, *args], input=stdin,
+                          capture_output=True, text=True, encoding='utf-8', cwd=ROOT)
+    if proc.returncode:
+        raise RuntimeError(f"node failed:\n{proc.stderr.strip()}")
+    return proc.stdout
+
+
+@functools.lru_cache(maxsize=None)
+def exports() -> Dict[str, dict]:
+    """Export name → object, for every test module (``HEXACO_TEST``, ``CAREER_DNA_MAX_SCORES``, ...)."""
+    files = sorted(glob.glob(os.path.join(TESTS_DIR, '*.js')))
+    return json.loads(run_node(_DUMP, *files))
@@ -0,0 +1,119 @@
+"""
+scoring.batch — rescore stored results with the current keys and norms.
+
+    python -m scoring.batch ROWS.jsonl [-o OUT.jsonl] [TEST_TYPE ...]
+    python -m scoring.batch --synthetic N [TEST_TYPE ...]
+
+``ROWS.jsonl`` holds one ``user_psychometrics`` row per line (``id``,
+``test_type``, ``raw_answers``; other columns are ignored).  Rows are
+grouped by test, scored a test at a time by ``scoring.engine``, and written
+back in input order as ``{"id", "test_type", "scores"}``, where ``scores``
+is what ``scoring.js`` would compute today.  A row it would reject gets
+``"error": "rejected"`` instead.
+
+``--synthetic N`` skips all I/O: it scores N random complete answer sets
+per test straight from matrices and reports rows per second.
+"""
+
+import argparse
+import json
+import time
+from typing import Dict, List
+
+import numpy as np
+
+from . import engine
+
+
+def synthetic(test_type: str, rows: int, seed: int = 0) -> engine.Responses:
+    """``rows`` random, complete, valid answer sets as a ``Responses`` batch."""
+    k = engine.key(test_type)
+    rng = np.random.default_rng(seed)
+    shape = (rows, len(k.questions))
+    if k.spec.kind == 'likert':
+        values = rng.integers(1, engine.scale_max(k) + 1, shape, dtype=np.int16)
+    else:
+        values = rng.integers(0, k.options, shape, dtype=np.int16)
+    return engine.Responses(values, np.ones(shape, dtype=bool), np.ones(rows, dtype=bool),
+                            np.full(rows, k.expected, dtype=np.int32))
+
+
+def read_rows(path: str) -> List[dict]:
+    with open(path, encoding='utf-8') as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def rescore(rows: List[dict], tests: List[str]) -> Dict[str, float]:
+    """Fill ``scores`` / ``error`` into every row of a wanted test; seconds per test."""
+    groups: Dict[str, List[int]] = {}
+    for i, row in enumerate(rows):
+        if row.get('test_type') in tests:
+            groups.setdefault(row['test_type'], []).append(i)
+    seconds = {}
+    for test_type, indices in groups.items():
+        start = time.perf_counter()
+        scores = engine.score(test_type, engine.encode(test_type, [rows[i].get('raw_answers') or {} for i in indices]))
+        for n, i in enumerate(indices):
+            record = engine.record(test_type, scores, n)
+            if record is None:
+                rows[i]['error'] = 'rejected'
+            else:
+                rows[i]['scores'] = record
+        seconds[test_type] = time.perf_counter() - start
+    return seconds
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m scoring.batch',
+                                     description="Rescore stored test results with the batch engine.")
+    parser.add_argument('input', nargs='?', help="JSON lines of user_psychometrics rows")
+    parser.add_argument('tests', nargs='*', metavar='TEST_TYPE', help="only these test types (default: all)")
+    parser.add_argument('--out', '-o', help="JSON lines output (default: report only)")
+    parser.add_argument('--synthetic', type=int, metavar='N', help="score N random rows per test, no I/O")
+    args = parser.parse_args(argv)
+
+    if args.synthetic and args.input:
+        args.tests.insert(0, args.input)
+        args.input = None
+    unknown = sorted(set(args.tests) - set(engine.SPECS))
+    if unknown:
+        parser.error(f"unknown test type(s): {', '.join(unknown)}")
+    if not args.synthetic and not args.input:
+        parser.error("give ROWS.jsonl or --synthetic N")
+    tests = args.tests or list(engine.SPECS)
+    width = max(len(t) for t in tests)
+
+    if args.synthetic:
+        print(f"\n=== scoring batch: {args.synthetic:,} synthetic rows per test ===\n")
+        for test_type in tests:
+            responses = synthetic(test_type, args.synthetic)
+            start = time.perf_counter()
+            engine.score(test_type, responses)
+            elapsed = time.perf_counter() - start
+            print(f"  {test_type:<{width}}  {elapsed * 1000:8.1f} ms  {args.synthetic / elapsed:>12,.0f} rows/s")
+        print("\n=== Done ===\n")
+        return 0
+
+    rows = read_rows(args.input)
+    print(f"\n=== scoring batch: {args.input} ({len(rows):,} rows) ===\n")
+    seconds = rescore(rows, tests)
+    for test_type, elapsed in seconds.items():
+        done = [r for r in rows if r.get('test_type') == test_type]
+        rejected = sum('error' in r for r in done)
+        print(f"  {test_type:<{width}}  {len(done):>8,} rows  {rejected:>6,} rejected"
+              f"  {elapsed * 1000:8.1f} ms  {len(done) / max(elapsed, 1e-9):>10,.0f} rows/s")
+    if args.out:
+        with open(args.out, 'w', encoding='utf-8') as f:
+            for row in rows:
+                if row.get('test_type') in seconds:
+                    out = {'id': row.get('id'), 'test_type': row['test_type']}
+                    out.update({'scores': row['scores']} if 'scores' in row else {'error': row['error']})
+                    f.write(json.dumps(out, ensure_ascii=False) + '\n')
+        print(f"\n  written: {args.out}")
+    print("\n=== Done ===\n")
+    return 0
+
+
+if __name__ == '__main__':
+    import sys
+    sys.exit(main())
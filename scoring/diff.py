@@ -0,0 +1,195 @@
+"""
+scoring.diff — differential check of ``scoring.engine`` against ``scoring.js``.
+
+    python -m scoring.diff [TEST_TYPE ...] [--rows N] [--seed S] [--input ROWS.jsonl]
+
+Every case is scored twice: by the browser's own ``calculate*Score``
+(``node`` importing ``src/utils/scoring.js``) and by the batch engine.  The
+engine's record must equal the JS result on every field it produces — exact
+float equality, no tolerance — and the engine must reject exactly the rows
+the JS throws on.
+
+The fixture set per test is deterministic for a ``--seed``:
+
+  1. ``--rows`` random complete answer sets,
+  2. edge rows: all lowest, all highest, all middle (every dimension tied,
+     which exercises the stable ranking), alternating answers,
+  3. rows the JS rejects or scores oddly: one answer dropped, one ``null``,
+     values just outside the scale, unknown choice labels, mixed case.
+
+``--input`` diffs real rows instead (JSON lines with ``test_type`` and
+``raw_answers``, e.g. a ``user_psychometrics`` export).  Exits 1 on any
+difference.
+"""
+
+import argparse
+import json
+import random
+import time
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from . import bank, engine
+
+_SCORE_ALL = '''
+import { readFileSync } from 'node:fs';
+import * as scoring from './src/utils/scoring.js';
+const out = JSON.parse(readFileSync(0, 'utf8')).map(([name, responses]) => {
+  try {
+    return { ok: scoring[name](responses) };
+  } catch (e) {
+    return { error: String(e.message) };
+  }
+});
+process.stdout.write(JSON.stringify(out));
+'''
+
+MISSING = object()
+
+
+# ─── Fixtures ─────────────────────────────────────────────────────────────────
+
+def _answer(k: engine.Key, rng: random.Random):
+    if k.spec.kind == 'likert':
+        return rng.randint(1, engine.scale_max(k))
+    label = rng.choice(k.labels)
+    return label.upper() if k.spec.kind != 'forced_choice' and rng.random() < 0.2 else label
+
+
+def fixtures(test_type: str, rows: int, rng: random.Random) -> List[dict]:
+    k = engine.key(test_type)
+    cases = [{q: _answer(k, rng) for q in k.questions} for _ in range(rows)]
+    if k.spec.kind == 'likert':
+        top = engine.scale_max(k)
+        levels = (1, top, (1 + top) // 2)
+        cases += [{q: level for q in k.questions} for level in levels]
+        cases.append({q: 1 + i % top for i, q in enumerate(k.questions)})
+        outside = (0, top + 1)
+    else:
+        cases += [{q: label for q in k.questions} for label in k.labels]
+        outside = ('x', 'E', 7)
+    for value in (None,) + outside:
+        case = {q: _answer(k, rng) for q in k.questions}
+        case[rng.choice(k.questions)] = value
+        cases.append(case)
+    dropped = {q: _answer(k, rng) for q in k.questions}
+    del dropped[rng.choice(k.questions)]
+    cases.append(dropped)
+    return cases
+
+
+# ─── Comparison ───────────────────────────────────────────────────────────────
+
+def js_scores(test_type: str, cases: List[dict]) -> List[dict]:
+    function = engine.SPECS[test_type].function
+    return json.loads(bank.run_node(_SCORE_ALL, stdin=json.dumps([[function, c] for c in cases])))
+
+
+def difference(expected, actual, path: str = '') -> Optional[Tuple[str, object, object]]:
+    """First (path, engine value, JS value) where ``actual`` lacks or differs from ``expected``."""
+    if isinstance(expected, dict):
+        if not isinstance(actual, dict):
+            return path, expected, actual
+        for key, value in expected.items():
+            found = difference(value, actual.get(key, MISSING), f'{path}.{key}' if path else key)
+            if found:
+                return found
+        return None
+    if isinstance(expected, list):
+        if not isinstance(actual, list) or len(actual) != len(expected):
+            return path, expected, actual
+        for i, (e, a) in enumerate(zip(expected, actual)):
+            found = difference(e, a, f'{path}[{i}]')
+            if found:
+                return found
+        return None
+    if actual is MISSING or actual != expected or isinstance(actual, bool) != isinstance(expected, bool):
+        return path, expected, actual
+    return None
+
+
+class TestDiff(NamedTuple):
+    test_type: str
+    rows: int
+    rejected: int               # by both
+    differences: List[str]
+    js_seconds: float
+    engine_seconds: float
+
+
+def diff_test(test_type: str, cases: List[dict], limit: int = 5) -> TestDiff:
+    start = time.perf_counter()
+    js = js_scores(test_type, cases)
+    js_seconds = time.perf_counter() - start
+    start = time.perf_counter()
+    scores = engine.score(test_type, engine.encode(test_type, cases))
+    records = [engine.record(test_type, scores, i) for i in range(len(cases))]
+    engine_seconds = time.perf_counter() - start
+
+    differences = []
+    rejected = 0
+    for i, (mine, theirs) in enumerate(zip(records, js)):
+        if mine is None and 'error' in theirs:
+            rejected += 1
+            continue
+        if mine is None or 'error' in theirs:
+            found = ('(row)', 'rejected' if mine is None else 'scored', theirs.get('error', 'scored'))
+        else:
+            found = difference(mine, theirs['ok'])
+        if found and len(differences) < limit:
+            path, ours, js_value = found
+            differences.append(f"row {i}: {path}  engine {ours!r}  js {js_value!r}  answers {json.dumps(cases[i])[:120]}")
+        elif found:
+            differences.append('')
+    return TestDiff(test_type, len(cases), rejected, differences, js_seconds, engine_seconds)
+
+
+def read_rows(path: str) -> Dict[str, List[dict]]:
+    rows: Dict[str, List[dict]] = {}
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            if line.strip():
+                row = json.loads(line)
+                rows.setdefault(row['test_type'], []).append(row['raw_answers'])
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m scoring.diff',
+                                     description="Compare the batch scoring engine with scoring.js.")
+    parser.add_argument('tests', nargs='*', metavar='TEST_TYPE',
+                        help=f"test types (default: all of {', '.join(engine.SPECS)})")
+    parser.add_argument('--rows', type=int, default=500, help="random cases per test (default 500)")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--input', help="JSON lines with test_type and raw_answers instead of fixtures")
+    args = parser.parse_args(argv)
+
+    unknown = sorted(set(args.tests) - set(engine.SPECS))
+    if unknown:
+        parser.error(f"unknown test type(s): {', '.join(unknown)}")
+    rng = random.Random(args.seed)
+    if args.input:
+        cases = read_rows(args.input)
+        tests = [t for t in engine.SPECS if t in cases and (not args.tests or t in args.tests)]
+    else:
+        tests = args.tests or list(engine.SPECS)
+        cases = {t: fixtures(t, args.rows, rng) for t in tests}
+
+    print(f"\n=== scoring diff: {len(tests)} tests vs src/utils/scoring.js ===\n")
+    failed = 0
+    width = max((len(t) for t in tests), default=0)
+    for test_type in tests:
+        result = diff_test(test_type, cases[test_type])
+        bad = len(result.differences)
+        failed += bad
+        print(f"  {'✗' if bad else '✓'} {test_type:<{width}}  {result.rows:>6} rows, {result.rejected:>3} rejected by both,"
+              f" {bad} differ   js {result.js_seconds * 1000:6.0f} ms, engine {result.engine_seconds * 1000:6.1f} ms")
+        for line in filter(None, result.differences):
+            print(f"      {line}")
+    print(f"\n  {'no differences' if not failed else f'{failed} differing rows'}")
+    print("\n=== Done ===\n")
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    import sys
+    sys.exit(main())
@@ -0,0 +1,545 @@
+"""
+scoring.engine — score whole batches of one test as NumPy matrices.
+
+Every ``calculate*Score`` of ``src/utils/scoring.js`` has a ``Spec`` here,
+keyed by the ``test_type`` stored in ``user_psychometrics`` (``HEXACO``,
+``DARK_TRIAD``, ...).  A batch is scored in three steps:
+
+  1. ``encode`` turns stored ``raw_answers`` into a ``Responses`` matrix,
+     one row per result and one column per question in definition order:
+     the Likert value, or the option index for choice tests.  It also
+     records which rows ``scoring.js`` would reject (wrong answer count,
+     missing answer, Likert value out of range).  A row with a key that is
+     not a question id, or a value that is not a number or string, is
+     rejected too.  The browser code would score those inconsistently,
+     e.g. ``"3"`` concatenates,
+  2. per-dimension sums are one matrix product.  For Likert tests the key
+     matrix holds ``+1`` / ``-1`` (reverse-scored) per item and dimension,
+     plus a constant ``reverse_max`` for every reversed item, so
+     ``6 - r`` costs nothing extra.  Choice tests multiply a one-hot of
+     the chosen options by their point table.  Sums of small integers are
+     exact in float64, so the averages are bit-identical to the browser's,
+  3. the test's own post-processing — ``toFixed``, ``Math.round``, norms,
+     stable ranking — with ``scoring.jsmath``, which reproduces JavaScript
+     rounding exactly.  Columns that depend on one dimension's sum alone
+     (``COLUMNS``) are read from the test's ``scoring.tables`` module when
+     it is current, instead of being computed.
+
+``score`` returns column arrays (``Scores``); ``record`` turns one row back
+into the JSON the browser computes, minus display-only fields (names,
+descriptions, icons, ``completed_at``).  ``scoring.diff`` compares the two.
+"""
+
+from typing import Callable, Dict, List, NamedTuple, Optional, Sequence
+
+import numpy as np
+
+from . import bank, tables
+from .jsmath import desc_order, js_round, seq_sum, to_fixed
+
+# Rows scored per matrix product; bounds memory at a few tens of MB
+CHUNK = 65536
+MAX_LIKERT = 1000               # larger answers are rejected, not wrapped into int16
+
+LEVELS = ('low', 'average', 'high')
+COLORS = ('red', 'yellow', 'green', 'blue')                 # answer a, b, c, d
+COLOR_ORDER = ('blue', 'green', 'red', 'yellow')            # profile key order
+ENNEAGRAM_CENTERS = ((8, 9, 1), (2, 3, 4), (5, 6, 7))       # gut, heart, head
+
+
+class Spec(NamedTuple):
+    export: str                 # definition object in src/data/tests/*.js
+    function: str               # calculate*Score in scoring.js
+    kind: str                   # 'likert', 'forced_choice', 'choice_4' or 'color'
+    groups: str = 'dimensions'  # definition list the items are scored into
+    item_group: str = 'dimension'
+    reverse_max: Optional[int] = None   # r ↦ reverse_max - r for reverse items; None: no reversal
+    count: Optional[int] = None         # expected answers if hard-coded, else question_count
+    require_all: bool = True            # every answer present (else `|| 0`)
+    scale: Optional[int] = None         # 1..scale checked, if scoring.js checks it
+
+
+SPECS: Dict[str, Spec] = {
+    'HEXACO': Spec('HEXACO_TEST', 'calculateHexacoScore', 'likert', reverse_max=6, count=60, scale=5),
+    'ENNEAGRAM': Spec('ENNEAGRAM_TEST', 'calculateEnneagramScore', 'forced_choice', 'types', count=36),
+    'DARK_TRIAD': Spec('DARK_TRIAD_TEST', 'calculateDarkTriadScore', 'likert', reverse_max=6, count=27, scale=5),
+    'STRENGTHS': Spec('STRENGTHS_TEST', 'calculateStrengthsScore', 'likert', 'strengths', 'strength',
+                      count=48, require_all=False),
+    'CAREER': Spec('CAREER_TEST', 'calculateCareerScore', 'likert', 'interest_types', 'interest',
+                   count=48, require_all=False),
+    'VALUES': Spec('VALUES_TEST', 'calculateValuesScore', 'likert', 'values', 'value', count=40, require_all=False),
+    'CAREER_DNA': Spec('CAREER_DNA_TEST', 'calculateCareerDnaScore', 'choice_4', require_all=False),
+    'EQ': Spec('EQ_TEST', 'calculateEQScore', 'likert', reverse_max=6),
+    'ATTACHMENT': Spec('ATTACHMENT_TEST', 'calculateAttachmentScore', 'likert'),
+    'DEFENSE': Spec('DEFENSE_TEST', 'calculateDefenseScore', 'likert'),
+    'MENTAL_TOUGHNESS': Spec('MENTAL_TOUGHNESS_TEST', 'calculateMentalToughnessScore', 'likert', reverse_max=6),
+    'MEANING': Spec('MEANING_TEST', 'calculateMeaningScore', 'likert', reverse_max=7),
+    'MOTIVATION': Spec('MOTIVATION_TEST', 'calculateMotivationScore', 'likert'),
+    'COLOR_PERSONALITY': Spec('COLOR_PERSONALITY_TEST', 'calculateColorScore', 'color', count=32),
+}
+
+
+# ─── Keys ─────────────────────────────────────────────────────────────────────
+
+class Key(NamedTuple):
+    """A test compiled for matrix scoring."""
+    test_type: str
+    spec: Spec
+    test: dict                  # the definition object itself
+    questions: List[str]        # question ids, column order
+    column: Dict[str, int]      # question id → column
+    groups: List[str]           # dimension / type / value ids, sum column order
+    matrix: np.ndarray          # (questions × options, groups) or (questions, groups) for Likert
+    offset: np.ndarray          # (groups,) added to every row's sums
+    counts: np.ndarray          # (groups,) items per group
+    options: int                # answer codes per question (1 for Likert)
+    labels: List[str]           # choice answer → option index, by position
+    expected: int               # answer count scoring.js insists on
+
+
+def _likert_key(spec: Spec, test: dict, groups: List[str]):
+    index = {g: i for i, g in enumerate(groups)}
+    matrix = np.zeros((len(test['questions']), len(groups)))
+    offset = np.zeros(len(groups))
+    for row, q in enumerate(test['questions']):
+        g = index[q[spec.item_group]]
+        if spec.reverse_max is not None and q.get('reverse'):
+            matrix[row, g] = -1.0
+            offset[g] += spec.reverse_max
+        else:
+            matrix[row, g] = 1.0
+    return matrix, offset, (matrix != 0).sum(axis=0).astype(np.float64), 1, []
+
+
+def _choice_key(spec: Spec, test: dict, groups: List[str]):
+    """Point table: one row per (question, option), one column per group."""
+    index = {g: i for i, g in enumerate(groups)}
+    questions = test['questions']
+    if spec.kind == 'forced_choice':
+        labels = ['a', 'b']
+        points = [[q['scores_a'], q['scores_b']] for q in questions]
+    else:
+        labels = ['a', 'b', 'c', 'd']
+        points = [[o['scores'] for o in q['options']] for q in questions]
+    matrix = np.zeros((len(questions) * len(labels), len(groups)))
+    for row, options in enumerate(points):
+        for option, scores in enumerate(options):
+            for group, value in scores.items():
+                if str(group) not in index:
+                    raise ValueError(f"{spec.export}: question {questions[row]['id']} scores unknown {group!r}")
+                matrix[row * len(labels) + option, index[str(group)]] += value
+    return matrix, np.zeros(len(groups)), np.ones(len(groups)), len(labels), labels
+
+
+def compile_key(test_type: str) -> Key:
+    spec = SPECS[test_type]
+    test = bank.exports()[spec.export]
+    if spec.kind == 'color':
+        groups = list(COLORS)
+        matrix, offset, counts = np.zeros((0, 4)), np.zeros(4), np.ones(4)
+        options, labels = 4, ['a', 'b', 'c', 'd']
+    else:
+        groups = [str(g['id']) for g in test[spec.groups]]
+        build = _likert_key if spec.kind == 'likert' else _choice_key
+        matrix, offset, counts, options, labels = build(spec, test, groups)
+    questions = [str(q['id']) for q in test['questions']]
+    return Key(test_type, spec, test, questions, {q: i for i, q in enumerate(questions)}, groups,
+               matrix, offset, counts, options, labels, spec.count or test['question_count'])
+
+
+_keys: Dict[str, Key] = {}
+
+
+def key(test_type: str) -> Key:
+    if test_type not in _keys:
+        _keys[test_type] = compile_key(test_type)
+    return _keys[test_type]
+
+
+def scale_max(k: Key) -> int:
+    """Top of the Likert scale from ``scale_type`` (``likert_5`` → 5)."""
+    return int(str(k.test.get('scale_type', 'likert_5')).rsplit('_', 1)[-1])
+
+
+# ─── Responses ────────────────────────────────────────────────────────────────
+
+class Responses(NamedTuple):
+    values: np.ndarray          # (n, questions) int16: Likert value / option index, -1 not an option
+    present: np.ndarray         # (n, questions) bool: answered, not null
+    valid: np.ndarray           # (n,) bool: scored (scoring.js would not throw)
+    keys: np.ndarray            # (n,) answers given, as Object.keys(responses).length
+
+
+def _code(k: Key, value) -> Optional[int]:
+    """Column value for one answer; None when the row cannot be scored."""
+    if k.spec.kind == 'likert':
+        if isinstance(value, bool) or not isinstance(value, (int, float)) \
+                or not float(value).is_integer() or abs(value) > MAX_LIKERT:
+            return None
+        return int(value)
+    if k.spec.kind == 'forced_choice':
+        return k.labels.index(value) if value in k.labels else None
+    if k.spec.kind == 'color':
+        text = ('true' if value else 'false') if isinstance(value, bool) else str(value)
+        return k.labels.index(text.lower()) if text.lower() in k.labels else -1
+    # choice_4: non-strings and unknown labels are skipped, not errors
+    if isinstance(value, str) and value.lower() in k.labels:
+        return k.labels.index(value.lower())
+    return -1
+
+
+def encode(test_type: str, answers: Sequence[dict]) -> Responses:
+    """``Responses`` for a list of ``raw_answers`` objects."""
+    k = key(test_type)
+    n, q = len(answers), len(k.questions)
+    values = np.zeros((n, q), dtype=np.int16)
+    present = np.zeros((n, q), dtype=bool)
+    valid = np.ones(n, dtype=bool)
+    keys = np.zeros(n, dtype=np.int32)
+    for row, given in enumerate(answers):
+        keys[row] = len(given)
+        for qid, value in given.items():
+            col = k.column.get(qid)
+            if col is None:
+                valid[row] = False
+                break
+            if value is None or (k.spec.kind == 'forced_choice' and not value):
+                continue
+            code = _code(k, value)
+            if code is None:
+                valid[row] = False
+                break
+            values[row, col] = code
+            present[row, col] = True
+    if k.spec.kind != 'likert':
+        values[~present] = -1
+    valid &= keys == k.expected
+    if k.spec.require_all:
+        valid &= present.all(axis=1)
+    if k.spec.scale:
+        valid &= ((values >= 1) & (values <= k.spec.scale)).all(axis=1)
+    return Responses(values, present, valid, keys)
+
+
+# ─── Sums ─────────────────────────────────────────────────────────────────────
+
+def group_sums(k: Key, r: Responses) -> np.ndarray:
+    """(n, groups) raw sums — the only per-item work, one matrix product per chunk."""
+    n = len(r.valid)
+    out = np.empty((n, len(k.groups)))
+    codes = np.arange(k.options, dtype=np.int16)
+    for start in range(0, n, CHUNK):
+        values = r.values[start:start + CHUNK]
+        if k.spec.kind == 'likert':
+            out[start:start + CHUNK] = values @ k.matrix + k.offset
+        elif k.spec.kind == 'color':
+            out[start:start + CHUNK] = (values[:, :, None] == codes).sum(axis=1)
+        else:
+            onehot = (values[:, :, None] == codes).reshape(len(values), -1)
+            out[start:start + CHUNK] = onehot @ k.matrix
+    return out
+
+
+# ─── Post-processing (one per calculate*Score) ────────────────────────────────
+
+Scores = Dict[str, np.ndarray]
+
+
+def _averages(k: Key, sums: np.ndarray) -> np.ndarray:
+    return sums / k.counts
+
+
+def _band(avg: np.ndarray, medium: float, high: float) -> np.ndarray:
+    """Report ``levelFor``: 0 low, 1 medium (``>= medium``), 2 high (``>= high``)."""
+    return np.where(avg >= high, 2, np.where(avg >= medium, 1, 0)).astype(np.int8)
+
+
+def _hexaco_columns(k: Key, sums: np.ndarray) -> Scores:
+    """HEXACO and EQ: unrounded averages, percentiles on the 1–5 range."""
+    avg = _averages(k, sums)
+    if k.test_type == 'HEXACO':         # getHexacoInterpretation: < 2.5 low, > 3.5 high
+        level = np.where(avg < 2.5, 0, np.where(avg > 3.5, 2, 1)).astype(np.int8)
+    else:
+        level = _band(avg, 2.5, 4.0)
+    return {'raw_scores': avg, 'percentile_scores': ((avg - 1) / 4) * 100, 'level': level}
+
+
+def _rounded_columns(k: Key, sums: np.ndarray) -> Scores:
+    """Mental toughness and meaning: averages to 2 places, percentile of the rounded average."""
+    avg = to_fixed(_averages(k, sums), 2)
+    span, medium, high = (4, 2.5, 4.0) if k.test_type == 'MENTAL_TOUGHNESS' else (5, 3.0, 4.5)
+    return {'raw_scores': avg, 'percentile_scores': js_round(((avg - 1) / span) * 100),
+            'level': _band(avg, medium, high)}
+
+
+def _hexaco_like(k: Key, sums: np.ndarray, r: Responses) -> Scores:
+    out = dimension_columns(k, sums)
+    if k.test_type == 'EQ':
+        out['total'] = to_fixed(seq_sum(out['raw_scores']) / len(k.groups), 2)
+    return out
+
+
+def _rounded_totals(k: Key, sums: np.ndarray, r: Responses) -> Scores:
+    out = dimension_columns(k, sums)
+    out['total'] = to_fixed(seq_sum(out['raw_scores']) / len(k.groups), 2)
+    return out
+
+
+def _ranked(k: Key, sums: np.ndarray, r: Responses) -> Scores:
+    """Attachment, defense, motivation: averages to 2 places, stable ranking."""
+    avg = to_fixed(_averages(k, sums), 2)
+    out = {'raw_scores': avg, 'order': desc_order(avg)}
+    if k.test_type == 'DEFENSE':
+        col = {g: i for i, g in enumerate(k.groups)}
+        out['maturity_index'] = to_fixed((avg[:, col['mature']] * 2 - avg[:, col['immature']]
+                                          - avg[:, col['primitive']]) / 2, 2)
+    return out
+
+
+def percentile_approx(score: np.ndarray, norm: dict) -> np.ndarray:
+    """``calculatePercentileApprox``: three linear ranges, 0–30, 30–70, 70–100."""
+    low, average, high = norm['low'][0], norm['average'][0], norm['high'][0]
+    in_low = js_round((score - low) / (average - low) * 30)
+    in_average = js_round(30 + (score - average) / (high - average) * 40)
+    in_high = js_round(70 + (score - high) / (norm['high'][1] - high) * 30)
+    return np.where(score < average, in_low, np.where(score < high, in_average, in_high))
+
+
+def _dark_triad_columns(k: Key, sums: np.ndarray) -> Scores:
+    avg = _averages(k, sums)
+    level = np.ones(avg.shape, dtype=np.int8)
+    vs, pct = np.empty(avg.shape), np.empty(avg.shape)
+    for i, g in enumerate(k.groups):
+        norm = k.test['norms'][g]
+        level[:, i] = np.where(avg[:, i] < norm['average'][0], 0, np.where(avg[:, i] >= norm['high'][0], 2, 1))
+        vs[:, i] = to_fixed(avg[:, i] - norm['mean'], 2)
+        pct[:, i] = percentile_approx(avg[:, i], norm)
+    return {'raw_scores': to_fixed(avg, 2), 'level': level, 'vs_population': vs, 'percentile': pct}
+
+
+def _dark_triad(k: Key, sums: np.ndarray, r: Responses) -> Scores:
+    out = dimension_columns(k, sums)
+    out.update(overall=out['level'].max(axis=1), order=desc_order(out['raw_scores']))
+    return out
+
+
+def _strengths(k: Key, sums: np.ndarray, r: Responses) -> Scores:
+    raw = to_fixed(_averages(k, sums), 2)
+    order = desc_order(raw)
+    category = np.array([[s['category'] for s in k.test['strengths']]])
+    categories = [c['id'] for c in k.test['categories']]
+    top = category[0][order[:, :5]]
+    averages = np.zeros((len(raw), len(categories)))
+    in_top = np.zeros((len(raw), len(categories)), dtype=np.int32)
+    for i, cat in enumerate(categories):
+        members = np.flatnonzero(category[0] == cat)
+        if members.size:
+            averages[:, i] = to_fixed(seq_sum(raw[:, members]) / members.size, 2)
+        in_top[:, i] = (top == cat).sum(axis=1)
+    return {'raw_scores': raw, 'order': order, 'category_average': averages, 'count_in_top5': in_top,
+            'dominant_category': desc_order(in_top)[:, 0]}
+
+
+def _career(k: Key, sums: np.ndarray, r: Responses) -> Scores:
+    raw = to_fixed(_averages(k, sums), 2)
+    return {'raw_scores': raw, 'order': desc_order(raw)}
+
+
+def _values(k: Key, sums: np.ndarray, r: Responses) -> Scores:
+    raw = to_fixed(_averages(k, sums), 3)
+    mrat = to_fixed(r.values.sum(axis=1, dtype=np.float64) / np.maximum(r.keys, 1), 3)
+    centered = to_fixed(raw - mrat[:, None], 3)
+    return {'raw_scores': raw, 'mrat': mrat, 'centered': centered, 'order': desc_order(centered)}
+
+
+def _enneagram(k: Key, sums: np.ndarray, r: Responses) -> Scores:
+    order = desc_order(sums)
+    types = np.array([int(g) for g in k.groups])
+    column = np.zeros(types.max() + 1, dtype=np.intp)      # type → sums column
+    column[types] = np.arange(len(types))
+    rows = np.arange(len(sums))
+    primary = types[order[:, 0]]
+    left = np.where(primary == 1, 9, primary - 1)
+    right = np.where(primary == 9, 1, primary + 1)
+    wing = np.where(sums[rows, column[left]] > sums[rows, column[right]], left, right)
+    # Tritype: the best-ranked type of each center, those three ranked by score
+    rank = np.argsort(order, axis=1)
+    best = []
+    for center in ENNEAGRAM_CENTERS:
+        cols = column[list(center)]
+        best.append(cols[np.argmin(rank[:, cols], axis=1)])
+    centers = np.stack(best, axis=1)
+    tritype = np.take_along_axis(centers, desc_order(np.take_along_axis(sums, centers, axis=1)), axis=1)
+    return {'raw_scores': sums, 'order': order, 'wing': wing, 'tritype': tritype}
+
+
+def _career_dna(k: Key, sums: np.ndarray, r: Responses) -> Scores:
+    maximum = bank.exports()['CAREER_DNA_MAX_SCORES']
+    dims = list(maximum)                                    # normalisation order
+    col = [k.groups.index(d) for d in dims]
+    top = np.array([maximum[d] for d in dims], dtype=np.float64)
+    normalized = np.minimum(100, js_round(np.maximum(0, sums[:, col]) / top * 100))
+    return {'raw_scores': sums, 'normalized': normalized, 'order': desc_order(normalized)}
+
+
+def _color(k: Key, sums: np.ndarray, r: Responses) -> Scores:
+    return {'counts': sums, 'percentages': to_fixed((sums / 32) * 100, 1), 'order': desc_order(sums)}
+
+
+# Per-dimension columns that depend on that dimension's sum alone, and so can
+# be tabulated by ``python -m scoring.norms``; ``level`` is the report level
+COLUMNS: Dict[str, Callable[[Key, np.ndarray], Scores]] = {
+    'HEXACO': _hexaco_columns,
+    'EQ': _hexaco_columns,
+    'MENTAL_TOUGHNESS': _rounded_columns,
+    'MEANING': _rounded_columns,
+    'DARK_TRIAD': _dark_triad_columns,
+}
+REPORT_LEVELS = {
+    'HEXACO': ('low', 'medium', 'high'),
+    'EQ': ('low', 'medium', 'high'),
+    'MENTAL_TOUGHNESS': ('low', 'medium', 'high'),
+    'MEANING': ('low', 'medium', 'high'),
+    'DARK_TRIAD': LEVELS,
+}
+
+
+def dimension_columns(k: Key, sums: np.ndarray) -> Scores:
+    """``COLUMNS`` of a test: looked up in its norm table if that is current, else computed."""
+    table = tables.load(k.test_type, k.test)
+    if table is None:
+        return COLUMNS[k.test_type](k, sums)
+    out, outside = table.lookup(sums)
+    if outside.any():           # answers off the scale, which scoring.js still scores
+        for name, values in COLUMNS[k.test_type](k, sums[outside]).items():
+            out[name][outside] = values
+    return out
+
+
+POST: Dict[str, Callable[[Key, np.ndarray, Responses], Scores]] = {
+    'HEXACO': _hexaco_like,
+    'EQ': _hexaco_like,
+    'MENTAL_TOUGHNESS': _rounded_totals,
+    'MEANING': _rounded_totals,
+    'ATTACHMENT': _ranked,
+    'DEFENSE': _ranked,
+    'MOTIVATION': _ranked,
+    'DARK_TRIAD': _dark_triad,
+    'STRENGTHS': _strengths,
+    'CAREER': _career,
+    'VALUES': _values,
+    'ENNEAGRAM': _enneagram,
+    'CAREER_DNA': _career_dna,
+    'COLOR_PERSONALITY': _color,
+}
+
+
+def score(test_type: str, responses: Responses) -> Scores:
+    """Column arrays for every row; rows with ``valid`` False hold garbage."""
+    k = key(test_type)
+    out = POST[test_type](k, group_sums(k, responses), responses)
+    out['valid'] = responses.valid
+    return out
+
+
+# ─── Records ──────────────────────────────────────────────────────────────────
+
+def _num(x):
+    x = float(x)
+    return int(x) if x.is_integer() and abs(x) < 2 ** 53 else x
+
+
+def _by_group(k: Key, row: np.ndarray, ids: Optional[List[str]] = None) -> dict:
+    return {g: _num(v) for g, v in zip(ids or k.groups, row)}
+
+
+def _ranking(k: Key, values: np.ndarray, order: np.ndarray, field: str = 'score') -> List[dict]:
+    return [{'id': k.groups[j], field: _num(values[j])} for j in order]
+
+
+def record(test_type: str, s: Scores, i: int) -> Optional[dict]:
+    """Row ``i`` as the JSON ``scoring.js`` returns (scored fields only); None if rejected."""
+    if not s['valid'][i]:
+        return None
+    k = key(test_type)
+    if test_type in ('HEXACO', 'EQ', 'MENTAL_TOUGHNESS', 'MEANING'):
+        out = {'raw_scores': _by_group(k, s['raw_scores'][i]),
+               'percentile_scores': _by_group(k, s['percentile_scores'][i])}
+        if 'total' in s:
+            total = {'EQ': 'total_eq', 'MENTAL_TOUGHNESS': 'total_mt', 'MEANING': 'total_meaning'}[test_type]
+            out[total] = _num(s['total'][i])
+        return out
+    if test_type in ('ATTACHMENT', 'DEFENSE', 'MOTIVATION'):
+        raw, order = s['raw_scores'][i], s['order'][i]
+        ranked = _ranking(k, raw, order)
+        out = {'raw_scores': _by_group(k, raw)}
+        if test_type == 'ATTACHMENT':
+            out.update(sorted_styles=ranked, dominant_style=ranked[0])
+        elif test_type == 'DEFENSE':
+            out.update(maturity_index=_num(s['maturity_index'][i]), sorted_mechanisms=ranked,
+                       dominant_mechanism=ranked[0])
+        else:
+            out.update(sorted_drives=ranked, top_drives=ranked[:3], shadow_drive=ranked[-1])
+        return out
+    if test_type == 'DARK_TRIAD':
+        raw, level = s['raw_scores'][i], s['level'][i]
+        dims = {g: {'raw_score': _num(raw[j]), 'level': LEVELS[level[j]],
+                    'vs_population': _num(s['vs_population'][i][j]),
+                    'norm_mean': _num(k.test['norms'][g]['mean']), 'percentile': _num(s['percentile'][i][j])}
+                for j, g in enumerate(k.groups)}
+        ranked = [{'id': k.groups[j], 'score': _num(raw[j]), 'level': LEVELS[level[j]]} for j in s['order'][i]]
+        return {'dimensions': dims, 'risk_levels': {g: d['level'] for g, d in dims.items()},
+                'overall_risk': LEVELS[s['overall'][i]], 'highest_dimension': ranked[0],
+                'sorted_dimensions': ranked}
+    if test_type == 'STRENGTHS':
+        raw, order = s['raw_scores'][i], s['order'][i]
+        category = {st['id']: st['category'] for st in k.test['strengths']}
+        categories = [c['id'] for c in k.test['categories']]
+        cats = {c: {'average_score': _num(s['category_average'][i][j]), 'count_in_top5': int(s['count_in_top5'][i][j])}
+                for j, c in enumerate(categories)}
+        dominant = categories[s['dominant_category'][i]]
+        return {'top_5': [{'rank': n + 1, 'id': k.groups[j], 'category': category[k.groups[j]], 'score': _num(raw[j])}
+                          for n, j in enumerate(order[:5])],
+                'all_scores': {g: {'raw_score': _num(raw[j]), 'category': category[g]} for j, g in enumerate(k.groups)},
+                'category_scores': cats, 'dominant_category': [dominant, cats[dominant]]}
+    if test_type == 'CAREER':
+        raw, order = s['raw_scores'][i], s['order'][i]
+        letter = {t['id']: t['letter'] for t in k.test['interest_types']}
+        top = [{'rank': n + 1, 'id': k.groups[j], 'letter': letter[k.groups[j]], 'score': _num(raw[j])}
+               for n, j in enumerate(order[:3])]
+        return {'holland_code': ''.join(t['letter'] for t in top), 'top_3': top,
+                'all_scores': {g: {'raw_score': _num(raw[j])} for j, g in enumerate(k.groups)}}
+    if test_type == 'VALUES':
+        raw, centered, order = s['raw_scores'][i], s['centered'][i], s['order'][i]
+
+        def entry(rank, j):
+            return {'rank': rank, 'id': k.groups[j], 'score': _num(centered[j]), 'raw_average': _num(raw[j])}
+        return {'mrat': _num(s['mrat'][i]),
+                'top_3': [entry(n + 1, j) for n, j in enumerate(order[:3])],
+                'bottom_3': [entry(8 + n, j) for n, j in enumerate(order[-3:])],
+                'all_scores': {g: {'raw_average': _num(raw[j]), 'centered_score': _num(centered[j])}
+                               for j, g in enumerate(k.groups)}}
+    if test_type == 'ENNEAGRAM':
+        sums, order = s['raw_scores'][i], s['order'][i]
+        ranked = [{'type': int(k.groups[j]), 'score': _num(sums[j])} for j in order]
+        return {'primary_type': ranked[0], 'wing': int(s['wing'][i]), 'all_scores': _by_group(k, sums),
+                'tritype': [{'type': int(k.groups[j]), 'score': _num(sums[j])} for j in s['tritype'][i]],
+                'sorted_types': ranked}
+    if test_type == 'CAREER_DNA':
+        dims = list(bank.exports()['CAREER_DNA_MAX_SCORES'])
+        normalized, order = s['normalized'][i], s['order'][i]
+        top1, top2 = dims[order[0]], dims[order[1]]
+        profile = f'{top1}+{top2}' if f'{top1}+{top2}' in k.test['profiles'] else f'{top2}+{top1}'
+        return {'raw_scores': _by_group(k, s['raw_scores'][i]), 'normalized_scores': _by_group(k, normalized, dims),
+                'sorted_dimensions': [{'id': dims[j], 'score': _num(normalized[j])} for j in order],
+                'top1': top1, 'top2': top2, 'profile_key': profile}
+    if test_type == 'COLOR_PERSONALITY':
+        counts, pct, order = s['counts'][i], s['percentages'][i], s['order'][i]
+        primary, secondary = COLORS[order[0]], COLORS[order[1]]
+        pair = '_'.join(sorted((primary, secondary), key=COLOR_ORDER.index))
+        return {'color_counts': _by_group(k, counts), 'color_percentages': _by_group(k, pct),
+                'primary_color': primary, 'secondary_color': secondary,
+                'profile_key': pair if pair in k.test['combination_profiles'] else f'{primary}_{secondary}',
+                'sorted_colors': [{'id': COLORS[j], 'count': _num(counts[j]), 'percentage': _num(pct[j])}
+                                  for j in order]}
+    raise KeyError(test_type)
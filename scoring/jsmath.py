@@ -0,0 +1,66 @@
+"""
+scoring.jsmath — JavaScript number semantics over NumPy arrays.
+
+``scoring.js`` rounds with ``parseFloat(x.toFixed(n))`` and ``Math.round``,
+and ranks with a stable ``Array.prototype.sort``.  ``np.round`` is not
+either of those: it rounds half to even, on ``x * 10**n``, which is itself
+rounded.  Here:
+
+  - ``to_fixed`` / ``js_round`` take the fast float path for every element
+    that is clearly not a tie, and decide the few that are near one exactly
+    (``Decimal`` / ``Fraction`` of the double, as JavaScript does),
+  - ``desc_order`` is a stable descending argsort, ties keeping definition
+    order like ``sort((a, b) => b - a)``,
+  - ``seq_sum`` adds columns left to right like ``reduce``; ``np.sum``
+    pairs them up and can differ in the last bit.
+"""
+
+import math
+from decimal import ROUND_HALF_UP, Decimal
+from fractions import Fraction
+
+import numpy as np
+
+# Any element this close to a rounding tie is decided exactly; float error
+# of |x| * 10**digits is orders of magnitude below it for test scores
+NEAR_TIE = 1e-6
+
+
+def to_fixed(x, digits: int) -> np.ndarray:
+    """``parseFloat(x.toFixed(digits))``, element-wise."""
+    x = np.asarray(x, dtype=np.float64)
+    scale = 10.0 ** digits
+    scaled = np.abs(x) * scale
+    n = np.floor(scaled + 0.5)
+    near = np.flatnonzero(np.abs(scaled - np.floor(scaled) - 0.5) < NEAR_TIE)
+    if near.size:
+        quantum = Decimal(1).scaleb(-digits)
+        flat = n.reshape(-1)
+        for i, value in zip(near, np.abs(x).reshape(-1)[near]):
+            flat[i] = int(Decimal(float(value)).quantize(quantum, rounding=ROUND_HALF_UP).scaleb(digits))
+    return np.copysign(n / scale, x)
+
+
+def js_round(x) -> np.ndarray:
+    """``Math.round(x)``: nearest integer, halves toward +∞."""
+    x = np.asarray(x, dtype=np.float64)
+    n = np.floor(x + 0.5)
+    near = np.flatnonzero(np.abs(x - np.floor(x) - 0.5) < NEAR_TIE)
+    if near.size:
+        flat = n.reshape(-1)
+        for i, value in zip(near, x.reshape(-1)[near]):
+            flat[i] = math.floor(Fraction(float(value)) + Fraction(1, 2))
+    return n
+
+
+def desc_order(x: np.ndarray) -> np.ndarray:
+    """Column indices of each row, highest first; equal values keep column order."""
+    return np.argsort(-x, axis=1, kind='stable')
+
+
+def seq_sum(x: np.ndarray) -> np.ndarray:
+    """Row sums added left to right, as ``reduce((s, v) => s + v, 0)``."""
+    total = np.zeros(x.shape[0])
+    for column in x.T:
+        total = total + column
+    return total
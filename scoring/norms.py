@@ -0,0 +1,247 @@
+"""
+scoring.norms — build the norm lookup tables in ``scoring/tables/``.
+
+    python -m scoring.norms [TEST_TYPE ...] [--check] [--bench N]
+
+``calculatePercentileApprox`` interpolates over three norm ranges on every
+call, and each ``generate*Report`` derives its level with its own
+thresholds.  Both are functions of one dimension's sum, which only takes
+``items × (scale - 1) + 1`` values, so for every test in
+``engine.COLUMNS``:
+
+  1. every possible sum of every dimension is scored once with the engine's
+     formulas, into dense per-dimension rows (average, percentile, norm
+     level, report level),
+  2. every row entry is cross-checked against ``scoring.js`` itself: an
+     answer set with exactly that sum is scored by ``node`` through the
+     real ``calculate*Score`` and ``generate*Report``, and must give the
+     same values bit for bit,
+  3. the rows are written as a small generated module,
+     ``scoring/tables/<test>.py``, which the engine then indexes with
+     ``sum - LOW`` instead of computing.
+
+Nothing is written unless every entry matches.  ``--check`` only reports
+tables that are missing or stale (exit 1), for CI.  ``--bench N`` times
+both paths on N random rows per test.
+"""
+
+import argparse
+import json
+import os
+import time
+from typing import Dict, List, NamedTuple, Tuple
+
+import numpy as np
+
+from . import bank, engine, tables
+from .engine import Key
+
+_SCORE_AND_REPORT = '''
+import { readFileSync } from 'node:fs';
+import * as scoring from './src/utils/scoring.js';
+const out = JSON.parse(readFileSync(0, 'utf8')).map(([calculate, report, responses]) => {
+  const scores = scoring[calculate](responses);
+  return { scores, report: scoring[report](scores) };
+});
+process.stdout.write(JSON.stringify(out));
+'''
+
+REPORTS = {
+    'HEXACO': 'generateHexacoReport',
+    'EQ': 'generateEQReport',
+    'MENTAL_TOUGHNESS': 'generateMentalToughnessReport',
+    'MEANING': 'generateMeaningReport',
+    'DARK_TRIAD': 'generateDarkTriadReport',
+}
+# getHexacoInterpretation reports its level by label
+HEXACO_LABELS = {'low': 'Niski', 'medium': 'Średni', 'high': 'Wysoki'}
+
+
+# ─── Tables ───────────────────────────────────────────────────────────────────
+
+class Built(NamedTuple):
+    test_type: str
+    low: List[int]                              # per group: smallest sum
+    columns: Dict[str, List[np.ndarray]]        # name → per group: one entry per sum
+
+
+def build(test_type: str) -> Built:
+    """Every sum of every dimension, scored with the engine's formulas."""
+    k = engine.key(test_type)
+    top = engine.scale_max(k)
+    low = k.counts.astype(int)
+    size = low * (top - 1) + 1
+    grid = low + np.minimum(np.arange(size.max())[:, None], size - 1)
+    values = engine.COLUMNS[test_type](k, grid.astype(np.float64))
+    return Built(test_type, low.tolist(),
+                 {name: [column[:n, j] for j, n in enumerate(size)] for name, column in values.items()})
+
+
+def _literal(x) -> str:
+    x = float(x)
+    return str(int(x)) if x.is_integer() else repr(x)
+
+
+def render(built: Built) -> str:
+    k = engine.key(built.test_type)
+    lines = [
+        '"""',
+        f'scoring.tables.{tables.module_name(built.test_type)} — norm table for {k.spec.export}.',
+        '',
+        'Generated by ``python -m scoring.norms``; do not edit.',
+        '"""',
+        '',
+        f'SOURCE = {tables.digest(k.test)!r}',
+        f'GROUPS = {tuple(k.groups)!r}',
+        f'LEVELS = {engine.REPORT_LEVELS[built.test_type]!r}',
+        f'LOW = {tuple(built.low)!r}',
+        '',
+        'COLUMNS = {',
+    ]
+    for name, rows in built.columns.items():
+        lines.append(f'    {name!r}: (')
+        lines.extend(f"        ({', '.join(_literal(v) for v in row)})," for row in rows)
+        lines.append('    ),')
+    lines.append('}')
+    return '\n'.join(lines) + '\n'
+
+
+def path(test_type: str) -> str:
+    return os.path.join(os.path.dirname(tables.__file__), tables.module_name(test_type) + '.py')
+
+
+# ─── Cross-check against scoring.js ───────────────────────────────────────────
+
+def answers_for(k: Key, group: int, total: int) -> dict:
+    """Answers giving ``group`` exactly ``total``; every other item in the middle."""
+    top = engine.scale_max(k)
+    extra = total - int(k.counts[group])
+    answers = {}
+    for row, q in enumerate(k.questions):
+        col = int(np.flatnonzero(k.matrix[row])[0])
+        if col == group:
+            value = 1 + min(extra, top - 1)
+            extra -= value - 1
+        else:
+            value = (1 + top) // 2
+        answers[q] = value if k.matrix[row, col] > 0 else k.spec.reverse_max - value
+    return answers
+
+
+def js_columns(test_type: str, k: Key, js: dict, group: int) -> dict:
+    """The tabulated values as scoring.js reports them for one dimension."""
+    g = k.groups[group]
+    if test_type == 'DARK_TRIAD':
+        d = js['scores']['dimensions'][g]
+        return {'raw_scores': d['raw_score'], 'level': d['level'],
+                'vs_population': d['vs_population'], 'percentile': d['percentile']}
+    dim = next(d for d in js['report']['dimensions'] if d['id'] == g)
+    return {'raw_scores': js['scores']['raw_scores'][g], 'percentile_scores': js['scores']['percentile_scores'][g],
+            'level': dim['interpretation']['level'] if test_type == 'HEXACO' else dim['level']}
+
+
+def cross_check(built: Built, limit: int = 5) -> Tuple[int, List[str]]:
+    """(entries checked, mismatches) of a built table against node."""
+    test_type = built.test_type
+    k = engine.key(test_type)
+    levels = engine.REPORT_LEVELS[test_type]
+    cases = [(j, built.low[j] + i) for j, rows in enumerate(next(iter(built.columns.values())))
+             for i in range(len(rows))]
+    calls = [[k.spec.function, REPORTS[test_type], answers_for(k, j, total)] for j, total in cases]
+    js = json.loads(bank.run_node(_SCORE_AND_REPORT, stdin=json.dumps(calls)))
+    mismatches = []
+    for (j, total), result in zip(cases, js):
+        theirs = js_columns(test_type, k, result, j)
+        for name, rows in built.columns.items():
+            ours = rows[j][total - built.low[j]]
+            if name == 'level':
+                ours = levels[ours]
+                ours = HEXACO_LABELS[ours] if test_type == 'HEXACO' else ours
+            else:
+                ours = float(ours)
+            if ours == theirs[name]:
+                continue
+            mismatches.append(f"{k.groups[j]} sum {total}: {name}  table {ours!r}  js {theirs[name]!r}"
+                              if len(mismatches) < limit else '')
+    return len(cases), mismatches
+
+
+# ─── Benchmark ────────────────────────────────────────────────────────────────
+
+def bench(test_type: str, rows: int, seed: int = 0) -> Tuple[float, float]:
+    """Seconds for the formula path and the table path on the same random sums."""
+    k = engine.key(test_type)
+    table = tables.load(test_type, k.test)
+    if table is None:
+        raise SystemExit(f"{test_type}: no current table — run python -m scoring.norms first")
+    rng = np.random.default_rng(seed)
+    sums = rng.integers(table.low, table.low + table.size, (rows, len(k.groups))).astype(np.float64)
+    start = time.perf_counter()
+    engine.COLUMNS[test_type](k, sums)
+    formula = time.perf_counter() - start
+    start = time.perf_counter()
+    table.lookup(sums)
+    return formula, time.perf_counter() - start
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m scoring.norms',
+                                     description="Build and cross-check the norm lookup tables.")
+    parser.add_argument('tests', nargs='*', metavar='TEST_TYPE',
+                        help=f"test types (default: all of {', '.join(engine.COLUMNS)})")
+    parser.add_argument('--check', action='store_true', help="report missing or stale tables, write nothing")
+    parser.add_argument('--bench', type=int, metavar='N', help="time formula vs lookup on N rows per test")
+    args = parser.parse_args(argv)
+
+    unknown = sorted(set(args.tests) - set(engine.COLUMNS))
+    if unknown:
+        parser.error(f"no norm table for: {', '.join(unknown)}")
+    tests = args.tests or list(engine.COLUMNS)
+    width = max(len(t) for t in tests)
+
+    if args.bench:
+        print(f"\n=== norm tables: formula vs lookup, {args.bench:,} rows per test ===\n")
+        for test_type in tests:
+            formula, lookup = bench(test_type, args.bench)
+            scores = args.bench * len(engine.key(test_type).groups)
+            print(f"  {test_type:<{width}}  formula {scores / formula / 1e6:7.1f} M scores/s"
+                  f"   lookup {scores / lookup / 1e6:7.1f} M scores/s   ×{formula / lookup:.1f}")
+        print("\n=== Done ===\n")
+        return 0
+
+    print(f"\n=== norm tables: {len(tests)} tests {'(check)' if args.check else 'vs src/utils/scoring.js'} ===\n")
+    failed = 0
+    for test_type in tests:
+        built = build(test_type)
+        text = render(built)
+        target = path(test_type)
+        try:
+            with open(target, encoding='utf-8') as f:
+                current = f.read() == text
+        except FileNotFoundError:
+            current = False
+        entries = sum(len(rows) for rows in next(iter(built.columns.values())))
+        if args.check:
+            failed += not current
+            print(f"  {'✓' if current else '✗'} {test_type:<{width}}  "
+                  f"{'current' if current else 'stale — run python -m scoring.norms'}")
+            continue
+        checked, mismatches = cross_check(built)
+        if mismatches:
+            failed += 1
+            print(f"  ✗ {test_type:<{width}}  {len(mismatches)} values in {checked} entries differ from scoring.js")
+            for line in filter(None, mismatches):
+                print(f"      {line}")
+            continue
+        if not current:
+            with open(target, 'w', encoding='utf-8') as f:
+                f.write(text)
+        print(f"  ✓ {test_type:<{width}}  {len(built.low)} groups, {entries} entries match scoring.js,"
+              f" {len(text.encode()) / 1024:.1f} KB {'unchanged' if current else 'written'}")
+    print("\n=== Done ===\n")
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    import sys
+    sys.exit(main())
@@ -0,0 +1,84 @@
+"""
+scoring.tables — generated norm tables, one module per test.
+
+A Likert dimension's sum is a small integer (``items`` to ``items × scale``),
+so every per-dimension result that depends on the sum alone — average,
+percentile, norm level, report level — is a row of a dense table indexed
+by ``sum - LOW``.  The modules here (``dark_triad.py``, ``hexaco.py``, ...)
+are written by ``python -m scoring.norms``; this package only loads them.
+
+A table records the ``SOURCE`` it was built from: the test definition plus
+the engine's formulas.  ``load`` ignores a table whose source has changed
+since, so a stale table falls back to computing and is never wrong.
+"""
+
+import hashlib
+import importlib
+import json
+import os
+from typing import Dict, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+_HERE = os.path.dirname(os.path.abspath(__file__))
+# The formulas tabulated; editing either invalidates every table
+FORMULAS = tuple(os.path.join(os.path.dirname(_HERE), name) for name in ('engine.py', 'jsmath.py'))
+
+
+def module_name(test_type: str) -> str:
+    return test_type.lower()
+
+
+def formulas_version() -> str:
+    h = hashlib.sha256()
+    for path in FORMULAS:
+        with open(path, 'rb') as f:
+            h.update(f.read())
+        h.update(b'\0')
+    return h.hexdigest()
+
+
+def digest(test: dict) -> str:
+    """``SOURCE`` of a table built from ``test`` with the current formulas."""
+    return hashlib.sha256((json.dumps(test, sort_keys=True) + formulas_version()).encode()).hexdigest()
+
+
+class Table(NamedTuple):
+    low: np.ndarray                 # (groups,) sum at entry 0
+    size: np.ndarray                # (groups,) entries per group
+    start: np.ndarray               # (groups,) offset of each group in the flat columns
+    columns: Dict[str, np.ndarray]  # name → every group's entries, concatenated
+
+    def lookup(self, sums: np.ndarray) -> Tuple[Dict[str, np.ndarray], np.ndarray]:
+        """Columns for (n, groups) ``sums``, and the rows with a sum off the table."""
+        index = sums.astype(np.intp) - self.low
+        outside = ((index < 0) | (index >= self.size)).any(axis=1)
+        if outside.any():
+            index = np.clip(index, 0, self.size - 1)
+        flat = index + self.start
+        return {name: values[flat] for name, values in self.columns.items()}, outside
+
+
+def from_module(module) -> Table:
+    low = np.array(module.LOW, dtype=np.intp)
+    size = np.array([len(row) for row in next(iter(module.COLUMNS.values()))], dtype=np.intp)
+    start = np.concatenate(([0], np.cumsum(size)[:-1]))
+    columns = {name: np.concatenate([np.array(row, dtype=np.int8 if name == 'level' else np.float64)
+                                     for row in rows])
+               for name, rows in module.COLUMNS.items()}
+    return Table(low, size, start, columns)
+
+
+_loaded: Dict[str, Optional[Table]] = {}
+
+
+def load(test_type: str, test: dict) -> Optional[Table]:
+    """The table for a test, or None if it has none or it is stale."""
+    if test_type not in _loaded:
+        try:
+            module = importlib.import_module(f'{__name__}.{module_name(test_type)}')
+        except ModuleNotFoundError:
+            module = None
+        current = module is not None and module.SOURCE == digest(test)
+        _loaded[test_type] = from_module(module) if current else None
+    return _loaded[test_type]
@@ -0,0 +1,33 @@
+"""
+scoring.tables.dark_triad — norm table for DARK_TRIAD_TEST.
+
+Generated by ``python -m scoring.norms``; do not edit.
+"""
+
+SOURCE = '0c1e0e06ae9f10a58e907f9b6b27f7790de6061dcbda795dfdd219fd8d00a4f2'
+GROUPS = ('machiavellianism', 'narcissism', 'psychopathy')
+LEVELS = ('low', 'average', 'high')
+LOW = (9, 9, 9)
+
+COLUMNS = {
+    'raw_scores': (
+        (1, 1.11, 1.22, 1.33, 1.44, 1.56, 1.67, 1.78, 1.89, 2, 2.11, 2.22, 2.33, 2.44, 2.56, 2.67, 2.78, 2.89, 3, 3.11, 3.22, 3.33, 3.44, 3.56, 3.67, 3.78, 3.89, 4, 4.11, 4.22, 4.33, 4.44, 4.56, 4.67, 4.78, 4.89, 5),
+        (1, 1.11, 1.22, 1.33, 1.44, 1.56, 1.67, 1.78, 1.89, 2, 2.11, 2.22, 2.33, 2.44, 2.56, 2.67, 2.78, 2.89, 3, 3.11, 3.22, 3.33, 3.44, 3.56, 3.67, 3.78, 3.89, 4, 4.11, 4.22, 4.33, 4.44, 4.56, 4.67, 4.78, 4.89, 5),
+        (1, 1.11, 1.22, 1.33, 1.44, 1.56, 1.67, 1.78, 1.89, 2, 2.11, 2.22, 2.33, 2.44, 2.56, 2.67, 2.78, 2.89, 3, 3.11, 3.22, 3.33, 3.44, 3.56, 3.67, 3.78, 3.89, 4, 4.11, 4.22, 4.33, 4.44, 4.56, 4.67, 4.78, 4.89, 5),
+    ),
+    'level': (
+        (0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2),
+        (0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2),
+        (0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2),
+    ),
+    'vs_population': (
+        (-2.1, -1.99, -1.88, -1.77, -1.66, -1.54, -1.43, -1.32, -1.21, -1.1, -0.99, -0.88, -0.77, -0.66, -0.54, -0.43, -0.32, -0.21, -0.1, 0.01, 0.12, 0.23, 0.34, 0.46, 0.57, 0.68, 0.79, 0.9, 1.01, 1.12, 1.23, 1.34, 1.46, 1.57, 1.68, 1.79, 1.9),
+        (-1.8, -1.69, -1.58, -1.47, -1.36, -1.24, -1.13, -1.02, -0.91, -0.8, -0.69, -0.58, -0.47, -0.36, -0.24, -0.13, -0.02, 0.09, 0.2, 0.31, 0.42, 0.53, 0.64, 0.76, 0.87, 0.98, 1.09, 1.2, 1.31, 1.42, 1.53, 1.64, 1.76, 1.87, 1.98, 2.09, 2.2),
+        (-1.3, -1.19, -1.08, -0.97, -0.86, -0.74, -0.63, -0.52, -0.41, -0.3, -0.19, -0.08, 0.03, 0.14, 0.26, 0.37, 0.48, 0.59, 0.7, 0.81, 0.92, 1.03, 1.14, 1.26, 1.37, 1.48, 1.59, 1.7, 1.81, 1.92, 2.03, 2.14, 2.26, 2.37, 2.48, 2.59, 2.7),
+    ),
+    'percentile': (
+        (0, 2, 4, 6, 7, 9, 11, 13, 15, 17, 19, 20, 22, 24, 26, 28, 30, 36, 43, 51, 58, 66, 71, 73, 75, 77, 79, 81, 83, 85, 88, 90, 92, 94, 96, 98, 100),
+        (0, 2, 4, 7, 9, 11, 13, 16, 18, 20, 22, 24, 27, 29, 33, 40, 46, 52, 59, 65, 70, 72, 74, 76, 78, 80, 81, 83, 85, 87, 89, 91, 93, 94, 96, 98, 100),
+        (0, 3, 7, 10, 13, 17, 20, 23, 27, 30, 36, 43, 49, 55, 62, 68, 71, 72, 74, 75, 77, 78, 80, 81, 83, 84, 86, 87, 88, 90, 91, 93, 94, 96, 97, 99, 100),
+    ),
+}
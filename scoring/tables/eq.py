@@ -0,0 +1,34 @@
+"""
+scoring.tables.eq — norm table for EQ_TEST.
+
+Generated by ``python -m scoring.norms``; do not edit.
+"""
+
+SOURCE = '65462ce9d2e660af2f59375ab31f8246118299baec84f4fdf2e84340f2f43911'
+GROUPS = ('self_awareness', 'self_regulation', 'empathy', 'social_skills', 'motivation')
+LEVELS = ('low', 'medium', 'high')
+LOW = (8, 8, 8, 8, 8)
+
+COLUMNS = {
+    'raw_scores': (
+        (1, 1.125, 1.25, 1.375, 1.5, 1.625, 1.75, 1.875, 2, 2.125, 2.25, 2.375, 2.5, 2.625, 2.75, 2.875, 3, 3.125, 3.25, 3.375, 3.5, 3.625, 3.75, 3.875, 4, 4.125, 4.25, 4.375, 4.5, 4.625, 4.75, 4.875, 5),
+        (1, 1.125, 1.25, 1.375, 1.5, 1.625, 1.75, 1.875, 2, 2.125, 2.25, 2.375, 2.5, 2.625, 2.75, 2.875, 3, 3.125, 3.25, 3.375, 3.5, 3.625, 3.75, 3.875, 4, 4.125, 4.25, 4.375, 4.5, 4.625, 4.75, 4.875, 5),
+        (1, 1.125, 1.25, 1.375, 1.5, 1.625, 1.75, 1.875, 2, 2.125, 2.25, 2.375, 2.5, 2.625, 2.75, 2.875, 3, 3.125, 3.25, 3.375, 3.5, 3.625, 3.75, 3.875, 4, 4.125, 4.25, 4.375, 4.5, 4.625, 4.75, 4.875, 5),
+        (1, 1.125, 1.25, 1.375, 1.5, 1.625, 1.75, 1.875, 2, 2.125, 2.25, 2.375, 2.5, 2.625, 2.75, 2.875, 3, 3.125, 3.25, 3.375, 3.5, 3.625, 3.75, 3.875, 4, 4.125, 4.25, 4.375, 4.5, 4.625, 4.75, 4.875, 5),
+        (1, 1.125, 1.25, 1.375, 1.5, 1.625, 1.75, 1.875, 2, 2.125, 2.25, 2.375, 2.5, 2.625, 2.75, 2.875, 3, 3.125, 3.25, 3.375, 3.5, 3.625, 3.75, 3.875, 4, 4.125, 4.25, 4.375, 4.5, 4.625, 4.75, 4.875, 5),
+    ),
+    'percentile_scores': (
+        (0, 3.125, 6.25, 9.375, 12.5, 15.625, 18.75, 21.875, 25, 28.125, 31.25, 34.375, 37.5, 40.625, 43.75, 46.875, 50, 53.125, 56.25, 59.375, 62.5, 65.625, 68.75, 71.875, 75, 78.125, 81.25, 84.375, 87.5, 90.625, 93.75, 96.875, 100),
+        (0, 3.125, 6.25, 9.375, 12.5, 15.625, 18.75, 21.875, 25, 28.125, 31.25, 34.375, 37.5, 40.625, 43.75, 46.875, 50, 53.125, 56.25, 59.375, 62.5, 65.625, 68.75, 71.875, 75, 78.125, 81.25, 84.375, 87.5, 90.625, 93.75, 96.875, 100),
+        (0, 3.125, 6.25, 9.375, 12.5, 15.625, 18.75, 21.875, 25, 28.125, 31.25, 34.375, 37.5, 40.625, 43.75, 46.875, 50, 53.125, 56.25, 59.375, 62.5, 65.625, 68.75, 71.875, 75, 78.125, 81.25, 84.375, 87.5, 90.625, 93.75, 96.875, 100),
+        (0, 3.125, 6.25, 9.375, 12.5, 15.625, 18.75, 21.875, 25, 28.125, 31.25, 34.375, 37.5, 40.625, 43.75, 46.875, 50, 53.125, 56.25, 59.375, 62.5, 65.625, 68.75, 71.875, 75, 78.125, 81.25, 84.375, 87.5, 90.625, 93.75, 96.875, 100),
+        (0, 3.125, 6.25, 9.375, 12.5, 15.625, 18.75, 21.875, 25, 28.125, 31.25, 34.375, 37.5, 40.625, 43.75, 46.875, 50, 53.125, 56.25, 59.375, 62.5, 65.625, 68.75, 71.875, 75, 78.125, 81.25, 84.375, 87.5, 90.625, 93.75, 96.875, 100),
+    ),
+    'level': (
+        (0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 2, 2, 2, 2, 2, 2, 2, 2, 2),
+        (0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 2, 2, 2, 2, 2, 2, 2, 2, 2),
+        (0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 2, 2, 2, 2, 2, 2, 2, 2, 2),
+        (0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 2, 2, 2, 2, 2, 2, 2, 2, 2),
+        (0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 2, 2, 2, 2, 2, 2, 2, 2, 2),
+    ),
+}
@@ -0,0 +1,37 @@
+"""
+scoring.tables.hexaco — norm table for HEXACO_TEST.
+
+Generated by ``python -m scoring.norms``; do not edit.
+"""
+
+SOURCE = '707eb1d1791f97d873ca62236a8d94391eb7ae50c7c7a7d585df3f54bc26eaca'
+GROUPS = ('honesty_humility', 'emotionality', 'extraversion', 'agreeableness', 'conscientiousness', 'openness')
+LEVELS = ('low', 'medium', 'high')
+LOW = (11, 9, 10, 9, 9, 12)
+
+COLUMNS = {
+    'raw_scores': (
+        (1, 1.0909090909090908, 1.1818181818181819, 1.2727272727272727, 1.3636363636363635, 1.4545454545454546, 1.5454545454545454, 1.6363636363636365, 1.7272727272727273, 1.8181818181818181, 1.9090909090909092, 2, 2.090909090909091, 2.1818181818181817, 2.272727272727273, 2.3636363636363638, 2.4545454545454546, 2.5454545454545454, 2.6363636363636362, 2.727272727272727, 2.8181818181818183, 2.909090909090909, 3, 3.090909090909091, 3.1818181818181817, 3.272727272727273, 3.3636363636363638, 3.4545454545454546, 3.5454545454545454, 3.6363636363636362, 3.727272727272727, 3.8181818181818183, 3.909090909090909, 4, 4.090909090909091, 4.181818181818182, 4.2727272727272725, 4.363636363636363, 4.454545454545454, 4.545454545454546, 4.636363636363637, 4.7272727272727275, 4.818181818181818, 4.909090909090909, 5),
+        (1, 1.1111111111111112, 1.2222222222222223, 1.3333333333333333, 1.4444444444444444, 1.5555555555555556, 1.6666666666666667, 1.7777777777777777, 1.8888888888888888, 2, 2.111111111111111, 2.2222222222222223, 2.3333333333333335, 2.4444444444444446, 2.5555555555555554, 2.6666666666666665, 2.7777777777777777, 2.888888888888889, 3, 3.111111111111111, 3.2222222222222223, 3.3333333333333335, 3.4444444444444446, 3.5555555555555554, 3.6666666666666665, 3.7777777777777777, 3.888888888888889, 4, 4.111111111111111, 4.222222222222222, 4.333333333333333, 4.444444444444445, 4.555555555555555, 4.666666666666667, 4.777777777777778, 4.888888888888889, 5),
+        (1, 1.1, 1.2, 1.3, 1.4, 1.5, 1.6, 1.7, 1.8, 1.9, 2, 2.1, 2.2, 2.3, 2.4, 2.5, 2.6, 2.7, 2.8, 2.9, 3, 3.1, 3.2, 3.3, 3.4, 3.5, 3.6, 3.7, 3.8, 3.9, 4, 4.1, 4.2, 4.3, 4.4, 4.5, 4.6, 4.7, 4.8, 4.9, 5),
+        (1, 1.1111111111111112, 1.2222222222222223, 1.3333333333333333, 1.4444444444444444, 1.5555555555555556, 1.6666666666666667, 1.7777777777777777, 1.8888888888888888, 2, 2.111111111111111, 2.2222222222222223, 2.3333333333333335, 2.4444444444444446, 2.5555555555555554, 2.6666666666666665, 2.7777777777777777, 2.888888888888889, 3, 3.111111111111111, 3.2222222222222223, 3.3333333333333335, 3.4444444444444446, 3.5555555555555554, 3.6666666666666665, 3.7777777777777777, 3.888888888888889, 4, 4.111111111111111, 4.222222222222222, 4.333333333333333, 4.444444444444445, 4.555555555555555, 4.666666666666667, 4.777777777777778, 4.888888888888889, 5),
+        (1, 1.1111111111111112, 1.2222222222222223, 1.3333333333333333, 1.4444444444444444, 1.5555555555555556, 1.6666666666666667, 1.7777777777777777, 1.8888888888888888, 2, 2.111111111111111, 2.2222222222222223, 2.3333333333333335, 2.4444444444444446, 2.5555555555555554, 2.6666666666666665, 2.7777777777777777, 2.888888888888889, 3, 3.111111111111111, 3.2222222222222223, 3.3333333333333335, 3.4444444444444446, 3.5555555555555554, 3.6666666666666665, 3.7777777777777777, 3.888888888888889, 4, 4.111111111111111, 4.222222222222222, 4.333333333333333, 4.444444444444445, 4.555555555555555, 4.666666666666667, 4.777777777777778, 4.888888888888889, 5),
+        (1, 1.0833333333333333, 1.1666666666666667, 1.25, 1.3333333333333333, 1.4166666666666667, 1.5, 1.5833333333333333, 1.6666666666666667, 1.75, 1.8333333333333333, 1.9166666666666667, 2, 2.0833333333333335, 2.1666666666666665, 2.25, 2.3333333333333335, 2.4166666666666665, 2.5, 2.5833333333333335, 2.6666666666666665, 2.75, 2.8333333333333335, 2.9166666666666665, 3, 3.0833333333333335, 3.1666666666666665, 3.25, 3.3333333333333335, 3.4166666666666665, 3.5, 3.5833333333333335, 3.6666666666666665, 3.75, 3.8333333333333335, 3.9166666666666665, 4, 4.083333333333333, 4.166666666666667, 4.25, 4.333333333333333, 4.416666666666667, 4.5, 4.583333333333333, 4.666666666666667, 4.75, 4.833333333333333, 4.916666666666667, 5),
+    ),
+    'percentile_scores': (
+        (0, 2.2727272727272707, 4.545454545454547, 6.8181818181818175, 9.090909090909088, 11.363636363636365, 13.636363636363635, 15.909090909090912, 18.181818181818183, 20.454545454545453, 22.72727272727273, 25, 27.27272727272727, 29.54545454545454, 31.818181818181824, 34.09090909090909, 36.36363636363637, 38.63636363636363, 40.90909090909091, 43.18181818181818, 45.45454545454546, 47.72727272727273, 50, 52.27272727272727, 54.54545454545454, 56.81818181818182, 59.09090909090909, 61.36363636363637, 63.63636363636363, 65.9090909090909, 68.18181818181817, 70.45454545454545, 72.72727272727273, 75, 77.27272727272727, 79.54545454545455, 81.81818181818181, 84.09090909090908, 86.36363636363636, 88.63636363636364, 90.90909090909092, 93.18181818181819, 95.45454545454545, 97.72727272727273, 100),
+        (0, 2.777777777777779, 5.555555555555558, 8.333333333333332, 11.11111111111111, 13.88888888888889, 16.666666666666668, 19.444444444444443, 22.22222222222222, 25, 27.77777777777778, 30.555555555555557, 33.333333333333336, 36.111111111111114, 38.888888888888886, 41.666666666666664, 44.44444444444444, 47.22222222222222, 50, 52.77777777777778, 55.55555555555556, 58.333333333333336, 61.111111111111114, 63.888888888888886, 66.66666666666666, 69.44444444444444, 72.22222222222221, 75, 77.77777777777777, 80.55555555555556, 83.33333333333333, 86.11111111111111, 88.88888888888889, 91.66666666666667, 94.44444444444444, 97.22222222222223, 100),
+        (0, 2.500000000000002, 4.999999999999999, 7.500000000000001, 9.999999999999998, 12.5, 15.000000000000002, 17.5, 20, 22.499999999999996, 25, 27.500000000000004, 30.000000000000004, 32.49999999999999, 35, 37.5, 40, 42.50000000000001, 44.99999999999999, 47.5, 50, 52.5, 55.00000000000001, 57.49999999999999, 60, 62.5, 65, 67.5, 70, 72.5, 75, 77.49999999999999, 80, 82.5, 85.00000000000001, 87.5, 89.99999999999999, 92.5, 95, 97.50000000000001, 100),
+        (0, 2.777777777777779, 5.555555555555558, 8.333333333333332, 11.11111111111111, 13.88888888888889, 16.666666666666668, 19.444444444444443, 22.22222222222222, 25, 27.77777777777778, 30.555555555555557, 33.333333333333336, 36.111111111111114, 38.888888888888886, 41.666666666666664, 44.44444444444444, 47.22222222222222, 50, 52.77777777777778, 55.55555555555556, 58.333333333333336, 61.111111111111114, 63.888888888888886, 66.66666666666666, 69.44444444444444, 72.22222222222221, 75, 77.77777777777777, 80.55555555555556, 83.33333333333333, 86.11111111111111, 88.88888888888889, 91.66666666666667, 94.44444444444444, 97.22222222222223, 100),
+        (0, 2.777777777777779, 5.555555555555558, 8.333333333333332, 11.11111111111111, 13.88888888888889, 16.666666666666668, 19.444444444444443, 22.22222222222222, 25, 27.77777777777778, 30.555555555555557, 33.333333333333336, 36.111111111111114, 38.888888888888886, 41.666666666666664, 44.44444444444444, 47.22222222222222, 50, 52.77777777777778, 55.55555555555556, 58.333333333333336, 61.111111111111114, 63.888888888888886, 66.66666666666666, 69.44444444444444, 72.22222222222221, 75, 77.77777777777777, 80.55555555555556, 83.33333333333333, 86.11111111111111, 88.88888888888889, 91.66666666666667, 94.44444444444444, 97.22222222222223, 100),
+        (0, 2.0833333333333313, 4.166666666666669, 6.25, 8.333333333333332, 10.416666666666668, 12.5, 14.583333333333332, 16.666666666666668, 18.75, 20.833333333333332, 22.916666666666668, 25, 27.083333333333336, 29.166666666666664, 31.25, 33.333333333333336, 35.416666666666664, 37.5, 39.583333333333336, 41.666666666666664, 43.75, 45.833333333333336, 47.916666666666664, 50, 52.083333333333336, 54.166666666666664, 56.25, 58.333333333333336, 60.416666666666664, 62.5, 64.58333333333334, 66.66666666666666, 68.75, 70.83333333333334, 72.91666666666666, 75, 77.08333333333333, 79.16666666666667, 81.25, 83.33333333333333, 85.41666666666667, 87.5, 89.58333333333333, 91.66666666666667, 93.75, 95.83333333333333, 97.91666666666667, 100),
+    ),
+    'level': (
+        (0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2),
+        (0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1, 1, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2),
+        (0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2),
+        (0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1, 1, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2),
+        (0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1, 1, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2),
+        (0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2),
+    ),
+}
@@ -0,0 +1,31 @@
+"""
+scoring.tables.meaning — norm table for MEANING_TEST.
+
+Generated by ``python -m scoring.norms``; do not edit.
+"""
+
+SOURCE = '81ba6011dc8b74283e6da9c945b6cc082e7510e26eb555ee49e0dc484a093723'
+GROUPS = ('purpose', 'transcendence', 'existential', 'connection')
+LEVELS = ('low', 'medium', 'high')
+LOW = (8, 8, 8, 8)
+
+COLUMNS = {
+    'raw_scores': (
+        (1, 1.13, 1.25, 1.38, 1.5, 1.63, 1.75, 1.88, 2, 2.13, 2.25, 2.38, 2.5, 2.63, 2.75, 2.88, 3, 3.13, 3.25, 3.38, 3.5, 3.63, 3.75, 3.88, 4, 4.13, 4.25, 4.38, 4.5, 4.63, 4.75, 4.88, 5, 5.13, 5.25, 5.38, 5.5, 5.63, 5.75, 5.88, 6),
+        (1, 1.13, 1.25, 1.38, 1.5, 1.63, 1.75, 1.88, 2, 2.13, 2.25, 2.38, 2.5, 2.63, 2.75, 2.88, 3, 3.13, 3.25, 3.38, 3.5, 3.63, 3.75, 3.88, 4, 4.13, 4.25, 4.38, 4.5, 4.63, 4.75, 4.88, 5, 5.13, 5.25, 5.38, 5.5, 5.63, 5.75, 5.88, 6),
+        (1, 1.13, 1.25, 1.38, 1.5, 1.63, 1.75, 1.88, 2, 2.13, 2.25, 2.38, 2.5, 2.63, 2.75, 2.88, 3, 3.13, 3.25, 3.38, 3.5, 3.63, 3.75, 3.88, 4, 4.13, 4.25, 4.38, 4.5, 4.63, 4.75, 4.88, 5, 5.13, 5.25, 5.38, 5.5, 5.63, 5.75, 5.88, 6),
+        (1, 1.13, 1.25, 1.38, 1.5, 1.63, 1.75, 1.88, 2, 2.13, 2.25, 2.38, 2.5, 2.63, 2.75, 2.88, 3, 3.13, 3.25, 3.38, 3.5, 3.63, 3.75, 3.88, 4, 4.13, 4.25, 4.38, 4.5, 4.63, 4.75, 4.88, 5, 5.13, 5.25, 5.38, 5.5, 5.63, 5.75, 5.88, 6),
+    ),
+    'percentile_scores': (
+        (0, 3, 5, 8, 10, 13, 15, 18, 20, 23, 25, 28, 30, 33, 35, 38, 40, 43, 45, 48, 50, 53, 55, 58, 60, 63, 65, 68, 70, 73, 75, 78, 80, 83, 85, 88, 90, 93, 95, 98, 100),
+        (0, 3, 5, 8, 10, 13, 15, 18, 20, 23, 25, 28, 30, 33, 35, 38, 40, 43, 45, 48, 50, 53, 55, 58, 60, 63, 65, 68, 70, 73, 75, 78, 80, 83, 85, 88, 90, 93, 95, 98, 100),
+        (0, 3, 5, 8, 10, 13, 15, 18, 20, 23, 25, 28, 30, 33, 35, 38, 40, 43, 45, 48, 50, 53, 55, 58, 60, 63, 65, 68, 70, 73, 75, 78, 80, 83, 85, 88, 90, 93, 95, 98, 100),
+        (0, 3, 5, 8, 10, 13, 15, 18, 20, 23, 25, 28, 30, 33, 35, 38, 40, 43, 45, 48, 50, 53, 55, 58, 60, 63, 65, 68, 70, 73, 75, 78, 80, 83, 85, 88, 90, 93, 95, 98, 100),
+    ),
+    'level': (
+        (0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2),
+        (0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2),
+        (0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2),
+        (0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2),
+    ),
+}
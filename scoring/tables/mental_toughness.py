@@ -0,0 +1,31 @@
+"""
+scoring.tables.mental_toughness — norm table for MENTAL_TOUGHNESS_TEST.
+
+Generated by ``python -m scoring.norms``; do not edit.
+"""
+
+SOURCE = 'e3c05e2d08a5f8a7dcb7c2bc2a4862d45d41d4c259533ba205442442e63f883c'
+GROUPS = ('control', 'commitment', 'challenge', 'confidence')
+LEVELS = ('low', 'medium', 'high')
+LOW = (10, 10, 10, 10)
+
+COLUMNS = {
+    'raw_scores': (
+        (1, 1.1, 1.2, 1.3, 1.4, 1.5, 1.6, 1.7, 1.8, 1.9, 2, 2.1, 2.2, 2.3, 2.4, 2.5, 2.6, 2.7, 2.8, 2.9, 3, 3.1, 3.2, 3.3, 3.4, 3.5, 3.6, 3.7, 3.8, 3.9, 4, 4.1, 4.2, 4.3, 4.4, 4.5, 4.6, 4.7, 4.8, 4.9, 5),
+        (1, 1.1, 1.2, 1.3, 1.4, 1.5, 1.6, 1.7, 1.8, 1.9, 2, 2.1, 2.2, 2.3, 2.4, 2.5, 2.6, 2.7, 2.8, 2.9, 3, 3.1, 3.2, 3.3, 3.4, 3.5, 3.6, 3.7, 3.8, 3.9, 4, 4.1, 4.2, 4.3, 4.4, 4.5, 4.6, 4.7, 4.8, 4.9, 5),
+        (1, 1.1, 1.2, 1.3, 1.4, 1.5, 1.6, 1.7, 1.8, 1.9, 2, 2.1, 2.2, 2.3, 2.4, 2.5, 2.6, 2.7, 2.8, 2.9, 3, 3.1, 3.2, 3.3, 3.4, 3.5, 3.6, 3.7, 3.8, 3.9, 4, 4.1, 4.2, 4.3, 4.4, 4.5, 4.6, 4.7, 4.8, 4.9, 5),
+        (1, 1.1, 1.2, 1.3, 1.4, 1.5, 1.6, 1.7, 1.8, 1.9, 2, 2.1, 2.2, 2.3, 2.4, 2.5, 2.6, 2.7, 2.8, 2.9, 3, 3.1, 3.2, 3.3, 3.4, 3.5, 3.6, 3.7, 3.8, 3.9, 4, 4.1, 4.2, 4.3, 4.4, 4.5, 4.6, 4.7, 4.8, 4.9, 5),
+    ),
+    'percentile_scores': (
+        (0, 3, 5, 8, 10, 13, 15, 18, 20, 22, 25, 28, 30, 32, 35, 38, 40, 43, 45, 48, 50, 53, 55, 57, 60, 63, 65, 68, 70, 73, 75, 77, 80, 83, 85, 88, 90, 93, 95, 98, 100),
+        (0, 3, 5, 8, 10, 13, 15, 18, 20, 22, 25, 28, 30, 32, 35, 38, 40, 43, 45, 48, 50, 53, 55, 57, 60, 63, 65, 68, 70, 73, 75, 77, 80, 83, 85, 88, 90, 93, 95, 98, 100),
+        (0, 3, 5, 8, 10, 13, 15, 18, 20, 22, 25, 28, 30, 32, 35, 38, 40, 43, 45, 48, 50, 53, 55, 57, 60, 63, 65, 68, 70, 73, 75, 77, 80, 83, 85, 88, 90, 93, 95, 98, 100),
+        (0, 3, 5, 8, 10, 13, 15, 18, 20, 22, 25, 28, 30, 32, 35, 38, 40, 43, 45, 48, 50, 53, 55, 57, 60, 63, 65, 68, 70, 73, 75, 77, 80, 83, 85, 88, 90, 93, 95, 98, 100),
+    ),
+    'level': (
+        (0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2),
+        (0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2),
+        (0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2),
+        (0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2),
+    ),
+}
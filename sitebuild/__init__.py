@@ -0,0 +1,7 @@
+"""Post-build stages for the static site Vite writes to ``dist/``.
+
+Vite copies ``public/`` into ``dist/`` verbatim; these stages then rewrite
+the copy (never ``public/`` itself) before it is deployed.  Run them all,
+in order, with ``python -m sitebuild`` after ``npm run build``, or one at a
+time with ``python -m sitebuild.<stage>``.
+"""
@@ -0,0 +1,38 @@
+"""
+python -m sitebuild [STAGE ...] [--site DIST] [-n] — run the post-build stages in order.
+"""
+
+import argparse
+import importlib
+import sys
+
+from . import site
+
+# In order: later stages see earlier stages' output
+STAGES = (
+    'components',
+    'tailwind',
+    'assets',
+    'minify',
+)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m sitebuild', description=__doc__.strip())
+    parser.add_argument('stages', nargs='*', metavar='STAGE', help=f"stages to run (default: {', '.join(STAGES)})")
+    parser.add_argument('--site', default=site.DIST, help="built site root (default: dist/)")
+    parser.add_argument('--dry-run', '-n', action='store_true', help="report only, write nothing")
+    args = parser.parse_args(argv)
+
+    unknown = sorted(set(args.stages) - set(STAGES))
+    if unknown:
+        parser.error(f"unknown stage(s): {', '.join(unknown)} (choose from {', '.join(STAGES)})")
+    for name in (s for s in STAGES if not args.stages or s in args.stages):
+        stage = importlib.import_module(f'.{name}', __package__)
+        rc = stage.main(['--site', args.site] + (['--dry-run'] if args.dry_run else []))
+        if rc:
+            return rc
+    return 0
+
+
+sys.exit(main())
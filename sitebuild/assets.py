@@ -0,0 +1,203 @@
+"""
+sitebuild.assets — content-hashed names for the unhashed static assets.
+
+    python -m sitebuild.assets [--site DIST] [-n] [--vercel FILE]
+
+Vite fingerprints what it bundles into ``assets/``, but ``public/`` is
+copied as-is: ``/tw.css`` is served ``immutable`` under a name that never
+changes, so a CSS change is either served stale for a year or needs a
+manual cache break.  This stage:
+
+  1. copies every asset in ``ASSETS`` to ``name.<hash>.ext`` (sha256 of the
+     content, ``HASH_LENGTH`` hex digits); the unhashed file stays for
+     anything that still links it (old cached HTML, crawlers),
+  2. rewrites every reference in every page in one regex pass — root
+     relative or absolute on the site's own host, with or without a
+     ``#fragment`` or ``?query``,
+  3. writes ``asset-manifest.json`` (name → hashed name) into the site,
+  4. regenerates the asset entries of ``vercel.json``'s ``headers``: one
+     ``immutable`` rule per asset matching only its hashed names, and no
+     rule for the unhashed name — ``npm run build`` does not run this stage
+     yet, so the deployed pages still link ``/tw.css`` and it has to be
+     revalidated.  The rules match any hash, so ``vercel.json`` only
+     changes when the asset list does; other entries keep their text.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from codemods.cache import ROOT
+from codemods.patterns import compiled
+
+from . import site
+
+ASSETS = (
+    'tw.css',
+    'components.css',
+    'sprite.svg',
+    'favicon.svg',
+    'og-image.png',
+    'nav-auth.js',
+)
+HASH_LENGTH = 10
+SITE_HOSTS = ('www.alcheme.io', 'alcheme.io')
+MANIFEST = 'asset-manifest.json'
+VERCEL_JSON = os.path.join(ROOT, 'vercel.json')
+IMMUTABLE = [{'key': 'Cache-Control', 'value': 'public, max-age=31536000, immutable'}]
+
+
+def hashed_name(name: str, data: bytes) -> str:
+    stem, ext = os.path.splitext(name)
+    return f"{stem}.{hashlib.sha256(data).hexdigest()[:HASH_LENGTH]}{ext}"
+
+
+def reference_pattern(names: List[str]) -> re.Pattern:
+    """``/name`` or ``https://host/name`` inside a quoted or ``url()`` value."""
+    hosts = '|'.join(re.escape(h) for h in SITE_HOSTS)
+    files = '|'.join(re.escape(n) for n in sorted(names, key=len, reverse=True))
+    return compiled(rf'''(?<=["'(])((?:https?://(?:{hosts}))?/)({files})(?=[?#"')])''')
+
+
+def header_source(name: str) -> str:
+    """Vercel (path-to-regexp) source matching every hashed name of ``name``."""
+    stem, ext = os.path.splitext(name)
+    return f"/{stem}.([0-9a-f]{{{HASH_LENGTH}}}){ext}"
+
+
+def vercel_headers(config: dict, manifest: Dict[str, str]) -> dict:
+    """``config`` with its asset header rules regenerated from ``manifest``."""
+    generated = [{'source': header_source(name), 'headers': IMMUTABLE} for name in manifest]
+    ours = {header_source(name) for name in ASSETS} | {f'/{name}' for name in ASSETS}
+    kept = [rule for rule in config.get('headers', []) if rule.get('source') not in ours]
+    return dict(config, headers=generated + kept)
+
+
+def dump_json(value, indent: str = '') -> str:
+    """vercel.json layout: flat objects on one line, everything else expanded."""
+    inner = indent + '  '
+    if isinstance(value, dict):
+        if not any(isinstance(v, (dict, list)) for v in value.values()):
+            return '{ ' + ', '.join(f"{json.dumps(k)}: {json.dumps(v, ensure_ascii=False)}"
+                                    for k, v in value.items()) + ' }'
+        items = [f"{inner}{json.dumps(k)}: {dump_json(v, inner)}" for k, v in value.items()]
+        return '{\n' + ',\n'.join(items) + f'\n{indent}}}'
+    if isinstance(value, list):
+        return '[\n' + ',\n'.join(inner + dump_json(v, inner) for v in value) + f'\n{indent}]'
+    return json.dumps(value, ensure_ascii=False)
+
+
+_DECODER = json.JSONDecoder()
+_SPACE = compiled(r'\s*')
+
+
+def _items(text: str, pos: int) -> List[Tuple[Optional[str], int, int]]:
+    """(key, start, end) of every value of the JSON object or array opening
+    at ``text[pos]``; the key is None in an array."""
+    close = '}' if text[pos] == '{' else ']'
+    items = []
+    pos = _SPACE.match(text, pos + 1).end()
+    while text[pos] != close:
+        key = None
+        if close == '}':
+            key, pos = _DECODER.raw_decode(text, pos)
+            pos = _SPACE.match(text, _SPACE.match(text, pos).end() + 1).end()     # past the ':'
+        start = pos
+        _, pos = _DECODER.raw_decode(text, pos)
+        items.append((key, start, pos))
+        pos = _SPACE.match(text, pos).end()
+        if text[pos] == ',':
+            pos = _SPACE.match(text, pos + 1).end()
+    return items
+
+
+def splice_headers(text: str, headers: List[dict]) -> str:
+    """vercel.json ``text`` with ``headers`` as its header rules.
+
+    Only the ``headers`` array is rewritten: a rule already in it keeps its
+    text as written, a new one is laid out by ``dump_json``.
+    """
+    top = _SPACE.match(text).end()
+    span = next(((start, end) for key, start, end in _items(text, top) if key == 'headers'), None)
+    if span is None:
+        return dump_json(dict(json.loads(text), headers=headers)) + '\n'
+    start, end = span
+    written = {}
+    for _, s, e in _items(text, start):
+        written.setdefault(json.dumps(json.loads(text[s:e]), sort_keys=True), text[s:e])
+    line = text[text.rfind('\n', 0, start) + 1:start]
+    indent = line[:len(line) - len(line.lstrip())]
+    inner = indent + '  '
+    rules = [written.get(json.dumps(rule, sort_keys=True)) or dump_json(rule, inner) for rule in headers]
+    array = '[\n' + ',\n'.join(inner + rule for rule in rules) + f'\n{indent}]' if rules else '[]'
+    return text[:start] + array + text[end:]
+
+
+class AssetResult(NamedTuple):
+    manifest: Dict[str, str]
+    references: Dict[str, int]      # page → references rewritten
+    vercel_changed: bool
+
+
+def run(root: str, dry_run: bool = False, vercel: str = VERCEL_JSON) -> AssetResult:
+    manifest = {}
+    for name in ASSETS:
+        full = os.path.join(root, name)
+        if os.path.isfile(full):
+            with open(full, 'rb') as f:
+                data = f.read()
+            manifest[name] = hashed_name(name, data)
+            if not dry_run:
+                site.write(root, manifest[name], data)
+
+    references = {}
+    if manifest:
+        pattern = reference_pattern(list(manifest))
+        for path in site.pages(root):
+            html = site.read(root, path)
+            new, n = pattern.subn(lambda m: m.group(1) + manifest[m.group(2)], html)
+            if n:
+                references[path] = n
+                if not dry_run:
+                    site.write(root, path, new)
+        if not dry_run:
+            site.write(root, MANIFEST, json.dumps(manifest, indent=2) + '\n')
+
+    with open(vercel, encoding='utf-8', newline='') as f:
+        text = f.read()
+    config = json.loads(text)
+    updated = vercel_headers(config, manifest)
+    changed = updated != config
+    if changed and not dry_run:
+        with open(vercel, 'w', encoding='utf-8', newline='') as f:
+            f.write(splice_headers(text, updated['headers']))
+    return AssetResult(manifest, references, changed)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m sitebuild.assets',
+                                     description="Fingerprint static assets and their references.")
+    parser.add_argument('--site', default=site.DIST, help="built site root (default: dist/)")
+    parser.add_argument('--dry-run', '-n', action='store_true', help="report only, write nothing")
+    parser.add_argument('--vercel', default=VERCEL_JSON, help="vercel.json whose headers to regenerate")
+    args = parser.parse_args(argv)
+
+    root = site.check_site(args.site)
+    print(f"\n=== sitebuild assets: {root} ===\n")
+    result = run(root, args.dry_run, args.vercel)
+    for name, hashed in result.manifest.items():
+        print(f"  {name:<16} → {hashed}")
+    print(f"\n  {sum(result.references.values())} references rewritten in {len(result.references)} pages")
+    if result.vercel_changed:
+        print(f"  {os.path.relpath(args.vercel)}: asset headers {'would change' if args.dry_run else 'regenerated'}"
+              " — commit it")
+    print("\n=== Done ===\n")
+    return 0
+
+
+if __name__ == '__main__':
+    import sys
+    sys.exit(main())
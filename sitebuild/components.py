@@ -0,0 +1,460 @@
+"""
+sitebuild.components — one cacheable copy of what every page inlines.
+
+    python -m sitebuild.components [--site DIST] [-n]
+
+Every page carries its own copy of the nav CSS, the ~2.5 KB logo SVG with
+its three filters and, in the footer, a ``style=`` plus
+``onmouseover``/``onmouseout`` pair on each of the links.  This stage moves
+them into two shared files and rewrites the pages to reference them:
+
+  components.css  nav rules found on two or more pages, plus one class per
+                  repeated inline-style + hover-handler pair (a ``:hover``
+                  rule replaces the handlers)
+  sprite.svg      every inline SVG of 512+ bytes that two or more pages
+                  share, as a ``<symbol>``; pages keep the outer ``<svg>``
+                  and ``<use>`` the symbol
+
+Nothing moves where that could change what renders.  A page only links the
+stylesheet if no rule in it would override what the page's own CSS sets
+(or reorder two rules that can hit the same element), and an SVG whose ids
+the page refers to elsewhere (``url(#id)``, ``getElementById``) stays
+inline.  Reports raw and gzip bytes per page and in total, net of the
+shared files.
+"""
+
+import argparse
+import hashlib
+import re
+from collections import Counter, defaultdict
+from typing import Dict, FrozenSet, List, NamedTuple, Optional, Tuple
+
+from codemods.htmltok import Span, locate, parse_attrs
+from codemods.patterns import compiled
+
+from . import site
+from .css import COMMENT, CssRule, css_rules, declarations, minify_css
+from .site import ZERO, Size
+
+STYLESHEET = 'components.css'
+SPRITE = 'sprite.svg'
+
+# Class families of the shared nav; only rules about them are extracted
+NAV_CLASSES = ('alcheme-logo', 'iiy-nav-link', 'nav-icon-btn')
+MIN_SHARED = 2              # pages (nav CSS, SVGs) or occurrences (hover pairs)
+SPRITE_MIN_BYTES = 512
+
+# ─── CSS ──────────────────────────────────────────────────────────────────────
+
+_CLASS = compiled(r'\.(-?[_a-zA-Z][\w-]*)')
+_SIMPLE_SELECTOR = compiled(r'(?:\.[\w-]+)+(?::{1,2}[\w-]+)*')
+_CLASS_ATTR = compiled(r'''\bclass(?:Name)?\s*=\s*["'`]([^"'`]*)["'`]''')
+
+
+def _nav_class(name: str) -> bool:
+    return any(name == f or name.startswith(f + '-') for f in NAV_CLASSES)
+
+
+def extractable(rule: CssRule) -> bool:
+    """Top level, and every selector a plain class chain naming a nav class."""
+    return (not rule.nested
+            and all(_SIMPLE_SELECTOR.fullmatch(p) and any(map(_nav_class, _CLASS.findall(p)))
+                    for p in rule.parts()))
+
+
+# ─── Pages ────────────────────────────────────────────────────────────────────
+
+class Page(NamedTuple):
+    path: str
+    html: str
+    styles: List[Span]
+    rules: List[CssRule]                # every rule of every <style>, in order
+    svgs: List[Span]                    # outermost <svg> elements
+    anchors: List[Span]
+    class_sets: List[FrozenSet[str]]    # class lists in markup and templates
+    dynamic: FrozenSet[str]             # classes scripts add with classList
+
+    @property
+    def classes(self) -> FrozenSet[str]:
+        return frozenset().union(self.dynamic, *self.class_sets)
+
+    def together(self, a: str, b: str) -> bool:
+        """Whether one element can match the last compound of both selectors."""
+        need = (_subject_classes(a) | _subject_classes(b)) - self.dynamic
+        return any(need <= s for s in self.class_sets)
+
+
+_CLASS_LIST = compiled(r'''classList\.(?:add|toggle)\(([^)]*)\)''')
+_QUOTED = compiled(r'''['"]([\w-]+)['"]''')
+_COMBINATOR = compiled(r'\s*[\s>+~]\s*')
+
+
+def scan(path: str, html: str, scripts: str = '') -> Page:
+    """``scripts``: the site's own modules the page loads, for the markup they render."""
+    styles, svgs, anchors = locate(html, ('style', 'svg', 'a'))
+    rules = [r for s in styles for r in css_rules(html[s.inner_start:s.inner_end], s.inner_start)]
+    outermost = []
+    for s in svgs:
+        if not outermost or s.start >= outermost[-1].end:
+            outermost.append(s)
+    class_sets = {frozenset(m.group(1).split()) for m in _CLASS_ATTR.finditer(html + scripts)}
+    dynamic = frozenset(c for m in _CLASS_LIST.finditer(html + scripts) for c in _QUOTED.findall(m.group(1)))
+    return Page(path, html, styles, rules, outermost, anchors, list(class_sets), dynamic)
+
+
+def _classes(selector: str) -> FrozenSet[str]:
+    return frozenset(_CLASS.findall(selector))
+
+
+def _subject_classes(selector: str) -> FrozenSet[str]:
+    return _classes(_COMBINATOR.split(selector.strip())[-1])
+
+
+_SPEC_ID = compiled(r'#[\w-]+')
+_SPEC_CLASS = compiled(r'\.[\w-]+|\[[^\]]*\]|(?<!:):(?!:|after\b|before\b)[\w-]+')
+_SPEC_ELEMENT = compiled(r'(?:^|(?<=[\s>+~]))[a-zA-Z][\w-]*|::[\w-]+|(?<!:):(?:after|before)\b')
+_PSEUDO_ELEMENT = compiled(r'::[\w-]+|(?<!:):(?:after|before)\b')
+
+
+def specificity(selector: str) -> Tuple[int, int, int]:
+    return (len(_SPEC_ID.findall(selector)), len(_SPEC_CLASS.findall(selector)),
+            len(_SPEC_ELEMENT.findall(selector)))
+
+
+def conflict(page: Page, a: CssRule, b: CssRule) -> bool:
+    """Whether swapping ``a`` and ``b`` can change a value on this page.
+
+    Only equal-specificity selectors on the same box (element or pseudo
+    element) that set one property to different values depend on order.
+    """
+    for (pa, prop), value in a.effects().items():
+        for (pb, prop_b), value_b in b.effects().items():
+            if (prop == prop_b and value != value_b
+                    and _PSEUDO_ELEMENT.findall(pa) == _PSEUDO_ELEMENT.findall(pb)
+                    and specificity(pa) == specificity(pb)
+                    and page.together(pa, pb)):
+                return True
+    return False
+
+
+# ─── Hover handlers ───────────────────────────────────────────────────────────
+
+_HANDLER = compiled(r"\s*this\.style\.(\w+)\s*=\s*'([^']*)'\s*;?\s*")
+_CAMEL = compiled(r'[A-Z]')
+_HOVER_ATTRS = compiled(r'''\s+(?:style|onmouseover|onmouseout)\s*=\s*(?:"[^"]*"|'[^']*')''', re.IGNORECASE)
+_CLASS_VALUE = compiled(r'''(\sclass\s*=\s*["'])''', re.IGNORECASE)
+
+
+def _handler(code: str) -> Optional[Dict[str, str]]:
+    """``this.style.x='v';...`` → {css property: value}, None if it does more."""
+    props = {}
+    pos = 0
+    while pos < len(code):
+        m = _HANDLER.match(code, pos)
+        if m is None or m.end() == pos:
+            return None
+        props[_CAMEL.sub(lambda c: '-' + c.group().lower(), m.group(1))] = minify_css(m.group(2))
+        pos = m.end()
+    return props
+
+
+def hover_pair(attrs: Dict[str, Optional[str]]) -> Optional[Tuple[str, str]]:
+    """(declarations, hover declarations) if the handlers are a plain :hover.
+
+    ``onmouseout`` has to restore exactly the inline values ``onmouseover``
+    changed; anything else (other statements, other properties) stays inline.
+    """
+    style, over, out = attrs.get('style'), attrs.get('onmouseover'), attrs.get('onmouseout')
+    if not (style and over and out):
+        return None
+    base, over, out = declarations(style), _handler(over), _handler(out)
+    if not over or out is None or over.keys() != out.keys():
+        return None
+    if any(base.get(prop) != value for prop, value in out.items()):
+        return None
+    return (';'.join(f"{p}:{v}" for p, v in base.items()),
+            ';'.join(f"{p}:{v}" for p, v in over.items()))
+
+
+def hover_class(pair: Tuple[str, str]) -> str:
+    return 'hv-' + hashlib.sha256('\0'.join(pair).encode()).hexdigest()[:6]
+
+
+# ─── SVG sprite ───────────────────────────────────────────────────────────────
+
+_BETWEEN_TAGS = compiled(r'>\s+<')
+_ID_ATTR = compiled(r'''\bid\s*=\s*["']([^"']+)["']''')
+
+
+def svg_key(page: Page, span: Span) -> Optional[Tuple[str, str]]:
+    """(viewBox, normalised content) of an inline SVG worth a symbol."""
+    inner = page.html[span.inner_start:span.inner_end].strip()
+    viewbox = parse_attrs(page.html[span.start + 4:span.inner_start - 1]).get('viewbox')
+    if not viewbox or len(inner.encode('utf-8')) < SPRITE_MIN_BYTES:
+        return None
+    return viewbox, _BETWEEN_TAGS.sub('><', inner)
+
+
+def ids_used_elsewhere(page: Page, span: Span, inner: str) -> bool:
+    outside = page.html[:span.start] + page.html[span.end:]
+    return any(f'#{i}' in outside or f'"{i}"' in outside or f"'{i}'" in outside
+               for i in _ID_ATTR.findall(inner))
+
+
+# ─── Plan ─────────────────────────────────────────────────────────────────────
+
+class Plan(NamedTuple):
+    nav_rules: List[CssRule]                        # in stylesheet order
+    hovers: Dict[Tuple[str, str], str]              # pair → class
+    symbols: Dict[Tuple[str, str], str]             # svg key → symbol id
+
+    def stylesheet(self) -> str:
+        lines = [r.key for r in self.nav_rules]
+        for (decls, hover), name in self.hovers.items():
+            lines.append(f".{name}{{{decls}}}.{name}:hover{{{hover}}}")
+        return '\n'.join(lines) + '\n'
+
+    def sprite(self) -> str:
+        symbols = ''.join(f'<symbol id="{sid}" viewBox="{viewbox}">{inner}</symbol>\n'
+                          for (viewbox, inner), sid in self.symbols.items())
+        return f'<svg xmlns="http://www.w3.org/2000/svg">\n{symbols}</svg>\n'
+
+
+def plan(pages: List[Page]) -> Plan:
+    """What to share: decided over all pages before any page is rewritten."""
+    # Nav CSS: per selector, the most common rule text, if two pages share it
+    variants = defaultdict(Counter)
+    for page in pages:
+        for key, selector in {(r.key, ','.join(r.parts())) for r in page.rules if extractable(r)}:
+            variants[selector][key] += 1
+    shared = {keys.most_common(1)[0][0] for keys in variants.values()
+              if keys.most_common(1)[0][1] >= MIN_SHARED}
+    # ... in an order every page agrees with as far as possible
+    order: List[str] = []
+    for page in pages:
+        prev = -1
+        for key in dict.fromkeys(r.key for r in page.rules if extractable(r) and r.key in shared):
+            if key in order:
+                prev = order.index(key)
+            else:
+                prev += 1
+                order.insert(prev, key)
+    nav_rules = css_rules('\n'.join(order))
+
+    pairs = Counter()
+    for page in pages:
+        for a in page.anchors:
+            pair = hover_pair(parse_attrs(page.html[a.start + 2:a.inner_start - 1]))
+            if pair:
+                pairs[pair] += 1
+    hovers = {pair: hover_class(pair) for pair, n in pairs.items() if n >= MIN_SHARED}
+
+    svgs = Counter()
+    for page in pages:
+        svgs.update({svg_key(page, s) for s in page.svgs} - {None})
+    symbols = {}
+    ids = set()
+    for key, n in svgs.items():
+        inner_ids = set(_ID_ATTR.findall(key[1]))
+        if n >= MIN_SHARED and not inner_ids & ids:     # one id space in the sprite
+            symbols[key] = 'svg-' + hashlib.sha256('\0'.join(key).encode()).hexdigest()[:8]
+            ids |= inner_ids
+    return Plan(nav_rules, hovers, symbols)
+
+
+# ─── Rewrite ──────────────────────────────────────────────────────────────────
+
+class Edit(NamedTuple):
+    start: int
+    end: int
+    text: str
+
+
+class PageResult(NamedTuple):
+    path: str
+    before: Size
+    after: Size
+    nav_rules: int
+    hovers: int
+    svgs: int
+    linked: bool
+    note: str = ''
+
+
+def _whole_lines(html: str, start: int, end: int) -> Tuple[int, int]:
+    """Widen [start, end) to whole lines when nothing else shares them."""
+    line_start = html.rfind('\n', 0, start) + 1
+    line_end = html.find('\n', end)
+    line_end = len(html) if line_end == -1 else line_end + 1
+    if html[line_start:start].strip() or html[end:line_end].strip():
+        return start, end
+    return line_start, line_end
+
+
+def link_position(page: Page, extracted: List[CssRule]) -> int:
+    """Where the stylesheet link goes: before the first <style> losing a rule."""
+    if extracted:
+        style = next(s for s in page.styles if s.start <= extracted[0].start < s.end)
+        return _whole_lines(page.html, style.start, style.end)[0]
+    head = page.html.lower().find('</head>')
+    if head == -1:
+        return 0
+    line_start = page.html.rfind('\n', 0, head) + 1
+    return line_start if not page.html[line_start:head].strip() else head
+
+
+def css_safe(page: Page, plan: Plan, extracted: List[CssRule], at: int) -> Optional[str]:
+    """Why linking the stylesheet would change this page's cascade, if it would."""
+    order = {r.key: i for i, r in enumerate(plan.nav_rules)}
+    for i, a in enumerate(extracted):
+        for b in extracted[i + 1:]:
+            if order[b.key] < order[a.key] and conflict(page, a, b):
+                return f"{a.selector.strip()} and {b.selector.strip()} swap places"
+
+    moved = {r.start for r in extracted}
+    staying = [r for r in page.rules if r.start not in moved]
+    # Rules that used to follow an extracted rule and now precede it
+    for e in extracted:
+        for r in staying:
+            if at <= r.start < e.start and conflict(page, r, e):
+                return f"{r.selector.strip()} would lose to {e.selector.strip()}"
+
+    # Shared rules this page never had must not change anything it renders
+    own = {}
+    for r in extracted:
+        own.update(r.effects())
+    later = {eff for r in staying if r.start > at and not r.nested for eff in r.effects()}
+    extracted_keys = {r.key for r in extracted}
+    for x in plan.nav_rules:
+        if x.key in extracted_keys or not _classes(x.selector) & page.classes:
+            continue
+        for eff, value in x.effects().items():
+            if own.get(eff) != value and eff not in later:
+                return f"shared rule {x.selector} would apply"
+    return None
+
+
+def rewrite(page: Page, plan: Plan) -> Tuple[str, PageResult]:
+    html = page.html
+    edits: List[Edit] = []
+    counts = Counter()
+
+    for span in page.svgs:
+        key = svg_key(page, span)
+        sid = plan.symbols.get(key) if key else None
+        if sid and not ids_used_elsewhere(page, span, key[1]):
+            edits.append(Edit(span.start, span.end,
+                              f'{html[span.start:span.inner_start]}<use href="/{SPRITE}#{sid}"/></svg>'))
+            counts['svgs'] += 1
+
+    shared = {r.key for r in plan.nav_rules}
+    extracted = [r for r in page.rules if extractable(r) and r.key in shared]
+    at = link_position(page, extracted)
+    problem = css_safe(page, plan, extracted, at)
+    if problem is None:
+        for a in page.anchors:
+            tag = html[a.start:a.inner_start]
+            name = plan.hovers.get(hover_pair(parse_attrs(tag[2:-1])))
+            if name is None:
+                continue
+            tag = _HOVER_ATTRS.sub('', tag)
+            if _CLASS_VALUE.search(tag):
+                tag = _CLASS_VALUE.sub(rf'\g<1>{name} ', tag, count=1)
+            else:
+                tag = f'{tag[:-1].rstrip()} class="{name}">'
+            edits.append(Edit(a.start, a.inner_start, tag))
+            counts['hovers'] += 1
+        for style in page.styles:
+            inner = [r for r in extracted if style.start <= r.start < style.end]
+            if not inner:
+                continue
+            rest = html[style.inner_start:style.inner_end]
+            for r in reversed(inner):
+                s, e = r.start - style.inner_start, r.end - style.inner_start
+                rest = rest[:s] + rest[e:]
+            if COMMENT.sub('', rest).strip():
+                edits.extend(Edit(*_whole_lines(html, r.start, r.end), '') for r in inner)
+            else:
+                edits.append(Edit(*_whole_lines(html, style.start, style.end), ''))
+        counts['nav_rules'] = len(extracted)
+
+    linked = problem is None and (counts['nav_rules'] or counts['hovers'])
+    if linked:
+        link = f'<link rel="stylesheet" href="/{STYLESHEET}">'
+        if at == 0 or html[at - 1] == '\n':
+            indent = html[at:at + len(html[at:]) - len(html[at:].lstrip(' \t'))]
+            link = f'{indent}{link}\n'
+        edits.append(Edit(at, at, link))
+
+    out = []
+    pos = 0
+    for edit in sorted(edits, key=lambda e: (e.start, e.end)):
+        out.append(html[pos:edit.start])
+        out.append(edit.text)
+        pos = edit.end
+    out.append(html[pos:])
+    new = ''.join(out)
+    return new, PageResult(page.path, site.size(html), site.size(new), counts['nav_rules'],
+                           counts['hovers'], counts['svgs'], bool(linked), problem or '')
+
+
+# ─── CLI ──────────────────────────────────────────────────────────────────────
+
+def run(root: str, dry_run: bool = False) -> Tuple[List[PageResult], Size]:
+    """Extract shared components under ``root``; return page results and asset sizes."""
+    pages = []
+    for path in site.pages(root):
+        html = site.read(root, path)
+        pages.append(scan(path, html, site.local_scripts(root, html)))
+    if any(f'/{STYLESHEET}"' in p.html or f'/{SPRITE}#' in p.html for p in pages):
+        raise SystemExit(f"{root}: components already extracted — rebuild the site first")
+    p = plan(pages)
+    results = []
+    for page in pages:
+        new, result = rewrite(page, p)
+        if new != page.html and not dry_run:
+            site.write(root, page.path, new)
+        results.append(result)
+
+    assets = ZERO
+    used = any(r.linked for r in results), any(r.svgs for r in results)
+    for name, text, needed in ((STYLESHEET, p.stylesheet(), used[0]), (SPRITE, p.sprite(), used[1])):
+        if needed:
+            assets += site.size(text)
+            if not dry_run:
+                site.write(root, name, text)
+    return results, assets
+
+
+def print_report(results: List[PageResult], assets: Size):
+    width = max(len(r.path) for r in results)
+    print(f"  {'page':<{width}}  {'raw':>9}  {'gzip':>8}  nav  hover  svg")
+    for r in results:
+        saved = r.before - r.after
+        print(f"  {r.path:<{width}}  {-saved.raw:>+9,}  {-saved.gzip:>+8,}  {r.nav_rules:>3}  {r.hovers:>5}  {r.svgs:>3}"
+              + (f"  (kept inline: {r.note})" if r.note else ''))
+    before = sum((r.before for r in results), ZERO)
+    after = sum((r.after for r in results), ZERO)
+    print(f"\n  pages:  {site.saving(before, after)}")
+    print(f"  shared: {STYLESHEET} + {SPRITE} = {assets.raw:,} B raw, {assets.gzip:,} B gzip (fetched once)")
+    print(f"  net:    {site.saving(before, after + assets)}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m sitebuild.components',
+                                     description="Move shared nav CSS, SVGs and hover handlers out of the pages.")
+    parser.add_argument('--site', default=site.DIST, help="built site root (default: dist/)")
+    parser.add_argument('--dry-run', '-n', action='store_true', help="report only, write nothing")
+    args = parser.parse_args(argv)
+
+    root = site.check_site(args.site)
+    print(f"\n=== sitebuild components: {root} ===\n")
+    results, assets = run(root, args.dry_run)
+    print_report(results, assets)
+    print("\n=== Done ===\n")
+    return 0
+
+
+if __name__ == '__main__':
+    import sys
+    sys.exit(main())
@@ -0,0 +1,181 @@
+"""
+sitebuild.css — just enough CSS parsing for the stages: rules with their
+offsets, declarations, selectors and the class names they require.
+
+Not a validating parser: comments and strings are skipped, blocks are
+paired by braces, and anything that is not a qualified rule (at-rule
+preludes, ``@import``) is left where it is.
+"""
+
+import re
+from typing import Dict, FrozenSet, List, NamedTuple, Tuple
+
+from codemods.patterns import compiled
+
+_CSS_TOKEN = compiled(r'/\*.*?\*/|"(?:\\.|[^"\\])*"|\'(?:\\.|[^\'\\])*\'|[{};]', re.DOTALL)
+COMMENT = compiled(r'/\*.*?\*/', re.DOTALL)
+_SPACE = compiled(r'\s+')
+_PUNCT_SPACE = compiled(r'\s*([{}:;,>])\s*')
+_DECLARATION_SPLIT = compiled(r';(?![^(]*\))')
+_ESCAPED_CLASS = compiled(r'\.((?:\\[0-9a-fA-F]{1,6} ?|\\.|[\w-])+)')
+_ESCAPE = compiled(r'\\([0-9a-fA-F]{1,6}) ?|\\(.)')
+_NEGATION = compiled(r':not\((?:[^()]|\([^()]*\))*\)')
+_EMPTY_AT_RULE = compiled(r'@[\w-]+[^{};]*\{\s*\}')
+_LIST_SPACE = compiled(r'\s*([,>~+])\s*(?![^(]*\))')
+_DECLARATION_SPACE = compiled(r'\s*([:,!])\s*')
+_GROUPING_AT_RULE = compiled(r'@(?:media|supports|layer|container|document|(?:-webkit-)?keyframes)\b', re.IGNORECASE)
+
+
+def minify_css(text: str) -> str:
+    """Whitespace-insensitive form used to compare and to ship rules."""
+    text = _SPACE.sub(' ', COMMENT.sub('', text)).strip()
+    return _PUNCT_SPACE.sub(r'\1', text).replace(';}', '}').rstrip(';')
+
+
+def minify_stylesheet(css: str) -> str:
+    """A whole sheet minified for shipping: strings kept, selectors left alone.
+
+    Unlike ``minify_css`` this never joins ``a :hover`` into ``a:hover``:
+    blanks around ``:`` only go inside declaration blocks.
+    """
+    out = []
+    stack = []                  # open blocks: True when they hold declarations
+    text = []                   # source text since the last string or brace
+    prelude = []                # squeezed text since the last brace or ``;``
+
+    def flush(strip_end: bool):
+        squeezed = _SPACE.sub(' ', ''.join(text))
+        text.clear()
+        if not out or out[-1] in ('{', '}', ';'):
+            squeezed = squeezed.lstrip()
+        if strip_end:
+            squeezed = squeezed.rstrip()
+        if stack and stack[-1]:
+            squeezed = _DECLARATION_SPACE.sub(r'\1', squeezed)
+        else:
+            squeezed = _LIST_SPACE.sub(r'\1', squeezed)
+        if squeezed:
+            out.append(squeezed)
+            prelude.append(squeezed)
+
+    pos = 0
+    for m in _CSS_TOKEN.finditer(css):
+        text.append(css[pos:m.start()])
+        tok = m.group()
+        pos = m.end()
+        if tok.startswith('/*'):
+            text.append(' ')
+        elif tok[0] in '"\'':
+            flush(False)
+            out.append(tok)
+            prelude.append(tok)
+        else:
+            flush(True)
+            if tok == '{':
+                stack.append(not _GROUPING_AT_RULE.match(''.join(prelude)))
+            elif tok == '}':
+                if out and out[-1] == ';':
+                    out.pop()
+                if stack:
+                    stack.pop()
+            out.append(tok)
+            prelude.clear()
+    text.append(css[pos:])
+    flush(True)
+    return ''.join(out)
+
+
+class CssRule(NamedTuple):
+    start: int              # offsets in the scanned text
+    end: int
+    selector: str
+    body: str
+    nested: bool            # inside @media, @supports, ...
+
+    @property
+    def key(self) -> str:
+        return minify_css(f"{self.selector}{{{self.body}}}")
+
+    def parts(self) -> List[str]:
+        return [' '.join(p.split()) for p in split_selectors(self.selector)]
+
+    def effects(self) -> Dict[Tuple[str, str], str]:
+        """(selector, property) → value for every declaration."""
+        decls = declarations(self.body)
+        return {(part, prop): value for part in self.parts() for prop, value in decls.items()}
+
+
+def declarations(body: str) -> Dict[str, str]:
+    decls = {}
+    for decl in _DECLARATION_SPLIT.split(COMMENT.sub('', body)):
+        prop, colon, value = decl.partition(':')
+        if colon:
+            decls[prop.strip().lower()] = minify_css(value)
+    return decls
+
+
+def split_selectors(selector: str) -> List[str]:
+    """A selector list split at its top-level commas (not inside ``:is()``)."""
+    parts = []
+    depth = 0
+    start = 0
+    escaped = False
+    for i, ch in enumerate(selector):
+        if escaped:
+            escaped = False
+        elif ch == '\\':
+            escaped = True
+        elif ch in '([':
+            depth += 1
+        elif ch in ')]':
+            depth -= 1
+        elif ch == ',' and depth == 0:
+            parts.append(selector[start:i])
+            start = i + 1
+    parts.append(selector[start:])
+    return parts
+
+
+def required_classes(selector: str) -> FrozenSet[str]:
+    """Unescaped class names an element tree must use for ``selector`` to match.
+
+    Classes inside ``:not()`` are not required, so they are ignored.
+    """
+    def unescape(name: str) -> str:
+        return _ESCAPE.sub(lambda m: chr(int(m.group(1), 16)) if m.group(1) else m.group(2), name)
+    return frozenset(unescape(m.group(1)) for m in _ESCAPED_CLASS.finditer(_NEGATION.sub('', selector)))
+
+
+def css_rules(css: str, base: int = 0) -> List[CssRule]:
+    """Qualified rules of a stylesheet, in order; offsets shifted by ``base``."""
+    rules = []
+    stack = []                  # open blocks: (prelude start, prelude, body start)
+    start = 0
+    for m in _CSS_TOKEN.finditer(css):
+        tok = m.group()
+        if tok.startswith('/*'):
+            if not css[start:m.start()].strip():
+                start = m.end()
+        elif tok == '{':
+            prelude = css[start:m.start()]
+            lead = len(prelude) - len(prelude.lstrip())
+            stack.append((start + lead, prelude.strip(), m.end()))
+            start = m.end()
+        elif tok == '}':
+            if stack:
+                s, prelude, body_start = stack.pop()
+                if not prelude.startswith('@'):
+                    rules.append(CssRule(base + s, base + m.end(), prelude,
+                                         css[body_start:m.start()], bool(stack)))
+            start = m.end()
+        elif tok == ';' and (not stack or stack[-1][1].startswith('@')):
+            start = m.end()
+    return sorted(rules)
+
+
+def drop_empty_at_rules(css: str) -> str:
+    """Remove ``@media (...) {}`` and friends left empty by filtering."""
+    while True:
+        css, n = _EMPTY_AT_RULE.subn('', css)
+        if not n:
+            return css
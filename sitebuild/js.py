@@ -0,0 +1,175 @@
+"""
+sitebuild.js — just enough JavaScript lexing to minify inline scripts
+without a parser: comments and indentation go, everything else stays.
+
+Strings, template literals (with their ``${...}`` expressions, however
+deeply nested) and regex literals are copied verbatim; line breaks are kept,
+so automatic semicolon insertion sees the same statements.  Whether a ``/``
+starts a regex or divides is decided from the previous significant token,
+the way every lightweight JS tokenizer does it.
+"""
+
+from codemods.patterns import compiled
+
+_LINE_BREAKS = compiled(r'[ \t\f\v\r]*\n\s*')
+_BLANKS = compiled(r'[ \t\f\v\r]+')
+_WORD_BEFORE = compiled(r'([\w$]+)$')
+_PLAIN = compiled(r'[^\'"`/]+')
+_SPACES = compiled(r'\s+')
+# Characters of context the regex-or-division decision looks back over
+_TAIL = 64
+
+# A ``/`` after one of these starts a regex literal, not a division
+REGEX_AFTER = frozenset('(,=:[!&|?{};+-*%<>~^')
+REGEX_KEYWORDS = frozenset((
+    'return', 'typeof', 'instanceof', 'in', 'of', 'new', 'delete', 'void',
+    'throw', 'case', 'do', 'else', 'yield', 'await',
+))
+
+
+def _skip_string(code: str, i: int) -> int:
+    """End of the quoted string starting at ``i`` (an unterminated one ends at the line)."""
+    quote = code[i]
+    i += 1
+    while i < len(code):
+        ch = code[i]
+        if ch == '\\':
+            i += 2
+            continue
+        if ch == quote:
+            return i + 1
+        if ch == '\n':
+            return i
+        i += 1
+    return len(code)
+
+
+def _skip_template(code: str, i: int) -> int:
+    """End of the template literal starting at ``i``, substitutions included."""
+    i += 1
+    while i < len(code):
+        ch = code[i]
+        if ch == '\\':
+            i += 2
+        elif ch == '`':
+            return i + 1
+        elif code.startswith('${', i):
+            i = _skip_expression(code, i + 2)
+        else:
+            i += 1
+    return len(code)
+
+
+def _skip_expression(code: str, i: int) -> int:
+    """Just past the ``}`` closing a ``${`` substitution whose body starts at ``i``."""
+    depth = 0
+    while i < len(code):
+        ch = code[i]
+        if ch in '\'"':
+            i = _skip_string(code, i)
+        elif ch == '`':
+            i = _skip_template(code, i)
+        elif code.startswith('/*', i):
+            end = code.find('*/', i + 2)
+            i = len(code) if end < 0 else end + 2
+        elif ch == '{':
+            depth += 1
+            i += 1
+        elif ch == '}':
+            if not depth:
+                return i + 1
+            depth -= 1
+            i += 1
+        else:
+            i += 1
+    return len(code)
+
+
+def _skip_regex(code: str, i: int) -> int:
+    """End of the regex literal starting at ``i``, flags included."""
+    i += 1
+    in_class = False
+    while i < len(code):
+        ch = code[i]
+        if ch == '\\':
+            i += 2
+            continue
+        if ch == '\n':
+            return i
+        if in_class:
+            in_class = ch != ']'
+        elif ch == '[':
+            in_class = True
+        elif ch == '/':
+            i += 1
+            while i < len(code) and (code[i].isalnum() or code[i] in '_$'):
+                i += 1
+            return i
+        i += 1
+    return len(code)
+
+
+def _regex_allowed(before: str) -> bool:
+    before = before.rstrip()
+    if not before:
+        return True
+    if before[-1] in REGEX_AFTER:
+        return True
+    word = _WORD_BEFORE.search(before)
+    return bool(word) and word.group(1) in REGEX_KEYWORDS
+
+
+def _squeeze(code: str) -> str:
+    """Indentation, trailing blanks and blank lines out; one blank between tokens."""
+    return _BLANKS.sub(' ', _LINE_BREAKS.sub('\n', code))
+
+
+def minify_js(code: str) -> str:
+    """``code`` without comments and redundant whitespace, tokens untouched."""
+    out = []
+    buf = []                    # code between literals, squeezed when a literal starts
+    tail = ''                   # the last _TAIL characters so far, blanks collapsed: the regex decision
+
+    def follow(text: str):
+        nonlocal tail
+        tail = _SPACES.sub(' ', tail + text[-_TAIL:])[-_TAIL:]
+
+    def flush():
+        if buf:
+            out.append(_squeeze(''.join(buf)))
+            buf.clear()
+
+    i = 0
+    n = len(code)
+    while i < n:
+        plain = _PLAIN.match(code, i)
+        if plain:
+            buf.append(plain.group())
+            follow(plain.group())
+            i = plain.end()
+            continue
+        ch = code[i]
+        if ch in '\'"`' or (ch == '/' and code[i + 1:i + 2] not in ('/', '*') and _regex_allowed(tail)):
+            flush()
+            end = (_skip_template(code, i) if ch == '`'
+                   else _skip_string(code, i) if ch != '/'
+                   else _skip_regex(code, i))
+            out.append(code[i:end])
+            follow(code[i:end])
+            i = end
+        elif code.startswith('//', i):
+            end = code.find('\n', i)
+            i = n if end < 0 else end
+        elif code.startswith('/*', i):
+            end = code.find('*/', i + 2)
+            comment = code[i:n if end < 0 else end + 2]
+            blank = '\n' if '\n' in comment else ' '
+            buf.append(blank)
+            follow(blank)
+            i += len(comment)
+        else:                   # a division
+            buf.append(ch)
+            follow(ch)
+            i += 1
+    flush()
+    return ''.join(out).strip()
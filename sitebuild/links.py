@@ -0,0 +1,233 @@
+"""
+sitebuild.links — every internal link must reach something Vercel serves.
+
+    python -m sitebuild.links [--site DIR] [-j N]
+
+Codemods rewrite hrefs all the time, and a target that has no file, no
+rewrite and no redirect is a silent 404.  The check works in two steps:
+
+  1. one ``LinkIndex`` of everything servable, built once: the files under
+     the site root (plus the Vite entries the build adds next to them, see
+     ``BUILD_ENTRIES``), the ``vercel.json`` redirects and rewrites in
+     Vercel's order (redirects, filesystem, rewrites), and the ``id`` /
+     ``name`` anchors of every page,
+  2. every page and every local ``.js`` file is checked against that index
+     in parallel: ``href`` / ``src`` / ``action`` attributes in the markup,
+     and, in inline and module scripts, attributes inside ``innerHTML``
+     templates, ``location`` assignments and ``['/path', ...]`` tables like
+     the one ``nav-auth.js`` renders the nav from.  Values with a
+     ``${...}`` substitution are only known at runtime and are skipped.
+
+Absolute links to ``SITE_URL`` count as internal.  A ``#fragment`` is
+checked against the target page's anchors; ids a page only creates from
+JS are invisible here.  Exits 1 when a link is broken, so it can follow
+the codemods: ``python -m codemods -j 0 && python -m sitebuild.links``.
+Runs on ``public/`` by default; ``--site dist`` checks the build.
+"""
+
+import argparse
+import os
+import re
+import time
+from typing import Dict, FrozenSet, List, NamedTuple, Optional, Tuple
+from urllib.parse import unquote, urljoin, urlsplit
+
+from codemods.cache import ROOT
+from codemods.htmltok import locate
+from codemods.patterns import compiled
+from codemods.runner import format_throughput, resolve_jobs, run_parallel
+
+from . import routes, site
+from .sitemap import PUBLIC, SITE_URL
+
+# Pages the Vite build writes into dist/ beside the copy of public/
+BUILD_ENTRIES = ('app.html',)
+SCRIPT_FILES = ('.js', '.mjs')
+MAX_REDIRECTS = 5
+
+_TAG = compiled(r'<[a-zA-Z][^<>]*>')
+_ATTR = compiled(r'''\s(?:href|src|action)\s*=\s*(?:"([^"]*)"|'([^']*)')''')
+_ANCHOR = compiled(r'''\s(?:id|name)\s*=\s*(?:"([^"]*)"|'([^']*)')''')
+# In script text: href="..." / src='...' inside string and template markup
+_JS_ATTR = compiled(r'''\b(?:href|src|action)\s*=\s*\\?(["'])((?:(?!\\?\1).)*?)\\?\1''')
+_JS_LOCATION = compiled(r'''\blocation(?:\.href)?\s*=\s*(["'`])([^"'`]*)\1'''
+                        r'''|\b(?:location\.(?:assign|replace)|window\.open)\(\s*(["'`])([^"'`]*)\3''')
+_JS_TABLE = compiled(r'''\[\s*(["'`])(/[^"'`\s]*)\1\s*,''')
+_EXTERNAL = compiled(r'^(?:[a-zA-Z][a-zA-Z0-9+.-]*:|//)')
+
+
+# ─── Index ────────────────────────────────────────────────────────────────────
+
+class LinkIndex(NamedTuple):
+    files: FrozenSet[str]                   # '/baza-wiedzy/index.html', '/tw.css', ...
+    anchors: Dict[str, FrozenSet[str]]      # page file → its ids and names
+    routes: Tuple[routes.Route, ...]
+
+    def resolve(self, path: str, hops: int = 0) -> Optional[str]:
+        """File that serves URL ``path`` (query and fragment already cut), or None."""
+        if hops > MAX_REDIRECTS:
+            return None
+        for route in self.routes:
+            if route.redirect and route.pattern.match(path):
+                return self.resolve(route.destination, hops + 1)
+        for candidate in (path, path + 'index.html' if path.endswith('/') else path + '/index.html'):
+            if candidate in self.files:
+                return candidate
+        for route in self.routes:
+            if not route.redirect and route.pattern.match(path):
+                if ':' in route.destination:
+                    return route.destination     # parameterised: trust the rule
+                return route.destination if route.destination in self.files else None
+        return None
+
+
+def anchors(html: str) -> FrozenSet[str]:
+    """Fragment targets of a page; ids in its script templates count too."""
+    return frozenset(a or b for a, b in _ANCHOR.findall(html))
+
+
+def build_index(root: str, config: dict) -> LinkIndex:
+    files = set()
+    for dirpath, _, names in os.walk(root):
+        rel = os.path.relpath(dirpath, root).replace(os.sep, '/')
+        prefix = '/' if rel == '.' else f'/{rel}/'
+        files.update(prefix + name for name in names)
+    files.update('/' + name for name in BUILD_ENTRIES if os.path.isfile(os.path.join(ROOT, name)))
+    return LinkIndex(frozenset(files),
+                     {'/' + path: anchors(site.read(root, path)) for path in site.pages(root)},
+                     tuple(routes.routes(config)))
+
+
+# ─── Workers ──────────────────────────────────────────────────────────────────
+
+class Broken(NamedTuple):
+    line: int
+    href: str
+    reason: str
+
+
+class FileJob(NamedTuple):
+    root: str
+    path: str
+    base: str                   # URL relative links resolve against
+    index: LinkIndex
+
+
+class FileResult(NamedTuple):
+    path: str
+    size: int
+    links: int
+    broken: List[Broken]
+
+
+def script_links(code: str, offset: int = 0) -> List[Tuple[int, str]]:
+    """(offset, value) of the link-like literals in script text."""
+    found = {}
+    for m in _JS_ATTR.finditer(code):
+        found[offset + m.start(2)] = m.group(2)
+    for m in _JS_LOCATION.finditer(code):
+        group = 2 if m.group(2) is not None else 4
+        found[offset + m.start(group)] = m.group(group)
+    for m in _JS_TABLE.finditer(code):
+        found[offset + m.start(2)] = m.group(2)
+    return sorted(found.items())
+
+
+def _attr_links(tag: re.Match) -> List[Tuple[int, str]]:
+    return [(tag.start() + m.start(), m.group(1) if m.group(1) is not None else m.group(2))
+            for m in _ATTR.finditer(tag.group())]
+
+
+def markup_links(html: str) -> List[Tuple[int, str]]:
+    """(offset, value) of every attribute link and script literal in a page."""
+    links = []
+    pos = 0
+    for span in sorted(s for found in locate(html, ('script', 'style')) for s in found):
+        if span.start < pos:
+            continue
+        for tag in _TAG.finditer(html, pos, span.inner_start):
+            links.extend(_attr_links(tag))
+        if html.startswith('<script', span.start):
+            links.extend(script_links(html[span.inner_start:span.inner_end], span.inner_start))
+        pos = span.end
+    for tag in _TAG.finditer(html, pos):
+        links.extend(_attr_links(tag))
+    return links
+
+
+def check_link(value: str, base: str, own: str, index: LinkIndex) -> Optional[str]:
+    """Why ``value`` (found on page file ``own``) is broken; None when it is fine or not ours."""
+    value = value.strip().replace('&amp;', '&')
+    if not value or '${' in value:
+        return None
+    if value.startswith(SITE_URL):
+        value = value[len(SITE_URL):] or '/'
+    elif _EXTERNAL.match(value):
+        return None
+    url = urlsplit(urljoin(base, value))
+    target = own if value.startswith('#') else index.resolve(unquote(url.path))
+    if target is None:
+        return "not served: no file, rewrite or redirect"
+    fragment = unquote(url.fragment)
+    if fragment and fragment != 'top' and target in index.anchors and fragment not in index.anchors[target]:
+        return f"no #{fragment} in {target.lstrip('/')}"
+    return None
+
+
+def check_file(job: FileJob) -> FileResult:
+    text = site.read(job.root, job.path)
+    is_script = job.path.endswith(SCRIPT_FILES)
+    links = script_links(text) if is_script else markup_links(text)
+    own = '/' + job.path
+    broken = []
+    for offset, value in links:
+        reason = check_link(value, job.base, own, job.index)
+        if reason:
+            broken.append(Broken(text.count('\n', 0, offset) + 1, value, reason))
+    return FileResult(job.path, len(text.encode('utf-8')), len(links), broken)
+
+
+def run(root: str = PUBLIC, jobs: int = 0, vercel: str = routes.VERCEL_JSON):
+    """Check ``root``; per-file results, the index, workers and wall time."""
+    start = time.perf_counter()
+    config = routes.load(vercel)
+    index = build_index(root, config)
+    items = [FileJob(root, path, routes.page_url(path, config) or '/' + path, index)
+             for path in site.pages(root)]
+    items += [FileJob(root, path.lstrip('/'), '/', index)
+              for path in sorted(index.files) if path.endswith(SCRIPT_FILES)
+              and os.path.isfile(os.path.join(root, path.lstrip('/')))]
+    workers = min(resolve_jobs(jobs), len(items)) or 1
+    results = list(run_parallel(check_file, items, workers))
+    return results, index, workers, time.perf_counter() - start
+
+
+# ─── Report ───────────────────────────────────────────────────────────────────
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m sitebuild.links',
+                                     description="Check every internal link against files and vercel.json.")
+    parser.add_argument('--site', default=PUBLIC, help="site root (default: public/)")
+    parser.add_argument('--jobs', '-j', type=int, default=0,
+                        help="worker processes (0 = one per CPU, the default)")
+    args = parser.parse_args(argv)
+
+    root = site.check_site(args.site)
+    print(f"\n=== sitebuild links: {root} ===\n")
+    results, index, workers, elapsed = run(root, args.jobs)
+    broken = 0
+    for result in results:
+        for b in result.broken:
+            print(f"  ✗ {result.path}:{b.line}  {b.href}\n      {b.reason}")
+            broken += 1
+    links = sum(r.links for r in results)
+    print(f"\n  {links} links in {len(results)} files against {len(index.files)} files,"
+          f" {len(index.routes)} routes: {broken} broken")
+    print(f"  {format_throughput(len(results), sum(r.size for r in results), elapsed, workers)}")
+    print("\n=== Done ===\n")
+    return 1 if broken else 0
+
+
+if __name__ == '__main__':
+    import sys
+    sys.exit(main())
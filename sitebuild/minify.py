@@ -0,0 +1,229 @@
+"""
+sitebuild.minify — minify every page, then precompress the site.
+
+    python -m sitebuild.minify [--site DIST] [-n] [-j N] [--min-bytes N]
+
+The last stage, so it sees every other stage's output.  Per page:
+
+  1. markup — comments go (``<!--[if`` ones stay) and every whitespace run
+     between tags collapses to one blank, or one newline if it held one.
+     Collapsing rather than removing keeps inline layout exactly as it was;
+     attribute values are never touched,
+  2. ``<style>`` — ``css.minify_stylesheet``, which keeps strings and never
+     joins a descendant combinator,
+  3. ``<script>`` (classic and ``type="module"``) — ``js.minify_js``:
+     comments and indentation out, strings, template literals and regex
+     literals copied verbatim, line breaks kept for ASI.  ``ld+json`` is
+     re-serialised compactly; other script types are data and stay as-is,
+
+and ``<pre>``, ``<textarea>`` and elements with a ``whitespace-pre*`` class
+are copied verbatim, scripts and styles inside them included.
+
+Then every text file of at least ``--min-bytes`` gets ``.gz`` (gzip -9) and
+``.br`` (Brotli quality 11) siblings, for hosts that serve precompressed
+files (``gzip_static`` / ``brotli_static``); a sibling that would not be
+smaller is not written.  Brotli needs the ``brotli`` package — without it
+only ``.gz`` is written and the report says so.
+
+Files are independent, so they are spread over ``runner.run_parallel``;
+each worker reports its own CPU time.
+"""
+
+import argparse
+import glob
+import gzip
+import json
+import os
+import re
+import time
+from typing import List, NamedTuple, Optional
+
+from codemods.htmltok import locate, parse_attrs
+from codemods.patterns import compiled
+from codemods.runner import format_throughput, resolve_jobs, run_parallel
+
+from . import site
+from .css import minify_stylesheet
+from .js import minify_js
+
+try:
+    import brotli
+except ImportError:                 # optional: pip install brotli
+    brotli = None
+
+COMPRESSIBLE = ('.html', '.css', '.js', '.mjs', '.svg', '.json', '.xml', '.txt', '.webmanifest')
+MIN_BYTES = 1024
+VERBATIM = ('pre', 'textarea', '.whitespace-pre', '.whitespace-pre-line',
+            '.whitespace-pre-wrap', '.whitespace-break-spaces')
+JS_TYPES = frozenset(('', 'module', 'text/javascript', 'application/javascript'))
+
+# A ``>`` inside a quoted attribute value does not end the tag; a ``<`` that starts no tag is text
+_MARKUP = compiled(r'<!--(?!\[if).*?-->|(<!--.*?-->|<(?:[^>"\']|"[^"]*"|\'[^\']*\')*>)|([^<]+|<)', re.DOTALL)
+_BLANKS = compiled(r'\s+')
+
+
+# ─── HTML ─────────────────────────────────────────────────────────────────────
+
+def _collapse(match: re.Match) -> str:
+    return '\n' if '\n' in match.group() else ' '
+
+
+def minify_markup(html: str) -> str:
+    """Comments out, whitespace runs between tags collapsed; tags untouched."""
+    out = []
+    text = []                   # text on both sides of a dropped comment is one run
+    for m in _MARKUP.finditer(html):
+        if m.group(1):
+            out.append(_BLANKS.sub(_collapse, ''.join(text)))
+            text.clear()
+            out.append(m.group(1))
+        elif m.group(2):
+            text.append(m.group(2))
+    out.append(_BLANKS.sub(_collapse, ''.join(text)))
+    return ''.join(out)
+
+
+def minify_script(open_tag: str, code: str) -> str:
+    kind = (parse_attrs(open_tag[len('<script'):-1]).get('type') or '').strip().lower()
+    if kind in JS_TYPES:
+        return minify_js(code)
+    if kind in ('application/ld+json', 'application/json', 'importmap'):
+        try:
+            return json.dumps(json.loads(code), ensure_ascii=False, separators=(',', ':'))
+        except ValueError:
+            return code
+    return code
+
+
+def minify_html(html: str) -> str:
+    """``html`` minified; verbatim elements, strings and templates untouched."""
+    *verbatim, scripts, styles = locate(html, VERBATIM + ('script', 'style'))
+    spans = sorted([(s, 'verbatim') for found in verbatim for s in found]
+                   + [(s, 'script') for s in scripts] + [(s, 'style') for s in styles])
+    out = []
+    pos = 0
+    for span, kind in spans:
+        if span.start < pos:
+            continue                        # nested in a verbatim element
+        out.append(minify_markup(html[pos:span.start]))
+        if kind == 'verbatim':
+            out.append(html[span.start:span.end])
+        else:
+            open_tag = html[span.start:span.inner_start]
+            inner = html[span.inner_start:span.inner_end]
+            inner = minify_script(open_tag, inner) if kind == 'script' else minify_stylesheet(inner)
+            out.append(minify_markup(open_tag) + inner + html[span.inner_end:span.end])
+        pos = span.end
+    out.append(minify_markup(html[pos:]))
+    return ''.join(out)
+
+
+# ─── Workers ──────────────────────────────────────────────────────────────────
+
+class FileJob(NamedTuple):
+    root: str
+    path: str
+    dry_run: bool
+    min_bytes: int
+
+
+class FileResult(NamedTuple):
+    path: str
+    raw: int
+    minified: int
+    gzip: Optional[int]         # None: below --min-bytes or not smaller
+    brotli: Optional[int]
+    cpu: float                  # seconds, this worker only
+
+
+def process_file(job: FileJob) -> FileResult:
+    start = time.process_time()
+    full = os.path.join(job.root, job.path)
+    with open(full, 'rb') as f:
+        data = f.read()
+    raw = len(data)
+    if job.path.endswith('.html'):
+        data = minify_html(data.decode('utf-8')).encode('utf-8')
+        if not job.dry_run and len(data) != raw:
+            site.write(job.root, job.path, data)
+
+    sizes = []
+    for ext, compress in (('.gz', lambda d: gzip.compress(d, 9, mtime=0)),
+                          ('.br', brotli and (lambda d: brotli.compress(d, quality=11)))):
+        packed = compress(data) if compress and len(data) >= job.min_bytes else None
+        if packed is not None and len(packed) >= len(data):
+            packed = None
+        if packed is not None and not job.dry_run:
+            site.write(job.root, job.path + ext, packed)
+        sizes.append(len(packed) if packed is not None else None)
+    return FileResult(job.path, raw, len(data), *sizes, time.process_time() - start)
+
+
+def site_files(root: str) -> List[str]:
+    return sorted(os.path.relpath(p, root).replace(os.sep, '/')
+                  for p in glob.glob(os.path.join(root, '**', '*'), recursive=True)
+                  if p.endswith(COMPRESSIBLE) and os.path.isfile(p))
+
+
+def run(root: str, dry_run: bool = False, jobs: int = 0, min_bytes: int = MIN_BYTES):
+    """Minify and precompress ``root``; per-file results, workers and wall time."""
+    items = [FileJob(root, path, dry_run, min_bytes) for path in site_files(root)]
+    workers = min(resolve_jobs(jobs), len(items)) or 1
+    start = time.perf_counter()
+    results = list(run_parallel(process_file, items, workers))
+    return results, workers, time.perf_counter() - start
+
+
+# ─── Report ───────────────────────────────────────────────────────────────────
+
+def _ratio(packed: Optional[int], raw: int) -> str:
+    return f"{packed / raw * 100:5.1f}%" if packed is not None and raw else '     -'
+
+
+def print_report(results: List[FileResult], workers: int, elapsed: float):
+    pages = [r for r in results if r.path.endswith('.html')]
+    if pages:
+        width = max(len(r.path) for r in pages)
+        print(f"  {'page':<{width}}  {'raw':>8}  {'minified':>8}  {'min':>6}  {'gzip':>6}  {'brotli':>6}  {'cpu ms':>6}")
+        for r in pages:
+            print(f"  {r.path:<{width}}  {r.raw:>8,}  {r.minified:>8,}  {_ratio(r.minified, r.raw)}"
+                  f"  {_ratio(r.gzip, r.raw)}  {_ratio(r.brotli, r.raw)}  {r.cpu * 1000:>6.1f}")
+        print("  (min / gzip / brotli as % of the raw page)\n")
+
+    for label, group in (('pages', pages), ('all files', results)):
+        raw = sum(r.raw for r in group)
+        minified = sum(r.minified for r in group)
+        gz = sum(r.gzip if r.gzip is not None else r.minified for r in group)
+        br = sum(r.brotli if r.brotli is not None else r.minified for r in group)
+        print(f"  {label + ':':<11} {raw:>9,} B → {minified:,} minified ({_ratio(minified, raw).strip()}),"
+              f" {gz:,} gzip ({_ratio(gz, raw).strip()})"
+              + (f", {br:,} brotli ({_ratio(br, raw).strip()})" if brotli else ''))
+    siblings = sum((r.gzip is not None) + (r.brotli is not None) for r in results)
+    print(f"  {siblings} precompressed siblings, {sum(r.cpu for r in results) * 1000:.0f} ms CPU")
+    if brotli is None:
+        print("  brotli not installed (pip install brotli): .br siblings skipped")
+    print(f"  {format_throughput(len(results), sum(r.raw for r in results), elapsed, workers)}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m sitebuild.minify',
+                                     description="Minify pages and write precompressed siblings.")
+    parser.add_argument('--site', default=site.DIST, help="built site root (default: dist/)")
+    parser.add_argument('--dry-run', '-n', action='store_true', help="report only, write nothing")
+    parser.add_argument('--jobs', '-j', type=int, default=0,
+                        help="worker processes (0 = one per CPU, the default)")
+    parser.add_argument('--min-bytes', type=int, default=MIN_BYTES,
+                        help=f"smallest file worth precompressing (default: {MIN_BYTES})")
+    args = parser.parse_args(argv)
+
+    root = site.check_site(args.site)
+    print(f"\n=== sitebuild minify: {root} ===\n")
+    results, workers, elapsed = run(root, args.dry_run, args.jobs, args.min_bytes)
+    print_report(results, workers, elapsed)
+    print("\n=== Done ===\n")
+    return 0
+
+
+if __name__ == '__main__':
+    import sys
+    sys.exit(main())
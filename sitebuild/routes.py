@@ -0,0 +1,87 @@
+"""
+sitebuild.routes — how Vercel serves the site: ``vercel.json`` rewrites and
+redirects, and the public URL of every page.
+
+Vercel sources are path-to-regexp patterns; the subset the config uses is
+supported: literal segments, ``:name`` (one segment), ``:name*`` (zero or
+more), ``:name+`` (one or more) and a bare ``(regex)`` group.
+"""
+
+import json
+import re
+from typing import List, NamedTuple, Optional
+
+from codemods.patterns import compiled
+
+from .assets import VERCEL_JSON
+
+_PARAM = compiled(r':(\w+)([*+?]?)|(\([^)]*\))|([^:(]+)')
+
+
+class Route(NamedTuple):
+    source: str
+    destination: str
+    pattern: re.Pattern
+    redirect: bool
+
+    @property
+    def literal(self) -> bool:
+        """A single path, no parameters."""
+        return self.pattern.pattern == f'^{re.escape(self.source)}$'
+
+
+def source_pattern(source: str) -> re.Pattern:
+    """Anchored regex for a Vercel ``source``."""
+    out = []
+    for m in _PARAM.finditer(source):
+        name, modifier, group, text = m.groups()
+        if text is not None:
+            out.append(re.escape(text))
+        elif group is not None:
+            out.append(group)
+        elif modifier == '*':
+            # "/x/:path*" also matches "/x" itself
+            if out and out[-1].endswith('/'):
+                out[-1] = out[-1][:-1]
+                out.append(r'(?:/.*)?')
+            else:
+                out.append(r'.*')
+        elif modifier == '+':
+            out.append(r'[^?#]+')
+        else:
+            out.append(r'[^/?#]+' + ('?' if modifier == '?' else ''))
+    return compiled(f"^{''.join(out)}$")
+
+
+def load(path: str = VERCEL_JSON) -> dict:
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def routes(config: dict) -> List[Route]:
+    """Redirects first, then rewrites — the order Vercel applies them."""
+    return ([Route(r['source'], r['destination'], source_pattern(r['source']), True)
+             for r in config.get('redirects', [])]
+            + [Route(r['source'], r['destination'], source_pattern(r['source']), False)
+               for r in config.get('rewrites', [])])
+
+
+def page_url(path: str, config: dict) -> Optional[str]:
+    """Public URL path of the site-relative page ``path``; None if only reached by redirect.
+
+    ``dir/index.html`` is ``/dir/``; a page that is the destination of a
+    literal rewrite (``/pricing`` → ``/pricing.html``) is served under the
+    rewrite's source.
+    """
+    url = '/' + path
+    for route in routes(config):
+        if not route.redirect and route.literal and route.destination == url:
+            url = route.source
+            break
+    if url.endswith('/index.html'):
+        url = url[:-len('index.html')]
+    for route in routes(config):
+        if route.redirect and route.pattern.match(url):
+            return None
+    return url
+
@@ -0,0 +1,81 @@
+"""
+sitebuild.site — the built site on disk, and byte accounting for reports.
+"""
+
+import glob
+import gzip
+import os
+import re
+from typing import List, NamedTuple, Union
+
+from codemods.cache import ROOT
+from codemods.patterns import compiled
+
+DIST = os.path.join(ROOT, 'dist')
+
+_LOCAL_SCRIPT = compiled(r'''<script\b[^>]*\bsrc=["']/([^"'?#:]+\.m?js)["']''', re.IGNORECASE)
+
+
+class Size(NamedTuple):
+    raw: int
+    gzip: int
+
+    def __add__(self, other):
+        return Size(self.raw + other.raw, self.gzip + other.gzip)
+
+    def __sub__(self, other):
+        return Size(self.raw - other.raw, self.gzip - other.gzip)
+
+
+ZERO = Size(0, 0)
+
+
+def size(data: Union[str, bytes]) -> Size:
+    """Raw and gzip -9 size of a file body."""
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+    return Size(len(data), len(gzip.compress(data, 9, mtime=0)))
+
+
+def saving(before: Size, after: Size) -> str:
+    """``-12.3 KB raw (-8%), -1.2 KB gzip (-5%)``."""
+    def part(b, a, label):
+        pct = (b - a) / b * 100 if b else 0.0
+        return f"{(a - b) / 1024:+.1f} KB {label} ({-pct:+.0f}%)"
+    return f"{part(before.raw, after.raw, 'raw')}, {part(before.gzip, after.gzip, 'gzip')}"
+
+
+def check_site(root: str) -> str:
+    """Absolute site root; exits with a hint when nothing has been built yet."""
+    root = os.path.abspath(root)
+    if not os.path.isfile(os.path.join(root, 'index.html')):
+        raise SystemExit(f"{root}: no index.html — run `npm run build` first (or pass --site)")
+    return root
+
+
+def pages(root: str) -> List[str]:
+    """Every HTML page under ``root``, as sorted site-relative paths."""
+    return sorted(os.path.relpath(p, root).replace(os.sep, '/')
+                  for p in glob.glob(os.path.join(root, '**', '*.html'), recursive=True))
+
+
+def read(root: str, path: str) -> str:
+    with open(os.path.join(root, path), encoding='utf-8', newline='') as f:
+        return f.read()
+
+
+def write(root: str, path: str, text: Union[str, bytes]):
+    full = os.path.join(root, path)
+    os.makedirs(os.path.dirname(full), exist_ok=True)
+    data = text.encode('utf-8') if isinstance(text, str) else text
+    with open(full, 'wb') as f:
+        f.write(data)
+
+
+def local_scripts(root: str, html: str) -> str:
+    """Source of the site's own scripts a page loads (``<script src="/...">``)."""
+    texts = []
+    for path in _LOCAL_SCRIPT.findall(html):
+        if os.path.isfile(os.path.join(root, path)):
+            texts.append(read(root, path))
+    return '\n'.join(texts)
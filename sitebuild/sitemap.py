@@ -0,0 +1,228 @@
+"""
+sitebuild.sitemap — keep ``public/sitemap.xml`` in step with the pages.
+
+    python -m sitebuild.sitemap [--public DIR] [-n] [--today YYYY-MM-DD]
+
+Unlike the post-build stages this one works on the source tree: the sitemap
+and its manifest are committed, so ``lastmod`` survives from one build to
+the next.  For every page under ``public/``:
+
+  1. its URL is the one Vercel serves it under — ``dir/index.html`` is
+     ``/dir/``, the destination of a literal ``vercel.json`` rewrite is
+     served under its source, and a page behind a redirect has none.  Pages
+     ``robots.txt`` disallows (by file or by URL) and ``EXCLUDE`` are left out,
+  2. its content hash is taken over the markup without ``<nav>``,
+     ``<footer>``, ``<script>`` and ``<style>``, whitespace-normalised, so
+     site-wide nav/footer codemods and reindentation do not touch every
+     ``lastmod``,
+  3. ``sitemap-manifest.json`` maps page → (hash, lastmod); ``lastmod``
+     moves to ``--today`` only when the hash changes.  A page the manifest
+     does not know yet keeps the ``lastmod`` the sitemap already gives it.
+
+Only the affected ``<url>`` entries are rewritten: changed ``lastmod``\\s,
+new pages (inserted after their closest sibling, copying its
+``changefreq``/``priority``) and entries whose page is gone.  Comments,
+order and hand-set priorities stay.  Commit both files.
+"""
+
+import argparse
+import datetime
+import json
+import os
+import re
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from codemods.cache import ROOT, sha256
+from codemods.htmltok import locate
+from codemods.patterns import compiled
+
+from . import routes, site
+
+PUBLIC = os.path.join(ROOT, 'public')
+SITEMAP = 'sitemap.xml'
+ROBOTS = 'robots.txt'
+MANIFEST = os.path.join(ROOT, 'sitemap-manifest.json')
+SITE_URL = 'https://www.alcheme.io'
+# Never in search results.  robots.txt's ``Disallow: /character`` also covers
+# character-card.html today, but only as a prefix match; this does not rely on it
+EXCLUDE = ('character-card.html',)
+DEFAULTS = ('monthly', '0.5')           # changefreq, priority with no sibling to copy
+
+_ENTRY = compiled(r'([ \t]*)<url>\s*<loc>\s*([^<\s]+)\s*</loc>.*?</url>[ \t]*\n?', re.DOTALL)
+_LASTMOD = compiled(r'(<lastmod>)\s*([^<]*?)\s*(</lastmod>)')
+_FIELD = compiled(r'<(changefreq|priority)>\s*([^<]*?)\s*</\1>')
+_DISALLOW = compiled(r'^\s*Disallow:\s*(\S+)', re.IGNORECASE | re.MULTILINE)
+_SPACE = compiled(r'\s+')
+_URLSET_CLOSE = compiled(r'[ \t]*</urlset>')
+
+
+def content_hash(html: str) -> str:
+    """sha256 of the page without its chrome (nav, footer, scripts, styles)."""
+    spans = sorted(s for found in locate(html, ('nav', 'footer', 'script', 'style')) for s in found)
+    parts = []
+    pos = 0
+    for span in spans:
+        if span.start >= pos:
+            parts.append(html[pos:span.start])
+            pos = span.end
+    parts.append(html[pos:])
+    return sha256(_SPACE.sub(' ', ''.join(parts)).strip().encode('utf-8'))
+
+
+def disallowed(public: str) -> Tuple[str, ...]:
+    """``Disallow`` path prefixes of ``robots.txt`` (all user agents alike)."""
+    path = os.path.join(public, ROBOTS)
+    if not os.path.isfile(path):
+        return ()
+    return tuple(_DISALLOW.findall(site.read(public, ROBOTS)))
+
+
+def indexable(public: str, config: dict) -> Dict[str, str]:
+    """page → absolute URL of every page that belongs in the sitemap."""
+    blocked = disallowed(public)
+    urls = {}
+    for path in site.pages(public):
+        url = routes.page_url(path, config)
+        if url is None or path in EXCLUDE:
+            continue
+        if any(p.startswith(prefix) for p in (url, '/' + path) for prefix in blocked):
+            continue
+        urls[path] = SITE_URL + url
+    return urls
+
+
+class Entry(NamedTuple):
+    start: int
+    end: int
+    indent: str
+    loc: str
+    text: str
+
+
+def entries(xml: str) -> List[Entry]:
+    return [Entry(m.start(), m.end(), m.group(1), m.group(2), m.group()) for m in _ENTRY.finditer(xml)]
+
+
+def render_entry(indent: str, loc: str, lastmod: str, changefreq: str, priority: str) -> str:
+    inner = indent + '  '
+    return (f"{indent}<url>\n{inner}<loc>{loc}</loc>\n{inner}<lastmod>{lastmod}</lastmod>\n"
+            f"{inner}<changefreq>{changefreq}</changefreq>\n{inner}<priority>{priority}</priority>\n"
+            f"{indent}</url>\n")
+
+
+def _sibling(loc: str, existing: List[Entry]) -> Optional[Entry]:
+    """The entry a new ``loc`` goes after: the last one sharing the longest directory prefix."""
+    def shared(other: str) -> int:
+        a, b = loc.split('/'), other.split('/')
+        n = 0
+        while n < min(len(a), len(b)) - 1 and a[n] == b[n]:
+            n += 1
+        return n
+    best = None
+    for entry in existing:
+        if best is None or shared(entry.loc) >= shared(best.loc):
+            best = entry
+    return best
+
+
+class SitemapResult(NamedTuple):
+    updated: List[str]      # loc whose lastmod moved
+    added: List[str]
+    removed: List[str]
+    xml: str
+    manifest: Dict[str, dict]
+
+
+def run(public: str = PUBLIC, dry_run: bool = False, today: Optional[str] = None,
+        manifest_path: str = MANIFEST, vercel: str = routes.VERCEL_JSON) -> SitemapResult:
+    today = today or datetime.date.today().isoformat()
+    urls = indexable(public, routes.load(vercel))
+    xml = site.read(public, SITEMAP)
+    known = {e.loc: e for e in entries(xml)}
+    previous = {}
+    if os.path.isfile(manifest_path):
+        with open(manifest_path, encoding='utf-8') as f:
+            previous = json.load(f)
+
+    manifest = {}
+    lastmods = {}
+    updated = []
+    for path, loc in urls.items():
+        digest = content_hash(site.read(public, path))
+        old = previous.get(path)
+        if old is None:
+            # First sight: trust the date the sitemap already gives, if any
+            m = _LASTMOD.search(known[loc].text) if loc in known else None
+            lastmod = m.group(2) if m else today
+        elif old['hash'] != digest:
+            lastmod = today
+        else:
+            lastmod = old['lastmod']
+        manifest[path] = {'hash': digest, 'lastmod': lastmod}
+        lastmods[loc] = lastmod
+
+    # Edit the sitemap entry by entry, back to front so offsets stay valid
+    edits = []
+    for entry in entries(xml):
+        if entry.loc not in lastmods:
+            edits.append((entry.start, entry.end, ''))
+            continue
+        text = _LASTMOD.sub(rf'\g<1>{lastmods[entry.loc]}\g<3>', entry.text)
+        if text != entry.text:
+            updated.append(entry.loc)
+            edits.append((entry.start, entry.end, text))
+    removed = [e.loc for e in entries(xml) if e.loc not in lastmods]
+
+    added = sorted(loc for loc in lastmods if loc not in known)
+    kept = [e for e in entries(xml) if e.loc in lastmods]
+    inserts: Dict[int, List[str]] = {}
+    for loc in added:
+        sibling = _sibling(loc, kept)
+        same_dir = sibling is not None and sibling.loc.rsplit('/', 1)[0] == loc.rsplit('/', 1)[0]
+        fields = dict(_FIELD.findall(sibling.text)) if same_dir else {}
+        indent = sibling.indent if sibling else '  '
+        block = render_entry(indent, loc, lastmods[loc], fields.get('changefreq', DEFAULTS[0]),
+                             fields.get('priority', DEFAULTS[1]))
+        at = sibling.end if sibling else _URLSET_CLOSE.search(xml).start()
+        inserts.setdefault(at, []).append(block)
+    for at, blocks in inserts.items():
+        edits.append((at, at, ''.join(blocks)))
+
+    for start, end, text in sorted(edits, key=lambda e: (e[0], e[1]), reverse=True):
+        xml = xml[:start] + text + xml[end:]
+
+    if not dry_run:
+        if updated or added or removed:
+            site.write(public, SITEMAP, xml)
+        if manifest != previous:
+            with open(manifest_path, 'w', encoding='utf-8') as f:
+                json.dump(manifest, f, indent=2, sort_keys=True)
+                f.write('\n')
+    return SitemapResult(updated, added, removed, xml, manifest)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m sitebuild.sitemap',
+                                     description="Update sitemap.xml from page content hashes.")
+    parser.add_argument('--public', default=PUBLIC, help="source site root (default: public/)")
+    parser.add_argument('--dry-run', '-n', action='store_true', help="report only, write nothing")
+    parser.add_argument('--today', help="date for changed pages (default: today)")
+    parser.add_argument('--manifest', default=MANIFEST, help="page hash manifest (default: sitemap-manifest.json)")
+    args = parser.parse_args(argv)
+
+    public = site.check_site(args.public)
+    print(f"\n=== sitebuild sitemap: {public} ===\n")
+    result = run(public, args.dry_run, args.today, args.manifest)
+    for label, locs in (('lastmod', result.updated), ('added', result.added), ('removed', result.removed)):
+        for loc in locs:
+            print(f"  {label:<8} {loc[len(SITE_URL):]}")
+    print(f"\n  {len(result.manifest)} pages: {len(result.updated)} lastmod changed, "
+          f"{len(result.added)} added, {len(result.removed)} removed"
+          + (" (dry run, nothing written)" if args.dry_run else ''))
+    print("\n=== Done ===\n")
+    return 0
+
+
+if __name__ == '__main__':
+    import sys
+    sys.exit(main())
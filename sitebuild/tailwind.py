@@ -0,0 +1,190 @@
+"""
+sitebuild.tailwind — purge tw.css to what the static pages use, and inline
+each page's critical subset.
+
+    python -m sitebuild.tailwind [--site DIST] [-n] [--fold BYTES]
+
+``tw.css`` is compiled from the React sources as well as ``public/``, and
+every static page blocks rendering on all of it.  This stage:
+
+  1. collects class candidates the way Tailwind's own extractor does —
+     every quote/whitespace-delimited token of every page (class
+     attributes, inline scripts, the ``nav-links`` / ``mobile-menu-content``
+     innerHTML templates), of the site's own ``*.js`` outside ``assets/``,
+     and of the markup the codemods inject (``codemods/rules/*.py``),
+  2. drops every selector that needs a class no candidate names (classes
+     inside ``:not()`` are not needed), then emptied ``@media`` blocks and
+     ``@keyframes`` nothing refers to, and rewrites ``tw.css``,
+  3. per page, keeps the rules whose classes appear in the first ``--fold``
+     bytes of the body markup, in an innerHTML template or in a module the
+     page loads from the site (the logged-in nav), plus every class-free
+     rule (preflight, ``html``, ``body``), and inlines that in a ``<style>``
+     where the ``tw.css`` link was; the full sheet is then preloaded and
+     applied on load, with a ``<noscript>`` fallback.
+
+The purged sheet comes straight after the critical copy, so the cascade
+order against the page's own ``<style>`` is unchanged.
+"""
+
+import argparse
+import glob
+import os
+import re
+from typing import FrozenSet, List, NamedTuple
+
+from codemods.cache import ROOT
+from codemods.patterns import compiled
+
+from . import site
+from .css import css_rules, drop_empty_at_rules, required_classes, split_selectors
+from .site import ZERO, Size
+
+TAILWIND = 'tw.css'
+FOLD_BYTES = 12 * 1024
+INJECTED = os.path.join(ROOT, 'codemods', 'rules', '*.py')
+
+_TOKEN = compiled(r'[^<>"\'`\s]+')
+_SUB_TOKEN = compiled(r'[^<>"\'`\s=(){};,]+')
+_WORD = compiled(r'[\w-]+')
+_KEYFRAMES = compiled(r'@(?:-webkit-)?keyframes\s+([\w-]+)\s*\{(?:[^{}]*\{[^{}]*\})*[^{}]*\}')
+_BODY = compiled(r'<body\b[^>]*>', re.IGNORECASE)
+_RAW_ELEMENTS = compiled(r'<(script|style)\b.*?</\1\s*>', re.IGNORECASE | re.DOTALL)
+_TEMPLATE = compiled(r'innerHTML\s*\+?=\s*`([^`]*)`')
+_LINK = compiled(r'''<link\b[^>]*\bhref=["']/tw\.css["'][^>]*>''', re.IGNORECASE)
+_STYLESHEET_REL = compiled(r'''\brel=["']stylesheet["']''', re.IGNORECASE)
+CRITICAL = '<style data-critical>'
+
+
+def tokens(text: str) -> FrozenSet[str]:
+    """Class candidates: whole tokens, and tokens split at JS punctuation."""
+    return frozenset(_TOKEN.findall(text)) | frozenset(_SUB_TOKEN.findall(text))
+
+
+def purge(css: str, used: FrozenSet[str], words: FrozenSet[str]) -> str:
+    """``css`` without selectors needing unused classes or unused keyframes."""
+    out = []
+    pos = 0
+    for rule in css_rules(css):
+        parts = split_selectors(rule.selector)
+        kept = [p for p in parts if required_classes(p) <= used]
+        if len(kept) == len(parts):
+            continue
+        out.append(css[pos:rule.start])
+        if kept:
+            out.append(f"{','.join(p.strip() for p in kept)}{{{rule.body}}}")
+        pos = rule.end
+    out.append(css[pos:])
+    css = drop_empty_at_rules(''.join(out))
+
+    outside = _KEYFRAMES.sub('', css)
+    referenced = words | frozenset(_WORD.findall(outside))
+    return _KEYFRAMES.sub(lambda m: m.group() if m.group(1) in referenced else '', css)
+
+
+def fold_tokens(html: str, fold: int, scripts: str = '') -> FrozenSet[str]:
+    """Candidates rendered first: the top of the body, the inline nav
+    templates and the site's own modules the page loads (``scripts``)."""
+    body = _BODY.search(html)
+    top = html[body.end():] if body else html
+    top = _RAW_ELEMENTS.sub('', top)[:fold]
+    templates = ' '.join(_TEMPLATE.findall(html))
+    return tokens(top) | tokens(templates) | tokens(scripts)
+
+
+def critical_block(link: str, indent: str, css: str) -> str:
+    href = f'/{TAILWIND}'
+    return (f'{CRITICAL}{css}</style>\n'
+            f'{indent}<link rel="preload" href="{href}" as="style" onload="this.onload=null;this.rel=\'stylesheet\'">\n'
+            f'{indent}<noscript>{link}</noscript>')
+
+
+class PageResult(NamedTuple):
+    path: str
+    before: Size
+    after: Size
+    blocking_before: Size
+    blocking_after: Size
+
+
+def run(root: str, dry_run: bool = False, fold: int = FOLD_BYTES):
+    """Purge and split ``tw.css`` under ``root``; page results and sheet sizes."""
+    full = os.path.join(root, TAILWIND)
+    if not os.path.isfile(full):
+        return [], ZERO, ZERO
+    sheet = site.read(root, TAILWIND)
+    pages = {path: site.read(root, path) for path in site.pages(root)}
+    # A page split before keeps its link only in the <noscript> fallback
+    linking = {path: html for path, html in pages.items() if _LINK.search(html) and CRITICAL not in html}
+
+    sources = list(pages.values())
+    for path in glob.glob(os.path.join(root, '**', '*.js'), recursive=True):
+        if not os.path.relpath(path, root).replace(os.sep, '/').startswith('assets/'):
+            sources.append(site.read(root, os.path.relpath(path, root)))
+    for path in glob.glob(INJECTED):
+        with open(path, encoding='utf-8') as f:
+            sources.append(f.read())
+    used = frozenset().union(*(tokens(s) for s in sources))
+    words = frozenset().union(*(_WORD.findall(s) for s in sources))
+    purged = purge(sheet, used, words)
+
+    results = []
+    for path, html in linking.items():
+        critical = purge(purged, fold_tokens(html, fold, site.local_scripts(root, html)), frozenset())
+
+        def replace(m):
+            if not _STYLESHEET_REL.search(m.group()):
+                return m.group()
+            line = html.rfind('\n', 0, m.start()) + 1
+            indent = html[line:m.start()] if not html[line:m.start()].strip() else ''
+            return critical_block(m.group(), indent, critical)
+
+        new = _LINK.sub(replace, html, count=1)
+        if new == html:
+            continue
+        if not dry_run:
+            site.write(root, path, new)
+        results.append(PageResult(path, site.size(html), site.size(new),
+                                  site.size(sheet), site.size(critical)))
+    if not dry_run and results:
+        site.write(root, TAILWIND, purged)
+    return results, site.size(sheet), site.size(purged)
+
+
+def print_report(results: List[PageResult], before: Size, after: Size):
+    if not results:
+        print(f"  no page links /{TAILWIND}")
+        return
+    width = max(len(r.path) for r in results)
+    print(f"  {'page':<{width}}  {'page raw':>9}  {'page gzip':>9}  {'blocking CSS gzip':>17}")
+    for r in results:
+        print(f"  {r.path:<{width}}  {r.after.raw - r.before.raw:>+9,}  {r.after.gzip - r.before.gzip:>+9,}"
+              f"  {r.blocking_before.gzip:>7,} → {r.blocking_after.gzip:<7,}")
+    pages_before = sum((r.before for r in results), ZERO)
+    pages_after = sum((r.after for r in results), ZERO)
+    blocking_before = sum((r.blocking_before for r in results), ZERO)
+    blocking_after = sum((r.blocking_after for r in results), ZERO)
+    print(f"\n  {TAILWIND}:        {site.saving(before, after)} ({before.raw:,} → {after.raw:,} B)")
+    print(f"  pages:         {site.saving(pages_before, pages_after)} (critical CSS inlined)")
+    print(f"  blocking CSS:  {site.saving(blocking_before, blocking_after)} over {len(results)} first visits")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m sitebuild.tailwind',
+                                     description="Purge tw.css and inline per-page critical CSS.")
+    parser.add_argument('--site', default=site.DIST, help="built site root (default: dist/)")
+    parser.add_argument('--dry-run', '-n', action='store_true', help="report only, write nothing")
+    parser.add_argument('--fold', type=int, default=FOLD_BYTES,
+                        help=f"body markup bytes treated as above the fold (default: {FOLD_BYTES})")
+    args = parser.parse_args(argv)
+
+    root = site.check_site(args.site)
+    print(f"\n=== sitebuild tailwind: {root} ===\n")
+    results, before, after = run(root, args.dry_run, args.fold)
+    print_report(results, before, after)
+    print("\n=== Done ===\n")
+    return 0
+
+
+if __name__ == '__main__':
+    import sys
+    sys.exit(main())
@@ -7,6 +7,9 @@ const corsHeaders = {
   'Access-Control-Allow-Headers': 'authorization, x-client-info, apikey, content-type',
 }
 
+// Overridable so the function can be run against a local stand-in (python -m edgetools.stubs)
+const OPENAI_BASE_URL = Deno.env.get('OPENAI_BASE_URL') ?? 'https://api.openai.com/v1'
+
 type CharacterCardContent = {
   archetype_name: string
   archetype_subtitle: string
@@ -150,7 +153,7 @@ serve(async (req: Request) => {
       schema: schemaHint,
     }
 
-    const openaiRes = await fetch('https://api.openai.com/v1/chat/completions', {
+    const openaiRes = await fetch(`${OPENAI_BASE_URL}/chat/completions`, {
       method: 'POST',
       headers: {
         Authorization: `Bearer ${openaiKey}`,
@@ -0,0 +1,61 @@
+import json
+
+from sitebuild import assets
+
+
+def manifest():
+    return {name: assets.hashed_name(name, name.encode()) for name in assets.ASSETS}
+
+
+def test_vercel_json_is_what_the_stage_writes():
+    with open(assets.VERCEL_JSON, encoding='utf-8') as f:
+        text = f.read()
+    config = json.loads(text)
+    assert assets.vercel_headers(config, manifest()) == config
+    assert assets.splice_headers(text, config['headers']) == text
+
+
+def test_vercel_headers_drops_the_immutable_rule_on_unhashed_names():
+    immutable = {'source': '/tw.css', 'headers': assets.IMMUTABLE}
+    security = {'source': '/(.*)', 'headers': [{'key': 'X-Frame-Options', 'value': 'DENY'}]}
+    stale = {'source': assets.header_source('sprite.svg'), 'headers': []}
+    updated = assets.vercel_headers({'headers': [immutable, stale, security]}, {'tw.css': 'tw.0123456789.css'})
+    assert updated['headers'] == [{'source': '/tw.([0-9a-f]{10}).css', 'headers': assets.IMMUTABLE}, security]
+
+
+def test_only_the_changed_header_rules_are_rewritten(tmp_path):
+    text = """{
+  "cleanUrls": true,
+  "headers": [
+    {
+      "source": "/tw.css",
+      "headers": [{ "key": "Cache-Control", "value": "public, max-age=31536000, immutable" }]
+    },
+    {
+      "source": "/(.*)",
+      "headers": [
+        {
+          "key": "X-Frame-Options",
+          "value": "DENY"
+        }
+      ]
+    }
+  ],
+  "redirects": [ { "source": "/a", "destination": "/b" } ]
+}
+"""
+    (tmp_path / 'tw.css').write_text('.a{}', encoding='utf-8')
+    vercel = tmp_path / 'vercel.json'
+    vercel.write_text(text, encoding='utf-8')
+    result = assets.run(str(tmp_path), vercel=str(vercel))
+    assert result.vercel_changed and result.manifest == {'tw.css': assets.hashed_name('tw.css', b'.a{}')}
+    start = text.index('    {\n      "source": "/tw.css"')
+    end = text.index('    {\n      "source": "/(.*)"')
+    assert vercel.read_text(encoding='utf-8') == text[:start] + """    {
+      "source": "/tw.([0-9a-f]{10}).css",
+      "headers": [
+        { "key": "Cache-Control", "value": "public, max-age=31536000, immutable" }
+      ]
+    },
+""" + text[end:]
+    assert not assets.run(str(tmp_path), vercel=str(vercel)).vercel_changed
@@ -0,0 +1,12 @@
+from scoring import batch, engine
+
+
+def test_rescore_rejects_rows_without_answers():
+    k = engine.key('EQ')
+    rows = [{'test_type': 'EQ'}, {'test_type': 'EQ', 'raw_answers': None},
+            {'test_type': 'EQ', 'raw_answers': {q: 3 for q in k.questions}},
+            {'test_type': 'DISC', 'raw_answers': {}}]
+    seconds = batch.rescore(rows, ['EQ'])
+    assert list(seconds) == ['EQ']
+    assert [row.get('error') for row in rows] == ['rejected', 'rejected', None, None]
+    assert rows[2]['scores'] and 'scores' not in rows[3]
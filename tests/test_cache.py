@@ -0,0 +1,63 @@
+import os
+
+from codemods import cache, cli, registry
+from codemods.cache import Manifest, sha256
+from codemods.cli import FileJob, process_file
+
+
+def test_a_file_is_skipped_once_its_output_is_stable(tmp_path):
+    path = str(tmp_path / 'manifest.json')
+    page = str(tmp_path / 'page.html')
+    before, after = sha256(b'old'), sha256(b'new')
+
+    manifest = Manifest('nav', 'v1', path)
+    assert not manifest.is_fixed_point(page, before)
+    manifest.record(page, before, after)                # changed: not a fixed point yet
+    manifest.save()
+
+    again = Manifest('nav', 'v1', path)
+    assert again.fixed_points(page) == frozenset()
+    again.record(page, after, after)                    # the rewrite was stable
+    again.save()
+
+    third = Manifest('nav', 'v1', path)
+    assert third.is_fixed_point(page, after) and not third.is_fixed_point(page, before)
+    third.record(page, after, after, skipped=True)
+    assert third.summary() == "cache: 1 skipped, 0 processed"
+
+
+def test_a_new_ruleset_or_namespace_forgets_everything(tmp_path):
+    path = str(tmp_path / 'manifest.json')
+    digest = sha256(b'x')
+    manifest = Manifest('nav', 'v1', path)
+    manifest.record('page.html', digest, digest)
+    manifest.save()
+    assert Manifest('nav', 'v1', path).is_fixed_point('page.html', digest)
+    assert not Manifest('nav', 'v2', path).is_fixed_point('page.html', digest)
+    assert not Manifest('nav kb-nav', 'v1', path).is_fixed_point('page.html', digest)
+    assert not Manifest('nav', 'v1', path, enabled=False).is_fixed_point('page.html', digest)
+
+
+def test_only_the_latest_inputs_are_remembered(tmp_path):
+    manifest = Manifest('nav', 'v1', str(tmp_path / 'manifest.json'))
+    digests = [sha256(str(n).encode()) for n in range(cache.MAX_SEEN + 2)]
+    for digest in digests:
+        manifest.record('page.html', digest, digest)
+    assert manifest.fixed_points('page.html') == frozenset(digests[2:])
+
+
+def test_process_file_skips_a_known_fixed_point(tmp_path):
+    (tmp_path / 'page.html').write_bytes(b'<p>x</p>')
+    digest = sha256(b'<p>x</p>')
+    result = process_file(FileJob(str(tmp_path), 'page.html', ('nav-footer',), frozenset({digest})))
+    assert result.cached and not result.changed and result.input_digest == digest
+
+
+def test_version_covers_rule_modules_that_are_not_selected(monkeypatch):
+    hashed = []
+    monkeypatch.setattr(cli, 'source_version', lambda *paths: hashed.extend(paths) or 'v')
+    manifest = cli.manifest_for(registry.select(['kb-nav']))
+    assert manifest.namespace == 'kb-nav'
+    names = {os.path.relpath(p, cache.ROOT).replace(os.sep, '/') for p in hashed}
+    assert {'codemods/engine.py', 'codemods/rules/knowledge_base.py', 'codemods/rules/js_auth.py',
+            'codemods/rules/nav_footer.py'} <= names
@@ -0,0 +1,51 @@
+from codemods import cli
+
+AUTH_PAGE = """<html><head>
+  <title>t</title>
+</head><body>
+  <script type="module">
+    import { createClient } from 'https://cdn.jsdelivr.net/npm/@supabase/supabase-js@2/+esm';
+    const supabase = createClient('https://x.supabase.co', 'anon');
+    (async () => {
+      const { data: { session } } = await supabase.auth.getSession();
+      if (session) {
+        document.getElementById('nav-links').innerHTML = `<a href="/settings">Ustawienia</a>`;
+      }
+    })();
+  </script>
+</body></html>
+"""
+
+
+def site(tmp_path):
+    page = tmp_path / 'public' / 'pricing.html'
+    page.parent.mkdir()
+    page.write_text(AUTH_PAGE, encoding='utf-8')
+    return page
+
+
+def test_a_budget_overrun_fails_the_run(tmp_path, capsys):
+    page = site(tmp_path)
+    rc = cli.main(['nav-auth', '--root', str(tmp_path), '--no-cache', '--rule-budget', '1e-6'])
+    assert rc == 1
+    assert page.read_text(encoding='utf-8') == AUTH_PAGE
+    assert '✗ public/pricing.html: nav-auth at offset' in capsys.readouterr().out
+
+    assert cli.main(['nav-auth', '--root', str(tmp_path), '--no-cache', '--rule-budget', '0']) == 0
+    assert '/nav-auth.js' in page.read_text(encoding='utf-8')
+
+
+def test_dry_run_prints_a_diff_and_writes_nothing(tmp_path, capsys):
+    page = site(tmp_path)
+    assert cli.main(['nav-auth', '--root', str(tmp_path), '--no-cache', '--dry-run']) == 1
+    assert page.read_text(encoding='utf-8') == AUTH_PAGE
+    assert sorted(p.name for p in tmp_path.rglob('*')) == ['pricing.html', 'public']
+    out = capsys.readouterr().out
+    assert '--- a/public/pricing.html\n+++ b/public/pricing.html\n@@ ' in out
+    assert any(line.startswith('+') and '/nav-auth.js' in line for line in out.splitlines())
+    assert '1 would change / 0 unchanged (dry run, nothing written)' in out
+
+    cli.main(['nav-auth', '--root', str(tmp_path), '--no-cache'])
+    capsys.readouterr()
+    assert cli.main(['nav-auth', '--root', str(tmp_path), '--no-cache', '--dry-run']) == 0
+    assert '--- a/' not in capsys.readouterr().out
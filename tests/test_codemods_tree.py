@@ -0,0 +1,32 @@
+"""The checked-in pages are what the default codemods produce: a bare
+``python -m codemods`` on a clean tree must not rewrite anything."""
+
+import os
+
+import pytest
+
+from codemods import registry
+from codemods.cache import ROOT, read_text
+from codemods.cli import unified_diff
+
+PLAN = registry.plan(registry.select())
+
+
+def test_the_default_run_has_targets():
+    assert 'public/index.html' in PLAN
+    assert any(path.startswith('public/baza-wiedzy/mocne-strony/') for path in PLAN)
+
+
+@pytest.mark.parametrize('path', sorted(PLAN))
+def test_default_run_changes_nothing(path):
+    with open(os.path.join(ROOT, path), 'rb') as f:
+        original = read_text(f.read())
+    result = registry.apply(path, original, PLAN[path])
+    assert result.text == original, f"{path}: {dict(result.hits)}\n" + unified_diff(path, original, result.text)[:2000]
+
+
+def test_every_footer_variant_is_live():
+    from codemods.rules import nav_footer
+    for footer in (nav_footer.CANONICAL_FOOTER, nav_footer.KB_HUB_FOOTER):
+        assert any(footer.strip() in read_text(open(os.path.join(ROOT, path), 'rb').read())
+                   for path in PLAN)
@@ -0,0 +1,60 @@
+from sitebuild import components, site
+
+LOGO = ('<svg class="alcheme-logo" viewBox="0 0 10 10"><defs><filter id="glow"/></defs>'
+        + '<path d="M0 0L10 10"/>' * 40 + '</svg>')
+LINK = ('<a href="/{0}" style="color:#999" onmouseover="this.style.color=\'#fff\'"'
+        ' onmouseout="this.style.color=\'#999\'">{0}</a>')
+
+
+def page(own_css='', body=''):
+    return f"""<html><head>
+  <style>
+    .iiy-nav-link{{color:#ccc;padding:4px}}
+    .iiy-nav-link:hover{{color:#fff}}{own_css}
+  </style>
+</head><body>
+  <nav>{LOGO}<a class="iiy-nav-link" href="/">Start</a></nav>
+  <footer>{LINK.format('pricing')}{LINK.format('faq')}</footer>{body}
+</body></html>
+"""
+
+
+def build(tmp_path, pages):
+    for name, html in pages.items():
+        site.write(str(tmp_path), name, html)
+    results, assets = components.run(str(tmp_path))
+    return {r.path: r for r in results}, assets
+
+
+def test_shared_nav_css_svg_and_hovers_move_out(tmp_path):
+    results, assets = build(tmp_path, {'index.html': page(), 'pricing.html': page(body='<p>x</p>')})
+    assert [(r.nav_rules, r.hovers, r.svgs, r.linked) for r in results.values()] == [(2, 2, 1, True)] * 2
+
+    html = site.read(str(tmp_path), 'index.html')
+    assert '<style>' not in html and 'onmouseover' not in html
+    assert '  <link rel="stylesheet" href="/components.css">\n</head>' in html
+    assert '<svg class="alcheme-logo" viewBox="0 0 10 10"><use href="/sprite.svg#svg-' in html
+
+    hover = components.hover_class(('color:#999', 'color:#fff'))
+    assert f'<a href="/faq" class="{hover}">faq</a>' in html
+    css = site.read(str(tmp_path), 'components.css')
+    assert css == (f'.iiy-nav-link{{color:#ccc;padding:4px}}\n.iiy-nav-link:hover{{color:#fff}}\n'
+                   f'.{hover}{{color:#999}}.{hover}:hover{{color:#fff}}\n')
+    sprite = site.read(str(tmp_path), 'sprite.svg')
+    assert sprite.count('<symbol ') == 1 and '<filter id="glow"/>' in sprite
+    assert assets.raw == len(css) + len(sprite.encode())
+
+
+def test_a_page_whose_cascade_would_change_keeps_its_css(tmp_path):
+    # Ahead of the shared rule it loses to it; ahead of the <link> it would win
+    early = page().replace('<style>\n', '<style>\n    .iiy-nav-link{color:#abc}\n')
+    results, _ = build(tmp_path, {'index.html': page(), 'pricing.html': early,
+                                  'faq.html': page(body='<script>x.style.filter = "url(#glow)"</script>')})
+    kept = results['pricing.html']
+    assert (kept.linked, kept.nav_rules, kept.hovers, kept.svgs) == (False, 0, 0, 1)
+    assert kept.note == '.iiy-nav-link would lose to .iiy-nav-link'
+    html = site.read(str(tmp_path), 'pricing.html')
+    assert '.iiy-nav-link{color:#abc}\n    .iiy-nav-link{color:#ccc;padding:4px}' in html
+    assert 'components.css' not in html and 'onmouseover' in html
+    # the logo's filter id is used elsewhere on the FAQ page: that SVG stays inline
+    assert results['faq.html'].svgs == 0 and LOGO in site.read(str(tmp_path), 'faq.html')
@@ -0,0 +1,25 @@
+import json
+
+from codemods import coverage
+from tests.test_cli import AUTH_PAGE, site
+
+
+def test_the_matrix_counts_hits_on_every_page(tmp_path, capsys):
+    site(tmp_path)
+    (tmp_path / 'public' / 'about.html').write_text(AUTH_PAGE, encoding='utf-8')
+    (tmp_path / 'public' / 'faq.html').write_text('<html><body></body></html>\n', encoding='utf-8')
+    out = tmp_path / 'coverage.json'
+    rc = coverage.main(['nav-auth', '--root', str(tmp_path), '-j', '1', '--repeat', '1',
+                        '--matrix', '--json', str(out)])
+    assert rc == 0
+    report = json.loads(out.read_text(encoding='utf-8'))
+    row, = report['rules']
+    assert {k: row[k] for k in ('rule', 'hits', 'files_hit', 'targets_hit', 'targets')} == \
+        {'rule': 'nav-auth', 'hits': 2, 'files_hit': 2, 'targets_hit': 1, 'targets': 1}
+    files = report['files']
+    assert files['public/pricing.html']['targeted'] == ['nav-auth']
+    assert [files[p]['hits'] for p in sorted(files)] == [{'nav-auth': 1}, {}, {'nav-auth': 1}]
+    matrix = capsys.readouterr().out.split('--- Hit matrix ---')[1]
+    assert ['public/faq.html', '·'] in [line.split() for line in matrix.splitlines()]
+    # nothing written to the tree
+    assert (tmp_path / 'public' / 'pricing.html').read_text(encoding='utf-8') == AUTH_PAGE
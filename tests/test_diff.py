@@ -0,0 +1,18 @@
+import shutil
+
+import pytest
+
+from scoring import diff
+
+@pytest.mark.skipif(shutil.which('node') is None, reason="scoring.diff runs scoring.js under node")
+def test_engine_matches_scoring_js(capsys):
+    assert diff.main(['--rows', '20', '--seed', '1']) == 0
+    out = capsys.readouterr().out
+    assert 'no differences' in out and '✗' not in out
+
+
+def test_a_changed_field_is_reported():
+    assert diff.difference({'a': [1, 2.5]}, {'a': [1, 2.5], 'extra': 0}) is None
+    assert diff.difference({'a': [1, 2.5]}, {'a': [1, 2.0]}) == ('a[1]', 2.5, 2.0)
+    assert diff.difference({'a': 1}, {'a': True}) == ('a', 1, True)
+    assert diff.difference({'a': 1}, {}) == ('a', 1, diff.MISSING)
@@ -0,0 +1,145 @@
+
+import pytest
+
+from codemods import engine
+from codemods.engine import Pipeline, Rule, RuleSet, literal_prefix, required_literals
+from codemods.htmltok import ElementRule, ElementRuleSet
+from codemods.registry import Codemod
+
+
+# ─── Anchors and required literals ────────────────────────────────────────────
+
+@pytest.mark.parametrize('pattern, prefix', [
+    (r'<nav\s+id="x"', '<nav'),
+    (r'(<div) class', '<div'),
+    (r'(?:\.foo\()bar', '.foo('),
+    (r'ab?c', 'a'),
+    (r'(ab)?c', ''),
+    (r'(?:<a|<b)x', ''),
+    (r'(ab|cd)e', ''),
+    (r'\w+', ''),
+])
+def test_literal_prefix(pattern, prefix):
+    assert literal_prefix(pattern) == prefix
+
+
+@pytest.mark.parametrize('pattern, literals', [
+    (r'<nav[^>]*>.*?data-auth="yes".*?</nav>', ('data-auth="yes"', '</nav>')),
+    (r'a(?:long-enough)+b', ('long-enough',)),
+    (r'a(?:long-enough)?b', ()),
+    (r'x(?:header-one|footer-two)y', ()),
+    (r'<a href="/x">', ('<a href="/x">',)),
+])
+def test_required_literals(pattern, literals):
+    assert required_literals(pattern) == literals
+
+
+def test_rule_needs_an_anchor():
+    with pytest.raises(ValueError):
+        Rule('words', r'\w+', 'x')
+    assert Rule('words', r'\w+', 'x', anchors=('w',)).anchors == ('w',)
+    assert Rule('nav', r'<nav[^>]*>.*?data-auth="yes"', 'x').requires == ('data-auth="yes"',)
+
+
+def test_missing_required_literal_skips_the_rule():
+    rules = RuleSet([Rule('auth-nav', r'<nav[^>]*>.*?data-auth="yes"', 'N')])
+    before = engine.stats()
+    assert rules.apply('<nav a> <nav b> <nav c>').text == '<nav a> <nav b> <nav c>'
+    after = engine.stats()
+    assert after.attempts == before.attempts
+    assert (after.skipped - before.skipped, after.rules_skipped - before.rules_skipped) == (3, 1)
+    assert rules.apply('<nav a> <nav data-auth="yes">').text == 'N>'
+
+
+# ─── Single-pass semantics ────────────────────────────────────────────────────
+
+def test_leftmost_match_wins_then_declaration_order():
+    rules = RuleSet([Rule.literal('ab', 'ab', 'X'), Rule.literal('a', 'a', 'Y'), Rule.literal('bc', 'bc', 'Z')])
+    result = rules.apply('abc bc a')
+    assert result.text == 'Xc Z Y'
+    assert result.hits == {'ab': 1, 'bc': 1, 'a': 1}
+
+
+def test_replacements_are_not_rescanned():
+    rules = RuleSet([Rule.literal('a-to-ab', 'a', 'ab'), Rule.literal('b-to-c', 'b', 'c')])
+    assert rules.apply('ab').text == 'abc'
+    assert Pipeline([RuleSet([rules.rules[0]]), RuleSet([rules.rules[1]])]).apply('ab').text == 'acc'
+
+
+def test_max_hits_mirrors_re_sub_count():
+    assert RuleSet([Rule.literal('x', 'x', 'y', max_hits=2)]).apply('xxxx') == ('yyxx', {'x': 2})
+
+
+def test_templates_and_callables_see_the_full_match():
+    rules = RuleSet([Rule('swap', r'(\w+)=(\w+)', r'\2=\1', anchors=('k',)),
+                     Rule('upper', r'v(\d)', lambda m: 'V' + m.group(1))])
+    assert rules.apply('key=val v1').text == 'val=key V1'
+
+
+def test_identity_replacement_is_not_a_hit():
+    assert RuleSet([Rule('same', r'a(b)', r'a\1')]).apply('ab ab').hits == {}
+
+
+def test_leading_whitespace_is_taken_like_re_sub():
+    rules = RuleSet([Rule.literal('a', 'a', 'A'), Rule('br', r'\s*<br>', '<br>')])
+    assert rules.apply('x  \n<br>a  <br>') == ('x<br>A<br>', {'br': 2, 'a': 1})
+
+
+# ─── Match-time budget ────────────────────────────────────────────────────────
+#
+# A rule charged exactly its budget is still within it; any further match
+# time puts it over, which makes the overrun paths deterministic to test.
+
+def test_charge_adds_up_per_rule():
+    with engine.budget(0.010) as b:
+        assert engine.charge('r', 0.006)
+        assert engine.charge('other', 0.006)
+        assert not engine.over_budget('r')
+        assert not engine.charge('r', 0.006)
+        assert engine.over_budget('r') and not engine.over_budget('other')
+    assert [o.rule for o in b.overruns] == ['r']
+    assert not engine.over_budget('r')          # only inside the block
+
+
+def test_no_budget_means_no_accounting():
+    assert engine.charge('r', 1e9)
+    with engine.budget(0) as b:
+        assert engine.charge('r', 1e9)
+    assert not b.overruns
+
+
+def test_budget_is_carried_across_phases():
+    rules = RuleSet([Rule('a-to-b', 'a', 'b')])
+    pipeline = Pipeline([RuleSet([Rule('x-to-y', 'x', 'y')]), rules])
+    with engine.budget(1.0) as b:
+        engine.charge('a-to-b', 1.0)            # spent by an earlier phase
+        result = pipeline.apply('xa')
+    assert result.text == 'ya'
+    assert [o.rule for o in b.overruns] == ['a-to-b']
+
+
+def test_a_rule_over_budget_is_skipped_by_later_sets():
+    with engine.budget(1.0):
+        engine.charge('a-to-b', 2.0)
+        assert RuleSet([Rule('a-to-b', 'a', 'b')]).apply('aaa').text == 'aaa'
+
+
+def test_element_rules_are_budgeted():
+    rules = ElementRuleSet([ElementRule('footer', 'footer', '<footer>new</footer>'),
+                            ElementRule('nav', 'nav', '<nav>new</nav>')])
+    html = '<nav>old</nav><footer>old</footer>'
+    with engine.budget(1.0) as b:
+        engine.charge('footer', 1.0)
+        result = rules.apply(html)
+    assert result.text == '<nav>new</nav><footer>old</footer>'
+    assert [o.rule for o in b.overruns] == ['footer']
+
+
+def test_plain_codemods_are_metered_under_their_name():
+    mod = Codemod('upper', ('x',), lambda path, text: text.upper())
+    assert mod.apply('x', 'abc').text == 'ABC'
+    with engine.budget(1.0) as b:
+        engine.charge('upper', 1.0)
+        assert mod.apply('x', 'abc').text == 'abc'
+        assert mod.apply('x', 'abc').hits == {}
+    assert [o.rule for o in b.overruns] == ['upper']
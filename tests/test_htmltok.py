@@ -0,0 +1,99 @@
+import pytest
+
+from codemods.htmltok import ElementRule, ElementRuleSet, Selector, locate
+
+
+def outer(html, selector):
+    return [html[s.start:s.end] for s in locate(html, (selector,))[0]]
+
+
+def inner(html, selector):
+    return [html[s.inner_start:s.inner_end] for s in locate(html, (selector,))[0]]
+
+
+# ─── locate ───────────────────────────────────────────────────────────────────
+
+def test_nested_elements_end_at_their_own_end_tag():
+    html = '<nav><div id="m"><div><a>x</a></div></div><div>y</div></nav>'
+    assert outer(html, '#m') == ['<div id="m"><div><a>x</a></div></div>']
+    assert outer(html, 'div') == ['<div id="m"><div><a>x</a></div></div>', '<div><a>x</a></div>', '<div>y</div>']
+    assert inner(html, 'nav') == ['<div id="m"><div><a>x</a></div></div><div>y</div>']
+
+
+def test_unclosed_elements_are_not_reported():
+    html = '<ul><li>a<li>b</ul><div class="x">open'
+    assert outer(html, 'ul') == ['<ul><li>a<li>b</ul>']
+    assert outer(html, 'li') == []
+    assert outer(html, '.x') == []
+
+
+def test_stray_end_tags_are_ignored():
+    assert outer('<p>a</div>b</p>', 'p') == ['<p>a</div>b</p>']
+
+
+def test_void_and_self_closing_elements():
+    html = '<head><meta charset="utf-8"><link rel="icon"/><svg><path d="M0"/></svg></head>'
+    assert outer(html, 'meta') == ['<meta charset="utf-8">']
+    assert outer(html, 'path') == ['<path d="M0"/>']
+    assert inner(html, 'link') == ['']
+
+
+def test_script_and_style_text_is_not_markup():
+    html = '<script>s = "<footer>" + "</div>"</script><style>a::after{content:"</p>"}</style><footer>f</footer>'
+    assert outer(html, 'footer') == ['<footer>f</footer>']
+    assert inner(html, 'script') == ['s = "<footer>" + "</div>"']
+    assert inner('<script>never closed <b>', 'script') == ['never closed <b>']
+
+
+def test_comments_and_quoted_gt_are_skipped():
+    html = '<!-- <footer>no</footer> --><a title="1 > 0" class="btn primary">ok</a>'
+    assert outer(html, 'footer') == []
+    assert outer(html, 'a.btn.primary') == ['<a title="1 > 0" class="btn primary">ok</a>']
+
+
+def test_several_selectors_in_one_pass():
+    html = '<div id="nav-links" class="hidden md:flex">a</div><div class="hidden">b</div>'
+    ids, hidden, flex = locate(html, ('div#nav-links', '.hidden', '.flex'))
+    assert [html[s.start:s.end] for s in ids] == ['<div id="nav-links" class="hidden md:flex">a</div>']
+    assert len(hidden) == 2 and flex == []
+
+
+def test_selector_matching_is_exact():
+    html = '<div id="nav-links-2" class="navx">a</div>'
+    assert outer(html, '#nav-links') == [] and outer(html, '.nav') == []
+
+
+@pytest.mark.parametrize('text', ['', 'div > a', 'a[href]', '#', '.md:flex'])
+def test_unsupported_selectors(text):
+    with pytest.raises(ValueError):
+        Selector.parse(text)
+
+
+# ─── ElementRuleSet ───────────────────────────────────────────────────────────
+
+def test_rules_replace_whole_elements_or_their_content():
+    rules = ElementRuleSet([ElementRule('footer', 'footer', '<footer>new</footer>'),
+                            ElementRule('menu', '#menu', lambda old: old.upper(), inner=True)])
+    result = rules.apply('<div id="menu"><a>x</a></div><footer><p>old</p></footer>')
+    assert result.text == '<div id="menu"><A>X</A></div><footer>new</footer>'
+    assert result.hits == {'footer': 1, 'menu': 1}
+
+
+def test_outer_edit_wins_over_a_nested_one():
+    rules = ElementRuleSet([ElementRule('inner', 'span', 'S'), ElementRule('outer', 'p', 'P')])
+    assert rules.apply('<p><span>a</span></p><span>b</span>').text == 'PS'
+
+
+def test_max_hits_and_identity_edits():
+    rules = ElementRuleSet([ElementRule('first', 'li', '<li>1</li>', max_hits=1)])
+    assert rules.apply('<li>a</li><li>b</li>').text == '<li>1</li><li>b</li>'
+    same = ElementRuleSet([ElementRule('same', 'li', '<li>a</li>')])
+    assert same.apply('<li>a</li>').hits == {}
+
+
+def test_anchors_gate_the_rule():
+    assert ElementRule('by-id', 'div#menu.card', '').anchors == ('menu',)
+    assert ElementRule('by-class', 'div.card.wider', '').anchors == ('card',)
+    rules = ElementRuleSet([ElementRule('cta', 'a.btn', 'B', anchors=('data-cta',))])
+    assert rules.apply('<a class="btn">x</a>').text == '<a class="btn">x</a>'
+    assert rules.apply('<a class="btn" data-cta>x</a>').text == 'B'
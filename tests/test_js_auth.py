@@ -0,0 +1,60 @@
+import pytest
+
+from codemods.rules.js_auth import NAV_AUTH_PRELOAD, NAV_AUTH_SCRIPT, block_end, nav_auth, strip_session_block
+
+
+@pytest.mark.parametrize('body', [
+    ' a(); } tail',
+    ' if (x) { y(); } } tail',
+    " s = '}' + \"}\\\"}\"; } tail",
+    ' t = `<div>}</div>${ {a: 1}.a }}`; } tail',
+    ' t = `${ `${"}"}` }\\`}`; } tail',
+])
+def test_block_end_skips_strings_and_templates(body):
+    code = '{' + body
+    assert code[block_end(code, 1):] == ' tail'
+
+
+def test_block_end_of_an_unterminated_block_is_the_end():
+    assert block_end('{ a(', 1) == 4
+
+
+SCRIPT = """
+  import { createClient } from 'https://cdn.jsdelivr.net/npm/@supabase/supabase-js@2/+esm';
+  const supabase = createClient('https://x.supabase.co', 'anon');
+
+  // Detect auth state and swap nav
+  const LOGOUT_SVG = `<svg>}</svg>`;
+
+  (async () => {
+    const { data: { session } } = await supabase.auth.getSession();
+    if (session) {
+      document.getElementById('nav-links').innerHTML = `<a href="/settings">${LOGOUT_SVG}</a>`;
+    }
+  })();
+"""
+
+
+def test_strip_session_block_takes_what_only_the_nav_used():
+    code, found = strip_session_block(SCRIPT)
+    assert found and not code.strip()
+
+
+def test_strip_session_block_keeps_what_the_page_still_uses():
+    code, found = strip_session_block(SCRIPT + "  supabase.from('t').select();\n")
+    assert found
+    assert 'getSession' not in code and 'LOGOUT_SVG' not in code and 'swap nav' not in code
+    assert 'createClient(' in code and "supabase.from('t')" in code
+
+
+def test_strip_session_block_needs_a_nav_swap():
+    code = "const { data: { session } } = await supabase.auth.getSession();\nif (session) { go(); }"
+    assert strip_session_block(code) == (code, False)
+
+
+def test_nav_auth_links_the_shared_module():
+    html = f'<html><head>\n  <title>t</title>\n</head><body>\n  <script type="module">{SCRIPT}</script>\n</body></html>'
+    out = nav_auth('public/pricing.html', html)
+    assert out == (f'<html><head>\n  <title>t</title>\n  {NAV_AUTH_PRELOAD}\n</head><body>\n'
+                   f'  {NAV_AUTH_SCRIPT}\n</body></html>')
+    assert nav_auth('public/pricing.html', out) == out
@@ -0,0 +1,54 @@
+import pytest
+
+from sitebuild import routes
+from sitebuild.links import SITE_URL, LinkIndex, check_link, markup_links, script_links
+
+CONFIG = {
+    'redirects': [{'source': '/character-sheet', 'destination': '/character'},
+                  {'source': '/loop', 'destination': '/loop'}],
+    'rewrites': [{'source': '/pricing', 'destination': '/pricing.html'},
+                 {'source': '/character/:path*', 'destination': '/app.html'},
+                 {'source': '/lost', 'destination': '/lost.html'}],
+}
+INDEX = LinkIndex(frozenset({'/index.html', '/pricing.html', '/app.html', '/kb/index.html', '/tw.css'}),
+                  {'/index.html': frozenset({'top-tests'}), '/pricing.html': frozenset({'faq'})},
+                  tuple(routes.routes(CONFIG)))
+
+
+@pytest.mark.parametrize('path, served', [
+    ('/', '/index.html'),
+    ('/kb', '/kb/index.html'),
+    ('/kb/', '/kb/index.html'),
+    ('/pricing', '/pricing.html'),
+    ('/character/abc', '/app.html'),
+    ('/character-sheet', '/app.html'),
+    ('/tw.css', '/tw.css'),
+    ('/lost', None),
+    ('/loop', None),
+    ('/nope', None),
+])
+def test_resolve(path, served):
+    assert INDEX.resolve(path) == served
+
+
+@pytest.mark.parametrize('value, reason', [
+    ('/pricing#faq', None),
+    (SITE_URL + '/pricing?x=1&amp;y=2', None),
+    ('https://example.com/nope', None),
+    ('mailto:a@b.c', None),
+    ('/character/${id}', None),
+    ('#top-tests', None),
+    ('../tw.css', None),
+    ('/nope', "not served: no file, rewrite or redirect"),
+    ('/pricing#cennik', "no #cennik in pricing.html"),
+    ('#missing', "no #missing in index.html"),
+])
+def test_check_link(value, reason):
+    assert check_link(value, '/kb/', '/index.html', INDEX) == reason
+
+
+def test_links_in_markup_and_scripts():
+    html = ('<a href="/a">x</a><script>el.innerHTML = `<a href="/b">`; location.href = \'/c\';'
+            "const LINKS = [['/d', 'D']];</script><style>a{background:url(/e)}</style><img src='/f'>")
+    assert [value for _, value in markup_links(html)] == ['/a', '/b', '/c', '/d', '/f']
+    assert script_links('x.innerHTML = "<a href=\\"/g\\">"')[0][1] == '/g'
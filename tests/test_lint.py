@@ -0,0 +1,35 @@
+import re
+import sys
+import types
+
+import pytest
+
+from codemods import lint, patterns, registry
+
+
+@pytest.mark.parametrize('pattern, flags, kinds', [
+    (r'(a+)+b', 0, ['nested quantifier']),
+    (r'(?:\s*x\s*)*y', 0, ['nested quantifier']),
+    (r'<a\s*\n\s*b', 0, ['overlapping quantifiers']),
+    (r'<nav>.*?</nav>', re.DOTALL, ['unbounded DOTALL scan']),
+    (r'<nav[^>]*>[^<]*</nav>', 0, []),
+])
+def test_analyse(pattern, flags, kinds):
+    assert [f.kind for f in lint.analyse(pattern, flags, 'r')] == kinds
+
+
+def test_plain_transform_regexes_are_linted(tmp_path, monkeypatch):
+    module = types.ModuleType('codemods.rules.fake_rule')
+    module.__file__ = str(tmp_path / 'fake_rule.py')
+    monkeypatch.setitem(sys.modules, module.__name__, module)
+    exec("from codemods.patterns import compiled\nBAD = compiled(r'<p>(?:\\s*\\w+\\s*)*</p>')", vars(module))
+    named = lint.module_patterns({module.__file__})
+    assert named == [('fake_rule.BAD', module.BAD)]
+    assert [(f.rule, f.severity) for f in lint.lint_patterns(named)] == [('fake_rule.BAD', 'error')]
+
+
+def test_registered_codemod_modules_are_covered():
+    codemods = registry.load()
+    names = [name for name, _ in lint.module_patterns({codemods['nav-auth'].source})]
+    assert 'js_auth.SESSION' in names and 'js_auth.CONST' in names
+    assert patterns.registered()[sys.modules['codemods.rules.js_auth'].SESSION] == 'codemods.rules.js_auth'
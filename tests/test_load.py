@@ -0,0 +1,42 @@
+import math
+
+import pytest
+
+from edgetools.load import Result, percentile, report, summary
+
+
+@pytest.mark.parametrize('q, expected', [(0, 1), (10, 1), (11, 2), (50, 5), (95, 10), (99, 10), (100, 10)])
+def test_percentile_is_nearest_rank(q, expected):
+    assert percentile(list(range(1, 11)), q) == expected
+
+
+def test_percentile_of_one_and_none():
+    assert percentile([7.0], 99) == 7.0
+    assert math.isnan(percentile([], 50))
+
+
+def test_summary_sorts():
+    assert summary([3.0, 1.0, 2.0]) == {'n': 3, 'p50': 2.0, 'p95': 3.0, 'p99': 3.0, 'max': 3.0}
+    assert summary([])['n'] == 0
+
+
+def test_report_splits_hits_misses_and_errors():
+    results = [Result(0.01, 200, True, None), Result(0.02, 200, True, None), Result(0.5, 200, False, None),
+               Result(0.3, 200, None, None), Result(1.0, 500, None, '500 LLM request failed'),
+               Result(60.0, 0, None, 'timeout'), Result(2.0, 500, None, '500 LLM request failed')]
+    result = report(results, shed=3, seconds=2.0)
+    assert result['sent'] == 7 and result['shed'] == 3 and result['rps'] == 3.5
+    assert result['ok'] == 4
+    assert result['errors'] == {'500 LLM request failed': 2, 'timeout': 1}
+    assert result['error_rate'] == pytest.approx(3 / 7)
+    # responses that do not say whether they were cached count for neither
+    assert result['hit_ratio'] == pytest.approx(2 / 3)
+    assert result['latency']['hit']['max'] == 0.02
+    assert result['latency']['miss']['n'] == 1
+    assert result['latency']['all']['max'] == 60.0
+
+
+def test_report_without_results():
+    result = report([], shed=0, seconds=0.0)
+    assert result['sent'] == 0 and result['rps'] == 0.0 and result['error_rate'] == 0.0
+    assert math.isnan(result['hit_ratio'])
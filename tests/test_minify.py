@@ -0,0 +1,66 @@
+import pytest
+
+from sitebuild.js import minify_js
+from sitebuild.minify import minify_html, minify_markup
+
+
+# ─── Markup ───────────────────────────────────────────────────────────────────
+
+def test_markup_collapses_whitespace_between_tags():
+    assert minify_markup('<ul>\n    <li>a</li>   <li>b</li>\n</ul>') == '<ul>\n<li>a</li> <li>b</li>\n</ul>'
+
+
+def test_markup_drops_comments_but_not_conditional_ones():
+    assert minify_markup('a <!-- x --> b<!--[if IE]><p><![endif]-->') == 'a b<!--[if IE]><p><![endif]-->'
+
+
+def test_markup_keeps_quoted_gt_inside_the_tag():
+    html = '<a title="x  >  y" data-v=\'1 >  2\'>  hi  </a>'
+    assert minify_markup(html) == '<a title="x  >  y" data-v=\'1 >  2\'> hi </a>'
+
+
+def test_markup_keeps_a_stray_lt():
+    assert minify_markup('<p>1 <  2</p>') == '<p>1 <  2</p>'
+    assert minify_markup('a  <') == 'a <'
+
+
+def test_html_leaves_verbatim_elements_alone():
+    html = '<div>  <pre>  a\n   b </pre>  <p class="whitespace-pre-line">  x  </p>  </div>'
+    assert minify_html(html) == '<div> <pre>  a\n   b </pre> <p class="whitespace-pre-line">  x  </p> </div>'
+
+
+def test_html_minifies_scripts_by_type():
+    html = ('<script>\n  // c\n  let a = 1;\n</script>'
+            '<script type="application/ld+json">{ "a": [1, 2] }</script>'
+            '<script type="text/template">  <b> </b>  </script>')
+    assert minify_html(html) == ('<script>let a = 1;</script>'
+                                 '<script type="application/ld+json">{"a":[1,2]}</script>'
+                                 '<script type="text/template">  <b> </b>  </script>')
+
+
+# ─── JavaScript ───────────────────────────────────────────────────────────────
+
+@pytest.mark.parametrize('code, expected', [
+    ('a = b / c / d', 'a = b / c / d'),
+    ('x = /a\\/[/]b/gi.test(y)', 'x = /a\\/[/]b/gi.test(y)'),
+    ('return /  x  /', 'return /  x  /'),
+    ('typeof /x/', 'typeof /x/'),
+    ('f(a, / b /)', 'f(a, / b /)'),
+    ('i++ / 2 / k', 'i++ / 2 / k'),
+    ('(a) / 2 / (b)', '(a) / 2 / (b)'),
+    ('returned / 2 / x', 'returned / 2 / x'),
+    ('s = "a // b" / 2', 's = "a // b" / 2'),
+])
+def test_js_tells_regex_from_division(code, expected):
+    assert minify_js(code) == expected
+
+
+def test_js_decision_looks_past_comments_and_blank_runs():
+    assert minify_js('return' + ' ' * 200 + '/* c */  / x /') == 'return / x /'
+    assert minify_js('n' + ' ' * 200 + '\n\n / 2 / m') == 'n\n/ 2 / m'
+
+
+def test_js_keeps_literals_and_line_breaks():
+    code = 'const a = `x ${ {b: "}"}.b }  y`;   // tail\n\n   /* block\n */ let c = \'  /* no */  \''
+    assert minify_js(code) == 'const a = `x ${ {b: "}"}.b }  y`;\nlet c = \'  /* no */  \''
+
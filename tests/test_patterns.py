@@ -0,0 +1,26 @@
+import re
+
+from codemods import cli, patterns
+from tests.test_cli import AUTH_PAGE
+
+
+def test_a_pattern_is_compiled_once():
+    before = patterns.stats()
+    first = patterns.compiled(r'<x-test-once\b[^>]*>', re.I)
+    again = patterns.compiled(r'<x-test-once\b[^>]*>', re.I)
+    other = patterns.compiled(r'<x-test-once\b[^>]*>')
+    after = patterns.stats()
+    assert first is again and other is not first and other.flags != first.flags
+    assert (after.patterns - before.patterns, after.compiles - before.compiles, after.hits - before.hits) == (2, 2, 1)
+    assert patterns.registered()[first] == __name__
+
+
+def test_rewriting_pages_compiles_nothing(tmp_path, capsys):
+    for name in ('index', 'pricing', 'baza-wiedzy/eq'):
+        page = tmp_path / 'public' / f'{name}.html'
+        page.parent.mkdir(parents=True, exist_ok=True)
+        page.write_text(AUTH_PAGE, encoding='utf-8')
+    assert cli.main(['nav-auth', '--root', str(tmp_path), '--no-cache', '--jobs', '1']) == 0
+    out = capsys.readouterr().out
+    assert '3 fixed / 0 unchanged' in out
+    assert ', 0 compiled while rewriting' in out
@@ -0,0 +1,109 @@
+import json
+
+import pytest
+
+from sitebuild import routes, sitemap
+from sitebuild.sitemap import SITE_URL
+
+CONFIG = {
+    'redirects': [{'source': '/old', 'destination': '/new', 'permanent': True}],
+    'rewrites': [{'source': '/pricing', 'destination': '/pricing.html'},
+                 {'source': '/test/:path*', 'destination': '/app.html'}],
+}
+
+
+# ─── Routes ───────────────────────────────────────────────────────────────────
+
+@pytest.mark.parametrize('source, matches, misses', [
+    ('/pricing', ['/pricing'], ['/pricing/', '/pricingx']),
+    ('/test/:path*', ['/test', '/test/a', '/test/a/b'], ['/tests']),
+    ('/auth/:id', ['/auth/x'], ['/auth', '/auth/x/y']),
+    ('/k/:rest+', ['/k/a/b'], ['/k/']),
+    ('/tw.([0-9a-f]{10}).css', ['/tw.0123456789.css'], ['/tw.css']),
+])
+def test_source_pattern(source, matches, misses):
+    pattern = routes.source_pattern(source)
+    assert all(pattern.match(p) for p in matches)
+    assert not any(pattern.match(p) for p in misses)
+
+
+@pytest.mark.parametrize('path, url', [
+    ('index.html', '/'),
+    ('baza-wiedzy/index.html', '/baza-wiedzy/'),
+    ('pricing.html', '/pricing'),
+    ('methodology.html', '/methodology.html'),
+    ('old.html', '/old.html'),
+    ('old/index.html', '/old/'),
+])
+def test_page_url(path, url):
+    assert routes.page_url(path, CONFIG) == url
+
+
+def test_page_behind_a_redirect_has_no_url():
+    config = dict(CONFIG, rewrites=CONFIG['rewrites'] + [{'source': '/old', 'destination': '/old.html'}])
+    assert routes.page_url('old.html', config) is None
+
+
+# ─── Sitemap ──────────────────────────────────────────────────────────────────
+
+def test_content_hash_ignores_chrome_and_whitespace():
+    page = '<nav>a</nav><main>\n  <h1>Tytuł</h1>\n</main><footer>{}</footer><script>x()</script>'
+    assert sitemap.content_hash(page.format('2025')) == sitemap.content_hash(
+        page.format('2026').replace('\n  ', ' ').replace('x()', 'y()'))
+    assert sitemap.content_hash(page) != sitemap.content_hash(page.replace('Tytuł', 'Inny'))
+
+
+def entry(path, lastmod, changefreq='monthly', priority='0.5'):
+    return sitemap.render_entry('  ', SITE_URL + path, lastmod, changefreq, priority)
+
+
+@pytest.fixture
+def site(tmp_path):
+    public = tmp_path / 'public'
+    (public / 'kb').mkdir(parents=True)
+    pages = {'index.html': 'home', 'pricing.html': 'plans', 'kb/a.html': 'a', 'app.html': 'app',
+             'character-card.html': 'card'}
+    for path, body in pages.items():
+        (public / path).write_text(f'<nav>n</nav><main>{body}</main>', encoding='utf-8')
+    (public / 'robots.txt').write_text('User-agent: *\nDisallow: /app.html\n', encoding='utf-8')
+    (public / 'sitemap.xml').write_text(
+        '<urlset>\n  <!-- Core -->\n' + entry('/', '2024-01-01', 'weekly', '1.0') + entry('/pricing', '2024-01-02')
+        + '  <!-- KB -->\n' + entry('/kb/a.html', '2024-01-03', 'yearly', '0.3') + entry('/gone', '2024-01-04')
+        + '</urlset>\n', encoding='utf-8')
+    vercel = tmp_path / 'vercel.json'
+    vercel.write_text(json.dumps(CONFIG), encoding='utf-8')
+    return public, str(tmp_path / 'manifest.json'), str(vercel)
+
+
+def test_first_run_keeps_dates_and_diffs_the_pages(site):
+    public, manifest, vercel = site
+    (public / 'kb' / 'b.html').write_text('<main>b</main>', encoding='utf-8')
+    result = sitemap.run(str(public), today='2026-10-18', manifest_path=manifest, vercel=vercel)
+    assert result.updated == []
+    assert result.added == [SITE_URL + '/kb/b.html']
+    assert result.removed == [SITE_URL + '/gone']
+    assert result.xml == ('<urlset>\n  <!-- Core -->\n' + entry('/', '2024-01-01', 'weekly', '1.0')
+                          + entry('/pricing', '2024-01-02') + '  <!-- KB -->\n'
+                          + entry('/kb/a.html', '2024-01-03', 'yearly', '0.3')
+                          + entry('/kb/b.html', '2026-10-18', 'yearly', '0.3') + '</urlset>\n')
+    assert result.manifest['pricing.html']['lastmod'] == '2024-01-02'
+
+
+def test_lastmod_moves_only_with_the_content(site):
+    public, manifest, vercel = site
+    sitemap.run(str(public), today='2026-01-01', manifest_path=manifest, vercel=vercel)
+    (public / 'index.html').write_text('<nav>new nav</nav>\n<main>home</main>', encoding='utf-8')
+    (public / 'pricing.html').write_text('<nav>n</nav><main>new plans</main>', encoding='utf-8')
+    result = sitemap.run(str(public), today='2026-10-18', manifest_path=manifest, vercel=vercel)
+    assert (result.updated, result.added, result.removed) == ([SITE_URL + '/pricing'], [], [])
+    assert entry('/pricing', '2026-10-18') in result.xml and entry('/', '2024-01-01', 'weekly', '1.0') in result.xml
+    again = sitemap.run(str(public), today='2026-12-01', manifest_path=manifest, vercel=vercel)
+    assert (again.updated, again.added, again.removed) == ([], [], [])
+
+
+def test_dry_run_writes_nothing(site):
+    public, manifest, vercel = site
+    before = (public / 'sitemap.xml').read_text(encoding='utf-8')
+    sitemap.run(str(public), dry_run=True, today='2026-10-18', manifest_path=manifest, vercel=vercel)
+    assert (public / 'sitemap.xml').read_text(encoding='utf-8') == before
+    assert not (public.parent / 'manifest.json').exists()
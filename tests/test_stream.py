@@ -0,0 +1,72 @@
+import shutil
+
+from codemods import cli
+
+PAGE = """<!DOCTYPE html>
+<html><head>
+  <style>
+    body { margin: 0; }
+    .theme-toggle { width: 40px; }
+    .theme-icon { opacity: .5; }
+  </style>
+</head><body>
+  <nav class="fixed">
+    <div id="nav-links" class="hidden md:flex"><a href="/methodology" class="iiy-nav-link">Metodologia</a></div>
+    <button id="nav-theme-btn" class="theme-toggle"><span>☾</span></button>
+  </nav>
+  <main><p>Treść — ąęś, <b>nie</b> w żadnym regionie.</p><!-- <footer> w komentarzu --></main>
+  <script>
+    const MOON_SVG = `<svg></svg>`;
+    const x = '<footer>';
+  </script>
+  <footer class="old"><p>Stara stopka</p></footer>
+</body></html>
+"""
+
+PROFILE = """<html><body>
+  <nav><div id="mobile-menu">
+    <a href="/settings" class="x">Ustawienia</a>
+    <a href="/methodology" class="x">Metodologia</a>
+    <div class="row"><span class="l">Motyw</span></div>
+  </div></nav>
+</body></html>
+"""
+
+
+def site(root):
+    public = root / 'public'
+    (public / 'baza-wiedzy' / 'enneagram').mkdir(parents=True)
+    (public / 'pricing.html').write_text(PAGE, encoding='utf-8')
+    (public / 'baza-wiedzy' / 'enneagram' / 'typ-1.html').write_text(PAGE.replace('</main>', '</main>' * 2),
+                                                                     encoding='utf-8')
+    (public / 'user-profile.html').write_text(PROFILE, encoding='utf-8')
+    # \r\n pages are never streamed: the in-memory path normalises them
+    (public / 'methodology.html').write_bytes(PAGE.replace('\n', '\r\n').encode('utf-8'))
+    return public
+
+
+def run(root, *extra):
+    return cli.main(['nav-footer', 'user-profile-menu', '--root', str(root), '--no-cache',
+                     '--rule-budget', '0', *extra])
+
+
+def test_streamed_and_in_memory_runs_write_the_same_bytes(tmp_path, capsys):
+    original = site(tmp_path / 'in-memory')
+    shutil.copytree(tmp_path / 'in-memory', tmp_path / 'streamed')
+    before = {p.name: p.read_bytes() for p in original.rglob('*.html')}
+
+    assert run(tmp_path / 'in-memory') == 0
+    assert '(streamed)' not in capsys.readouterr().out
+    assert run(tmp_path / 'streamed', '--stream-above', '0') == 0
+    out = capsys.readouterr().out
+    assert '✓ Fixed (streamed): public/pricing.html' in out
+    assert '✓ Fixed (streamed): public/user-profile.html' in out
+    assert '✓ Fixed: public/methodology.html' in out
+
+    files = [p.relative_to(tmp_path / 'in-memory') for p in (tmp_path / 'in-memory').rglob('*.html')]
+    assert len(files) == 4
+    for rel in files:
+        assert (tmp_path / 'in-memory' / rel).read_bytes() == (tmp_path / 'streamed' / rel).read_bytes(), rel
+        assert (tmp_path / 'in-memory' / rel).read_bytes() != before[rel.name]
+    pricing = (tmp_path / 'streamed' / 'public' / 'pricing.html').read_text(encoding='utf-8')
+    assert 'theme-toggle' not in pricing and 'Stara stopka' not in pricing and "const x = '<footer>';" in pricing
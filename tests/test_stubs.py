@@ -0,0 +1,188 @@
+import asyncio
+import json
+import random
+
+import pytest
+
+from edgetools import stubs
+from edgetools.http import Request
+from edgetools.stubs import LLM, Database, Latency
+
+
+def request(method, path, query=(), headers=None, body=None):
+    return Request(method, path, list(query), headers or {}, json.dumps(body).encode() if body is not None else b'')
+
+
+# ─── Latency ──────────────────────────────────────────────────────────────────
+
+@pytest.mark.parametrize('spec, low, high', [
+    ('constant:0.5', 0.5, 0.5),
+    ('0.25', 0.25, 0.25),
+    ('uniform:1,2', 1.0, 2.0),
+    ('exp:0', 0.0, 0.0),
+])
+def test_latency_bounds(spec, low, high):
+    draw = Latency.parse(spec).draw
+    rng = random.Random(1)
+    assert all(low <= draw(rng) <= high for _ in range(200))
+
+
+def test_latency_normal_never_negative():
+    draw = Latency.parse('normal:0,1').draw
+    rng = random.Random(1)
+    assert min(draw(rng) for _ in range(500)) == 0.0
+
+
+def test_latency_lognormal_hits_its_percentiles():
+    draw = Latency.parse('lognormal:1,9').draw
+    rng = random.Random(1)
+    ordered = sorted(draw(rng) for _ in range(20000))
+    assert ordered[len(ordered) // 2] == pytest.approx(1.0, rel=0.1)
+    assert ordered[int(len(ordered) * 0.99)] == pytest.approx(9.0, rel=0.15)
+
+
+@pytest.mark.parametrize('spec', ['lognormal:2', 'lognormal:9,1', 'uniform:-1,1', 'gamma:1', 'constant:x', ''])
+def test_latency_rejects(spec):
+    with pytest.raises(ValueError):
+        Latency.parse(spec)
+
+
+# ─── Database ─────────────────────────────────────────────────────────────────
+
+@pytest.fixture
+def db():
+    database = Database()
+    database.seed('ai_interpretations', [
+        {'id': 'a', 'user_id': 'u1', 'test_type': 'HEXACO', 'prompt_version': 2, 'created_at': '2024-01-01'},
+        {'id': 'b', 'user_id': 'u1', 'test_type': 'HEXACO', 'prompt_version': 3, 'created_at': '2024-02-01'},
+        {'id': 'c', 'user_id': 'u2', 'test_type': 'EQ', 'prompt_version': 3, 'created_at': None},
+        {'id': 'd', 'user_id': 'u3', 'test_type': 'DISC', 'prompt_version': 1, 'created_at': '2024-03-01'},
+    ])
+    return database
+
+
+def ids(rows):
+    return [row['id'] for row in rows]
+
+
+@pytest.mark.parametrize('query, expected', [
+    ([('user_id', 'eq.u1')], ['a', 'b']),
+    ([('test_type', 'neq.HEXACO')], ['c', 'd']),
+    ([('test_type', 'in.(EQ,"DISC")')], ['c', 'd']),
+    ([('created_at', 'is.null')], ['c']),
+    ([('prompt_version', 'gte.3')], ['b', 'c']),
+    ([('prompt_version', 'lt.3')], ['a', 'd']),
+    ([('user_id', 'eq.u1'), ('prompt_version', 'eq.3')], ['b']),
+    ([('user_id', 'eq.nobody')], []),
+])
+def test_select_filters(db, query, expected):
+    assert ids(db.select('ai_interpretations', query)) == expected
+
+
+def test_select_order_puts_nulls_last(db):
+    rows = db.select('ai_interpretations', [('order', 'created_at.desc')])
+    assert ids(rows) == ['d', 'b', 'a', 'c']
+    rows = db.select('ai_interpretations', [('order', 'user_id.asc,created_at.desc')])
+    assert ids(rows) == ['b', 'a', 'c', 'd']
+
+
+def test_select_pages_and_projects(db):
+    rows = db.select('ai_interpretations', [('select', 'id, user_id'), ('order', 'id'),
+                                            ('offset', '1'), ('limit', '2')])
+    assert rows == [{'id': 'b', 'user_id': 'u1'}, {'id': 'c', 'user_id': 'u2'}]
+
+
+def test_select_caps_at_max_rows():
+    database = Database()
+    database.seed('user_psychometrics', ({'user_id': str(n)} for n in range(stubs.MAX_ROWS + 5)))
+    assert len(database.select('user_psychometrics', [('limit', '5000')])) == stubs.MAX_ROWS
+
+
+def test_select_rejects_unknown_filters(db):
+    with pytest.raises(ValueError):
+        db.select('ai_interpretations', [('test_type', 'like.HEX*')])
+
+
+def test_single_is_406_unless_exactly_one_row(db):
+    accept = {'accept': 'application/vnd.pgrst.object+json'}
+    one = db._route(request('GET', '/rest/v1/ai_interpretations', [('id', 'eq.b')], accept))
+    assert one.status == 200 and one.json()['prompt_version'] == 3
+    for query in ([('id', 'eq.zzz')], [('user_id', 'eq.u1')]):
+        response = db._route(request('GET', '/rest/v1/ai_interpretations', query, accept))
+        assert response.status == 406 and response.json()['code'] == 'PGRST116'
+
+
+def test_upsert_merges_on_conflict(db):
+    response = db._route(request(
+        'POST', '/rest/v1/ai_interpretations', [('on_conflict', 'user_id,test_type,prompt_version')],
+        {'prefer': 'resolution=merge-duplicates,return=representation'},
+        {'user_id': 'u1', 'test_type': 'HEXACO', 'prompt_version': 3, 'interpretation': 'new'}))
+    assert response.status == 201
+    assert response.json()[0]['id'] == 'b'
+    rows = db.select('ai_interpretations', [('user_id', 'eq.u1')])
+    assert [row.get('interpretation') for row in rows] == [None, 'new']
+    assert 'updated_at' in rows[1]
+
+
+def test_insert_without_merge_is_409_on_a_duplicate_key():
+    database = Database()
+    database.seed('character_card_cache', [{'user_id': 'u1', 'content': {}}])
+    status, body = database.upsert('character_card_cache', [{'user_id': 'u1', 'content': {'x': 1}}],
+                                   ('user_id',), merge=False)
+    assert status == 409 and body[0]['code'] == '23505'
+    status, _ = database.upsert('character_card_cache', [{'user_id': 'u2', 'content': {}}], ('user_id',), merge=False)
+    assert status == 201
+    assert len(database.rows('character_card_cache')) == 2
+
+
+def test_insert_assigns_id_and_created_at():
+    database = Database()
+    row = database.upsert('ai_interpretations', [{'user_id': 'u1'}], ('id',), merge=False)[1][0]
+    assert row['id'] and row['created_at']
+
+
+def test_auth_user_answers_with_the_token_subject(db):
+    from edgetools.functions import token
+    ok = db._route(request('GET', '/auth/v1/user', headers={'authorization': f'Bearer {token("u9")}'}))
+    assert ok.status == 200 and ok.json()['id'] == 'u9'
+    bad = db._route(request('GET', '/auth/v1/user', headers={'authorization': 'Bearer stub-anon-key'}))
+    assert bad.status == 401
+
+
+# ─── LLM ──────────────────────────────────────────────────────────────────────
+
+def test_completion_fills_a_schema():
+    prompt = 'Opisz postać.\n\n' + json.dumps({'schema': {'name': 'string', 'stats': {'level': 3},
+                                                         'tags': ['string']}})
+    text = stubs.completion_text([{'role': 'user', 'content': prompt}], 800)
+    assert json.loads(text) == {'name': 'Stub', 'stats': {'level': 3}, 'tags': ['Stub']}
+
+
+def test_completion_is_markdown_of_about_max_tokens():
+    text = stubs.completion_text([{'role': 'user', 'content': 'Zinterpretuj wyniki.'}], 100)
+    assert text.startswith('## ')
+    assert len(text.split()) == 70 + 4
+
+
+def call_llm(llm, body, headers=None):
+    headers = {'authorization': 'Bearer k'} if headers is None else headers
+    return asyncio.run(llm(request('POST', '/v1/chat/completions', headers=headers, body=body)))
+
+
+def test_llm_answers_in_the_chat_completions_shape():
+    llm = LLM(Latency.parse('0'))
+    response = call_llm(llm, {'model': 'gpt-4o-mini', 'messages': [{'role': 'user', 'content': 'hej'}],
+                              'max_tokens': 50})
+    assert response.status == 200
+    data = response.json()
+    assert data['model'] == 'gpt-4o-mini'
+    assert data['choices'][0]['message']['content'].startswith('## ')
+    assert llm.stats.counts['completed'] == 1
+
+
+def test_llm_throttles_and_fails():
+    llm = LLM(Latency.parse('0'), rate=1)
+    statuses = [call_llm(llm, {'messages': []}).status for _ in range(3)]
+    assert statuses[0] == 200 and 429 in statuses[1:]
+    assert call_llm(LLM(Latency.parse('0'), errors=1.0), {'messages': []}).status == 500
+    assert call_llm(LLM(Latency.parse('0')), {'messages': []}, headers={}).status == 401
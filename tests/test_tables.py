@@ -0,0 +1,56 @@
+import sys
+import types
+
+import numpy as np
+import pytest
+
+from scoring import tables
+from scoring.tables import eq
+
+TEST = {'test_type': 'FAKE', 'dimensions': ['a', 'b']}
+
+
+@pytest.fixture
+def fake(monkeypatch):
+    module = types.ModuleType('scoring.tables.fake')
+    module.SOURCE = tables.digest(TEST)
+    module.LOW = (2, 3)
+    module.COLUMNS = {'average': ((1.0, 1.5, 2.0), (1.0, 2.0)), 'level': ((0, 1, 2), (0, 2))}
+    monkeypatch.setitem(sys.modules, module.__name__, module)
+    monkeypatch.setattr(tables, '_loaded', {})
+    return module
+
+
+def test_load_uses_a_current_table(fake):
+    table = tables.load('FAKE', TEST)
+    assert table is not None and list(table.low) == [2, 3] and list(table.size) == [3, 2]
+    assert tables.load('NONE', TEST) is None
+
+
+def test_load_ignores_a_stale_table(fake):
+    assert tables.load('FAKE', dict(TEST, dimensions=['a', 'c'])) is None
+
+
+def test_a_formula_change_makes_every_table_stale(fake, monkeypatch):
+    monkeypatch.setattr(tables, 'formulas_version', lambda: 'edited')
+    assert tables.load('FAKE', TEST) is None
+
+
+def test_lookup_flags_sums_off_the_table(fake):
+    columns, outside = tables.load('FAKE', TEST).lookup(np.array([[2, 4], [4, 3], [1, 3], [3, 5]]))
+    assert columns['average'].tolist() == [[1.0, 2.0], [2.0, 1.0], [1.0, 1.0], [1.5, 2.0]]
+    assert columns['level'].dtype == np.int8
+    assert outside.tolist() == [False, False, True, True]
+
+
+def test_lookup_gives_back_every_entry_of_a_generated_table():
+    table = tables.from_module(eq)
+    width = max(len(row) for row in next(iter(eq.COLUMNS.values())))
+    # row i looks up entry i of every group (clamped for the shorter ones)
+    sums = np.array([[low + min(i, len(row) - 1) for low, row in zip(eq.LOW, eq.COLUMNS['raw_scores'])]
+                     for i in range(width)])
+    columns, outside = table.lookup(sums)
+    assert not outside.any()
+    for name, rows in eq.COLUMNS.items():
+        expected = [[row[min(i, len(row) - 1)] for row in rows] for i in range(width)]
+        assert columns[name].tolist() == expected, name
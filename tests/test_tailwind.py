@@ -0,0 +1,50 @@
+from sitebuild import site, tailwind
+
+SHEET = ('*,::before{box-sizing:border-box}'
+         '.zz-top{display:flex}'
+         '.zz-below{margin:0}'
+         '.zz-unused{color:red}'
+         '.zz-top,.zz-unused{padding:0}'
+         '@media (min-width:768px){.md\\:zz-top{display:grid}.zz-unused{color:blue}}'
+         '.zz-spin{animation:zz-turn 1s}'
+         '@keyframes zz-turn{to{transform:rotate(1turn)}}'
+         '@keyframes zz-ping{to{opacity:0}}')
+PAGE = """<html><head>
+    <link rel="stylesheet" href="/tw.css">
+</head><body>
+  <div class="zz-top md:zz-top">top</div>
+  <script>el.classList.add('zz-spin')</script>
+  <p>{filler}</p>
+  <p class="zz-below">below the fold</p>
+</body></html>
+"""
+
+
+def test_purge_keeps_what_some_page_names():
+    used = frozenset({'zz-top', 'md:zz-top'})
+    assert tailwind.purge(SHEET, used, frozenset()) == (
+        '*,::before{box-sizing:border-box}.zz-top{display:flex}.zz-top{padding:0}'
+        '@media (min-width:768px){.md\\:zz-top{display:grid}}')
+
+
+def test_pages_inline_the_part_above_the_fold(tmp_path):
+    root = str(tmp_path)
+    site.write(root, 'tw.css', SHEET)
+    html = PAGE.format(filler='x' * 200)
+    site.write(root, 'index.html', html)
+    results, before, after = tailwind.run(root, fold=100)
+    assert [r.path for r in results] == ['index.html'] and after.raw < before.raw
+
+    purged = site.read(root, 'tw.css')
+    assert '.zz-below{margin:0}' in purged and '.zz-spin{animation:zz-turn 1s}' in purged
+    assert 'zz-unused' not in purged and 'zz-ping' not in purged and '@keyframes zz-turn' in purged
+
+    critical = ('*,::before{box-sizing:border-box}.zz-top{display:flex}.zz-top{padding:0}'
+                '@media (min-width:768px){.md\\:zz-top{display:grid}}')
+    assert site.read(root, 'index.html') == html.replace(
+        '<link rel="stylesheet" href="/tw.css">',
+        tailwind.critical_block('<link rel="stylesheet" href="/tw.css">', '    ', critical))
+    assert results[0].blocking_after == site.size(critical)
+
+    # nothing left to split on a second run
+    assert tailwind.run(root, fold=100)[0] == []
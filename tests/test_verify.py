@@ -0,0 +1,28 @@
+from codemods import registry, verify
+from codemods.engine import Rule, RuleSet
+from codemods.registry import Codemod
+
+# Guardless: every pass adds another badge
+BADGE = RuleSet([Rule('badge', r'</h1>', '</h1><span class="badge">new</span>')])
+STABLE = RuleSet([Rule('title', r'<h1>Old</h1>', '<h1>New</h1>')])
+
+
+def install(monkeypatch, name, rules):
+    monkeypatch.setitem(registry.REGISTRY, name, Codemod(
+        name, ('public/*.html',), lambda path, text: rules.apply(text), rules=tuple(rules.rules), source=__file__))
+
+
+def test_a_rule_that_matches_its_own_output_is_flagged(tmp_path, monkeypatch, capsys):
+    install(monkeypatch, 'test-badge', BADGE)
+    install(monkeypatch, 'test-title', STABLE)
+    (tmp_path / 'public').mkdir()
+    page = tmp_path / 'public' / 'page.html'
+    page.write_text('<h1>Old</h1>\n', encoding='utf-8')
+
+    assert verify.main(['test-title', '--root', str(tmp_path), '--no-cache', '-j', '1']) == 0
+    assert verify.main(['test-title', 'test-badge', '--root', str(tmp_path), '--no-cache', '-j', '1']) == 1
+    out = capsys.readouterr().out
+    assert '✗ Not a fixed point: public/page.html\n    second pass: badge×1\n' in out
+    assert '+<h1>New</h1><span class="badge">new</span><span class="badge">new</span>' in out
+    assert '0 fixed points / 1 not (1 would change on the next run, 0 cached)' in out
+    assert page.read_text(encoding='utf-8') == '<h1>Old</h1>\n'
@@ -0,0 +1,134 @@
+import asyncio
+import random
+
+import pytest
+
+from edgetools import stubs, warm
+from edgetools.http import Client, bound_port, json_response, serve
+from edgetools.warm import Checkpoint, Job, Outcome, Pair, RateLimiter, Settings
+
+
+def test_body_mirrors_each_results_page():
+    hexaco = {'test_type': 'HEXACO', 'percentile_scores': {'extraversion': 70}, 'raw_scores': {'extraversion': 3.9}}
+    assert warm.body(hexaco) == hexaco
+
+    dark = {'test_type': 'DARK_TRIAD', 'raw_scores': {'dimensions': {'narcissism': {'percentile': 40},
+                                                                     'psychopathy': None}}}
+    assert warm.body(dark) == {'test_type': 'DARK_TRIAD', 'percentile_scores': {'narcissism': 40, 'psychopathy': 0}}
+
+    strengths = {'test_type': 'STRENGTHS', 'raw_scores': {'top_5': [{'name': 'Focus', 'keywords': 'a, b'}]}}
+    sent = warm.body(strengths)
+    assert sent['raw_scores']['top_5'][0]['keywords'] == ['a', 'b']
+    assert sent['report'] is sent['raw_scores']
+
+    career = {'test_type': 'CAREER', 'raw_scores': {'x': 1}, 'completed_at': '2024-05-01'}
+    assert warm.body(career, {'top': 'A'})['report'] == {'top': 'A', 'completed_at': '2024-05-01'}
+    assert warm.body({**career, 'test_type': 'CAREER_DNA'}, {'top': 'A'})['report'] == {'top': 'A'}
+
+    eq = {'test_type': 'EQ', 'raw_scores': {'total': 80}, 'report': {'level': 'high'}}
+    assert warm.body(eq) == eq
+
+
+def test_checkpoint_resumes_per_version(tmp_path):
+    path = str(tmp_path / 'warm.jsonl')
+    checkpoint = Checkpoint(path, 3)
+    checkpoint.record(Outcome(Pair('u1', 'EQ'), 'generated', 1, None, 200))
+    checkpoint.record(Outcome(Pair('u2', 'EQ'), 'failed', 6, '503', 503))
+    checkpoint.record(Outcome(Pair('u3', 'EQ'), 'failed', 1, '400 bad', 400))
+    checkpoint.record(Outcome(Pair('u4', 'EQ'), 'failed', 1, '400 bad', 400))
+    checkpoint.record(Outcome(Pair('u4', 'EQ'), 'cached', 1, None, 200))
+    checkpoint.close()
+
+    again = Checkpoint(path, 3)
+    assert again.done == {Pair('u1', 'EQ'), Pair('u4', 'EQ')}
+    assert again.failed == {Pair('u3', 'EQ')}     # retryable failures are tried again
+    again.close()
+    bumped = Checkpoint(path, 4)
+    assert not bumped.done and not bumped.failed
+    bumped.close()
+
+
+def test_rate_limiter_spaces_calls():
+    async def run():
+        limiter = RateLimiter(50, burst=1)
+        start = asyncio.get_running_loop().time()
+        for _ in range(6):
+            await limiter.acquire()
+        return asyncio.get_running_loop().time() - start
+
+    assert asyncio.run(run()) == pytest.approx(0.1, abs=0.05)
+
+
+def serve_sequence(statuses):
+    """A fake interpret-test answering with ``statuses`` in turn; returns its calls."""
+    calls = []
+
+    async def handler(request):
+        calls.append(request.json())
+        status = statuses[min(len(calls), len(statuses)) - 1]
+        if status == 200:
+            return json_response(200, {'interpretation': 'x', 'cached': False})
+        return json_response(status, {'error': 'nope'}, {'retry-after': '0'})
+
+    return handler, calls
+
+
+def invoke(statuses, retries=3):
+    handler, calls = serve_sequence(statuses)
+
+    async def run():
+        server = await serve(handler)
+        client = Client(5)
+        settings = Settings(f'http://127.0.0.1:{bound_port(server)}/', 'secret', 'anon', retries, 0.001, 0.01)
+        try:
+            return await warm.invoke(client, RateLimiter(0), settings,
+                                     Job(Pair('u1', 'EQ'), {'test_type': 'EQ'}), random.Random(0))
+        finally:
+            await client.close()
+            server.close()
+
+    return asyncio.run(run()), calls
+
+
+def test_invoke_retries_transient_failures():
+    outcome, calls = invoke([503, 429, 200])
+    assert outcome == Outcome(Pair('u1', 'EQ'), 'generated', 3, None, 200)
+    assert all(call == {'test_type': 'EQ', 'force': False} for call in calls)
+
+
+def test_invoke_gives_up():
+    outcome, calls = invoke([500], retries=2)
+    assert (outcome.status, outcome.attempts, outcome.http) == ('failed', 3, 500)
+    outcome, calls = invoke([400, 200])
+    assert (outcome.status, outcome.attempts, outcome.error) == ('failed', 1, '400 nope')
+    assert len(calls) == 1
+
+
+def test_missing_pages_and_keeps_the_latest_result(monkeypatch):
+    monkeypatch.setattr(warm, 'PAGE', 2)
+    database = stubs.Database()
+    database.seed('user_psychometrics', [
+        {'user_id': 'u1', 'test_type': 'EQ', 'completed_at': '2024-01-01', 'raw_scores': {'v': 'old'}},
+        {'user_id': 'u1', 'test_type': 'EQ', 'completed_at': '2024-03-01', 'raw_scores': {'v': 'new'}},
+        {'user_id': 'u2', 'test_type': 'EQ', 'completed_at': '2024-02-01'},
+        {'user_id': 'u3', 'test_type': 'EQ', 'completed_at': '2024-04-01'},
+        {'user_id': 'u3', 'test_type': 'DISC', 'completed_at': '2024-04-01'},
+    ])
+    database.seed('ai_interpretations', [
+        {'user_id': 'u2', 'test_type': 'EQ', 'prompt_version': 3},
+        {'user_id': 'u3', 'test_type': 'EQ', 'prompt_version': 2},
+    ])
+
+    async def run():
+        server = await serve(database)
+        client = Client(5)
+        rest = warm.Rest.service(f'http://127.0.0.1:{bound_port(server)}', 'service')
+        try:
+            return await warm.missing(client, rest, ['EQ'], 3)
+        finally:
+            await client.close()
+            server.close()
+
+    rows, have = asyncio.run(run())
+    assert have == 1
+    assert [(row['user_id'], (row['raw_scores'] or {}).get('v')) for row in rows] == [('u3', None), ('u1', 'new')]